@@ -11,14 +11,17 @@ from .validators import is_item_iterable
 from .validators import validate_data
 from .encoders import DataEncoder
 from .encoders import DataDecoder
+from .encoders import DataProxy
 from .data import Data
 
-from .json import json_load, json_loads, json_dump, json_dumps
+from .json import json_load, json_loads, json_dump, json_dumps, json_iter
+from .binary import binary_load, binary_loads, binary_dump, binary_dumps
 
 __all__ = [
     "Data",
     "DataEncoder",
     "DataDecoder",
+    "DataProxy",
     "DecoderError",
     "is_sequence_of_int",
     "is_sequence_of_uint",
@@ -31,5 +34,10 @@ __all__ = [
     "json_loads",
     "json_dump",
     "json_dumps",
+    "json_iter",
+    "binary_load",
+    "binary_loads",
+    "binary_dump",
+    "binary_dumps",
     "validate_data",
 ]
@@ -0,0 +1,513 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import io
+import json
+import math
+import struct
+import zipfile
+
+from collections import OrderedDict
+from itertools import chain
+
+from compas import _iotools
+from compas.data import DataEncoder
+from compas.data import DataDecoder
+from compas.data import DecoderError
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+try:
+    long
+except NameError:
+    long = int
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+FORMAT_VERSION = 1
+"""int: The version of the layout of binary COMPAS files."""
+
+MIN_COLUMN_SIZE = 32
+"""int: The minimum number of items of a list or a dict for its values to be stored as packed columns."""
+
+_DOCUMENT = "data.json"
+_COLUMN = "columns/{}"
+_MARKER = "$binary"
+
+_FORMATS = {
+    "b1": "?",
+    "i1": "b",
+    "u1": "B",
+    "i2": "h",
+    "u2": "H",
+    "i4": "i",
+    "u4": "I",
+    "i8": "q",
+    "u8": "Q",
+    "f4": "f",
+    "f8": "d",
+}
+
+_NUMBERS = set([bool, int, long, float])
+_INTEGERS = set([int, long])
+_SEQUENCES = set([list, tuple])
+
+_MISSING = object()
+
+
+class _Sparse(list):
+    """A column of a table with missing values."""
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _key(key):
+    """Convert a dict key to a string, in the same way as the JSON encoder."""
+    if isinstance(key, basestring):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        if math.isnan(key):
+            return "NaN"
+        if math.isinf(key):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    if isinstance(key, (int, long)):
+        return int.__repr__(key) if isinstance(key, int) else str(long(key))
+    raise TypeError("keys must be str, int, float, bool or None, not {}".format(type(key).__name__))
+
+
+def _pack(values, dtype):
+    """Pack a flat sequence of numbers into a little-endian buffer."""
+    if np is not None:
+        return np.asarray(values, dtype=dtype).tobytes()
+    return struct.pack("<{}{}".format(len(values), _FORMATS[dtype[1:]]), *values)
+
+
+def _unpack(buffer, dtype, shape):
+    """Unpack a little-endian buffer into (nested) lists of numbers."""
+    if np is not None:
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape).tolist()
+    fmt = _FORMATS[dtype[1:]]
+    count = len(buffer) // struct.calcsize("<" + fmt)
+    return _reshape(list(struct.unpack("<{}{}".format(count, fmt), buffer)), shape)
+
+
+def _reshape(values, shape):
+    """Nest a flat list of values according to a (rectangular) shape."""
+    for size in reversed(shape[1:]):
+        values = [values[i : i + size] for i in range(0, len(values), size)]
+    return values
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+class _BinaryWriter(object):
+    """Converts a collection of COMPAS objects to a JSON document and a list of packed numeric columns.
+
+    The document has the structure of the JSON serialization of the objects,
+    except for lists and dicts of numbers, which are replaced by references to the columns.
+    These references are dicts with a single key ``"$binary"``.
+    Keys of other dicts starting with ``"$"`` are escaped with an additional ``"$"``,
+    and the dict is marked with a key ``"$"``.
+    """
+
+    def __init__(self):
+        self.encoder = DataEncoder()
+        self.columns = []
+
+    def marker(self, *args):
+        return {_MARKER: list(args)}
+
+    def column(self, buffer, dtype, shape):
+        self.columns.append(buffer)
+        return self.marker("array", len(self.columns) - 1, dtype, list(shape))
+
+    def encode(self, o):
+        if o is None or isinstance(o, (basestring, bool, int, long, float)):
+            return o
+        if isinstance(o, (list, tuple)):
+            return self.encode_list(o)
+        if isinstance(o, dict):
+            return self.encode_dict(o)
+        if np is not None and isinstance(o, np.ndarray):
+            return self.encode_array(o)
+        return self.encode(self.encoder.default(o))
+
+    def encode_array(self, a):
+        if a.size < MIN_COLUMN_SIZE or a.dtype.kind not in "biuf" or a.dtype.itemsize > 8:
+            return self.encode(a.tolist())
+        if a.dtype.kind == "f" and a.dtype.itemsize < 4:
+            a = a.astype("f4")
+        a = np.ascontiguousarray(a, dtype=a.dtype.newbyteorder("<"))
+        return self.column(a.tobytes(), a.dtype.str, a.shape)
+
+    def encode_list(self, values):
+        if len(values) >= MIN_COLUMN_SIZE:
+            column = self.pack_list(values)
+            if column is not None:
+                return column
+        return [self.encode(value) for value in values]
+
+    def encode_dict(self, o):
+        if len(o) >= MIN_COLUMN_SIZE:
+            table = self.pack_dict(o)
+            if table is not None:
+                return table
+        items = [(_key(key), value) for key, value in o.items()]
+        if not any(key[:1] == "$" for key, _ in items):
+            return {key: self.encode(value) for key, value in items}
+        data = {"$": 0}
+        for key, value in items:
+            data["$" + key if key[:1] == "$" else key] = self.encode(value)
+        return data
+
+    def pack_numbers(self, values, types, shape):
+        if types == set([float]):
+            return self.column(_pack(values, "<f8"), "<f8", shape)
+        if types == set([bool]):
+            return self.column(_pack(values, "|b1"), "|b1", shape)
+        if types <= _INTEGERS:
+            if min(values) >= -(2**63) and max(values) < 2**63:
+                return self.column(_pack(values, "<i8"), "<i8", shape)
+            return None
+        if bool in types:
+            return None
+        # ints and floats, of which the ints are restored from a mask
+        mask = [type(value) is not float for value in values]
+        if any(abs(value) > 2**53 for value, isint in zip(values, mask) if isint):
+            return None
+        floats = self.column(_pack(values, "<f8"), "<f8", [len(values)])
+        ints = self.column(_pack(mask, "|b1"), "|b1", [len(values)])
+        return self.marker("mixed", floats, ints, list(shape))
+
+    def pack_list(self, values):
+        types = set(map(type, values))
+        if types <= _NUMBERS:
+            return self.pack_numbers(values, types, [len(values)])
+        if not types <= _SEQUENCES:
+            return None
+        flat = list(chain.from_iterable(values))
+        types = set(map(type, flat))
+        if not flat or not types <= _NUMBERS:
+            return None
+        sizes = list(map(len, values))
+        if len(set(sizes)) == 1:
+            return self.pack_numbers(flat, types, [len(values), sizes[0]])
+        column = self.pack_numbers(flat, types, [len(flat)])
+        if column is None:
+            return None
+        return self.marker("ragged", column, self.column(_pack(sizes, "<i8"), "<i8", [len(sizes)]))
+
+    def pack_keys(self, o):
+        types = set(map(type, o))
+        if types <= _INTEGERS:
+            ints = list(o)
+        elif types <= set([str]):
+            keys = list(o)
+            try:
+                ints = [int(key) for key in keys]
+            except ValueError:
+                return keys
+            if list(map(str, ints)) != keys:
+                return keys
+        else:
+            return [_key(key) for key in o]
+        column = self.pack_list(ints)
+        if column is None:
+            return [_key(key) for key in o]
+        return self.marker("keys", column)
+
+    def pack_dict(self, o):
+        values = list(o.values())
+        types = set(map(type, values))
+        if types <= _NUMBERS or types <= _SEQUENCES:
+            return self.marker("map", self.pack_keys(o), self.encode_list(values))
+        if types != set([dict]):
+            return None
+        names = []
+        for layout in OrderedDict.fromkeys(map(tuple, values)):
+            for name in layout:
+                if not isinstance(name, basestring) or name == "dtype" or name[:1] == "$":
+                    return None
+                if name not in names:
+                    names.append(name)
+        columns = []
+        for name in names:
+            column = [value.get(name, _MISSING) for value in values]
+            mask = [item is not _MISSING for item in column]
+            if all(mask):
+                columns.append(self.encode_list(column))
+            else:
+                present = [item for item in column if item is not _MISSING]
+                columns.append(self.marker("sparse", self.encode_list(mask), self.encode_list(present)))
+        return self.marker("table", self.pack_keys(o), names, columns)
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+
+class _BinaryDecoder(DataDecoder):
+    """Data decoder for the JSON document of a binary COMPAS file, which restores the packed columns."""
+
+    def __init__(self, archive, *args, **kwargs):
+        super(_BinaryDecoder, self).__init__(*args, **kwargs)
+        self.archive = archive
+
+    def object_hook(self, o):
+        if "$" in o:
+            del o["$"]
+            o = {key[1:] if key[:1] == "$" else key: value for key, value in o.items()}
+            return super(_BinaryDecoder, self).object_hook(o)
+        if _MARKER in o:
+            return self.unmark(*o[_MARKER])
+        return super(_BinaryDecoder, self).object_hook(o)
+
+    def unmark(self, kind, *args):
+        if kind == "array":
+            index, dtype, shape = args
+            return _unpack(self.archive.read(_COLUMN.format(index)), dtype, shape)
+        if kind == "mixed":
+            floats, ints, shape = args
+            return _reshape([int(value) if isint else value for value, isint in zip(floats, ints)], shape)
+        if kind == "ragged":
+            flat, sizes = args
+            values = []
+            start = 0
+            for size in sizes:
+                values.append(flat[start : start + size])
+                start += size
+            return values
+        if kind == "keys":
+            return list(map(str, args[0]))
+        if kind == "sparse":
+            mask, present = args
+            present = iter(present)
+            return _Sparse(next(present) if exists else _MISSING for exists in mask)
+        if kind == "map":
+            keys, values = args
+            return self.rebuild(dict(zip(keys, values)))
+        if kind == "table":
+            keys, names, columns = args
+            full = [(name, column) for name, column in zip(names, columns) if not isinstance(column, _Sparse)]
+            if full:
+                fields = [name for name, _ in full]
+                records = [dict(zip(fields, row)) for row in zip(*[column for _, column in full])]
+            else:
+                records = [{} for _ in keys]
+            for name, column in zip(names, columns):
+                if isinstance(column, _Sparse):
+                    for record, value in zip(records, column):
+                        if value is not _MISSING:
+                            record[name] = value
+            return self.rebuild(dict(zip(keys, records)))
+        raise DecoderError("Unknown type of binary data: {}.".format(kind))
+
+    def rebuild(self, o):
+        if "dtype" in o:
+            return super(_BinaryDecoder, self).object_hook(o)
+        return o
+
+
+# =============================================================================
+# API
+# =============================================================================
+
+
+def binary_dump(data, fp, compress=False):
+    """Write a collection of COMPAS object data to a binary file.
+
+    Parameters
+    ----------
+    data : object
+        Any JSON serializable object.
+        This includes any (combination of) COMPAS object(s).
+    fp : path string or file-like object
+        A writeable file-like object or the path to a file.
+    compress : bool, optional
+        If True, compress the contents of the file.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.binary_loads`
+
+    Notes
+    -----
+    The file is a ZIP archive containing a JSON document with the same structure as the JSON serialization of the data,
+    in which lists and dicts of numbers, and NumPy arrays, are replaced by references to packed, little-endian arrays.
+    The packed arrays are stored as separate entries of the archive.
+
+    Loading the file produces the same result as loading the JSON serialization of the data.
+    For example, NumPy arrays are loaded as (nested) lists, and the keys of dicts as strings.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.data import binary_dump, binary_load
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> binary_dump(mesh, 'data.bin')
+    >>> other = binary_load('data.bin')
+    >>> other.guid == mesh.guid
+    True
+
+    """
+    writer = _BinaryWriter()
+    document = json.dumps({"version": FORMAT_VERSION, "data": writer.encode(data)}, separators=(",", ":"))
+    mode = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with _iotools.open_file(fp, "wb") as f:
+        archive = zipfile.ZipFile(f, "w", mode, allowZip64=True)
+        try:
+            archive.writestr(_DOCUMENT, document)
+            for index, buffer in enumerate(writer.columns):
+                archive.writestr(_COLUMN.format(index), buffer)
+        finally:
+            archive.close()
+
+
+def binary_dumps(data, compress=False):
+    """Write a collection of COMPAS objects to a binary string.
+
+    Parameters
+    ----------
+    data : object
+        Any JSON serializable object.
+        This includes any (combination of) COMPAS object(s).
+    compress : bool, optional
+        If True, compress the contents of the string.
+
+    Returns
+    -------
+    bytes
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.binary_loads`
+
+    Examples
+    --------
+    >>> from compas.data import binary_dumps, binary_loads
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> s = binary_dumps(data1)
+    >>> data2 = binary_loads(s)
+    >>> data1 == data2
+    True
+
+    """
+    stream = io.BytesIO()
+    binary_dump(data, stream, compress=compress)
+    return stream.getvalue()
+
+
+def binary_load(fp, lazy=False):
+    """Read COMPAS object data from a binary file.
+
+    Parameters
+    ----------
+    fp : path string | file-like object | URL string
+        A readable path, a file-like object or a URL pointing to a file.
+    lazy : bool, optional
+        If True, return the COMPAS objects as :class:`~compas.data.DataProxy` objects,
+        which are only constructed when they are used for the first time.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the file.
+
+    Raises
+    ------
+    :class:`~compas.data.DecoderError`
+        If the file was written with an unsupported version of the format.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_loads`
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.data import binary_dump, binary_load
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> binary_dump(data1, 'data.bin')
+    >>> data2 = binary_load('data.bin')
+    >>> data1 == data2
+    True
+
+    """
+    with _iotools.open_file(fp, "rb") as f:
+        archive = zipfile.ZipFile(f, "r")
+        try:
+            document = archive.read(_DOCUMENT).decode("utf-8")
+            content = json.loads(document, cls=_BinaryDecoder, archive=archive, lazy=lazy)
+        finally:
+            archive.close()
+    if content.get("version") != FORMAT_VERSION:
+        raise DecoderError("Unsupported version of the binary format: {}.".format(content.get("version")))
+    return content["data"]
+
+
+def binary_loads(s, lazy=False):
+    """Read COMPAS object data from a binary string.
+
+    Parameters
+    ----------
+    s : bytes
+        A binary data string.
+    lazy : bool, optional
+        If True, return the COMPAS objects as :class:`~compas.data.DataProxy` objects,
+        which are only constructed when they are used for the first time.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the string.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+
+    Examples
+    --------
+    >>> from compas.data import binary_dumps, binary_loads
+    >>> s = binary_dumps({"a": list(range(100))})
+    >>> binary_loads(s)["a"] == list(range(100))
+    True
+
+    """
+    return binary_load(io.BytesIO(s), lazy=lazy)
@@ -106,6 +106,8 @@ class Data(object):
 
     JSONSCHEMA = {}
 
+    __slots__ = ("_guid", "_name")
+
     def __init__(self, name=None):
         self._guid = None
         self._name = None
@@ -115,18 +117,27 @@ class Data(object):
     def __getstate__(self):
         """Return the object data for state serialization with older pickle protocols."""
         return {
-            "__dict__": self.__dict__,
+            "__dict__": getattr(self, "__dict__", {}),
             "dtype": self.dtype,
             "data": self.data,
             "guid": str(self.guid),
+            "name": self._name,
         }
 
     def __setstate__(self, state):
         """Assign a deserialized state to the object data to support older pickle protocols."""
-        self.__dict__.update(state["__dict__"])
+        attributes = dict(state["__dict__"])
+        # states created before the attributes of the base class were turned into slots
+        # store these attributes in the instance dict
+        self._guid = attributes.pop("_guid", None)
+        self._name = attributes.pop("_name", None)
+        if attributes:
+            self.__dict__.update(attributes)
         self.data = state["data"]
         if "guid" in state:
             self._guid = UUID(state["guid"])
+        if "name" in state:
+            self._name = state["name"]
 
     @property
     def dtype(self):
@@ -275,6 +286,48 @@ class Data(object):
         """
         return compas.json_dumps(self.data, pretty=pretty, compact=compact)
 
+    @classmethod
+    def from_binary(cls, filepath):
+        """Construct an object from serialized data contained in a binary file.
+
+        Parameters
+        ----------
+        filepath : path string | file-like object | URL string
+            The path, file or URL to the file for serialization.
+
+        Returns
+        -------
+        :class:`~compas.data.Data`
+            An instance of this object type if the data contained in the binary file has the correct schema.
+
+        """
+        data = compas.data.binary_load(filepath)
+        return cls.from_data(data)
+
+    def to_binary(self, filepath, compress=False):
+        """Serialize the data representation of an object to a binary file.
+
+        Parameters
+        ----------
+        filepath : path string or file-like object
+            The path or file-like object to the file containing the data.
+        compress : bool, optional
+            If True, compress the contents of the file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The binary file contains the same information as the JSON file written by :meth:`to_json`,
+        but stores lists and dicts of numbers as packed arrays,
+        which makes reading and writing large objects significantly faster.
+        See :func:`compas.data.binary_dump` for details.
+
+        """
+        compas.data.binary_dump(self.data, filepath, compress=compress)
+
     def copy(self, cls=None):
         """Make an independent copy of the data object.
 
@@ -289,9 +342,40 @@ class Data(object):
         :class:`~compas.data.Data`
             An independent copy of this object.
 
+        Notes
+        -----
+        If the type of this object and the requested type share an implementation of a fast copy,
+        the copy is made directly from the internal state of this object.
+        Otherwise, the copy is constructed from a deep copy of the data dict.
+
         """
         if not cls:
             cls = type(self)
+        copier = _copier(type(self))
+        if copier is not None and copier is _copier(cls):
+            return self._copy(cls)
+        return cls.from_data(deepcopy(self.data))
+
+    def _copy(self, cls):
+        """Make an independent copy of the data object directly from its internal state.
+
+        Parameters
+        ----------
+        cls : Type[:class:`~compas.data.Data`]
+            The type of data object to return.
+
+        Returns
+        -------
+        :class:`~compas.data.Data`
+            An independent copy of this object.
+
+        Notes
+        -----
+        This method is used by :meth:`copy` to avoid the round trip through a deep copy of the data dict.
+        Subclasses can override it, provided that the result is identical to ``cls.from_data(deepcopy(self.data))``.
+        The override is only used for types that do not redefine :attr:`data` or :meth:`from_data` themselves.
+
+        """
         return cls.from_data(deepcopy(self.data))
 
     @classmethod
@@ -389,3 +473,28 @@ class Data(object):
         if as_string:
             return h.hexdigest()
         return h.digest()
+
+
+def _owner(cls, name):
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base
+
+
+def _copier(cls):
+    """Find the class providing the fast copy of objects of the given type.
+
+    The fast copy can only be used if it is defined on the class that defines the data representation
+    and the data constructor of the type, or on a subclass of those.
+
+    Returns
+    -------
+    type | None
+
+    """
+    copier = _owner(cls, "_copy")
+    if copier is Data:
+        return None
+    if not issubclass(copier, _owner(cls, "data")) or not issubclass(copier, _owner(cls, "from_data")):
+        return None
+    return copier
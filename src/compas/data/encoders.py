@@ -3,6 +3,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 import json
+import operator
 import platform
 import uuid
 
@@ -29,6 +30,8 @@ try:
 except ImportError:
     numpy_support = False
 
+_DTYPE_CLASSES = {}
+
 
 def cls_from_dtype(dtype):
     """Get the class object corresponding to a COMPAS data type specification.
@@ -52,10 +55,235 @@ def cls_from_dtype(dtype):
     AttributeError
         If the module doesn't contain the specified data type.
 
+    Notes
+    -----
+    The resolved classes are cached,
+    such that the module of every data type is only imported once.
+
     """
+    try:
+        return _DTYPE_CLASSES[dtype]
+    except (KeyError, TypeError):
+        pass
     mod_name, attr_name = dtype.split("/")
     module = __import__(mod_name, fromlist=[attr_name])
-    return getattr(module, attr_name)
+    cls = getattr(module, attr_name)
+    _DTYPE_CLASSES[dtype] = cls
+    return cls
+
+
+def _from_value(cls, value, guid=None):
+    """Construct an object of the given class from its serialized value, and restore its guid."""
+    if hasattr(cls, "from_jsondata"):
+        obj = cls.from_jsondata(value)
+    else:
+        obj = cls.from_data(value)
+    if guid is not None:
+        obj._guid = uuid.UUID(guid)
+    return obj
+
+
+def _materialize(value):
+    """Replace the proxies in a (nested) serialized value by the objects they represent."""
+    if isinstance(value, DataProxy):
+        return value.materialize()
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (DataProxy, dict, list)):
+                value[key] = _materialize(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (DataProxy, dict, list)):
+                value[index] = _materialize(item)
+    return value
+
+
+class DataProxy(object):
+    """Lightweight placeholder for a deserialized data object, which is only constructed when it is first used.
+
+    The proxy stores the class and the serialized value of the object.
+    The object is constructed on first access of any of its attributes, methods or operators,
+    and all further access is forwarded to it.
+    The data type and guid of the object are available without constructing it.
+
+    Parameters
+    ----------
+    cls : Type[:class:`~compas.data.Data`]
+        The class of the object.
+    value : dict | list
+        The serialized value of the object.
+    guid : str, optional
+        The serialized guid of the object.
+    dtype : str, optional
+        The data type of the object.
+        Defaults to the data type of the class.
+
+    Attributes
+    ----------
+    dtype : str
+        The data type of the object.
+    guid : :class:`uuid.UUID`
+        The guid of the object.
+    is_materialized : bool
+        True if the object has been constructed.
+
+    See Also
+    --------
+    compas.data.DataDecoder
+    compas.data.json_load
+
+    Notes
+    -----
+    Because ``isinstance`` checks are forwarded to the class of the object,
+    proxies can be used in most places where the object itself is expected.
+    Use :meth:`materialize` to get the actual object.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.geometry import Point
+    >>> s = compas.json_dumps([Point(1, 2, 3), Point(4, 5, 6)])
+    >>> a, b = compas.json_loads(s, lazy=True)
+    >>> a.dtype
+    'compas.geometry/Point'
+    >>> a.is_materialized
+    False
+    >>> isinstance(a, Point)
+    True
+    >>> a.x
+    1.0
+    >>> a.is_materialized
+    True
+
+    """
+
+    __slots__ = ("_cls", "_value", "_guid", "_dtype", "_obj")
+
+    def __init__(self, cls, value, guid=None, dtype=None):
+        object.__setattr__(self, "_cls", cls)
+        object.__setattr__(self, "_value", value)
+        object.__setattr__(self, "_guid", guid)
+        object.__setattr__(self, "_dtype", dtype)
+        object.__setattr__(self, "_obj", None)
+
+    @property
+    def __class__(self):
+        return self._cls
+
+    @property
+    def dtype(self):
+        if self._dtype is None:
+            return self.materialize().dtype
+        return self._dtype
+
+    @property
+    def guid(self):
+        if self._guid is None:
+            return self.materialize().guid
+        return uuid.UUID(self._guid)
+
+    @property
+    def is_materialized(self):
+        return self._obj is not None
+
+    def materialize(self):
+        """Construct the object represented by the proxy, if that has not happened yet.
+
+        Nested proxies in the serialized value of the object are materialized as well.
+
+        Returns
+        -------
+        :class:`~compas.data.Data`
+
+        """
+        if self._obj is None:
+            obj = _from_value(self._cls, _materialize(self._value), self._guid)
+            object.__setattr__(self, "_obj", obj)
+            object.__setattr__(self, "_value", None)
+        return self._obj
+
+    def __getattr__(self, name):
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.materialize(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.materialize(), name)
+
+    def __reduce_ex__(self, protocol):
+        return self.materialize().__reduce_ex__(protocol)
+
+
+def _forward(function):
+    def method(self, *args):
+        return function(self.materialize(), *args)
+
+    return method
+
+
+def _inplace(function):
+    def method(self, other):
+        obj = self.materialize()
+        result = function(obj, other)
+        # objects without in-place operators return a new object, as they would without the proxy
+        return self if result is obj else result
+
+    return method
+
+
+def _reflect(function):
+    def method(self, other):
+        return function(other, self.materialize())
+
+    return method
+
+
+for _name, _function in [
+    ("__repr__", repr),
+    ("__str__", str),
+    ("__hash__", hash),
+    ("__bool__", bool),
+    ("__nonzero__", bool),
+    ("__len__", len),
+    ("__iter__", iter),
+    ("__contains__", operator.contains),
+    ("__getitem__", operator.getitem),
+    ("__setitem__", operator.setitem),
+    ("__delitem__", operator.delitem),
+    ("__eq__", operator.eq),
+    ("__ne__", operator.ne),
+    ("__neg__", operator.neg),
+    ("__add__", operator.add),
+    ("__sub__", operator.sub),
+    ("__mul__", operator.mul),
+    ("__truediv__", operator.truediv),
+    ("__div__", operator.truediv),
+    ("__pow__", operator.pow),
+    ("__and__", operator.and_),
+    ("__or__", operator.or_),
+    ("__xor__", operator.xor),
+]:
+    setattr(DataProxy, _name, _forward(_function))
+
+for _name, _function in [
+    ("__radd__", operator.add),
+    ("__rsub__", operator.sub),
+    ("__rmul__", operator.mul),
+    ("__rtruediv__", operator.truediv),
+    ("__rdiv__", operator.truediv),
+]:
+    setattr(DataProxy, _name, _reflect(_function))
+
+for _name, _function in [
+    ("__iadd__", operator.iadd),
+    ("__isub__", operator.isub),
+    ("__imul__", operator.imul),
+    ("__itruediv__", operator.itruediv),
+    ("__idiv__", operator.itruediv),
+    ("__ipow__", operator.ipow),
+]:
+    setattr(DataProxy, _name, _inplace(_function))
 
 
 class DataEncoder(json.JSONEncoder):
@@ -185,6 +413,12 @@ class DataDecoder(json.JSONDecoder):
     * a class can be imported into the current scope from the info in ``o["dtype"]``; and
     * the imported class has a method ``from_data``.
 
+    Parameters
+    ----------
+    lazy : bool, optional
+        If True, reconstruct the data objects as :class:`~compas.data.DataProxy` objects,
+        which only construct the actual objects when these are used for the first time.
+
     See Also
     --------
     compas.data.Data
@@ -209,6 +443,7 @@ class DataDecoder(json.JSONDecoder):
     """
 
     def __init__(self, *args, **kwargs):
+        self.lazy = kwargs.pop("lazy", False)
         super(DataDecoder, self).__init__(object_hook=self.object_hook, *args, **kwargs)
 
     def object_hook(self, o):
@@ -249,12 +484,9 @@ class DataDecoder(json.JSONDecoder):
         if IDictionary and isinstance(o, IDictionary[str, object]):
             obj_value = {key: obj_value[key] for key in obj_value.Keys}
 
-        if hasattr(cls, "from_jsondata"):
-            obj = cls.from_jsondata(obj_value)
-        else:
-            obj = cls.from_data(obj_value)
+        guid = o["guid"] if "guid" in o else None
 
-        if "guid" in o:
-            obj._guid = uuid.UUID(o["guid"])
+        if self.lazy:
+            return DataProxy(cls, obj_value, guid, o["dtype"])
 
-        return obj
+        return _from_value(cls, obj_value, guid)
@@ -3,6 +3,8 @@ from __future__ import absolute_import
 from __future__ import division
 
 import json
+import re
+
 from compas import _iotools
 from compas.data import DataEncoder
 from compas.data import DataDecoder
@@ -99,13 +101,16 @@ def json_dumps(data, pretty=False, compact=False):
     return json.dumps(data, cls=DataEncoder, **kwargs)
 
 
-def json_load(fp):
+def json_load(fp, lazy=False):
     """Read COMPAS object data from a JSON file.
 
     Parameters
     ----------
     fp : path string | file-like object | URL string
         A readable path, a file-like object or a URL pointing to a file.
+    lazy : bool, optional
+        If True, return the COMPAS objects as :class:`~compas.data.DataProxy` objects,
+        which are only constructed when they are used for the first time.
 
     Returns
     -------
@@ -117,6 +122,7 @@ def json_load(fp):
     :class:`compas.data.json_dump`
     :class:`compas.data.json_dumps`
     :class:`compas.data.json_loads`
+    :class:`compas.data.json_iter`
 
     Examples
     --------
@@ -130,16 +136,19 @@ def json_load(fp):
 
     """
     with _iotools.open_file(fp, "r") as f:
-        return json.load(f, cls=DataDecoder)
+        return json.load(f, cls=DataDecoder, lazy=lazy)
 
 
-def json_loads(s):
+def json_loads(s, lazy=False):
     """Read COMPAS object data from a JSON string.
 
     Parameters
     ----------
     s : str
         A JSON data string.
+    lazy : bool, optional
+        If True, return the COMPAS objects as :class:`~compas.data.DataProxy` objects,
+        which are only constructed when they are used for the first time.
 
     Returns
     -------
@@ -163,7 +172,133 @@ def json_loads(s):
     True
 
     """
-    return json.loads(s, cls=DataDecoder)
+    return json.loads(s, cls=DataDecoder, lazy=lazy)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONReader(object):
+    """Incremental reader of the text of a JSON document.
+
+    Only the part of the document that was not decoded yet is kept in memory.
+    Values are decoded from the buffered text as soon as the text is complete.
+    """
+
+    def __init__(self, f, size=65536):
+        self.f = f
+        self.size = size
+        self.buffer = ""
+        self.index = 0
+        self.eof = False
+
+    def read(self):
+        # read at least as much as is already buffered
+        # such that large values are decoded in a logarithmic number of attempts
+        chunk = self.f.read(max(self.size, len(self.buffer) - self.index))
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.index :] + chunk
+        self.index = 0
+
+    def peek(self):
+        while True:
+            self.index = _WHITESPACE.match(self.buffer, self.index).end()
+            if self.index < len(self.buffer):
+                return self.buffer[self.index]
+            if self.eof:
+                return ""
+            self.read()
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                "Expecting one of {!r} at position {} of the remaining document.".format(chars, self.index)
+            )
+        self.index += 1
+        return char
+
+    def decode(self, decoder):
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.index)
+            except ValueError:
+                if self.eof:
+                    raise
+                self.read()
+                continue
+            # the end of numbers and literals is only known if the text continues after them
+            if end < len(self.buffer) or self.eof:
+                self.index = end
+                return value
+            self.read()
+
+
+def json_iter(fp, lazy=False):
+    """Iterate over the top-level items of a JSON file, without reading the entire file in memory.
+
+    Parameters
+    ----------
+    fp : path string | file-like object | URL string
+        A readable path, a file-like object or a URL pointing to a file.
+    lazy : bool, optional
+        If True, return the COMPAS objects as :class:`~compas.data.DataProxy` objects,
+        which are only constructed when they are used for the first time.
+
+    Yields
+    ------
+    object | tuple[str, object]
+        If the file contains a list, the (COMPAS) data of the items of the list.
+        If the file contains a dict, the keys and the (COMPAS) data of the values of the dict.
+
+    Raises
+    ------
+    ValueError
+        If the file does not contain a list or a dict, or if the document is invalid.
+
+    See Also
+    --------
+    :class:`compas.data.json_load`
+
+    Notes
+    -----
+    The file is read and decoded incrementally.
+    Only the items that have not been consumed by the iteration yet, and the unread part of the file are kept in memory.
+
+    A file containing a single COMPAS object is a dict with the keys "dtype", "value" and "guid".
+    To iterate over the items of such objects, load them with :func:`json_load`.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.geometry import Point
+    >>> from compas.data import json_iter
+    >>> compas.json_dump([Point(0, 0, 0), Point(1, 0, 0)], 'data.json')
+    >>> [point.x for point in json_iter('data.json')]
+    [0.0, 1.0]
+
+    """
+    decoder = DataDecoder(lazy=lazy)
+    with _iotools.open_file(fp, "r") as f:
+        reader = _JSONReader(f)
+        if reader.expect("[{") == "[":
+            if reader.peek() == "]":
+                return
+            while True:
+                yield reader.decode(decoder)
+                if reader.expect(",]") == "]":
+                    return
+        else:
+            if reader.peek() == "}":
+                return
+            while True:
+                key = reader.decode(decoder)
+                reader.expect(":")
+                yield key, reader.decode(decoder)
+                if reader.expect(",}") == "}":
+                    return
 
 
 def json_validate(filepath, schema):
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 
 import compas
 
+from .hashing import StructuralHash
 from .datastructure import Datastructure
 
 # =============================================================================
@@ -25,6 +26,7 @@ from .network.planarity import (
     network_embed_in_plane_proxy,
     network_find_crossings,
     network_is_crossed,
+    network_iter_crossings,
     network_is_planar,
     network_is_planar_embedding,
     network_is_xy,
@@ -40,6 +42,7 @@ if not compas.IPY:
         network_degree_matrix,
         network_laplacian_matrix,
     )
+    from .network.smoothing_numpy import network_smooth_centroid_numpy
 
 # =============================================================================
 # Halfedges
@@ -83,7 +86,7 @@ from .mesh.join import mesh_weld, meshes_join, meshes_join_and_weld  # used by o
 from .mesh.orientation import mesh_face_adjacency, mesh_flip_cycles, mesh_unify_cycles  # used by offset
 from .mesh.offset import mesh_offset, mesh_thicken
 from .mesh.planarisation import mesh_flatness, mesh_planarize_faces  # this needs to be moved to geometry
-from .mesh.remesh import trimesh_remesh
+from .mesh.remesh import trimesh_remesh, TrimeshRemesher
 from .mesh.slice import mesh_slice_plane
 from .mesh.smoothing import mesh_smooth_area, mesh_smooth_centerofmass, mesh_smooth_centroid
 from .mesh.subdivision import (
@@ -95,6 +98,7 @@ from .mesh.subdivision import (
     mesh_subdivide_quad,
     mesh_subdivide_tri,
     trimesh_subdivide_loop,
+    SubdivisionPlan,
 )
 from .mesh.transformations import mesh_transform, mesh_transformed  # this needs to be moved to geometry
 from .mesh.triangulation import mesh_quads_to_triangles
@@ -107,6 +111,7 @@ if not compas.IPY:
         mesh_face_matrix,
         mesh_laplacian_matrix,
         trimesh_cotangent_laplacian_matrix,
+        trimesh_gradient_matrix,
         trimesh_vertexarea_matrix,
     )
 
@@ -114,11 +119,27 @@ if not compas.IPY:
         mesh_oriented_bounding_box_numpy,
         mesh_oriented_bounding_box_xy_numpy,
     )  # this needs to be moved to geometry
+    from .mesh.bvh_numpy import MeshBVH
     from .mesh.contours_numpy import mesh_isolines_numpy, mesh_contours_numpy  # this needs to be moved to geometry
     from .mesh.descent_numpy import trimesh_descent  # this needs to be moved to geometry
-    from .mesh.geodesics_numpy import mesh_geodesic_distances_numpy
+    from .mesh.geodesics_numpy import mesh_geodesic_distances_numpy, HeatGeodesicSolver
+    from .mesh.geometry_numpy import (
+        mesh_edges_lengths_numpy,
+        mesh_faces_areas_numpy,
+        mesh_faces_centers_numpy,
+        mesh_faces_centroids_numpy,
+        mesh_faces_flatness_numpy,
+        mesh_faces_normals_numpy,
+        mesh_vertices_areas_numpy,
+        mesh_vertices_normals_numpy,
+    )
     from .mesh.pull_numpy import trimesh_pull_points_numpy  # this needs to be moved to geometry
-    from .mesh.smoothing_numpy import trimesh_smooth_laplacian_cotangent
+    from .mesh.smoothing_numpy import (
+        mesh_smooth_area_numpy,
+        mesh_smooth_centerofmass_numpy,
+        mesh_smooth_centroid_numpy,
+        trimesh_smooth_laplacian_cotangent,
+    )
     from .mesh.transformations_numpy import (
         mesh_transform_numpy,
         mesh_transformed_numpy,
@@ -163,6 +184,7 @@ BaseVolMesh = VolMesh
 
 __all__ = [
     "Datastructure",
+    "StructuralHash",
     # Graphs
     "Graph",
     # Networks
@@ -179,6 +201,7 @@ __all__ = [
     "network_find_cycles",
     "network_is_connected",
     "network_is_crossed",
+    "network_iter_crossings",
     "network_is_planar_embedding",
     "network_is_planar",
     "network_is_xy",
@@ -194,6 +217,8 @@ __all__ = [
     # Meshes
     "BaseMesh",
     "Mesh",
+    "SubdivisionPlan",
+    "TrimeshRemesher",
     "mesh_add_vertex_to_face_edge",
     "mesh_bounding_box_xy",
     "mesh_bounding_box",
@@ -283,23 +308,38 @@ if not compas.IPY:
         "network_connectivity_matrix",
         "network_degree_matrix",
         "network_laplacian_matrix",
+        "network_smooth_centroid_numpy",
         # Meshes
         "mesh_adjacency_matrix",
+        "MeshBVH",
         "mesh_connectivity_matrix",
         "mesh_contours_numpy",
         "mesh_degree_matrix",
+        "mesh_edges_lengths_numpy",
         "mesh_face_matrix",
+        "mesh_faces_areas_numpy",
+        "mesh_faces_centers_numpy",
+        "mesh_faces_centroids_numpy",
+        "mesh_faces_flatness_numpy",
+        "mesh_faces_normals_numpy",
         "mesh_geodesic_distances_numpy",
+        "HeatGeodesicSolver",
         "mesh_isolines_numpy",
         "mesh_laplacian_matrix",
         "mesh_oriented_bounding_box_numpy",
         "mesh_oriented_bounding_box_xy_numpy",
+        "mesh_smooth_area_numpy",
+        "mesh_smooth_centerofmass_numpy",
+        "mesh_smooth_centroid_numpy",
         "mesh_transform_numpy",
         "mesh_transformed_numpy",
         "trimesh_cotangent_laplacian_matrix",
         "trimesh_descent",
+        "trimesh_gradient_matrix",
         "trimesh_pull_points_numpy",
         "trimesh_samplepoints_numpy",
         "trimesh_smooth_laplacian_cotangent",
+        "mesh_vertices_areas_numpy",
+        "mesh_vertices_normals_numpy",
         "trimesh_vertexarea_matrix",
     ]
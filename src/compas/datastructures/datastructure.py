@@ -2,13 +2,103 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from copy import deepcopy
+
+from compas import PY3
 from compas.data import Data
+from compas.datastructures.hashing import StructuralHash
 
 __all__ = ["Datastructure"]
 
 
+if PY3:
+    IMMUTABLE = (type(None), bool, int, float, str, bytes)
+else:
+    IMMUTABLE = (type(None), bool, int, long, float, str, unicode)  # noqa: F821
+
+
+def copy_attributes(attr):
+    """Make an independent copy of a dictionary of attributes.
+
+    Parameters
+    ----------
+    attr : dict[str, Any]
+        The attributes.
+
+    Returns
+    -------
+    dict[str, Any]
+        A new dictionary sharing all immutable values with the original,
+        and containing deep copies of all other values.
+
+    """
+    copy = attr.copy()
+    for name, value in attr.items():
+        if type(value) not in IMMUTABLE:
+            copy[name] = deepcopy(value)
+    return copy
+
+
 class Datastructure(Data):
     """Base class for all data structures."""
 
     def __init__(self):
         super(Datastructure, self).__init__()
+
+    def _hash_sections(self):
+        """The general attributes and the sections of elements of the data structure, for computing structural hashes.
+
+        Returns
+        -------
+        tuple[object, dict[str, tuple[mapping, callable, callable | None]]]
+
+        """
+        raise NotImplementedError
+
+    def structural_hash(self, previous=None, **changed):
+        """Compute a structure-aware hash of the data structure, or update a previously computed one.
+
+        Parameters
+        ----------
+        previous : :class:`~compas.datastructures.StructuralHash`, optional
+            A hash of this data structure computed before it was modified.
+        **changed : dict[str, sequence[hashable]], optional
+            The identifiers of all elements that were added, removed or modified since `previous` was computed,
+            per section of the data structure.
+            The available sections depend on the type of data structure.
+
+        Returns
+        -------
+        :class:`~compas.datastructures.StructuralHash`
+
+        Raises
+        ------
+        ValueError
+            If the name of a section is not valid.
+
+        Notes
+        -----
+        Without a previous hash, all elements of the data structure are hashed.
+        With a previous hash, only the chunks of elements containing the changed elements are hashed again.
+        Note that the hash will not be correct if modified elements are not included in `changed`.
+
+        Unlike :meth:`~compas.data.Data.sha256`, the hash does not depend on the order of the elements and attributes,
+        nor on the guid of the data structure.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+        >>> before = mesh.structural_hash()
+        >>> mesh.vertex_attribute(0, "z", 1.0)
+        >>> after = mesh.structural_hash(before, vertices=[0])
+        >>> after == before
+        False
+        >>> after.diff(before)
+        ['vertices']
+        >>> after == mesh.structural_hash()
+        True
+
+        """
+        attributes, sections = self._hash_sections()
+        return StructuralHash(attributes, sections, previous=previous, changed=changed)
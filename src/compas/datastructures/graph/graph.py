@@ -6,10 +6,29 @@ from random import sample
 from ast import literal_eval
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import copy_attributes
 from compas.datastructures.attributes import NodeAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 
 
+class _Adjacency(object):
+    """Mapping of the nodes with outgoing edges, for the edge section of structural hashes.
+
+    Isolated nodes have an empty entry in :attr:`Graph.edge`,
+    but they should not affect the hash of the edges.
+    """
+
+    def __init__(self, edge):
+        self.edge = edge
+
+    def __iter__(self):
+        edge = self.edge
+        return (u for u in edge if edge[u])
+
+    def __contains__(self, u):
+        return bool(self.edge.get(u))
+
+
 class Graph(Datastructure):
     """Base graph data structure for describing the topological relationships between nodes connected by edges.
 
@@ -130,6 +149,33 @@ class Graph(Datastructure):
                 self.add_edge(u, v, attr_dict=attr)
         self._max_node = data.get("max_node", self._max_node)
 
+    def _copy(self, cls):
+        other = cls()
+        other.attributes.update(copy_attributes(self.attributes))
+        other.default_node_attributes.update(copy_attributes(self.default_node_attributes))
+        other.default_edge_attributes.update(copy_attributes(self.default_edge_attributes))
+        other.node = {key: copy_attributes(attr) for key, attr in self.node.items()}
+        other.edge = {u: {v: copy_attributes(attr) for v, attr in nbrs.items()} for u, nbrs in self.edge.items()}
+        other.adjacency = {u: nbrs.copy() for u, nbrs in self.adjacency.items()}
+        other._max_node = self._max_node
+        return other
+
+    def _hash_sections(self):
+        edge = self.edge
+
+        def edge_element(u):
+            return [[v, edge[u][v]] for v in sorted(edge[u], key=repr)]
+
+        def edge_members(edge):
+            return [edge[0]]
+
+        attributes = [self.attributes, self.default_node_attributes, self.default_edge_attributes]
+        sections = {
+            "nodes": (self.node, self.node.__getitem__, None),
+            "edges": (_Adjacency(edge), edge_element, edge_members),
+        }
+        return attributes, sections
+
     def to_jsondata(self):
         """Returns a dictionary of structured data representing the graph that can be serialised to JSON format.
 
@@ -0,0 +1,280 @@
+"""
+Incrementally updated topological information of the half-edge data structure.
+
+The cache is maintained per vertex.
+Every modification of the topology marks the affected vertices as "dirty",
+and the information of the dirty vertices is recomputed the next time the cache is queried.
+The global properties of the data structure, such as the number of boundary half-edges
+and the set of non-manifold vertices, are updated from the differences between the old and new per-vertex information.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+__all__ = ["TopologyCache"]
+
+
+class TopologyCache(object):
+    """Cache of derived topological information of a half-edge data structure.
+
+    The cache is created with :meth:`compas.datastructures.HalfEdge.enable_topology_cache`
+    and is updated incrementally by the methods of the data structure that modify its topology.
+
+    Parameters
+    ----------
+    halfedge : :class:`~compas.datastructures.HalfEdge`
+        The data structure.
+
+    Attributes
+    ----------
+    hits : int
+        The number of queries answered with the cached information.
+    misses : int
+        The number of queries for which (part of) the cached information had to be recomputed first.
+    updates : int
+        The total number of vertices for which the cached information was recomputed.
+
+    """
+
+    def __init__(self, halfedge):
+        self.halfedge = halfedge
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+        self.reset()
+
+    def __str__(self):
+        tpl = "<TopologyCache with {} hits, {} misses, {} updates>"
+        return tpl.format(self.hits, self.misses, self.updates)
+
+    def reset(self):
+        """Discard all cached information.
+
+        Returns
+        -------
+        None
+
+        """
+        self._vertex = {}
+        self._face = {}
+        self._naked = 0
+        self._nonmanifold = set()
+        self._unchecked = set()
+        self._boundaries = None
+        self._dirty = set(self.halfedge.vertices())
+
+    def reset_stats(self):
+        """Reset the counters of the cache.
+
+        Returns
+        -------
+        None
+
+        """
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+
+    def stats(self):
+        """Summarize the use of the cache.
+
+        Returns
+        -------
+        dict[str, int | float]
+            The numbers of hits, misses and updated vertices, and the hit rate.
+
+        """
+        queries = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "updates": self.updates,
+            "rate": self.hits / queries if queries else 0.0,
+        }
+
+    def invalidate(self, vertices=None):
+        """Invalidate the cached information.
+
+        Parameters
+        ----------
+        vertices : list[int], optional
+            The vertices of which the topology was modified.
+            This includes the vertices of all faces that were added, removed, or modified,
+            and all vertices of which the outgoing half-edges changed.
+            If None, all cached information is discarded.
+
+        Returns
+        -------
+        None
+
+        """
+        if vertices is None:
+            self.reset()
+        else:
+            self._dirty.update(vertices)
+
+    def _update(self):
+        halfedge = self.halfedge
+        for key in self._dirty:
+            old = self._vertex.pop(key, None)
+            if old is not None and old[0]:
+                self._naked -= old[0]
+                self._boundaries = None
+            self._nonmanifold.discard(key)
+            if key not in halfedge.vertex:
+                self._unchecked.discard(key)
+                continue
+            naked = 0
+            for fkey in halfedge.halfedge[key].values():
+                if fkey is None:
+                    naked += 1
+                else:
+                    self._face.pop(fkey, None)
+            if naked:
+                self._naked += naked
+                self._boundaries = None
+            self._unchecked.add(key)
+            self._vertex[key] = naked, len(halfedge.halfedge[key])
+        self.updates += len(self._dirty)
+        self._dirty = set()
+
+    def _check(self, vertices):
+        # the manifold check is expensive and only done when needed
+        # stopping at the first non-manifold vertex
+        for key in vertices:
+            self._unchecked.discard(key)
+            if not self.halfedge._is_vertex_manifold(key):
+                self._nonmanifold.add(key)
+                return
+
+    def _query(self, dirty):
+        if dirty:
+            self.misses += 1
+            self._update()
+        else:
+            self.hits += 1
+
+    def vertex_degree(self, key):
+        """Count the neighbors of a vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        int
+
+        """
+        self._query(key in self._dirty)
+        return self._vertex[key][1]
+
+    def is_vertex_on_boundary(self, key):
+        """Verify that a vertex is on a boundary.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        bool
+
+        """
+        self._query(key in self._dirty)
+        return self._vertex[key][0] > 0
+
+    def is_vertex_manifold(self, key):
+        """Verify that the faces incident to a vertex form a closed or an open fan.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        bool
+
+        """
+        self._query(key in self._dirty or key in self._unchecked)
+        if key in self._unchecked:
+            self._check([key])
+        return self._vertex[key] is not None and key not in self._nonmanifold
+
+    def face_neighbors(self, fkey):
+        """Return the neighbors of a face across its edges.
+
+        Parameters
+        ----------
+        fkey : int
+            The identifier of the face.
+
+        Returns
+        -------
+        list[int]
+
+        """
+        if self._dirty:
+            self._update()
+        nbrs = self._face.get(fkey) if fkey in self.halfedge.face else None
+        if nbrs is None:
+            self.misses += 1
+            halfedge = self.halfedge.halfedge
+            nbrs = []
+            for u, v in self.halfedge.face_halfedges(fkey):
+                nbr = halfedge[v][u]
+                if nbr is not None:
+                    nbrs.append(nbr)
+            self._face[fkey] = nbrs
+        else:
+            self.hits += 1
+        return nbrs[:]
+
+    def is_closed(self):
+        """Verify that the data structure is not empty and has no boundary half-edges.
+
+        Returns
+        -------
+        bool
+
+        """
+        self._query(self._dirty)
+        return bool(self._vertex) and not self._naked
+
+    def is_manifold(self):
+        """Verify that the data structure is not empty and all its vertices are manifold.
+
+        Returns
+        -------
+        bool
+
+        """
+        self._query(self._dirty or (self._unchecked and not self._nonmanifold))
+        if not self._nonmanifold:
+            self._check(list(self._unchecked))
+        return bool(self._vertex) and not self._nonmanifold
+
+    def boundaries(self, compute):
+        """Return the vertices of all boundaries.
+
+        Parameters
+        ----------
+        compute : callable
+            The function computing the boundaries from scratch, if necessary.
+
+        Returns
+        -------
+        list[list[int]]
+
+        """
+        if self._dirty:
+            self._update()
+        if self._boundaries is None:
+            self.misses += 1
+            self._boundaries = compute()
+        else:
+            self.hits += 1
+        return [vertices[:] for vertices in self._boundaries]
@@ -2,12 +2,18 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from operator import itemgetter
 from random import sample
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import copy_attributes
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
+from compas.datastructures.halfedge.storage import ArrayVertexStore
+from compas.datastructures.halfedge.storage import ArrayFaceStore
+from compas.datastructures.halfedge.storage import ArrayHalfEdgeStore
+from compas.datastructures.halfedge.cache import TopologyCache
 
 from compas.utilities import pairwise
 from compas.utilities import window
@@ -26,6 +32,16 @@ class HalfEdge(Datastructure):
         Default values for edge attributes.
     default_face_attributes: dict, optional
         Default values for face attributes.
+    storage : Literal['dict', 'array'], optional
+        The storage backend for vertices, faces and half-edges.
+        The default backend uses nested dictionaries.
+        The "array" backend stores the same information in contiguous arrays,
+        which requires significantly less memory for large meshes.
+        However, every access to an element goes through a mapping view implemented in Python.
+        Building a mesh and traversing its topology element by element
+        are therefore several times slower (about 4 to 7 times in CPython) than with the default backend.
+        Use it for large meshes that are mostly processed in bulk,
+        for example with :meth:`vertices_attributes_array`.
 
     Attributes
     ----------
@@ -106,15 +122,14 @@ class HalfEdge(Datastructure):
         default_vertex_attributes=None,
         default_edge_attributes=None,
         default_face_attributes=None,
+        storage=None,
     ):
         super(HalfEdge, self).__init__()
+        if storage not in (None, "dict", "array"):
+            raise ValueError("Storage backend not supported: {}".format(storage))
+        self._storage = storage or "dict"
         self._max_vertex = -1
         self._max_face = -1
-        self.vertex = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
-        self.edgedata = {}
         self.attributes = {"name": name or "HalfEdge"}
         self.default_vertex_attributes = {}
         self.default_edge_attributes = {}
@@ -125,6 +140,7 @@ class HalfEdge(Datastructure):
             self.default_edge_attributes.update(default_edge_attributes)
         if default_face_attributes:
             self.default_face_attributes.update(default_face_attributes)
+        self._init_storage()
 
     def __str__(self):
         tpl = "<HalfEdge with {} vertices, {} faces, {} edges>"
@@ -146,6 +162,11 @@ class HalfEdge(Datastructure):
     def adjacency(self):
         return self.halfedge
 
+    @property
+    def storage(self):
+        """str - The storage backend of the data structure, either "dict" or "array"."""
+        return self._storage
+
     @property
     def data(self):
         """Returns a dictionary of structured data representing the data structure.
@@ -163,13 +184,19 @@ class HalfEdge(Datastructure):
             The data dictionary.
 
         """
+        vertex = self.vertex
+        face = self.face
+        if not isinstance(vertex, dict):
+            vertex = vertex.to_dict()
+        if not isinstance(face, dict):
+            face = face.to_dict()
         return {
             "attributes": self.attributes,
             "dva": self.default_vertex_attributes,
             "dea": self.default_edge_attributes,
             "dfa": self.default_face_attributes,
-            "vertex": self.vertex,
-            "face": self.face,
+            "vertex": vertex,
+            "face": face,
             "facedata": self.facedata,
             "edgedata": self.edgedata,
             "max_vertex": self._max_vertex,
@@ -178,11 +205,7 @@ class HalfEdge(Datastructure):
 
     @data.setter
     def data(self, data):
-        self.vertex = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
-        self.edgedata = {}
+        self._init_storage()
         self._max_vertex = -1
         self._max_face = -1
         self.attributes.update(data.get("attributes") or {})
@@ -201,10 +224,78 @@ class HalfEdge(Datastructure):
         self._max_vertex = data.get("max_vertex", self._max_vertex)
         self._max_face = data.get("max_face", self._max_face)
 
+    def _copy(self, cls):
+        other = cls()
+        other._storage = self._storage
+        other.attributes.update(copy_attributes(self.attributes))
+        other.default_vertex_attributes.update(copy_attributes(self.default_vertex_attributes))
+        other.default_edge_attributes.update(copy_attributes(self.default_edge_attributes))
+        other.default_face_attributes.update(copy_attributes(self.default_face_attributes))
+        if self._storage == "array":
+            other.vertex = self.vertex.copy()
+            other.halfedge = self.halfedge.copy()
+            other.face = self.face.copy()
+        else:
+            other.vertex = {key: copy_attributes(attr) for key, attr in self.vertex.items()}
+            other.halfedge = {key: nbrs.copy() for key, nbrs in self.halfedge.items()}
+            other.face = {fkey: vertices[:] for fkey, vertices in self.face.items()}
+        other.facedata = {fkey: copy_attributes(attr) for fkey, attr in self.facedata.items()}
+        other.edgedata = {edge: copy_attributes(attr) for edge, attr in self.edgedata.items()}
+        other._max_vertex = self._max_vertex
+        other._max_face = self._max_face
+        return other
+
+    def _hash_sections(self):
+        vertex = self.vertex
+        face = self.face
+        facedata = self.facedata
+        edgedata = self.edgedata
+
+        def vertex_element(key):
+            attr = vertex[key]
+            return attr if isinstance(attr, dict) else dict(attr)
+
+        def face_element(fkey):
+            return [list(face[fkey]), facedata.get(fkey) or {}]
+
+        def edge_members(edge):
+            return [str(tuple(sorted(edge))) if isinstance(edge, tuple) else edge]
+
+        attributes = [
+            self.attributes,
+            self.default_vertex_attributes,
+            self.default_edge_attributes,
+            self.default_face_attributes,
+        ]
+        sections = {
+            "vertices": (vertex, vertex_element, None),
+            "faces": (face, face_element, None),
+            "edges": (edgedata, edgedata.__getitem__, edge_members),
+        }
+        return attributes, sections
+
     # --------------------------------------------------------------------------
     # helpers
     # --------------------------------------------------------------------------
 
+    def _init_storage(self):
+        if getattr(self, "_storage", None) == "array":
+            columns = [name for name, value in self.default_vertex_attributes.items() if isinstance(value, float)]
+            self.vertex = ArrayVertexStore(columns=columns)
+            self.halfedge = ArrayHalfEdgeStore()
+            self.face = ArrayFaceStore()
+        else:
+            self.vertex = {}
+            self.halfedge = {}
+            self.face = {}
+        self.facedata = {}
+        self.edgedata = {}
+        self._cache = {}
+        if getattr(self, "_topology", None) is not None:
+            self._topology.reset()
+        else:
+            self._topology = None
+
     def clear(self):
         """Clear all the mesh data.
 
@@ -218,14 +309,97 @@ class HalfEdge(Datastructure):
         del self.halfedge
         del self.face
         del self.facedata
-        self.vertex = {}
-        self.edgedata = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
+        self._init_storage()
         self._max_vertex = -1
         self._max_face = -1
 
+    def clear_cache(self, vertices=None):
+        """Clear all data cached on the data structure.
+
+        Derived data, such as the matrix operators of a mesh, can be cached on the data structure.
+        The cache is cleared automatically whenever the topology is modified through the methods of the data structure.
+        Call this method after modifying the vertex, face or half-edge dictionaries directly.
+
+        Parameters
+        ----------
+        vertices : list[int], optional
+            The vertices of which the topology was modified directly.
+            If provided, the topological information cached for all other vertices is kept.
+            Otherwise, the topology cache is reset as well.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        :meth:`enable_topology_cache`
+
+        """
+        self._cache.clear()
+        if self._topology is not None:
+            self._topology.invalidate(vertices)
+
+    @property
+    def topology_cache(self):
+        """:class:`compas.datastructures.halfedge.cache.TopologyCache` - The cache of topological information, if enabled."""
+        return self._topology
+
+    def enable_topology_cache(self):
+        """Cache topological information and update it incrementally when the topology changes.
+
+        With the cache enabled, :meth:`vertex_degree`, :meth:`is_vertex_on_boundary`, :meth:`face_neighbors`,
+        :meth:`is_closed` and :meth:`is_manifold` (and the boundary queries of meshes)
+        only recompute the information of the vertices that were modified since the previous query.
+
+        Returns
+        -------
+        :class:`compas.datastructures.halfedge.cache.TopologyCache`
+            The cache, with counters of its hits and misses.
+
+        See Also
+        --------
+        :meth:`disable_topology_cache`, :meth:`clear_cache`
+
+        Notes
+        -----
+        The cache is updated by all methods of the data structure, and by the functions in
+        :mod:`compas.datastructures.mesh.operations`, that modify the topology.
+        After modifying the vertex, face, or half-edge dictionaries directly,
+        call :meth:`clear_cache` with the modified vertices.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> mesh = Mesh.from_meshgrid(dx=3, nx=3)
+        >>> cache = mesh.enable_topology_cache()
+        >>> mesh.is_vertex_on_boundary(5)
+        False
+        >>> mesh.delete_face(4)
+        >>> mesh.is_vertex_on_boundary(5)
+        True
+        >>> cache.updates
+        20
+
+        """
+        if self._topology is None:
+            self._topology = TopologyCache(self)
+        return self._topology
+
+    def disable_topology_cache(self):
+        """Discard the cache of topological information.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        :meth:`enable_topology_cache`
+
+        """
+        self._topology = None
+
     def vertex_sample(self, size=1):
         """A random sample of the vertices.
 
@@ -375,6 +549,9 @@ class HalfEdge(Datastructure):
         if key not in self.vertex:
             self.vertex[key] = {}
             self.halfedge[key] = {}
+            self._cache.clear()
+            if self._topology is not None:
+                self._topology.invalidate([key])
         attr = attr_dict or {}
         attr.update(kwattr)
         self.vertex[key].update(attr)
@@ -432,6 +609,9 @@ class HalfEdge(Datastructure):
         attr.update(kwattr)
         self.face[fkey] = vertices
         self.facedata.setdefault(fkey, attr)
+        self._cache.clear()
+        if self._topology is not None:
+            self._topology.invalidate(vertices)
         for u, v in pairwise(vertices + vertices[:1]):
             self.halfedge[u][v] = fkey
             if u not in self.halfedge[v]:
@@ -466,7 +646,13 @@ class HalfEdge(Datastructure):
         culling (:meth:`cull_vertices`).
 
         """
+        self._cache.clear()
         nbrs = self.vertex_neighbors(key)
+        if self._topology is not None:
+            self._topology.invalidate([key])
+            self._topology.invalidate(nbrs)
+            for fkey in self.vertex_faces(key):
+                self._topology.invalidate(self.face[fkey])
         for nbr in nbrs:
             fkey = self.halfedge[key][nbr]
             if fkey is None:
@@ -486,6 +672,8 @@ class HalfEdge(Datastructure):
                 if self.halfedge[nbr][n] is None and self.halfedge[n][nbr] is None:
                     del self.halfedge[nbr][n]
                     del self.halfedge[n][nbr]
+                    if self._topology is not None:
+                        self._topology.invalidate([n])
                     edge = "-".join(map(str, sorted([nbr, n])))
                     if edge in self.edgedata:
                         del self.edgedata[edge]
@@ -516,6 +704,9 @@ class HalfEdge(Datastructure):
         culling (:meth:`cull_vertices`).
 
         """
+        self._cache.clear()
+        if self._topology is not None:
+            self._topology.invalidate(self.face[fkey])
         for u, v in self.face_halfedges(fkey):
             self.halfedge[u][v] = None
             if self.halfedge[v][u] is None:
@@ -540,13 +731,19 @@ class HalfEdge(Datastructure):
         :meth:`delete_vertex`
 
         """
+        self._cache.clear()
+        unused = []
         for u in list(self.vertices()):
             if u not in self.halfedge:
                 del self.vertex[u]
+                unused.append(u)
             else:
                 if not self.halfedge[u]:
                     del self.vertex[u]
                     del self.halfedge[u]
+                    unused.append(u)
+        if self._topology is not None:
+            self._topology.invalidate(unused)
 
     cull_vertices = remove_unused_vertices
 
@@ -1198,7 +1395,16 @@ class HalfEdge(Datastructure):
             for key in keys:
                 self.vertex_attributes(key, names, values)
             return
-        return [self.vertex_attributes(key, names) for key in keys]
+        if not names:
+            return [self.vertex_attributes(key, names) for key in keys]
+        vertex = self.vertex
+        defaults = [self.default_vertex_attributes.get(name) for name in names]
+        names_defaults = list(zip(names, defaults))
+        values = []
+        for key in keys:
+            attr = vertex[key]
+            values.append([attr[name] if name in attr else default for name, default in names_defaults])
+        return values
 
     def update_default_face_attributes(self, attr_dict=None, **kwattr):
         """Update the default face attributes.
@@ -1686,6 +1892,511 @@ class HalfEdge(Datastructure):
             return
         return [self.edge_attributes(edge, names) for edge in edges]
 
+    # --------------------------------------------------------------------------
+    # attribute arrays
+    # --------------------------------------------------------------------------
+
+    def vertices_attribute_array(self, name, keys=None, dtype=float):
+        """Get the values of an attribute of multiple vertices as a NumPy array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        keys : list[int], optional
+            A list of vertex identifiers.
+            Defaults to all vertices, in iteration order.
+        dtype : type, optional
+            The data type of the array.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys),).
+
+        Raises
+        ------
+        KeyError
+            If any of the vertices does not exist.
+
+        See Also
+        --------
+        :meth:`vertices_attributes_array`, :meth:`set_vertices_attribute_array`
+
+        """
+        return self.vertices_attributes_array([name], keys=keys, dtype=dtype)[:, 0]
+
+    def vertices_attributes_array(self, names, keys=None, dtype=float):
+        """Get the values of multiple attributes of multiple vertices as a NumPy array.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            The names of the attributes.
+            A string is interpreted as a sequence of single-character names, e.g. ``"xyz"``.
+        keys : list[int], optional
+            A list of vertex identifiers.
+            Defaults to all vertices, in iteration order.
+        dtype : type, optional
+            The data type of the array.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys), len(names)).
+
+        Raises
+        ------
+        KeyError
+            If any of the vertices does not exist.
+
+        See Also
+        --------
+        :meth:`vertices_attribute_array`, :meth:`set_vertices_attributes_array`
+
+        Notes
+        -----
+        The array is a copy of the attribute values.
+        Changing the array does not change the attributes of the vertices.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0]], [[0, 1, 2]])
+        >>> mesh.vertices_attributes_array('xyz').shape
+        (3, 3)
+
+        """
+        from numpy import asarray
+
+        names = list(names)
+        if (
+            isinstance(self.vertex, ArrayVertexStore)
+            and all(name in self.vertex.columns for name in names)
+            and not self.vertex.has_extras(names)
+        ):
+            if keys is not None:
+                for key in keys:
+                    if key not in self.vertex:
+                        raise KeyError(key)
+            defaults = [self.default_vertex_attributes.get(name) for name in names]
+            values = self.vertex.get_columns_numpy(names, keys, defaults)
+            return asarray(values, dtype=dtype)
+        if keys is None:
+            keys = list(self.vertices())
+        vertex = self.vertex
+        if names:
+            # fast path for attributes that are explicitly set on all vertices
+            getter = itemgetter(*names)
+            try:
+                values = [getter(vertex[key]) for key in keys]
+            except KeyError:
+                pass
+            else:
+                return asarray(values, dtype=dtype).reshape((len(keys), len(names)))
+        defaults = [self.default_vertex_attributes.get(name) for name in names]
+        values = []
+        for key in keys:
+            attr = vertex[key]
+            values.append([attr[name] if name in attr else default for name, default in zip(names, defaults)])
+        return asarray(values, dtype=dtype).reshape((len(keys), len(names)))
+
+    def set_vertices_attribute_array(self, name, values, keys=None):
+        """Set the values of an attribute of multiple vertices from an array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        values : array-like
+            The values of the attribute, one per vertex.
+        keys : list[int], optional
+            A list of vertex identifiers.
+            Defaults to all vertices, in iteration order.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If any of the vertices does not exist.
+
+        See Also
+        --------
+        :meth:`vertices_attribute_array`, :meth:`set_vertices_attributes_array`
+
+        """
+        from numpy import asarray
+
+        values = asarray(values)
+        self.set_vertices_attributes_array([name], values.reshape((-1, 1)), keys=keys)
+
+    def set_vertices_attributes_array(self, names, values, keys=None):
+        """Set the values of multiple attributes of multiple vertices from an array.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            The names of the attributes.
+            A string is interpreted as a sequence of single-character names, e.g. ``"xyz"``.
+        values : array-like
+            An array of shape (len(keys), len(names)).
+        keys : list[int], optional
+            A list of vertex identifiers.
+            Defaults to all vertices, in iteration order.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If any of the vertices does not exist.
+        ValueError
+            If the shape of the values does not match the number of vertices and attributes.
+
+        See Also
+        --------
+        :meth:`vertices_attributes_array`, :meth:`set_vertices_attribute_array`
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0]], [[0, 1, 2]])
+        >>> xyz = mesh.vertices_attributes_array('xyz')
+        >>> mesh.set_vertices_attributes_array('xyz', xyz + 1.0)
+        >>> mesh.vertex_coordinates(0)
+        [1.0, 1.0, 1.0]
+
+        """
+        from numpy import asarray
+
+        names = list(names)
+        values = asarray(values)
+        count = self.number_of_vertices() if keys is None else len(keys)
+        if values.shape != (count, len(names)):
+            raise ValueError("Expected an array of shape {}, got {}.".format((count, len(names)), values.shape))
+        if keys is not None:
+            # validate all keys first, such that nothing is written if any of them is invalid
+            for key in keys:
+                if key not in self.vertex:
+                    raise KeyError(key)
+        if (
+            isinstance(self.vertex, ArrayVertexStore)
+            and all(name in self.vertex.columns for name in names)
+            and values.dtype.kind in "fiu"
+        ):
+            self.vertex.set_columns_numpy(names, values, keys)
+            return
+        if keys is None:
+            keys = list(self.vertices())
+        vertex = self.vertex
+        for key, row in zip(keys, values.tolist()):
+            attr = vertex[key]
+            for name, value in zip(names, row):
+                attr[name] = value
+
+    def faces_attribute_array(self, name, keys=None, dtype=float):
+        """Get the values of an attribute of multiple faces as a NumPy array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        keys : list[int], optional
+            A list of face identifiers.
+            Defaults to all faces, in iteration order.
+        dtype : type, optional
+            The data type of the array.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys),).
+
+        Raises
+        ------
+        KeyError
+            If any of the faces does not exist.
+
+        See Also
+        --------
+        :meth:`faces_attributes_array`, :meth:`set_faces_attribute_array`
+
+        """
+        return self.faces_attributes_array([name], keys=keys, dtype=dtype)[:, 0]
+
+    def faces_attributes_array(self, names, keys=None, dtype=float):
+        """Get the values of multiple attributes of multiple faces as a NumPy array.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the attributes.
+        keys : list[int], optional
+            A list of face identifiers.
+            Defaults to all faces, in iteration order.
+        dtype : type, optional
+            The data type of the array.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys), len(names)).
+
+        Raises
+        ------
+        KeyError
+            If any of the faces does not exist.
+
+        See Also
+        --------
+        :meth:`faces_attribute_array`, :meth:`set_faces_attributes_array`
+
+        """
+        from numpy import asarray
+
+        names = list(names)
+        if keys is None:
+            keys = list(self.faces())
+        defaults = [self.default_face_attributes.get(name) for name in names]
+        values = []
+        for key in keys:
+            if key not in self.face:
+                raise KeyError(key)
+            attr = self.facedata.get(key) or {}
+            values.append([attr[name] if name in attr else default for name, default in zip(names, defaults)])
+        return asarray(values, dtype=dtype).reshape((len(keys), len(names)))
+
+    def set_faces_attribute_array(self, name, values, keys=None):
+        """Set the values of an attribute of multiple faces from an array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        values : array-like
+            The values of the attribute, one per face.
+        keys : list[int], optional
+            A list of face identifiers.
+            Defaults to all faces, in iteration order.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If any of the faces does not exist.
+
+        See Also
+        --------
+        :meth:`faces_attribute_array`, :meth:`set_faces_attributes_array`
+
+        """
+        from numpy import asarray
+
+        values = asarray(values)
+        self.set_faces_attributes_array([name], values.reshape((-1, 1)), keys=keys)
+
+    def set_faces_attributes_array(self, names, values, keys=None):
+        """Set the values of multiple attributes of multiple faces from an array.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the attributes.
+        values : array-like
+            An array of shape (len(keys), len(names)).
+        keys : list[int], optional
+            A list of face identifiers.
+            Defaults to all faces, in iteration order.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If any of the faces does not exist.
+        ValueError
+            If the shape of the values does not match the number of faces and attributes.
+
+        See Also
+        --------
+        :meth:`faces_attributes_array`, :meth:`set_faces_attribute_array`
+
+        """
+        from numpy import asarray
+
+        names = list(names)
+        if keys is None:
+            keys = list(self.faces())
+        values = asarray(values)
+        if values.shape != (len(keys), len(names)):
+            raise ValueError("Expected an array of shape {}, got {}.".format((len(keys), len(names)), values.shape))
+        for key in keys:
+            if key not in self.face:
+                raise KeyError(key)
+        for key, row in zip(keys, values.tolist()):
+            attr = self.facedata.setdefault(key, {})
+            for name, value in zip(names, row):
+                attr[name] = value
+
+    def edges_attribute_array(self, name, keys=None, dtype=float):
+        """Get the values of an attribute of multiple edges as a NumPy array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        keys : list[tuple[int, int]], optional
+            A list of edge identifiers.
+            Defaults to all edges, in iteration order.
+        dtype : type, optional
+            The data type of the array.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys),).
+
+        Raises
+        ------
+        KeyError
+            If any of the edges does not exist.
+
+        See Also
+        --------
+        :meth:`edges_attributes_array`, :meth:`set_edges_attribute_array`
+
+        """
+        return self.edges_attributes_array([name], keys=keys, dtype=dtype)[:, 0]
+
+    def edges_attributes_array(self, names, keys=None, dtype=float):
+        """Get the values of multiple attributes of multiple edges as a NumPy array.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the attributes.
+        keys : list[tuple[int, int]], optional
+            A list of edge identifiers.
+            Defaults to all edges, in iteration order.
+        dtype : type, optional
+            The data type of the array.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys), len(names)).
+
+        Raises
+        ------
+        KeyError
+            If any of the edges does not exist.
+
+        See Also
+        --------
+        :meth:`edges_attribute_array`, :meth:`set_edges_attributes_array`
+
+        """
+        from numpy import asarray
+
+        names = list(names)
+        if keys is None:
+            keys = list(self.edges())
+        defaults = [self.default_edge_attributes.get(name) for name in names]
+        values = []
+        for u, v in keys:
+            if u not in self.halfedge or v not in self.halfedge[u]:
+                raise KeyError((u, v))
+            attr = self.edgedata.get(str(tuple(sorted((u, v))))) or {}
+            values.append([attr[name] if name in attr else default for name, default in zip(names, defaults)])
+        return asarray(values, dtype=dtype).reshape((len(keys), len(names)))
+
+    def set_edges_attribute_array(self, name, values, keys=None):
+        """Set the values of an attribute of multiple edges from an array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        values : array-like
+            The values of the attribute, one per edge.
+        keys : list[tuple[int, int]], optional
+            A list of edge identifiers.
+            Defaults to all edges, in iteration order.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If any of the edges does not exist.
+
+        See Also
+        --------
+        :meth:`edges_attribute_array`, :meth:`set_edges_attributes_array`
+
+        """
+        from numpy import asarray
+
+        values = asarray(values)
+        self.set_edges_attributes_array([name], values.reshape((-1, 1)), keys=keys)
+
+    def set_edges_attributes_array(self, names, values, keys=None):
+        """Set the values of multiple attributes of multiple edges from an array.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the attributes.
+        values : array-like
+            An array of shape (len(keys), len(names)).
+        keys : list[tuple[int, int]], optional
+            A list of edge identifiers.
+            Defaults to all edges, in iteration order.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If any of the edges does not exist.
+        ValueError
+            If the shape of the values does not match the number of edges and attributes.
+
+        See Also
+        --------
+        :meth:`edges_attributes_array`, :meth:`set_edges_attribute_array`
+
+        """
+        from numpy import asarray
+
+        names = list(names)
+        if keys is None:
+            keys = list(self.edges())
+        values = asarray(values)
+        if values.shape != (len(keys), len(names)):
+            raise ValueError("Expected an array of shape {}, got {}.".format((len(keys), len(names)), values.shape))
+        for u, v in keys:
+            if u not in self.halfedge or v not in self.halfedge[u]:
+                raise KeyError((u, v))
+        for (u, v), row in zip(keys, values.tolist()):
+            attr = self.edgedata.setdefault(str(tuple(sorted((u, v)))), {})
+            for name, value in zip(names, row):
+                attr[name] = value
+
     # --------------------------------------------------------------------------
     # mesh info
     # --------------------------------------------------------------------------
@@ -1870,29 +2581,38 @@ class HalfEdge(Datastructure):
         :meth:`is_valid`, :meth:`is_regular`, :meth:`is_orientable`, :meth:`is_empty`, :meth:`is_closed`, :meth:`is_trimesh`, :meth:`is_quadmesh`
 
         """
+        if self._topology is not None:
+            return self._topology.is_manifold()
+
         if not self.vertex:
             return False
 
         for key in self.vertices():
-            if list(self.halfedge[key].values()).count(None) > 1:
+            if not self._is_vertex_manifold(key):
                 return False
 
-            nbrs = self.vertex_neighbors(key, ordered=True)
+        return True
 
-            if not nbrs:
-                return False
+    def _is_vertex_manifold(self, key):
+        if list(self.halfedge[key].values()).count(None) > 1:
+            return False
 
-            if self.halfedge[nbrs[0]][key] is None:
-                for nbr in nbrs[1:-1]:
-                    if self.halfedge[key][nbr] is None:
-                        return False
+        nbrs = self.vertex_neighbors(key, ordered=True)
 
-                if self.halfedge[key][nbrs[-1]] is not None:
+        if not nbrs:
+            return False
+
+        if self.halfedge[nbrs[0]][key] is None:
+            for nbr in nbrs[1:-1]:
+                if self.halfedge[key][nbr] is None:
+                    return False
+
+            if self.halfedge[key][nbrs[-1]] is not None:
+                return False
+        else:
+            for nbr in nbrs[1:]:
+                if self.halfedge[key][nbr] is None:
                     return False
-            else:
-                for nbr in nbrs[1:]:
-                    if self.halfedge[key][nbr] is None:
-                        return False
 
         return True
 
@@ -1983,6 +2703,8 @@ class HalfEdge(Datastructure):
         :meth:`is_valid`, :meth:`is_regular`, :meth:`is_manifold`, :meth:`is_orientable`, :meth:`is_empty`, :meth:`is_trimesh`, :meth:`is_quadmesh`
 
         """
+        if self._topology is not None:
+            return self._topology.is_closed()
         if self.is_empty():
             return False
         for edge in self.edges():
@@ -2087,6 +2809,8 @@ class HalfEdge(Datastructure):
             False otherwise.
 
         """
+        if self._topology is not None:
+            return self._topology.is_vertex_on_boundary(key)
         for nbr in self.halfedge[key]:
             if self.halfedge[key][nbr] is None:
                 return True
@@ -2195,6 +2919,8 @@ class HalfEdge(Datastructure):
             The degree of the vertex.
 
         """
+        if self._topology is not None:
+            return self._topology.vertex_degree(key)
         return len(self.vertex_neighbors(key))
 
     def vertex_min_degree(self):
@@ -2595,6 +3321,8 @@ class HalfEdge(Datastructure):
             The identifiers of the neighboring faces.
 
         """
+        if self._topology is not None:
+            return self._topology.face_neighbors(fkey)
         nbrs = []
         for u, v in self.face_halfedges(fkey):
             nbr = self.halfedge[v][u]
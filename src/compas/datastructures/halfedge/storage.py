@@ -0,0 +1,950 @@
+"""
+Compact, array-backed storage for the half-edge data structure.
+
+The classes in this module provide the same (nested) mapping interface as the dictionaries
+that are normally used to store the vertices, faces and half-edges of a :class:`compas.datastructures.HalfEdge`,
+but keep the underlying data in contiguous arrays of the standard library :mod:`array` module.
+
+Vertex and face identifiers are used directly as indices into the arrays.
+The storage is therefore only compact if the identifiers are (more or less) contiguous,
+which is the case for all identifiers generated automatically by the data structure.
+
+The mapping interface is implemented in Python on top of the arrays.
+Access to individual elements is therefore several times slower than with the dictionaries,
+whereas bulk access to the vertex attributes through NumPy is fast.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+from operator import index
+
+from compas.datastructures._mutablemapping import MutableMapping
+from compas.datastructures.datastructure import copy_attributes
+
+__all__ = [
+    "ArrayVertexStore",
+    "ArrayFaceStore",
+    "ArrayHalfEdgeStore",
+]
+
+
+try:
+    long
+except NameError:
+    long = int
+
+NAN = float("nan")
+
+# Largest integer that can be stored exactly as a double.
+MAXINT = 2**53
+
+# States of the values in the columns.
+UNSET = 0
+FLOAT = 1
+INT = 2
+
+
+def _state(value):
+    """The state of a value stored in a column, or UNSET if the value cannot be stored in a column."""
+    if isinstance(value, float):
+        return FLOAT
+    if isinstance(value, (int, long)) and not isinstance(value, bool) and -MAXINT <= value <= MAXINT:
+        return INT
+    return UNSET
+
+
+def _index(key):
+    try:
+        i = index(key)
+    except TypeError:
+        raise KeyError(key)
+    if i < 0:
+        raise KeyError(key)
+    return i
+
+
+# ==============================================================================
+# Vertices
+# ==============================================================================
+
+
+class _VertexRow(MutableMapping):
+    """Mutable mapping view of the attributes of one vertex in an :class:`ArrayVertexStore`."""
+
+    __slots__ = ("_store", "_key")
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def __str__(self):
+        return str(dict(self.items()))
+
+    __repr__ = __str__
+
+    def __getitem__(self, name):
+        store = self._store
+        state = store._states[name][self._key] if name in store._states else UNSET
+        if state == FLOAT:
+            return store._columns[name][self._key]
+        if state == INT:
+            return int(store._columns[name][self._key])
+        extra = store._extras.get(self._key)
+        if extra is None:
+            raise KeyError(name)
+        return extra[name]
+
+    def __setitem__(self, name, value):
+        store = self._store
+        key = self._key
+        states = store._states.get(name)
+        state = _state(value) if states is not None else UNSET
+        current = states[key] if states is not None else UNSET
+        if state and current:
+            store._columns[name][key] = value
+            states[key] = state
+            return
+        extra = store._extras.get(key)
+        order = store._order.get(key)
+        if order is None:
+            if current:
+                # the value moves from the column to the extras
+                if not state:
+                    store._order[key] = order = list(self)
+            elif extra and name in extra:
+                # the value moves from the extras to the column
+                if state:
+                    store._order[key] = order = list(self)
+            elif state and (extra or any(states[key] for states in store._after[name])):
+                # the new value is not stored in the order in which the attributes are iterated
+                store._order[key] = order = list(self)
+                order.append(name)
+        elif name not in self:
+            order.append(name)
+        if state:
+            store._columns[name][key] = value
+            states[key] = state
+            if extra and name in extra:
+                del extra[name]
+            return
+        if current:
+            states[key] = UNSET
+        if extra is None:
+            extra = store._extras[key] = {}
+        extra[name] = value
+
+    def __delitem__(self, name):
+        store = self._store
+        states = store._states.get(name)
+        if states is not None and states[self._key]:
+            states[self._key] = UNSET
+        else:
+            extra = store._extras.get(self._key)
+            if extra is None:
+                raise KeyError(name)
+            del extra[name]
+        order = store._order.get(self._key)
+        if order is not None:
+            order.remove(name)
+
+    def __contains__(self, name):
+        store = self._store
+        states = store._states.get(name)
+        if states is not None and states[self._key]:
+            return True
+        extra = store._extras.get(self._key)
+        return extra is not None and name in extra
+
+    def __iter__(self):
+        store = self._store
+        key = self._key
+        order = store._order.get(key)
+        if order is not None:
+            for name in order:
+                yield name
+            return
+        for name, states in store._states.items():
+            if states[key]:
+                yield name
+        extra = store._extras.get(key)
+        if extra:
+            for name in extra:
+                yield name
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+
+class ArrayVertexStore(MutableMapping):
+    """Vertex storage with numerical attributes in columns of contiguous memory.
+
+    Parameters
+    ----------
+    columns : list[str], optional
+        The names of the attributes that should be stored in columns.
+        Floats, and integers that can be represented exactly by double precision floats,
+        are stored in these columns as double precision floats.
+        Other values, and the values of all other attributes,
+        are stored in a regular dictionary per vertex, which is only created when needed.
+
+    Notes
+    -----
+    The store behaves as a dictionary mapping vertex identifiers to attribute dictionaries.
+    The attribute "dictionaries" are lightweight views on the underlying columns.
+
+    For every column, a mask records if the value of a vertex is not set, is a float, or is an integer.
+    Integers are therefore returned as integers, and NaN is a valid value.
+    The attributes of a vertex are iterated in the order in which they were added,
+    as in the dictionaries of the default storage.
+
+    """
+
+    def __init__(self, columns=None):
+        super(ArrayVertexStore, self).__init__()
+        self._alive = bytearray()
+        self._count = 0
+        self._columns = {}
+        self._states = {}
+        for name in columns or []:
+            self._columns[name] = array("d")
+            self._states[name] = bytearray()
+        self._after = self._states_after()
+        self._extras = {}
+        self._order = {}
+
+    def __str__(self):
+        return str({key: dict(attr.items()) for key, attr in self.items()})
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        alive = self._alive
+        for key in range(len(alive)):
+            if alive[key]:
+                yield key
+
+    def __contains__(self, key):
+        try:
+            return key >= 0 and self._alive[key] == 1
+        except (IndexError, TypeError):
+            return False
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return _VertexRow(self, key)
+
+    def __setitem__(self, key, attr):
+        try:
+            key = _index(key)
+        except KeyError:
+            raise ValueError("The array storage only supports non-negative integer vertex identifiers: {}".format(key))
+        self._reserve(key + 1)
+        if not self._alive[key]:
+            self._alive[key] = 1
+            self._count += 1
+        self._clear(key)
+        row = _VertexRow(self, key)
+        for name, value in attr.items():
+            row[name] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        key = index(key)
+        self._alive[key] = 0
+        self._count -= 1
+        self._clear(key)
+
+    def _clear(self, key):
+        for states in self._states.values():
+            states[key] = UNSET
+        self._extras.pop(key, None)
+        self._order.pop(key, None)
+
+    def _states_after(self):
+        # per column, the masks of the columns that are iterated after it
+        names = list(self._states)
+        return {name: [self._states[other] for other in names[i + 1 :]] for i, name in enumerate(names)}
+
+    def _reserve(self, size):
+        n = size - len(self._alive)
+        if n <= 0:
+            return
+        n = max(n, len(self._alive) // 2, 16)
+        self._alive.extend(bytearray(n))
+        for column in self._columns.values():
+            column.extend(array("d", [NAN]) * n)
+        for states in self._states.values():
+            states.extend(bytearray(n))
+
+    @property
+    def columns(self):
+        """dict[str, array] - The attribute columns, indexed by vertex identifier."""
+        return self._columns
+
+    def column(self, name):
+        """Return the contiguous buffer of an attribute column.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+
+        Returns
+        -------
+        array
+            A buffer of doubles indexed by vertex identifier.
+            The buffer may be longer than the number of vertices.
+            The values of vertices for which the attribute is not set are undefined.
+
+        """
+        return self._columns[name]
+
+    @property
+    def alive(self):
+        """bytearray - Flags indicating which vertex identifiers are in use."""
+        return self._alive
+
+    def has_extras(self, names):
+        """Verify that any of the named attributes has values stored outside of the columns.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the attributes.
+
+        Returns
+        -------
+        bool
+
+        """
+        for extra in self._extras.values():
+            for name in names:
+                if name in extra:
+                    return True
+        return False
+
+    def get_columns_numpy(self, names, keys=None, defaults=None):
+        """Get the values of multiple column attributes as a NumPy array.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the column attributes.
+        keys : list[int], optional
+            The identifiers of the vertices.
+            Defaults to all vertices, in iteration order.
+        defaults : list[float | None], optional
+            The values of the attributes of vertices for which they are not set.
+            Defaults to NaN.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(keys), len(names)).
+
+        """
+        from numpy import frombuffer
+        from numpy import empty
+        from numpy import uint8
+
+        if keys is None:
+            keys = frombuffer(self._alive, dtype=uint8).nonzero()[0]
+        if defaults is None:
+            defaults = [None] * len(names)
+        values = empty((len(keys), len(names)), dtype=float)
+        for j, (name, default) in enumerate(zip(names, defaults)):
+            column = values[:, j]
+            column[:] = frombuffer(self._columns[name], dtype=float)[keys]
+            unset = frombuffer(self._states[name], dtype=uint8)[keys] == UNSET
+            if unset.any():
+                column[unset] = NAN if default is None else default
+        return values
+
+    def set_columns_numpy(self, names, values, keys=None):
+        """Set the values of multiple column attributes from a NumPy array.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the column attributes.
+        values : array-like
+            An array of shape (len(keys), len(names)).
+            Integer arrays are stored as integer values.
+        keys : list[int], optional
+            The identifiers of the vertices.
+            Defaults to all vertices, in iteration order.
+
+        Returns
+        -------
+        None
+
+        """
+        from numpy import frombuffer
+        from numpy import asarray
+        from numpy import uint8
+
+        if keys is None:
+            keys = frombuffer(self._alive, dtype=uint8).nonzero()[0]
+        keys = asarray(keys, dtype=int)
+        values = asarray(values)
+        state = INT if values.dtype.kind in "iu" and abs(values).max(initial=0) <= MAXINT else FLOAT
+        if state == FLOAT:
+            values = asarray(values, dtype=float)
+        values = values.reshape((len(keys), len(names)))
+        # rows on which the attributes are not yet set in the columns
+        # are updated one by one, to keep track of the order of their attributes
+        fast = None
+        for name in names:
+            isset = frombuffer(self._states[name], dtype=uint8)[keys] != UNSET
+            fast = isset if fast is None else fast & isset
+        if fast is None:
+            return
+        if not fast.all():
+            convert = int if state == INT else float
+            for i in (~fast).nonzero()[0].tolist():
+                row = _VertexRow(self, int(keys[i]))
+                for name, value in zip(names, values[i].tolist()):
+                    row[name] = convert(value)
+            keys = keys[fast]
+            values = values[fast]
+        for j, name in enumerate(names):
+            column = frombuffer(self._columns[name], dtype=float)
+            column[keys] = values[:, j]
+            del column
+            states = frombuffer(self._states[name], dtype=uint8)
+            states[keys] = state
+            del states
+
+    def copy(self):
+        """Make an independent copy of the store.
+
+        Returns
+        -------
+        :class:`ArrayVertexStore`
+
+        """
+        store = ArrayVertexStore()
+        store._alive = self._alive[:]
+        store._count = self._count
+        store._columns = {name: column[:] for name, column in self._columns.items()}
+        store._states = {name: states[:] for name, states in self._states.items()}
+        store._after = store._states_after()
+        store._extras = {key: copy_attributes(extra) for key, extra in self._extras.items()}
+        store._order = {key: order[:] for key, order in self._order.items()}
+        return store
+
+    def to_dict(self):
+        """Convert the store to a dictionary of attribute dictionaries.
+
+        Returns
+        -------
+        dict[int, dict[str, Any]]
+
+        """
+        return {key: dict(attr.items()) for key, attr in self.items()}
+
+
+# ==============================================================================
+# Faces
+# ==============================================================================
+
+
+class _FaceVertices(list):
+    """List of face vertices that writes all modifications back into the face store."""
+
+    def __init__(self, store, fkey, vertices):
+        super(_FaceVertices, self).__init__(vertices)
+        self._store = store
+        self._fkey = fkey
+
+    def _sync(self):
+        if self._fkey in self._store:
+            self._store._write(self._fkey, self)
+
+    def __setitem__(self, index, value):
+        super(_FaceVertices, self).__setitem__(index, value)
+        self._sync()
+
+    def __delitem__(self, index):
+        super(_FaceVertices, self).__delitem__(index)
+        self._sync()
+
+    def __setslice__(self, i, j, values):
+        super(_FaceVertices, self).__setslice__(i, j, values)
+        self._sync()
+
+    def __delslice__(self, i, j):
+        super(_FaceVertices, self).__delslice__(i, j)
+        self._sync()
+
+    def __iadd__(self, values):
+        super(_FaceVertices, self).extend(values)
+        self._sync()
+        return self
+
+    def append(self, value):
+        super(_FaceVertices, self).append(value)
+        self._sync()
+
+    def extend(self, values):
+        super(_FaceVertices, self).extend(values)
+        self._sync()
+
+    def insert(self, index, value):
+        super(_FaceVertices, self).insert(index, value)
+        self._sync()
+
+    def remove(self, value):
+        super(_FaceVertices, self).remove(value)
+        self._sync()
+
+    def pop(self, *args):
+        value = super(_FaceVertices, self).pop(*args)
+        self._sync()
+        return value
+
+    def reverse(self):
+        super(_FaceVertices, self).reverse()
+        self._sync()
+
+    def sort(self, *args, **kwargs):
+        super(_FaceVertices, self).sort(*args, **kwargs)
+        self._sync()
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return list(self)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+class ArrayFaceStore(MutableMapping):
+    """Face storage with the vertex lists of all faces in one contiguous buffer.
+
+    Notes
+    -----
+    The store behaves as a dictionary mapping face identifiers to lists of vertex identifiers.
+    The returned lists are copies of the stored data,
+    but all in-place modifications of these lists are written back into the store.
+
+    Faces that grow are moved to the end of the buffer.
+    The space they leave behind is reclaimed by :meth:`compact`.
+
+    """
+
+    def __init__(self):
+        super(ArrayFaceStore, self).__init__()
+        self._alive = bytearray()
+        self._count = 0
+        self._start = array("i")
+        self._size = array("i")
+        self._data = array("i")
+        self._garbage = 0
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        alive = self._alive
+        for fkey in range(len(alive)):
+            if alive[fkey]:
+                yield fkey
+
+    def __contains__(self, fkey):
+        try:
+            return fkey >= 0 and self._alive[fkey] == 1
+        except (IndexError, TypeError):
+            return False
+
+    def __getitem__(self, fkey):
+        if fkey not in self:
+            raise KeyError(fkey)
+        fkey = index(fkey)
+        start = self._start[fkey]
+        return _FaceVertices(self, fkey, self._data[start : start + self._size[fkey]])
+
+    def __setitem__(self, fkey, vertices):
+        try:
+            fkey = _index(fkey)
+        except KeyError:
+            raise ValueError("The array storage only supports non-negative integer face identifiers: {}".format(fkey))
+        self._reserve(fkey + 1)
+        if not self._alive[fkey]:
+            self._alive[fkey] = 1
+            self._count += 1
+            self._size[fkey] = 0
+        self._write(fkey, vertices)
+
+    def __delitem__(self, fkey):
+        if fkey not in self:
+            raise KeyError(fkey)
+        fkey = index(fkey)
+        self._alive[fkey] = 0
+        self._count -= 1
+        self._garbage += self._size[fkey]
+        self._size[fkey] = 0
+        if self._garbage > 1024 and self._garbage > len(self._data) // 2:
+            self.compact()
+
+    def _reserve(self, size):
+        n = size - len(self._alive)
+        if n <= 0:
+            return
+        n = max(n, len(self._alive) // 2, 16)
+        self._alive.extend(bytearray(n))
+        self._start.extend(array("i", [0]) * n)
+        self._size.extend(array("i", [0]) * n)
+
+    def _write(self, fkey, vertices):
+        vertices = array("i", vertices)
+        n = len(vertices)
+        size = self._size[fkey]
+        if n <= size:
+            start = self._start[fkey]
+            self._data[start : start + n] = vertices
+            self._garbage += size - n
+        else:
+            self._garbage += size
+            self._start[fkey] = len(self._data)
+            self._data.extend(vertices)
+        self._size[fkey] = n
+
+    def compact(self):
+        """Remove the unused space from the face buffer.
+
+        Returns
+        -------
+        None
+
+        """
+        data = array("i")
+        for fkey in self:
+            start = self._start[fkey]
+            self._start[fkey] = len(data)
+            data.extend(self._data[start : start + self._size[fkey]])
+        self._data = data
+        self._garbage = 0
+
+    def copy(self):
+        """Make an independent copy of the store.
+
+        Returns
+        -------
+        :class:`ArrayFaceStore`
+
+        """
+        store = ArrayFaceStore()
+        store._alive = self._alive[:]
+        store._count = self._count
+        store._start = self._start[:]
+        store._size = self._size[:]
+        store._data = self._data[:]
+        store._garbage = self._garbage
+        return store
+
+    def to_dict(self):
+        """Convert the store to a dictionary of vertex lists.
+
+        Returns
+        -------
+        dict[int, list[int]]
+
+        """
+        return {fkey: list(self[fkey]) for fkey in self}
+
+
+# ==============================================================================
+# Halfedges
+# ==============================================================================
+
+
+class _HalfEdgeRow(MutableMapping):
+    """Mutable mapping view of the outgoing half-edges of one vertex in an :class:`ArrayHalfEdgeStore`."""
+
+    __slots__ = ("_store", "_u")
+
+    def __init__(self, store, u):
+        self._store = store
+        self._u = u
+
+    def __str__(self):
+        return str(dict(self.items()))
+
+    __repr__ = __str__
+
+    def __getitem__(self, v):
+        h = self._store._find(self._u, v)
+        if h < 0:
+            raise KeyError(v)
+        face = self._store._face[h]
+        return None if face < 0 else face
+
+    def __setitem__(self, v, face):
+        store = self._store
+        h = store._find(self._u, v)
+        if h < 0:
+            h = store._new(self._u, v)
+        store._face[h] = -1 if face is None else face
+
+    def __delitem__(self, v):
+        if not self._store._remove(self._u, v):
+            raise KeyError(v)
+
+    def __contains__(self, v):
+        return self._store._find(self._u, v) >= 0
+
+    def __iter__(self):
+        store = self._store
+        h = store._head[self._u]
+        while h >= 0:
+            link = store._link[h]
+            yield store._target[h]
+            h = link
+
+    def __len__(self):
+        count = 0
+        store = self._store
+        h = store._head[self._u]
+        while h >= 0:
+            count += 1
+            h = store._link[h]
+        return count
+
+
+class ArrayHalfEdgeStore(MutableMapping):
+    """Half-edge storage with the connectivity information in contiguous integer arrays.
+
+    Notes
+    -----
+    The store behaves as the dictionary of dictionaries of the default half-edge storage:
+    ``store[u][v]`` is the face to the left of the half-edge from ``u`` to ``v``, or None.
+
+    Half-edges are allocated in pairs, such that the twin of half-edge ``h`` is always ``h ^ 1``.
+    For every half-edge, the arrays contain the origin vertex, the target vertex, and the face.
+    The outgoing half-edges of a vertex are linked in insertion order,
+    such that iteration order is identical to the iteration order of the default storage.
+
+    """
+
+    def __init__(self):
+        super(ArrayHalfEdgeStore, self).__init__()
+        self._alive = bytearray()
+        self._count = 0
+        self._head = array("i")
+        self._tail = array("i")
+        self._origin = array("i")
+        self._target = array("i")
+        self._face = array("i")
+        self._link = array("i")
+        self._used = bytearray()
+        self._free = []
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        alive = self._alive
+        for u in range(len(alive)):
+            if alive[u]:
+                yield u
+
+    def __contains__(self, u):
+        try:
+            return u >= 0 and self._alive[u] == 1
+        except (IndexError, TypeError):
+            return False
+
+    def __getitem__(self, u):
+        if u not in self:
+            raise KeyError(u)
+        return _HalfEdgeRow(self, u)
+
+    def __setitem__(self, u, nbrs):
+        try:
+            u = _index(u)
+        except KeyError:
+            raise ValueError("The array storage only supports non-negative integer vertex identifiers: {}".format(u))
+        self._reserve(u + 1)
+        if not self._alive[u]:
+            self._alive[u] = 1
+            self._count += 1
+        else:
+            self._clear(u)
+        row = _HalfEdgeRow(self, u)
+        for v, face in nbrs.items():
+            row[v] = face
+
+    def __delitem__(self, u):
+        if u not in self:
+            raise KeyError(u)
+        u = index(u)
+        self._clear(u)
+        self._alive[u] = 0
+        self._count -= 1
+
+    def _reserve(self, size):
+        n = size - len(self._alive)
+        if n <= 0:
+            return
+        n = max(n, len(self._alive) // 2, 16)
+        self._alive.extend(bytearray(n))
+        self._head.extend(array("i", [-1]) * n)
+        self._tail.extend(array("i", [-1]) * n)
+
+    def _find(self, u, v):
+        # u should be a valid row index
+        h = self._head[u]
+        target = self._target
+        link = self._link
+        while h >= 0:
+            if target[h] == v:
+                return h
+            h = link[h]
+        return -1
+
+    def _new(self, u, v):
+        v = _index(v)
+        twin = self._find(v, u) if v < len(self._alive) and self._alive[v] else -1
+        if twin >= 0:
+            h = twin ^ 1
+        elif self._free:
+            h = self._free.pop()
+        else:
+            h = len(self._used)
+            self._origin.extend((-1, -1))
+            self._target.extend((-1, -1))
+            self._face.extend((-1, -1))
+            self._link.extend((-1, -1))
+            self._used.extend(b"\x00\x00")
+        self._used[h] = 1
+        self._origin[h] = u
+        self._target[h] = v
+        self._face[h] = -1
+        self._link[h] = -1
+        tail = self._tail[u]
+        if tail < 0:
+            self._head[u] = h
+        else:
+            self._link[tail] = h
+        self._tail[u] = h
+        return h
+
+    def _remove(self, u, v):
+        if u not in self:
+            return False
+        h = self._head[u]
+        prev = -1
+        while h >= 0:
+            if self._target[h] == v:
+                break
+            prev = h
+            h = self._link[h]
+        if h < 0:
+            return False
+        if prev < 0:
+            self._head[u] = self._link[h]
+        else:
+            self._link[prev] = self._link[h]
+        if self._tail[u] == h:
+            self._tail[u] = prev
+        self._used[h] = 0
+        self._face[h] = -1
+        self._link[h] = -1
+        if not self._used[h ^ 1]:
+            self._free.append(h & ~1)
+        return True
+
+    def _clear(self, u):
+        for v in list(_HalfEdgeRow(self, u)):
+            self._remove(u, v)
+
+    def arrays(self, faces=None):
+        """Return the connectivity arrays of the half-edges.
+
+        Parameters
+        ----------
+        faces : Mapping[int, list[int]], optional
+            The face storage of the data structure.
+            If provided, the "next" array is computed as well.
+
+        Returns
+        -------
+        dict[str, array]
+            A dictionary with the arrays "origin", "vertex", "face", "twin", and optionally "next".
+            The arrays are indexed by half-edge index.
+            Unused half-edge slots have origin -1.
+            Missing faces and missing twins or successors are represented by -1.
+
+        """
+        n = len(self._used)
+        origin = array("i", self._origin)
+        for h in range(n):
+            if not self._used[h]:
+                origin[h] = -1
+        twin = array("i", [-1]) * n
+        for h in range(n):
+            if self._used[h] and self._used[h ^ 1]:
+                twin[h] = h ^ 1
+        result = {
+            "origin": origin,
+            "vertex": array("i", self._target),
+            "face": array("i", self._face),
+            "twin": twin,
+        }
+        if faces is not None:
+            following = array("i", [-1]) * n
+            for fkey in faces:
+                vertices = faces[fkey]
+                halfedges = [
+                    self._find(u, v) if u in self else -1 for u, v in zip(vertices, vertices[1:] + vertices[:1])
+                ]
+                for a, b in zip(halfedges, halfedges[1:] + halfedges[:1]):
+                    if a >= 0:
+                        following[a] = b
+            result["next"] = following
+        return result
+
+    def copy(self):
+        """Make an independent copy of the store.
+
+        Returns
+        -------
+        :class:`ArrayHalfEdgeStore`
+
+        """
+        store = ArrayHalfEdgeStore()
+        store._alive = self._alive[:]
+        store._count = self._count
+        store._head = self._head[:]
+        store._tail = self._tail[:]
+        store._origin = self._origin[:]
+        store._target = self._target[:]
+        store._face = self._face[:]
+        store._link = self._link[:]
+        store._used = self._used[:]
+        store._free = self._free[:]
+        return store
+
+    def to_dict(self):
+        """Convert the store to a dictionary of dictionaries.
+
+        Returns
+        -------
+        dict[int, dict[int, int | None]]
+
+        """
+        return {u: dict(self[u].items()) for u in self}
@@ -5,6 +5,7 @@ from __future__ import print_function
 from random import sample
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import copy_attributes
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
@@ -226,6 +227,65 @@ class HalfFace(Datastructure):
         self._max_face = data.get("max_face", self._max_face)
         self._max_cell = data.get("max_cell", self._max_cell)
 
+    def _copy(self, cls):
+        other = cls()
+        other.attributes.update(copy_attributes(self.attributes))
+        other.default_vertex_attributes.update(copy_attributes(self.default_vertex_attributes))
+        other.default_edge_attributes.update(copy_attributes(self.default_edge_attributes))
+        other.default_face_attributes.update(copy_attributes(self.default_face_attributes))
+        other.default_cell_attributes.update(copy_attributes(self.default_cell_attributes))
+        other._vertex = {key: copy_attributes(attr) for key, attr in self._vertex.items()}
+        other._halfface = {fkey: vertices[:] for fkey, vertices in self._halfface.items()}
+        other._cell = {ckey: {u: nbrs.copy() for u, nbrs in cell.items()} for ckey, cell in self._cell.items()}
+        other._plane = {u: {v: nbrs.copy() for v, nbrs in plane.items()} for u, plane in self._plane.items()}
+        other._edge_data = {edge: copy_attributes(attr) for edge, attr in self._edge_data.items()}
+        other._face_data = {fkey: copy_attributes(attr) for fkey, attr in self._face_data.items()}
+        other._cell_data = {ckey: copy_attributes(attr) for ckey, attr in self._cell_data.items()}
+        other._max_vertex = self._max_vertex
+        other._max_face = self._max_face
+        other._max_cell = self._max_cell
+        return other
+
+    def _hash_sections(self):
+        halfface = self._halfface
+        cell = self._cell
+        edge_data = self._edge_data
+        face_data = self._face_data
+        cell_data = self._cell_data
+
+        def face_element(face):
+            vertices = halfface[face]
+            return [vertices, face_data.get(str(tuple(sorted(vertices)))) or {}]
+
+        def cell_element(c):
+            faces = [halfface[cell[c][u][v]] for u in sorted(cell[c]) for v in sorted(cell[c][u])]
+            return [faces, cell_data.get(c) or {}]
+
+        def face_members(face):
+            # the attributes of a face are shared by the opposite halfface
+            if face not in halfface:
+                return [face]
+            opposite = self.halfface_opposite_halfface(face)
+            return [face] if opposite is None else [face, opposite]
+
+        def edge_members(edge):
+            return [str(tuple(sorted(edge))) if isinstance(edge, tuple) else edge]
+
+        attributes = [
+            self.attributes,
+            self.default_vertex_attributes,
+            self.default_edge_attributes,
+            self.default_face_attributes,
+            self.default_cell_attributes,
+        ]
+        sections = {
+            "vertices": (self._vertex, self._vertex.__getitem__, None),
+            "faces": (halfface, face_element, face_members),
+            "cells": (cell, cell_element, None),
+            "edges": (edge_data, edge_data.__getitem__, edge_members),
+        }
+        return attributes, sections
+
     # --------------------------------------------------------------------------
     # helpers
     # --------------------------------------------------------------------------
@@ -0,0 +1,232 @@
+"""
+Structure-aware content hashes of data structures.
+
+The hash of a data structure is a small Merkle tree.
+The elements of every section of the data structure (for example the vertices or faces of a mesh)
+are distributed over chunks, based on their identifiers.
+Every chunk is hashed separately, the digests of the chunks are combined into the digest of the section,
+and the digests of the sections and the digest of the general attributes of the data structure
+are combined into the root digest.
+
+After a modification of a data structure only the chunks containing the modified elements have to be hashed again.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import binascii
+import hashlib
+import json
+
+from compas.data import DataEncoder
+
+try:
+    long
+except NameError:
+    long = int
+
+__all__ = ["StructuralHash"]
+
+
+CHUNK_SIZE = 256
+"""int: The range of the integer identifiers of the elements in one chunk."""
+
+BUCKETS = 1024
+"""int: The number of chunks over which elements with other identifiers are distributed."""
+
+
+def _dumps(value):
+    return json.dumps(value, cls=DataEncoder, sort_keys=True, separators=(",", ":"))
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _is_int(key):
+    return isinstance(key, (int, long)) and not isinstance(key, bool)
+
+
+def _order(key):
+    """Sort key for identifiers of mixed types."""
+    if _is_int(key):
+        return (0, key, "")
+    return (1, 0, _dumps(key))
+
+
+def _chunk(key):
+    """The chunk of an element identifier.
+
+    Integer identifiers are grouped in ranges of :attr:`CHUNK_SIZE`,
+    such that consecutive identifiers end up in the same chunk.
+    Tuples are assigned to the chunk of their first item.
+    Other identifiers are distributed over :attr:`BUCKETS` chunks based on a hash of their serialization.
+    """
+    if isinstance(key, tuple) and key:
+        key = key[0]
+    if _is_int(key):
+        return key // CHUNK_SIZE
+    return "~{}".format(int(hashlib.md5(_dumps(key).encode("utf-8")).hexdigest()[:8], 16) % BUCKETS)
+
+
+class StructuralHash(object):
+    """Merkle-style hash of the attributes and the elements of a data structure.
+
+    Structural hashes are created with :meth:`compas.datastructures.Datastructure.structural_hash`.
+
+    Parameters
+    ----------
+    attributes : object
+        The general attributes of the data structure.
+    sections : dict[str, tuple[mapping, callable, callable | None]]
+        The sections of the data structure.
+        For every section, a mapping of which the keys are the identifiers of the elements,
+        a function returning the serializable data of an element from its identifier,
+        and, optionally, a function returning the keys of the mapping affected by the modification of an element.
+    previous : :class:`~compas.datastructures.StructuralHash`, optional
+        The hash of the same data structure before it was modified.
+    changed : dict[str, sequence[hashable]], optional
+        The identifiers of the elements per section that were added, removed or modified since the previous hash.
+        Only the chunks containing these elements are hashed again.
+
+    Attributes
+    ----------
+    sections : dict[str, str]
+        The hexadecimal digests of the individual sections.
+
+    Notes
+    -----
+    The digests are computed from the canonical JSON serialization of the elements,
+    with the attributes of every element ordered by name and the elements of every chunk ordered by identifier.
+    Structurally identical data structures therefore have the same hash,
+    irrespective of the order in which their elements and attributes were added.
+    The hash is independent of the guid of the data structure.
+
+    """
+
+    def __init__(self, attributes, sections, previous=None, changed=None):
+        changed = changed or {}
+        for name in changed:
+            if name not in sections:
+                raise ValueError("Unknown section: {}. Valid sections are: {}.".format(name, ", ".join(sections)))
+        self._attributes = _sha256(_dumps(attributes))
+        self._members = {}
+        self._chunks = {}
+        self._sections = {}
+        for name, section in sections.items():
+            if previous is None or name not in previous._members:
+                self._hash_section(name, section)
+            else:
+                self._update_section(name, section, previous, changed.get(name) or [])
+        h = hashlib.sha256(self._attributes)
+        for name in sorted(self._sections):
+            h.update(name.encode("utf-8"))
+            h.update(self._sections[name])
+        self._root = h.digest()
+
+    def __str__(self):
+        return "<StructuralHash {}>".format(self.hexdigest())
+
+    __repr__ = __str__
+
+    def __eq__(self, other):
+        return isinstance(other, StructuralHash) and self._root == other._root
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._root)
+
+    @property
+    def sections(self):
+        sections = {name: binascii.hexlify(digest).decode("ascii") for name, digest in self._sections.items()}
+        sections["attributes"] = binascii.hexlify(self._attributes).decode("ascii")
+        return sections
+
+    def digest(self):
+        """The root digest of the hash.
+
+        Returns
+        -------
+        bytes
+
+        """
+        return self._root
+
+    def hexdigest(self):
+        """The root digest of the hash in hexadecimal format.
+
+        Returns
+        -------
+        str
+
+        """
+        return binascii.hexlify(self._root).decode("ascii")
+
+    def diff(self, other):
+        """Identify the sections that differ from the sections of another hash.
+
+        Parameters
+        ----------
+        other : :class:`~compas.datastructures.StructuralHash`
+            The hash of another version of the same data structure.
+
+        Returns
+        -------
+        list[str]
+            The names of the differing sections,
+            including "attributes" if the general attributes differ.
+
+        """
+        mine = self.sections
+        theirs = other.sections
+        return sorted(name for name in set(mine) | set(theirs) if mine.get(name) != theirs.get(name))
+
+    # --------------------------------------------------------------------------
+    # helpers
+    # --------------------------------------------------------------------------
+
+    def _hash_section(self, name, section):
+        mapping, element, _ = section
+        members = {}
+        for key in mapping:
+            members.setdefault(_chunk(key), set()).add(key)
+        self._members[name] = members
+        self._chunks[name] = {chunk: self._hash_chunk(keys, element) for chunk, keys in members.items()}
+        self._sections[name] = self._combine(self._chunks[name])
+
+    def _update_section(self, name, section, previous, keys):
+        mapping, element, member = section
+        members = previous._members[name].copy()
+        chunks = previous._chunks[name].copy()
+        touched = set()
+        for key in keys:
+            for key in member(key) if member else [key]:
+                chunk = _chunk(key)
+                if chunk not in touched:
+                    touched.add(chunk)
+                    members[chunk] = set(members.get(chunk, ()))
+                if key in mapping:
+                    members[chunk].add(key)
+                else:
+                    members[chunk].discard(key)
+        for chunk in touched:
+            if members[chunk]:
+                chunks[chunk] = self._hash_chunk(members[chunk], element)
+            else:
+                del members[chunk]
+                chunks.pop(chunk, None)
+        self._members[name] = members
+        self._chunks[name] = chunks
+        self._sections[name] = self._combine(chunks) if touched else previous._sections[name]
+
+    def _hash_chunk(self, keys, element):
+        return _sha256(_dumps([[key, element(key)] for key in sorted(keys, key=_order)]))
+
+    def _combine(self, chunks):
+        h = hashlib.sha256()
+        for chunk in sorted(chunks, key=_order):
+            h.update(str(chunk).encode("utf-8"))
+            h.update(chunks[chunk])
+        return h.digest()
@@ -0,0 +1,485 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import broadcast_to
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import diff
+from numpy import errstate
+from numpy import full
+from numpy import inf
+from numpy import lexsort
+from numpy import maximum
+from numpy import minimum
+from numpy import repeat
+from numpy import sqrt
+from numpy import unique
+from numpy import vstack
+from numpy import where
+from numpy import zeros
+
+from compas.geometry._core.kdtree import QUERY_CHUNK_SIZE
+from compas.geometry._core.kdtree import _box_distance_sqrd
+from compas.geometry._core.kdtree import _build_arrays
+
+
+# A direction that is unlikely to be parallel to the edges and faces of a mesh,
+# for counting the crossings of rays from points inside or outside the mesh.
+RAY_DIRECTION = [0.5773, 0.5778, 0.5769]
+
+
+class MeshBVH(object):
+    """A bounding volume hierarchy of the triangles of a mesh, for batched spatial queries.
+
+    Parameters
+    ----------
+    vertices : array-like
+        The vertex coordinates, as an array of shape (n, 3).
+    faces : array-like | list[list[int]]
+        The faces, as an array of shape (f, 3) of vertex indices, or as a list of polygons.
+        Polygons are triangulated as fans around their first vertex.
+    leafsize : int, optional
+        The maximum number of triangles per leaf of the tree.
+
+    Attributes
+    ----------
+    vertices : ndarray
+        The vertex coordinates.
+    triangles : ndarray
+        The vertex indices of the triangles, as an array of shape (t, 3).
+    faces : ndarray
+        The identifier of the face of every triangle.
+        These are face indices, or face identifiers if the tree was created with :meth:`from_mesh`.
+    mesh : :class:`~compas.datastructures.Mesh` | None
+        The mesh of the tree, if it was created with :meth:`from_mesh`.
+
+    Notes
+    -----
+    The triangles are divided into leaves by recursively splitting them at the median of their centroids,
+    along the axis of the largest extent of the centroids.
+    Like the batched queries of :class:`~compas.geometry.KDTree`,
+    the tree has an implicit, heap-ordered node layout in which every node stores the bounding box of its triangles,
+    and all queries are processed simultaneously, one level of the tree at a time.
+
+    The division into leaves only depends on the triangles at the time the tree is built.
+    After moving the vertices, the bounding boxes are updated with :meth:`refit`, without rebuilding the tree.
+    The queries remain correct, but become slower if the vertices move far.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> bvh = MeshBVH.from_mesh(mesh)
+    >>> bvh.contains_points([[0, 0, 0], [2, 0, 0]]).tolist()
+    [True, False]
+    >>> faces, distances = bvh.intersect_rays([[[0, 0, 0], [1, 0, 0]]])
+    >>> round(float(distances[0]), 3)
+    1.155
+
+    """
+
+    def __init__(self, vertices, faces, leafsize=4):
+        if leafsize < 2:
+            raise ValueError("The leaf size should be at least 2.")
+        self.leafsize = leafsize
+        self.mesh = None
+        self.vertices = asarray(vertices, dtype=float).reshape((-1, 3))
+        if hasattr(faces, "ndim"):
+            indices = asarray(faces, dtype=int).ravel()
+            offsets = arange(0, indices.shape[0] + 1, faces.shape[1])
+        else:
+            indices = asarray([vertex for face in faces for vertex in face], dtype=int)
+            offsets = zeros(len(faces) + 1, dtype=int)
+            offsets[1:] = cumsum([len(face) for face in faces])
+        self.triangles, self.faces = _fans(indices, offsets)
+        if not self.triangles.shape[0]:
+            raise ValueError("The tree should contain at least one triangle.")
+        self._build()
+
+    @classmethod
+    def from_mesh(cls, mesh, leafsize=4):
+        """Construct a tree of the faces of a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`~compas.datastructures.Mesh`
+            A mesh object.
+        leafsize : int, optional
+            The maximum number of triangles per leaf of the tree.
+
+        Returns
+        -------
+        :class:`~compas.datastructures.MeshBVH`
+
+        """
+        V, indices, offsets, _ = mesh.to_arrays(return_offsets=True)
+        bvh = cls.__new__(cls)
+        bvh.leafsize = leafsize
+        bvh.mesh = mesh
+        bvh.vertices = V
+        bvh.triangles, faces = _fans(indices, offsets)
+        if not bvh.triangles.shape[0]:
+            raise ValueError("The tree should contain at least one triangle.")
+        bvh.faces = asarray(list(mesh.faces()), dtype=int)[faces]
+        bvh._build()
+        return bvh
+
+    def _build(self):
+        centroids = self.vertices[self.triangles].mean(axis=1)
+        arrays = _build_arrays(centroids, self.leafsize)
+        self._order = arrays["order"]
+        self._depth = arrays["depth"]
+        self._bounds = arrays["bounds"]
+        self._width = arrays["leafsize"]
+        self._faces = self.faces[self._order]
+        self.refit()
+
+    def refit(self, vertices=None):
+        """Update the bounding boxes of the tree after the vertices have moved.
+
+        Parameters
+        ----------
+        vertices : array-like, optional
+            The new vertex coordinates, as an array of shape (n, 3), in the original order of the vertices.
+            If None, the coordinates are read from the mesh of the tree, if it has one,
+            or the current :attr:`vertices` are used.
+
+        Returns
+        -------
+        None
+
+        """
+        if vertices is not None:
+            self.vertices = asarray(vertices, dtype=float).reshape((-1, 3))
+        elif self.mesh is not None:
+            self.vertices = self.mesh.vertices_attributes_array("xyz")
+        # the triangles in the order of the leaves
+        self._xyz = self.vertices[self.triangles[self._order]]
+        self._tmin = self._xyz.min(axis=1)
+        self._tmax = self._xyz.max(axis=1)
+        start = self._bounds[:-1]
+        levels_min = [minimum.reduceat(self._tmin, start)]
+        levels_max = [maximum.reduceat(self._tmax, start)]
+        for level in range(self._depth):
+            levels_min.append(levels_min[-1].reshape((-1, 2, 3)).min(axis=1))
+            levels_max.append(levels_max[-1].reshape((-1, 2, 3)).max(axis=1))
+        self._min = vstack(levels_min[::-1])
+        self._max = vstack(levels_max[::-1])
+
+    # --------------------------------------------------------------------------
+    # traversal
+    # --------------------------------------------------------------------------
+
+    def _leaves(self, count, test):
+        """Find the leaves of which the bounding boxes pass a test, for every query.
+
+        The test is called with the indices of the queries and the nodes,
+        and returns a boolean array.
+        """
+        qindex = arange(count)
+        nodes = zeros(count, dtype=int)
+        keep = test(qindex, nodes)
+        qindex = qindex[keep]
+        nodes = nodes[keep]
+        for level in range(self._depth):
+            qindex = repeat(qindex, 2)
+            nodes = (2 * nodes[:, None] + asarray([1, 2])).ravel()
+            keep = test(qindex, nodes)
+            qindex = qindex[keep]
+            nodes = nodes[keep]
+        return qindex, nodes - (2**self._depth - 1)
+
+    def _triangles(self, qindex, leaves):
+        """Collect the triangles of the given leaves.
+
+        Returns the indices of the queries and the positions of the triangles in the order of the leaves.
+        """
+        index = self._bounds[leaves, None] + arange(self._width)
+        valid = index < self._bounds[leaves + 1, None]
+        qindex = broadcast_to(qindex[:, None], index.shape)[valid]
+        return qindex, index[valid]
+
+    # --------------------------------------------------------------------------
+    # queries
+    # --------------------------------------------------------------------------
+
+    def _hits(self, origins, directions):
+        """Intersect rays with the triangles in their path.
+
+        Returns the indices of the rays and the positions of the triangles of all hits,
+        and the distances of the hits along the rays.
+        """
+        with errstate(divide="ignore", invalid="ignore"):
+            inverse = 1.0 / where(directions == 0, 1e-300, directions)
+
+        def test(qindex, nodes):
+            o = origins[qindex]
+            i = inverse[qindex]
+            t1 = (self._min[nodes] - o) * i
+            t2 = (self._max[nodes] - o) * i
+            tnear = minimum(t1, t2).max(axis=1)
+            tfar = maximum(t1, t2).min(axis=1)
+            return (tnear <= tfar) & (tfar >= 0)
+
+        qindex, position = self._triangles(*self._leaves(origins.shape[0], test))
+        t, hit = _intersect_triangles(origins[qindex], directions[qindex], self._xyz[position])
+        return qindex[hit], position[hit], t[hit]
+
+    def intersect_rays(self, rays):
+        """Find the first intersection of multiple rays with the mesh.
+
+        Parameters
+        ----------
+        rays : sequence[tuple[[float, float, float], [float, float, float]]]
+            The rays, as pairs of a start point and a direction vector.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            For every ray, the identifier of the first face hit by the ray, or -1 if there is no hit,
+            and the distance between the start point of the ray and the hit, or infinity if there is no hit.
+            The hit points are the start points plus the distances times the unitized directions.
+
+        """
+        rays = asarray(rays, dtype=float).reshape((-1, 2, 3))
+        faces = full(rays.shape[0], -1, dtype=int)
+        distances = full(rays.shape[0], inf)
+        for start in range(0, rays.shape[0], QUERY_CHUNK_SIZE):
+            chunk = rays[start : start + QUERY_CHUNK_SIZE]
+            origins = chunk[:, 0]
+            directions = chunk[:, 1]
+            length = sqrt((directions**2).sum(axis=1))
+            directions = directions / where(length > 0, length, 1.0)[:, None]
+            qindex, position, t = self._hits(origins, directions)
+            ordering = lexsort((t, qindex))
+            qindex, first = unique(qindex[ordering], return_index=True)
+            faces[start + qindex] = self._faces[position[ordering][first]]
+            distances[start + qindex] = t[ordering][first]
+        return faces, distances
+
+    def contains_points(self, points):
+        """Verify that points are inside the mesh.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            The points.
+
+        Returns
+        -------
+        ndarray
+            For every point, True if the point is inside the mesh.
+
+        Notes
+        -----
+        A point is inside the mesh if a ray from the point crosses the faces of the mesh an odd number of times.
+        The result is only meaningful for closed meshes.
+
+        """
+        points = asarray(points, dtype=float).reshape((-1, 3))
+        inside = zeros(points.shape[0], dtype=bool)
+        direction = asarray(RAY_DIRECTION) / sqrt(sum(x**2 for x in RAY_DIRECTION))
+        for start in range(0, points.shape[0], QUERY_CHUNK_SIZE):
+            chunk = points[start : start + QUERY_CHUNK_SIZE]
+            directions = broadcast_to(direction, chunk.shape)
+            qindex, _, _ = self._hits(chunk, directions)
+            inside[start : start + chunk.shape[0]] = bincount(qindex, minlength=chunk.shape[0]) % 2 == 1
+        return inside
+
+    def closest_points(self, points):
+        """Find the closest points on the mesh to multiple points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            The points.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, ndarray]
+            The closest points, as an array of shape (len(points), 3),
+            the identifiers of the faces of the closest points,
+            and the distances between the points and the closest points.
+
+        """
+        points = asarray(points, dtype=float).reshape((-1, 3))
+        m = points.shape[0]
+        closest = zeros((m, 3))
+        faces = zeros(m, dtype=int)
+        distances = zeros(m)
+        for start in range(0, m, QUERY_CHUNK_SIZE):
+            chunk = points[start : start + QUERY_CHUNK_SIZE]
+            n = chunk.shape[0]
+
+            # descend to the closest leaf
+            # the distance to any of its triangles is an upper bound for the search
+            nodes = zeros(n, dtype=int)
+            for level in range(self._depth):
+                left = 2 * nodes + 1
+                d_left = _box_distance_sqrd(chunk, self._min[left], self._max[left])
+                d_right = _box_distance_sqrd(chunk, self._min[left + 1], self._max[left + 1])
+                nodes = left + (d_right < d_left)
+            position = self._bounds[nodes - (2**self._depth - 1)]
+            xyz = _closest_points_triangles(chunk, self._xyz[position])
+            bound = ((xyz - chunk) ** 2).sum(axis=1)
+
+            def test(qindex, nodes):
+                return _box_distance_sqrd(chunk[qindex], self._min[nodes], self._max[nodes]) <= bound[qindex]
+
+            qindex, position = self._triangles(*self._leaves(n, test))
+            xyz = _closest_points_triangles(chunk[qindex], self._xyz[position])
+            d2 = ((xyz - chunk[qindex]) ** 2).sum(axis=1)
+            ordering = lexsort((d2, qindex))
+            _, first = unique(qindex[ordering], return_index=True)
+            select = ordering[first]
+
+            closest[start : start + n] = xyz[select]
+            faces[start : start + n] = self._faces[position[select]]
+            distances[start : start + n] = sqrt(d2[select])
+        return closest, faces, distances
+
+    def overlapping_faces(self, other):
+        """Find the pairs of faces of two meshes with overlapping bounding boxes.
+
+        Parameters
+        ----------
+        other : :class:`~compas.datastructures.MeshBVH`
+            The tree of the other mesh.
+
+        Returns
+        -------
+        ndarray
+            The unique pairs of identifiers of faces of this tree and of the other tree
+            of which the bounding boxes of at least one of their triangles overlap,
+            as an array of shape (k, 2).
+
+        Notes
+        -----
+        The bounding boxes of the triangles are much tighter than the bounding boxes of the faces,
+        such that the result is a small set of candidates for exact intersection tests.
+
+        """
+        a = zeros(1, dtype=int)
+        b = zeros(1, dtype=int)
+        keep = _overlap(self._min[a], self._max[a], other._min[b], other._max[b])
+        a = a[keep]
+        b = b[keep]
+        for level in range(max(self._depth, other._depth)):
+            if level < self._depth:
+                a = (2 * a[:, None] + asarray([1, 2])).ravel()
+                b = repeat(b, 2)
+            if level < other._depth:
+                b = (2 * b[:, None] + asarray([1, 2])).ravel()
+                a = repeat(a, 2)
+            keep = _overlap(self._min[a], self._max[a], other._min[b], other._max[b])
+            a = a[keep]
+            b = b[keep]
+        pairs, a = self._triangles(arange(a.shape[0]), a - (2**self._depth - 1))
+        b = b[pairs] - (2**other._depth - 1)
+        pairs, b = other._triangles(arange(b.shape[0]), b)
+        a = a[pairs]
+        keep = _overlap(self._tmin[a], self._tmax[a], other._tmin[b], other._tmax[b])
+        faces = concatenate((self._faces[a[keep]][:, None], other._faces[b[keep]][:, None]), axis=1)
+        return unique(faces, axis=0) if faces.shape[0] else faces
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _fans(indices, offsets):
+    """Triangulate polygons given as flat vertex indices and offsets, as fans around their first vertex.
+
+    Returns the vertex indices of the triangles and the index of the polygon of every triangle.
+    """
+    sizes = maximum(diff(offsets) - 2, 0)
+    faces = repeat(arange(sizes.shape[0]), sizes)
+    local = arange(faces.shape[0]) - (cumsum(sizes) - sizes)[faces] + 1
+    first = offsets[:-1][faces]
+    triangles = concatenate(
+        (
+            indices[first][:, None],
+            indices[first + local][:, None],
+            indices[first + local + 1][:, None],
+        ),
+        axis=1,
+    )
+    return triangles, faces
+
+
+def _overlap(amin, amax, bmin, bmax):
+    return ((amin <= bmax) & (bmin <= amax)).all(axis=1)
+
+
+def _intersect_triangles(origins, directions, triangles, tol=1e-12):
+    """Intersect rays with triangles, pairwise, with the Moeller-Trumbore algorithm.
+
+    Returns the distances along the rays and a mask of the hits in front of the start points.
+    """
+    a = triangles[:, 0]
+    e1 = triangles[:, 1] - a
+    e2 = triangles[:, 2] - a
+    p = cross(directions, e2)
+    det = (e1 * p).sum(axis=1)
+    valid = abs(det) > tol
+    inverse = 1.0 / where(valid, det, 1.0)
+    s = origins - a
+    u = (s * p).sum(axis=1) * inverse
+    q = cross(s, e1)
+    v = (directions * q).sum(axis=1) * inverse
+    t = (e2 * q).sum(axis=1) * inverse
+    return t, valid & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+
+
+def _closest_points_triangles(points, triangles):
+    """Compute the closest points on triangles, pairwise.
+
+    The regions of the triangles are tested as in [1]_.
+    The assignments are made in reverse order, such that the first region containing a point takes precedence.
+
+    References
+    ----------
+    .. [1] Ericson, C. *Real-Time Collision Detection*. Morgan Kaufmann, 2005. Section 5.1.5.
+
+    """
+    a = triangles[:, 0]
+    b = triangles[:, 1]
+    c = triangles[:, 2]
+    ab = b - a
+    ac = c - a
+    ap = points - a
+    bp = points - b
+    cp = points - c
+    d1 = (ab * ap).sum(axis=1)
+    d2 = (ac * ap).sum(axis=1)
+    d3 = (ab * bp).sum(axis=1)
+    d4 = (ac * bp).sum(axis=1)
+    d5 = (ab * cp).sum(axis=1)
+    d6 = (ac * cp).sum(axis=1)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    def ratio(x, y):
+        return x / where(y != 0, y, 1.0)
+
+    denom = va + vb + vc
+    result = a + ratio(vb, denom)[:, None] * ab + ratio(vc, denom)[:, None] * ac
+    regions = [
+        (denom == 0, a),
+        ((va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0), b + ratio(d4 - d3, (d4 - d3) + (d5 - d6))[:, None] * (c - b)),
+        ((vb <= 0) & (d2 >= 0) & (d6 <= 0), a + ratio(d2, d2 - d6)[:, None] * ac),
+        ((d6 >= 0) & (d5 <= d6), c),
+        ((vc <= 0) & (d1 >= 0) & (d3 <= 0), a + ratio(d1, d1 - d3)[:, None] * ab),
+        ((d3 >= 0) & (d4 <= d3), b),
+        ((d1 <= 0) & (d2 <= 0), a),
+    ]
+    for mask, xyz in regions:
+        result = where(mask[:, None], xyz, result)
+    return result
@@ -2,7 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.utilities import geometric_key
+from compas.utilities import SpatialHash
 
 
 def mesh_delete_duplicate_vertices(mesh, precision=None):
@@ -44,24 +44,25 @@ def mesh_delete_duplicate_vertices(mesh, precision=None):
     36
 
     """
-    key_gkey = {key: geometric_key(mesh.vertex_attributes(key, "xyz"), precision=precision) for key in mesh.vertices()}
-    gkey_key = {gkey: key for key, gkey in iter(key_gkey.items())}
+    mesh.clear_cache()
+    keys = list(mesh.vertices())
+    spatialhash = SpatialHash(precision=precision)
+    indices = spatialhash.add_points(mesh.vertices_attributes("xyz", keys=keys))
+    index_key = dict(zip(indices, keys))
+    key_key = {key: index_key[index] for key, index in zip(keys, indices)}
 
-    for key in list(mesh.vertices()):
-        test = gkey_key[key_gkey[key]]
-        if test != key:
+    for key in keys:
+        if key_key[key] != key:
+            for u in list(mesh.halfedge[key]):
+                if u in mesh.halfedge and key in mesh.halfedge[u]:
+                    del mesh.halfedge[u][key]
             del mesh.vertex[key]
             del mesh.halfedge[key]
-            for u in mesh.halfedge:
-                nbrs = list(mesh.halfedge[u].keys())
-                for v in nbrs:
-                    if v == key:
-                        del mesh.halfedge[u][v]
 
     for fkey in mesh.faces():
         seen = set()
         face = []
-        for key in [gkey_key[key_gkey[key]] for key in mesh.face_vertices(fkey)]:
+        for key in [key_key[key] for key in mesh.face_vertices(fkey)]:
             if key not in seen:
                 seen.add(key)
                 face.append(key)
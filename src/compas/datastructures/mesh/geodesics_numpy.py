@@ -2,109 +2,247 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from numpy import array
+from numpy import arange
+from numpy import asarray
+from numpy import concatenate
+from numpy import inf
 from numpy import cross
-from numpy import bincount
 from numpy import zeros
 from numpy import mean
+from numpy import ones
 from numpy import tan
 from numpy import arccos
+from numpy import setdiff1d
+from numpy import sqrt
 from numpy import sum
+from numpy import unique
+from numpy import where
 
+from scipy.sparse import coo_matrix
+from scipy.sparse import hstack
 from scipy.sparse import spdiags
+from scipy.sparse.csgraph import connected_components
 from scipy.sparse.linalg import splu
 
 from compas.numerical import normrow
 from compas.numerical import normalizerow
 
-from .matrices import trimesh_cotangent_laplacian_matrix
+from .matrices import trimesh_vertexarea_matrix
 
 
-def mesh_geodesic_distances_numpy(mesh, sources, m=1.0):
-    """Compute geodesic from the vertices of a mesh to given source vertices.
+class HeatGeodesicSolver(object):
+    """Solver for geodesic distances on a triangle mesh with the heat method.
+
+    The heat flow and Poisson systems of the heat method only depend on the mesh.
+    They are factorized once, when the solver is created,
+    such that the distances from any set of sources can be computed with back substitutions only.
 
     Parameters
     ----------
     mesh : :class:`~compas.datastructures.Mesh`
-        A mesh instance.
-    sources : list[int]
-        A list of vertex identifiers from which the distances should be calculated.
+        A triangle mesh.
     m : float, optional
-        ?
+        Multiplier of the time step of the heat flow,
+        which is ``m`` times the square of the average edge length.
 
-    Returns
-    -------
-    array
-        Distance values.
+    Attributes
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        The mesh.
+    vertex_index : dict[int, int]
+        Mapping between vertex identifiers and the corresponding indices in the arrays of distances.
+
+    Notes
+    -----
+    The solver is not updated if the mesh changes.
+    Create a new solver instead.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> mesh.quads_to_triangles()
+    >>> solver = HeatGeodesicSolver(mesh)
+    >>> d = solver.distances([0])
+    >>> d.shape
+    (121,)
+    >>> D = solver.batch_distances([[0], [10, 120]])
+    >>> D.shape
+    (2, 121)
 
     """
-    Lc = trimesh_cotangent_laplacian_matrix(mesh)
 
-    vertex_index = mesh.vertex_index()
-    vertices = mesh.vertices_attributes("xyz")
-    faces = [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in mesh.faces()]
+    def __init__(self, mesh, m=1.0):
+        self.mesh = mesh
 
-    V = array(vertices)
-    F = array(faces, dtype=int)
+        V, F, self.vertex_index = mesh.to_arrays()
+        n = V.shape[0]
+        f = F.shape[0]
 
-    e01 = V[F[:, 1]] - V[F[:, 0]]
-    e12 = V[F[:, 2]] - V[F[:, 1]]
-    e20 = V[F[:, 0]] - V[F[:, 2]]
+        e01 = V[F[:, 1]] - V[F[:, 0]]
+        e12 = V[F[:, 2]] - V[F[:, 1]]
+        e20 = V[F[:, 0]] - V[F[:, 2]]
 
-    normal = cross(e01, e12)
-    A2 = normrow(normal)
-    A3 = A2.ravel() / 6
+        h = mean([normrow(e01), normrow(e12), normrow(e20)])
+        t = m * h**2
 
-    VA = zeros(V.shape[0])
-    for i in (0, 1, 2):
-        b = bincount(F[:, i], A3)
-        VA[: len(b)] += b
-    VA = spdiags(VA, 0, V.shape[0], V.shape[0])
+        # the symmetric cotangent Laplacian
+        # and the divergence of a vector field per face, from the stacked x, y and z components
 
-    h = mean([normrow(e01), normrow(e12), normrow(e20)])
-    t = m * h**2
+        weights = []
+        rows = []
+        cols = []
+        data = [[], [], []]
+        for i1, i2, i3 in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]:
+            v1 = F[:, i1]
+            v2 = F[:, i2]
+            v3 = F[:, i3]
 
-    u0 = zeros(V.shape[0])
-    u0[sources] = 1.0
+            e1 = V[v2] - V[v1]
+            e2 = V[v3] - V[v1]
+            e0 = V[v3] - V[v2]
 
-    # A = VA - t * Lc
-    # print(A.sum(axis=1))
+            a = 1 / tan(arccos(sum(normalizerow(-e2) * normalizerow(-e0), axis=1)))
+            b = 1 / tan(arccos(sum(normalizerow(-e1) * normalizerow(+e0), axis=1)))
 
-    u = splu((VA - t * Lc).tocsc()).solve(u0)
+            weights.append(0.5 * a)
+            rows.append(v1)
+            cols.append(v2)
 
-    unit = normal / A2
+            for axis in (0, 1, 2):
+                data[axis].append(0.5 * (a * e1[:, axis] + b * e2[:, axis]))
 
-    unit_e01 = cross(unit, e01)
-    unit_e12 = cross(unit, e12)
-    unit_e20 = cross(unit, e20)
+        weights = concatenate(weights)
+        rows = concatenate(rows)
+        cols = concatenate(cols)
 
-    grad_u = (unit_e01 * u[F[:, 2], None] + unit_e12 * u[F[:, 0], None] + unit_e20 * u[F[:, 1], None]) / A2
-
-    X = -grad_u / normrow(grad_u)
-
-    div_X = zeros(V.shape[0])
+        W = coo_matrix(
+            (concatenate((weights, weights)), (concatenate((rows, cols)), concatenate((cols, rows)))), shape=(n, n)
+        )
+        W = W.tocsr()
+        Lc = W - spdiags(asarray(W.sum(axis=1)).ravel(), 0, n, n)
+        VA = trimesh_vertexarea_matrix(mesh)
+
+        faces = concatenate([arange(f)] * 3)
+        blocks = [coo_matrix((concatenate(data[axis]), (rows, faces)), shape=(n, f)) for axis in (0, 1, 2)]
+        self._divergence = hstack(blocks).tocsr()
+
+        # the gradient of a field per face, as the stacked x, y and z components
+
+        normal = cross(e01, e12)
+        A2 = normrow(normal)
+        unit = normal / A2
+
+        unit_e01 = cross(unit, e01) / A2
+        unit_e12 = cross(unit, e12) / A2
+        unit_e20 = cross(unit, e20) / A2
+
+        cols = concatenate((F[:, 2], F[:, 0], F[:, 1]))
+        self._gradient = []
+        for axis in (0, 1, 2):
+            data = concatenate((unit_e01[:, axis], unit_e12[:, axis], unit_e20[:, axis]))
+            self._gradient.append(coo_matrix((data, (faces, cols)), shape=(f, n)).tocsr())
+
+        # the Poisson system is only defined up to a constant per connected component
+        # which is fixed by removing the first vertex of every component from the system
+
+        A = coo_matrix((ones(rows.shape[0]), (rows, cols)), shape=(n, n))
+        count, labels = connected_components(A, directed=False)
+        _, pinned = unique(labels, return_index=True)
+        self._components = [labels == label for label in range(count)]
+        self._free = setdiff1d(arange(n), pinned)
+
+        self._heat = splu((VA - t * Lc).tocsc())
+        self._poisson = splu(Lc.tocsc()[self._free][:, self._free])
+
+    def _solve(self, U0):
+        U = self._heat.solve(U0)
+        G = [gradient.dot(U) for gradient in self._gradient]
+        length = sqrt(G[0] ** 2 + G[1] ** 2 + G[2] ** 2)
+        # the heat does not reach the faces of components without sources
+        length[length == 0] = 1.0
+        X = -concatenate(G, axis=0) / concatenate([length] * 3, axis=0)
+        phi = zeros(U.shape)
+        phi[self._free] = self._poisson.solve(self._divergence.dot(X)[self._free])
+        # the distances of every component are relative to the sources in that component
+        for component in self._components:
+            sources = U0[component] > 0
+            offset = where(sources, phi[component], inf).min(axis=0)
+            values = phi[component] - offset
+            values[:, ~sources.any(axis=0)] = inf
+            phi[component] = values
+        return phi
+
+    def distances(self, sources):
+        """Compute the geodesic distances from the vertices of the mesh to a set of source vertices.
+
+        Parameters
+        ----------
+        sources : list[int]
+            The identifiers of the source vertices.
+
+        Returns
+        -------
+        ndarray
+            The distances of all vertices, in the order of :attr:`vertex_index`.
+            Vertices in connected components of the mesh without sources have an infinite distance.
+
+        """
+        return self.batch_distances([sources])[0]
+
+    def batch_distances(self, sources):
+        """Compute the geodesic distances from the vertices of the mesh to multiple sets of source vertices.
+
+        The distances for all sets of sources are computed simultaneously,
+        as the solution of systems with multiple right-hand sides.
+
+        Parameters
+        ----------
+        sources : list[list[int]]
+            A list of sets of identifiers of source vertices.
+
+        Returns
+        -------
+        ndarray
+            An array of shape (len(sources), number of vertices),
+            with in every row the distances of the vertices in the order of :attr:`vertex_index`
+            to the corresponding set of source vertices.
+            Vertices in connected components of the mesh without sources have an infinite distance.
+
+        """
+        U0 = zeros((len(self.vertex_index), len(sources)))
+        for column, vertices in enumerate(sources):
+            U0[[self.vertex_index[vertex] for vertex in vertices], column] = 1.0
+        return asarray(self._solve(U0).T)
 
-    for i1, i2, i3 in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]:
-        v1 = F[:, i1]
-        v2 = F[:, i2]
-        v3 = F[:, i3]
 
-        e1 = V[v2] - V[v1]
-        e2 = V[v3] - V[v1]
-        e0 = V[v3] - V[v2]
+def mesh_geodesic_distances_numpy(mesh, sources, m=1.0):
+    """Compute geodesic from the vertices of a mesh to given source vertices.
 
-        a = 1 / tan(arccos(sum(normalizerow(-e2) * normalizerow(-e0), axis=1)))
-        b = 1 / tan(arccos(sum(normalizerow(-e1) * normalizerow(+e0), axis=1)))
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh instance.
+    sources : list[int]
+        A list of vertex identifiers from which the distances should be calculated.
+    m : float, optional
+        Multiplier of the time step of the heat flow,
+        which is ``m`` times the square of the average edge length.
 
-        div_X += bincount(
-            v1,
-            0.5 * (a * sum(e1 * X, axis=1) + b * sum(e2 * X, axis=1)),
-            minlength=V.shape[0],
-        )
+    Returns
+    -------
+    array
+        Distance values.
 
-    # print(Lc.sum(axis=1))
+    See Also
+    --------
+    :class:`HeatGeodesicSolver`
 
-    phi = splu(Lc.tocsc()).solve(div_X)
-    phi -= phi.min()
+    Notes
+    -----
+    To compute the distances to many different sets of sources on the same mesh,
+    use a :class:`HeatGeodesicSolver` instead,
+    which factorizes the underlying systems of equations only once.
 
-    return phi
+    """
+    return HeatGeodesicSolver(mesh, m=m).distances(sources)
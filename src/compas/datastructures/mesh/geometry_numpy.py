@@ -0,0 +1,307 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import cross
+from numpy import diff
+from numpy import divide
+from numpy import repeat
+from numpy import where
+from numpy import zeros
+
+from compas.numerical import normrow
+
+
+def _fan(X, o, sizes, offsets, groups, a, b):
+    """Signed double areas and area weighted centroids of polygons, from the triangles between their center and segments.
+
+    The signs of the areas follow :func:`compas.geometry.area_polygon` and :func:`compas.geometry.centroid_polygon`,
+    which compare the normal of every triangle with the normal of the triangle of the first segment.
+    """
+    n = sizes.shape[0]
+    oa = X[a] - o[groups]
+    ob = X[b] - o[groups]
+    normal = cross(oa, ob)
+    length = normrow(normal).ravel()
+    nonempty = offsets[sizes > 0]
+    reference = zeros((n, 3))
+    reference[sizes > 0] = normal[nonempty]
+    sign = where((normal * reference[groups]).sum(axis=1) > 0, 1.0, -1.0)
+    sign[nonempty] = 1.0
+    a2 = sign * length
+    A2 = bincount(groups, a2, minlength=n)
+    c = (o[groups] + X[a] + X[b]) / 3.0
+    C = zeros((n, 3))
+    for axis in (0, 1, 2):
+        C[:, axis] = bincount(groups, a2 * c[:, axis], minlength=n)
+    return A2, C
+
+
+def _sum(groups, values, n):
+    """Sum rows of vectors per group."""
+    result = zeros((n, 3))
+    for axis in (0, 1, 2):
+        result[:, axis] = bincount(groups, values[:, axis], minlength=n)
+    return result
+
+
+def _unitize(vectors):
+    length = normrow(vectors)
+    return divide(vectors, length, out=zeros(vectors.shape), where=length > 0)
+
+
+def _faces(mesh):
+    """Coordinates, corner indices and centroids of the faces of a mesh.
+
+    For every corner of every face, ``groups`` contains the index of the face,
+    ``b`` the index of the vertex, and ``a`` the index of the previous vertex of the face.
+    """
+    X, b, offsets, _ = mesh.to_arrays(return_offsets=True)
+    sizes = diff(offsets)
+    offsets = offsets[:-1]
+    groups = repeat(arange(sizes.shape[0]), sizes)
+    local = arange(b.shape[0]) - offsets[groups]
+    a = b[offsets[groups] + (local - 1) % sizes[groups]]
+    o = _sum(groups, X[b], sizes.shape[0])
+    o /= where(sizes > 0, sizes, 1)[:, None]
+    return X, o, sizes, offsets, groups, a, b
+
+
+def mesh_faces_centroids_numpy(mesh):
+    """Compute the centroids of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The centroids of the faces, as an array of shape (f, 3),
+        in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_centroid`
+
+    """
+    _, o, _, _, _, _, _ = _faces(mesh)
+    return o
+
+
+def mesh_faces_centers_numpy(mesh):
+    """Compute the centers of mass of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The centers of the faces, as an array of shape (f, 3),
+        in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_center`
+
+    Notes
+    -----
+    The center of a triangle, and of a face with zero area, is its centroid.
+
+    """
+    X, o, sizes, offsets, groups, a, b = _faces(mesh)
+    A2, C = _fan(X, o, sizes, offsets, groups, a, b)
+    ok = (sizes > 3) & (A2 != 0)
+    centers = o.copy()
+    centers[ok] = C[ok] / A2[ok, None]
+    return centers
+
+
+def mesh_faces_normals_numpy(mesh, unitized=True):
+    """Compute the normals of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    unitized : bool, optional
+        If True, unitize the normal vectors.
+        Otherwise, the length of every normal is the area of the projection of the face
+        on the plane perpendicular to the normal.
+
+    Returns
+    -------
+    ndarray
+        The normals of the faces, as an array of shape (f, 3),
+        in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_normal`
+
+    Notes
+    -----
+    Normals of length zero are not unitized.
+
+    """
+    X, o, sizes, _, groups, a, b = _faces(mesh)
+    normals = 0.5 * _sum(groups, cross(X[a] - o[groups], X[b] - o[groups]), sizes.shape[0])
+    if unitized:
+        return _unitize(normals)
+    return normals
+
+
+def mesh_faces_areas_numpy(mesh):
+    """Compute the areas of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The areas of the faces, as an array of shape (f,),
+        in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_area`
+
+    """
+    A2, _ = _fan(*_faces(mesh))
+    return 0.5 * abs(A2)
+
+
+def mesh_faces_flatness_numpy(mesh, maxdev=0.02):
+    """Compute the flatness of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    maxdev : float, optional
+        A maximum value for the allowed deviation from flatness.
+
+    Returns
+    -------
+    ndarray
+        The flatness of the faces, as an array of shape (f,),
+        in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    Raises
+    ------
+    ValueError
+        If the mesh has faces with less than four vertices.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_flatness`
+
+    """
+    X, _, sizes, offsets, groups, a, b = _faces(mesh)
+    if (sizes < 4).any():
+        raise ValueError("The flatness is only defined for faces with at least four vertices.")
+    lengths = normrow(X[b] - X[a]).ravel()
+    length = bincount(groups, lengths, minlength=sizes.shape[0]) / sizes
+    p0, p1, p2, p3 = [X[b[offsets + i]] for i in range(4)]
+    ab = p2 - p0
+    cd = p3 - p1
+    ac = p1 - p0
+    n = cross(ab, cd)
+    nn = normrow(n).ravel()
+    # the distance between parallel diagonals is the distance of the first point to the second diagonal
+    ll = normrow(cd).ravel()
+    parallel = normrow(cross(cd, -ac)).ravel() / where(ll > 0, ll, 1.0)
+    skew = abs((n * ac).sum(axis=1)) / where(nn > 0, nn, 1.0)
+    d = where(nn > 0, skew, parallel)
+    return (d / length) / maxdev
+
+
+def mesh_edges_lengths_numpy(mesh):
+    """Compute the lengths of all edges of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The lengths of the edges, as an array of shape (e,),
+        in the order of :meth:`~compas.datastructures.Mesh.edges`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.edge_length`
+
+    """
+    X, _, _, vertex_index = mesh.to_arrays(return_offsets=True)
+    edges = asarray([(vertex_index[u], vertex_index[v]) for u, v in mesh.edges()], dtype=int).reshape((-1, 2))
+    return normrow(X[edges[:, 1]] - X[edges[:, 0]]).ravel()
+
+
+def mesh_vertices_normals_numpy(mesh):
+    """Compute the normals of all vertices of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The unitized normals of the vertices, as an array of shape (n, 3),
+        in the order of :meth:`~compas.datastructures.Mesh.vertices`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.vertex_normal`
+
+    Notes
+    -----
+    The normal of a vertex is the average of the (non-unitized) normals of its faces.
+    The normal of a vertex without faces is a zero vector.
+
+    """
+    X, o, sizes, _, groups, a, b = _faces(mesh)
+    normals = 0.5 * _sum(groups, cross(X[a] - o[groups], X[b] - o[groups]), sizes.shape[0])
+    return _unitize(_sum(b, normals[groups], X.shape[0]))
+
+
+def mesh_vertices_areas_numpy(mesh):
+    """Compute the tributary areas of all vertices of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The areas of the vertices, as an array of shape (n,),
+        in the order of :meth:`~compas.datastructures.Mesh.vertices`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.vertex_area`
+
+    """
+    X, o, sizes, offsets, groups, a, b = _faces(mesh)
+    local = arange(b.shape[0]) - offsets[groups]
+    c = b[offsets[groups] + (local + 1) % sizes[groups]]
+    p = X[b]
+    co = o[groups] - p
+    area = normrow(cross(X[c] - p, co)).ravel() + normrow(cross(X[a] - p, co)).ravel()
+    return 0.25 * bincount(b, area, minlength=X.shape[0])
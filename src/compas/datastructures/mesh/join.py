@@ -3,7 +3,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 from compas.utilities import pairwise
-from compas.utilities import geometric_key
+from compas.utilities import SpatialHash
 
 
 def mesh_weld(mesh, precision=None, cls=None):
@@ -14,7 +14,9 @@ def mesh_weld(mesh, precision=None, cls=None):
     mesh : :class:`~compas.datastructures.Mesh`
         A mesh.
     precision: str, optional
-        Tolerance distance for welding.
+        Precision for point comparison in the form of a string formatting specifier.
+        For example, floating point precision (``'3f'``), or decimal integer (``'d'``).
+        Default is :attr:`compas.PRECISION`.
     cls : Type[:class:`~compas.datastructures.Mesh`], optional
         Type of the welded mesh.
         This defaults to the type of the first mesh in the list.
@@ -28,14 +30,12 @@ def mesh_weld(mesh, precision=None, cls=None):
     if cls is None:
         cls = type(mesh)
 
-    geo = geometric_key
-
-    key_xyz = {key: mesh.vertex_coordinates(key) for key in mesh.vertices()}
-    gkey_key = {geo(xyz, precision): key for key, xyz in key_xyz.items()}
-    gkey_index = {gkey: index for index, gkey in enumerate(gkey_key)}
+    keys = list(mesh.vertices())
+    spatialhash = SpatialHash(precision=precision)
+    key_index = dict(zip(keys, spatialhash.add_points(mesh.vertices_attributes("xyz", keys=keys))))
 
-    vertices = [key_xyz[key] for gkey, key in gkey_key.items()]
-    faces = [[gkey_index[geo(key_xyz[key], precision)] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+    vertices = spatialhash.points
+    faces = [[key_index[key] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
 
     faces[:] = [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
     faces[:] = [face for face in faces if len(face) > 2]  # make sure no face has less than 3 vertices
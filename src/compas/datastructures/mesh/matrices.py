@@ -2,12 +2,20 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from numpy import arange
+from numpy import array_equal
 from numpy import asarray
-from numpy import zeros
-from numpy import cross
 from numpy import bincount
+from numpy import concatenate
+from numpy import cross
+from numpy import diff
+from numpy import divide
+from numpy import ones
+from numpy import repeat
+from numpy import zeros
 
 from scipy.sparse import coo_matrix
+from scipy.sparse import identity
 from scipy.sparse import spdiags
 
 from compas.geometry import dot_vectors
@@ -20,6 +28,76 @@ from compas.numerical import degree_matrix
 from compas.numerical import connectivity_matrix
 from compas.numerical import face_matrix
 
+from compas.geometry import trimesh_gradient_numpy
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _convert(M, rtype):
+    if rtype == "csr":
+        return M.tocsr()
+    if rtype == "csc":
+        return M.tocsc()
+    if rtype == "array":
+        return M.toarray()
+    if rtype == "list":
+        return M.toarray().tolist()
+    return M.tocoo()
+
+
+def _mesh_corners(mesh, cache=False):
+    """Index arrays of the corners of the faces of a mesh.
+
+    Returns the number of vertices, the offsets of the faces in the corner arrays,
+    and for every corner of every face the index of its vertex and the indices of the next and previous vertex of the face.
+    The indices refer to the order of :meth:`~compas.datastructures.Mesh.vertices`.
+    """
+    if cache:
+        corners = mesh._cache.get("matrices.corners")
+        if corners is not None:
+            return corners
+    _, i, offsets, vertex_index = mesh.to_arrays(return_offsets=True)
+    sizes = diff(offsets)
+    offsets = offsets[:-1]
+    start = repeat(offsets, sizes)
+    size = repeat(sizes, sizes)
+    local = arange(i.shape[0]) - start
+    j = i[start + (local + 1) % size]
+    k = i[start + (local - 1) % size]
+    corners = len(vertex_index), offsets, i, j, k
+    if cache:
+        mesh._cache["matrices.corners"] = corners
+    return corners
+
+
+def _mesh_xyz(mesh):
+    return mesh.vertices_attributes_array("xyz")
+
+
+def _cached(mesh, name, xyz, build, cache=False):
+    """Build an operator of a mesh, or retrieve it from the cache of the mesh.
+
+    Operators that depend on the geometry of the mesh are cached together with the vertex coordinates used to build them,
+    and are rebuilt if the coordinates have changed.
+    The cache of the mesh is cleared whenever its topology changes.
+    """
+    if not cache:
+        return build()
+    entry = mesh._cache.get(name)
+    if entry is not None and (xyz is None or array_equal(entry[0], xyz)):
+        return entry[1]
+    M = build()
+    mesh._cache[name] = (None if xyz is None else xyz.copy()), M
+    return M
+
+
+# ==============================================================================
+# Matrices
+# ==============================================================================
+
 
 def mesh_adjacency_matrix(mesh, rtype="array"):
     """Creates a vertex adjacency matrix from a Mesh datastructure.
@@ -179,7 +257,7 @@ def mesh_face_matrix(mesh, rtype="array"):
     return face_matrix(face_vertices, rtype=rtype)
 
 
-def mesh_laplacian_matrix(mesh, rtype="csr"):
+def mesh_laplacian_matrix(mesh, rtype="csr", cache=False):
     r"""Construct a Laplacian matrix with uniform weights from a mesh data structure.
 
     Parameters
@@ -188,6 +266,8 @@ def mesh_laplacian_matrix(mesh, rtype="csr"):
         Instance of mesh.
     rtype : Literal['array', 'csc', 'csr', 'coo', 'list'], optional
         Format of the result.
+    cache : bool, optional
+        If True, store the matrix on the mesh, and reuse it as long as the topology of the mesh does not change.
 
     Returns
     -------
@@ -234,34 +314,16 @@ def mesh_laplacian_matrix(mesh, rtype="csr"):
     >>> d = L.dot(xyz)
 
     """
-    data, rows, cols = [], [], []
-    vertex_index = mesh.vertex_index()
 
-    for vertex in mesh.vertices():
-        i = vertex_index[vertex]
-        nbrs = mesh.vertex_neighbors(vertex)
-        w = len(nbrs)
-        data.append(-1.0)
-        rows.append(i)
-        cols.append(i)
-        d = 1.0 / w
-        for nbr in nbrs:
-            j = vertex_index[nbr]
-            data.append(d)
-            rows.append(i)
-            cols.append(j)
-
-    L = coo_matrix((data, (rows, cols)))
+    def build():
+        n, _, i, j, _ = _mesh_corners(mesh, cache=cache)
+        A = coo_matrix((ones(2 * i.shape[0]), (concatenate((i, j)), concatenate((j, i)))), shape=(n, n)).tocsr()
+        A.data[:] = 1.0
+        degree = diff(A.indptr)
+        d = divide(1.0, degree, out=zeros(n), where=degree > 0)
+        return (spdiags(d, 0, n, n).dot(A) - identity(n)).tocsr()
 
-    if rtype == "csr":
-        return L.tocsr()
-    if rtype == "csc":
-        return L.tocsc()
-    if rtype == "array":
-        return L.toarray()
-    if rtype == "list":
-        return L.toarray().tolist()
-    return L
+    return _convert(_cached(mesh, "matrices.laplacian", None, build, cache=cache), rtype)
 
 
 def trimesh_edge_cotangent(mesh, edge):
@@ -315,13 +377,18 @@ def trimesh_edge_cotangents(mesh, edge):
     return a, b
 
 
-def trimesh_cotangent_laplacian_matrix(mesh, rtype="csr"):
+def trimesh_cotangent_laplacian_matrix(mesh, rtype="csr", cache=False):
     r"""Construct the Laplacian of a triangular mesh with cotangent weights.
 
     Parameters
     ----------
     mesh : :class:`~compas.datastructures.Mesh`
         Instance of mesh.
+    rtype : Literal['array', 'csc', 'csr', 'coo', 'list'], optional
+        Format of the result.
+    cache : bool, optional
+        If True, store the matrix on the mesh,
+        and reuse it as long as the topology and the vertex coordinates of the mesh do not change.
 
     Returns
     -------
@@ -354,63 +421,49 @@ def trimesh_cotangent_laplacian_matrix(mesh, rtype="csr"):
 
          w_{ij} = \frac{\omega_{ij}}{\sum_{(i, k) \in \mathbf{E}_{i}} \omega_{ik}}
 
+    and :math:`\omega_{ij}` the sum of the cotangents of the angles opposite the edge :math:`(i, j)`
+    in the faces on either side of the edge.
+
+    The matrix is assembled from the corners of all faces at once,
+    rather than from the neighbors of every vertex separately.
+
     References
     ----------
     .. [1] Nealen A., Igarashi T., Sorkine O. and Alexa M.
         `Laplacian Mesh Optimization <https://igl.ethz.ch/projects/Laplacian-mesh-processing/Laplacian-mesh-optimization/lmo.pdf>`_.
 
     """
-    vertex_index = mesh.vertex_index()
-    n = mesh.number_of_vertices()
-    data = []
-    rows = []
-    cols = []
-
-    for vertex in mesh.vertices():
-        nbrs = mesh.vertex_neighbors(vertex)
-        i = vertex_index[vertex]
-        data.append(-1.0)
-        rows.append(i)
-        cols.append(i)
-
-        W = 0
-        for nbr in nbrs:
-            a, b = trimesh_edge_cotangents(mesh, (vertex, nbr))
-            w = a + b
-            W += w
-
-        for nbr in nbrs:
-            j = vertex_index[nbr]
-            a, b = trimesh_edge_cotangents(mesh, (vertex, nbr))
-            w = a + b
-            data.append(w / W)
-            rows.append(i)
-            cols.append(j)
-
-    L = coo_matrix((data, (rows, cols)), shape=(n, n))
+    xyz = _mesh_xyz(mesh)
 
-    if rtype == "csr":
-        return L.tocsr()
-    if rtype == "csc":
-        return L.tocsc()
-    if rtype == "array":
-        return L.toarray()
-    if rtype == "list":
-        return L.toarray().tolist()
-    return L
+    def build():
+        n, _, i, j, k = _mesh_corners(mesh, cache=cache)
+        a = xyz[i] - xyz[k]
+        b = xyz[j] - xyz[k]
+        length = normrow(cross(a, b)).ravel()
+        cotangent = divide((a * b).sum(axis=1), length, out=zeros(i.shape[0]), where=length > 0)
+        data = concatenate((cotangent, cotangent))
+        W = coo_matrix((data, (concatenate((i, j)), concatenate((j, i)))), shape=(n, n)).tocsr()
+        w = asarray(W.sum(axis=1)).ravel()
+        d = divide(1.0, w, out=zeros(n), where=w != 0)
+        return (spdiags(d, 0, n, n).dot(W) - identity(n)).tocsr()
+
+    return _convert(_cached(mesh, "matrices.cotangent_laplacian", xyz, build, cache=cache), rtype)
 
 
 def trimesh_positive_cotangent_laplacian_matrix(mesh):
     raise NotImplementedError
 
 
-def trimesh_vertexarea_matrix(mesh):
+def trimesh_vertexarea_matrix(mesh, cache=False):
     """Compute the n x n diagonal matrix of per-vertex voronoi areas.
 
     Parameters
     ----------
     mesh : :class:`~compas.datastructures.Mesh`
         The triangle mesh data structure.
+    cache : bool, optional
+        If True, store the matrix on the mesh,
+        and reuse it as long as the topology and the vertex coordinates of the mesh do not change.
 
     Returns
     -------
@@ -426,19 +479,61 @@ def trimesh_vertexarea_matrix(mesh):
     [0.1666, 0.1666, 0.1666]
 
     """
-    vertex_index = mesh.vertex_index()
-    xyz = asarray(mesh.vertices_attributes("xyz"), dtype=float)
-    tris = asarray(
-        [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in mesh.faces()],
-        dtype=int,
-    )
-    e1 = xyz[tris[:, 1]] - xyz[tris[:, 0]]
-    e2 = xyz[tris[:, 2]] - xyz[tris[:, 0]]
-    n = cross(e1, e2)
-    a = 0.5 * normrow(n).ravel()
-    a3 = a / 3.0
-    area = zeros(xyz.shape[0])
-    for i in (0, 1, 2):
-        b = bincount(tris[:, i], a3)
-        area[: len(b)] += b
-    return spdiags(area, 0, xyz.shape[0], xyz.shape[0])
+    xyz = _mesh_xyz(mesh)
+
+    def build():
+        n, offsets, i, _, _ = _mesh_corners(mesh, cache=cache)
+        tris = i[offsets[:, None] + arange(3)]
+        e1 = xyz[tris[:, 1]] - xyz[tris[:, 0]]
+        e2 = xyz[tris[:, 2]] - xyz[tris[:, 0]]
+        a3 = normrow(cross(e1, e2)).ravel() / 6.0
+        area = zeros(n)
+        for corner in (0, 1, 2):
+            area += bincount(tris[:, corner], a3, minlength=n)
+        return spdiags(area, 0, n, n)
+
+    return _cached(mesh, "matrices.vertexarea", xyz, build, cache=cache)
+
+
+def trimesh_gradient_matrix(mesh, rtype="csr", cache=False):
+    """Construct the gradient operator of a triangle mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        The triangle mesh data structure.
+    rtype : Literal['array', 'csc', 'csr', 'coo', 'list'], optional
+        Format of the result.
+    cache : bool, optional
+        If True, store the matrix on the mesh,
+        and reuse it as long as the topology and the vertex coordinates of the mesh do not change.
+
+    Returns
+    -------
+    array_like
+        The 3f x n gradient matrix, with f the number of faces and n the number of vertices.
+        Multiplying the matrix with a scalar field defined at the vertices
+        results in the x, y and z components of the gradient of the field per face,
+        stacked on top of each other.
+
+    See Also
+    --------
+    :func:`compas.geometry.trimesh_gradient_numpy`
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polygons([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]])
+    >>> G = trimesh_gradient_matrix(mesh)
+    >>> G.dot([0.0, 1.0, 0.0]).tolist()
+    [1.0, 0.0, 0.0]
+
+    """
+    xyz = _mesh_xyz(mesh)
+
+    def build():
+        _, offsets, i, _, _ = _mesh_corners(mesh, cache=cache)
+        tris = i[offsets[:, None] + arange(3)]
+        return trimesh_gradient_numpy((xyz, tris), rtype="csr")
+
+    return _convert(_cached(mesh, "matrices.gradient", xyz, build, cache=cache), rtype)
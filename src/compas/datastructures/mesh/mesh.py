@@ -47,6 +47,8 @@ from compas.geometry import vector_average
 from compas.utilities import linspace
 
 from compas.utilities import geometric_key
+from compas.utilities import geometric_keys
+from compas.utilities import SpatialHash
 from compas.utilities import pairwise
 from compas.utilities import window
 
@@ -88,6 +90,12 @@ class Mesh(HalfEdge):
         Default values for edge attributes.
     default_face_attributes: dict[str, Any], optional
         Default values for face attributes.
+    storage : Literal['dict', 'array'], optional
+        The storage backend for vertices, faces and half-edges.
+        Use "array" to store the topology and the vertex coordinates of large meshes in compact arrays.
+        This requires less memory, but building the mesh and accessing individual elements
+        are several times slower than with the default "dict" backend.
+        See :class:`~compas.datastructures.HalfEdge` for details.
 
     Examples
     --------
@@ -135,6 +143,7 @@ class Mesh(HalfEdge):
         default_vertex_attributes=None,
         default_edge_attributes=None,
         default_face_attributes=None,
+        storage=None,
     ):
         _default_vertex_attributes = {"x": 0.0, "y": 0.0, "z": 0.0}
         _default_edge_attributes = {}
@@ -150,6 +159,7 @@ class Mesh(HalfEdge):
             default_vertex_attributes=_default_vertex_attributes,
             default_edge_attributes=_default_edge_attributes,
             default_face_attributes=_default_face_attributes,
+            storage=storage,
         )
 
     def __str__(self):
@@ -491,7 +501,14 @@ class Mesh(HalfEdge):
         :class:`~compas.datastructures.Mesh`
             A mesh object.
 
+        See Also
+        --------
+        :meth:`from_arrays`
+
         """
+        if not isinstance(vertices, Mapping) and not isinstance(faces, Mapping):
+            return cls.from_arrays(vertices, faces)
+
         mesh = cls()
 
         if isinstance(vertices, Mapping):
@@ -510,6 +527,82 @@ class Mesh(HalfEdge):
 
         return mesh
 
+    @classmethod
+    def from_arrays(cls, vertices, faces, offsets=None):
+        """Construct a mesh object from arrays of vertex coordinates and face vertex indices.
+
+        The vertex, face and half-edge dictionaries are built directly,
+        instead of through :meth:`add_vertex` and :meth:`add_face`.
+        The vertices and faces get the indices of their rows in the arrays as identifiers.
+
+        Parameters
+        ----------
+        vertices : array_like
+            The XYZ coordinates of the vertices, as an array of shape (n, 3).
+        faces : array_like
+            The vertex indices of the faces, as an array of shape (f, k) if all faces have k vertices.
+            If `offsets` are provided, the vertex indices of all faces concatenated in a flat array.
+        offsets : array_like, optional
+            An array of shape (f + 1,) with the start of every face in the flat array of vertex indices,
+            followed by the total number of indices.
+            Face ``i`` consists of the vertices ``faces[offsets[i]:offsets[i + 1]]``.
+
+        Returns
+        -------
+        :class:`~compas.datastructures.Mesh`
+            A mesh object.
+
+        See Also
+        --------
+        :meth:`to_arrays`, :meth:`from_vertices_and_faces`
+
+        Notes
+        -----
+        Faces with fewer than three distinct vertices, or with consecutive duplicate vertices,
+        are processed by :meth:`add_face`.
+
+        Examples
+        --------
+        >>> vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+        >>> mesh = Mesh.from_arrays(vertices, [0, 1, 2, 3, 1, 4, 2], offsets=[0, 4, 7])
+        >>> mesh.face_vertices(1)
+        [1, 4, 2]
+
+        """
+        if hasattr(vertices, "tolist"):
+            vertices = vertices.tolist()
+        if hasattr(faces, "tolist"):
+            faces = faces.tolist()
+        if offsets is not None:
+            if hasattr(offsets, "tolist"):
+                offsets = offsets.tolist()
+            faces = [faces[start:end] for start, end in pairwise(offsets)]
+
+        mesh = cls()
+        vertex = mesh.vertex
+        halfedge = mesh.halfedge
+
+        for key, (x, y, z) in enumerate(vertices):
+            vertex[key] = {"x": x, "y": y, "z": z}
+            halfedge[key] = {}
+        mesh._max_vertex = len(vertex) - 1
+
+        for face in faces:
+            face = [int(key) for key in face]
+            halfedges = list(zip(face, face[1:] + face[:1]))
+            if len(face) < 3 or any(u == v for u, v in halfedges):
+                mesh.add_face(face)
+                continue
+            fkey = mesh._max_face = mesh._max_face + 1
+            mesh.face[fkey] = face
+            mesh.facedata[fkey] = {}
+            for u, v in halfedges:
+                halfedge[u][v] = fkey
+                if u not in halfedge[v]:
+                    halfedge[v][u] = None
+
+        return mesh
+
     def to_vertices_and_faces(self, triangulated=False):
         """Return the vertices and faces of a mesh.
 
@@ -555,6 +648,87 @@ class Mesh(HalfEdge):
 
         return vertices, faces
 
+    def to_arrays(self, return_offsets=False):
+        """Return the vertices and faces of the mesh as NumPy arrays.
+
+        The arrays of face vertex indices are computed only once,
+        and are stored on the mesh until its topology changes,
+        such that all algorithms working on the same mesh share the same conversion.
+
+        Parameters
+        ----------
+        return_offsets : bool, optional
+            If True, return the vertex indices of all faces concatenated in a flat array,
+            together with the offsets of the faces in this array.
+            This is necessary if the faces of the mesh do not all have the same number of vertices.
+
+        Returns
+        -------
+        ndarray
+            The XYZ coordinates of the vertices, as an array of shape (n, 3).
+        ndarray
+            The vertex indices of the faces.
+            An array of shape (f, k) if `return_offsets` is False,
+            and a flat array of all indices otherwise.
+        ndarray, optional
+            If `return_offsets` is True, an array of shape (f + 1,) with the offsets of the faces in the flat array of indices.
+        dict[int, int]
+            Mapping between vertex identifiers and vertex indices.
+
+        Raises
+        ------
+        ValueError
+            If `return_offsets` is False, and the faces do not all have the same number of vertices.
+
+        See Also
+        --------
+        :meth:`from_arrays`, :meth:`to_vertices_and_faces`
+
+        Notes
+        -----
+        The arrays of indices and the index map are shared by all calls, and should not be modified.
+        The coordinates are collected from the vertex attributes in every call.
+        The cached arrays are discarded by all methods of the mesh that modify its topology.
+        After modifying the vertex, face or half-edge dictionaries directly, call :meth:`clear_cache`.
+
+        Examples
+        --------
+        >>> mesh = Mesh.from_meshgrid(dx=2, nx=2)
+        >>> V, F, vertex_index = mesh.to_arrays()
+        >>> V.shape, F.shape
+        ((9, 3), (4, 4))
+        >>> mesh.to_arrays()[1] is F
+        True
+
+        """
+        from numpy import asarray
+        from numpy import cumsum
+        from numpy import zeros
+
+        arrays = self._cache.get("arrays")
+        if arrays is None:
+            vertex_index = self.vertex_index()
+            faces = [self.face_vertices(face) for face in self.faces()]
+            offsets = zeros(len(faces) + 1, dtype=int)
+            offsets[1:] = cumsum([len(vertices) for vertices in faces])
+            indices = asarray([vertex_index[vertex] for vertices in faces for vertex in vertices], dtype=int)
+            sizes = set(len(vertices) for vertices in faces)
+            F = indices.reshape((len(faces), sizes.pop())) if len(sizes) == 1 else None
+            for array in (indices, offsets, F):
+                if array is not None:
+                    array.flags.writeable = False
+            arrays = self._cache["arrays"] = indices, offsets, F, vertex_index
+        indices, offsets, F, vertex_index = arrays
+
+        V = self.vertices_attributes_array("xyz")
+        if return_offsets:
+            return V, indices, offsets, vertex_index
+        if F is None:
+            if offsets.shape[0] > 1:
+                raise ValueError("The faces of the mesh do not all have the same number of vertices.")
+            F = indices.reshape((0, 3))
+        return V, F, vertex_index
+
     @classmethod
     def from_polyhedron(cls, f):
         """Construct a mesh from a platonic solid.
@@ -646,19 +820,9 @@ class Mesh(HalfEdge):
             A mesh object.
 
         """
-        faces = []
-        gkey_xyz = {}
-        for points in polygons:
-            face = []
-            for xyz in points:
-                gkey = geometric_key(xyz, precision=precision)
-                gkey_xyz[gkey] = xyz
-                face.append(gkey)
-            faces.append(face)
-        gkey_index = {gkey: index for index, gkey in enumerate(gkey_xyz)}
-        vertices = gkey_xyz.values()
-        faces[:] = [[gkey_index[gkey] for gkey in face] for face in faces]
-        return cls.from_vertices_and_faces(vertices, faces)
+        spatialhash = SpatialHash(precision=precision)
+        faces = [spatialhash.add_points(points) for points in polygons]
+        return cls.from_vertices_and_faces(spatialhash.points, faces)
 
     def to_polygons(self):
         """Convert the mesh to a collection of polygons.
@@ -730,9 +894,9 @@ class Mesh(HalfEdge):
             A dictionary of key-geometric key pairs.
 
         """
-        gkey = geometric_key
-        xyz = self.vertex_coordinates
-        return {key: gkey(xyz(key), precision) for key in self.vertices()}
+        vertices = list(self.vertices())
+        xyz = self.vertices_attributes("xyz", keys=vertices)
+        return dict(zip(vertices, geometric_keys(xyz, precision)))
 
     def gkey_key(self, precision=None):
         """Returns a dictionary that maps *geometric keys* of a certain precision
@@ -750,9 +914,9 @@ class Mesh(HalfEdge):
             A dictionary of geometric key-key pairs.
 
         """
-        gkey = geometric_key
-        xyz = self.vertex_coordinates
-        return {gkey(xyz(key), precision): key for key in self.vertices()}
+        vertices = list(self.vertices())
+        xyz = self.vertices_attributes("xyz", keys=vertices)
+        return dict(zip(geometric_keys(xyz, precision), vertices))
 
     vertex_gkey = key_gkey
     gkey_vertex = gkey_key
@@ -1128,6 +1292,73 @@ class Mesh(HalfEdge):
             )
         return 2 * pi - C
 
+    def vertices_normals(self):
+        """Compute the normals of all vertices.
+
+        Returns
+        -------
+        dict[int, list[float]]
+            The unitized normal vector per vertex.
+
+        See Also
+        --------
+        :meth:`vertex_normal`, :meth:`faces_normals`
+
+        Notes
+        -----
+        With NumPy, all normals are computed at once with :func:`compas.datastructures.mesh_vertices_normals_numpy`.
+        The normal of a vertex without faces is a zero vector.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_vertices_normals_numpy
+
+            return dict(zip(self.vertices(), mesh_vertices_normals_numpy(self).tolist()))
+        normals = self.faces_normals(unitized=False)
+        result = {}
+        for key in self.vertices():
+            normal = sum_vectors([normals[fkey] for fkey in self.vertex_faces(key)]) or [0.0, 0.0, 0.0]
+            length = length_vector(normal)
+            result[key] = scale_vector(normal, 1.0 / length) if length else normal
+        return result
+
+    def vertices_areas(self):
+        """Compute the tributary areas of all vertices.
+
+        Returns
+        -------
+        dict[int, float]
+            The tributary area per vertex.
+
+        See Also
+        --------
+        :meth:`vertex_area`, :meth:`faces_areas`
+
+        Notes
+        -----
+        With NumPy, all areas are computed at once with :func:`compas.datastructures.mesh_vertices_areas_numpy`.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_vertices_areas_numpy
+
+            return dict(zip(self.vertices(), mesh_vertices_areas_numpy(self).tolist()))
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        centroids = self.faces_centroids()
+        result = {}
+        for key in self.vertices():
+            p0 = xyz[key]
+            area = 0.0
+            for nbr, fkey in self.halfedge[key].items():
+                v1 = subtract_vectors(xyz[nbr], p0)
+                if fkey is not None:
+                    area += length_vector(cross_vectors(v1, subtract_vectors(centroids[fkey], p0)))
+                fkey = self.halfedge[nbr][key]
+                if fkey is not None:
+                    area += length_vector(cross_vectors(v1, subtract_vectors(centroids[fkey], p0)))
+            result[key] = 0.25 * area
+        return result
+
     # --------------------------------------------------------------------------
     # edge geometry
     # --------------------------------------------------------------------------
@@ -1200,6 +1431,30 @@ class Mesh(HalfEdge):
         a, b = self.edge_coordinates(edge)
         return distance_point_point(a, b)
 
+    def edges_lengths(self):
+        """Compute the lengths of all edges.
+
+        Returns
+        -------
+        dict[tuple[int, int], float]
+            The length per edge.
+
+        See Also
+        --------
+        :meth:`edge_length`
+
+        Notes
+        -----
+        With NumPy, all lengths are computed at once with :func:`compas.datastructures.mesh_edges_lengths_numpy`.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_edges_lengths_numpy
+
+            return dict(zip(self.edges(), mesh_edges_lengths_numpy(self).tolist()))
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return {(u, v): distance_point_point(xyz[u], xyz[v]) for u, v in self.edges()}
+
     def edge_vector(self, edge):
         """Return the vector of an edge.
 
@@ -1428,6 +1683,156 @@ class Mesh(HalfEdge):
         d = distance_line_line((points[0], points[2]), (points[1], points[3]))
         return (d / length) / maxdev
 
+    def faces_normals(self, unitized=True):
+        """Compute the normals of all faces.
+
+        Parameters
+        ----------
+        unitized : bool, optional
+            If True, unitize the normal vectors.
+
+        Returns
+        -------
+        dict[int, list[float]]
+            The normal vector per face.
+
+        See Also
+        --------
+        :meth:`face_normal`, :meth:`vertices_normals`
+
+        Notes
+        -----
+        With NumPy, all normals are computed at once with :func:`compas.datastructures.mesh_faces_normals_numpy`.
+        Normals of length zero are not unitized.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_normals_numpy
+
+            return dict(zip(self.faces(), mesh_faces_normals_numpy(self, unitized=unitized).tolist()))
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        result = {}
+        for fkey in self.faces():
+            normal = normal_polygon([xyz[key] for key in self.face_vertices(fkey)], unitized=False)
+            length = length_vector(normal)
+            result[fkey] = scale_vector(normal, 1.0 / length) if unitized and length else normal
+        return result
+
+    def faces_centroids(self):
+        """Compute the centroids of all faces.
+
+        Returns
+        -------
+        dict[int, list[float]]
+            The centroid per face.
+
+        See Also
+        --------
+        :meth:`face_centroid`, :meth:`faces_centers`
+
+        Notes
+        -----
+        With NumPy, all centroids are computed at once with :func:`compas.datastructures.mesh_faces_centroids_numpy`.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_centroids_numpy
+
+            return dict(zip(self.faces(), mesh_faces_centroids_numpy(self).tolist()))
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return {fkey: centroid_points([xyz[key] for key in self.face_vertices(fkey)]) for fkey in self.faces()}
+
+    def faces_centers(self):
+        """Compute the centers of mass of all faces.
+
+        Returns
+        -------
+        dict[int, list[float]]
+            The center of mass per face.
+
+        See Also
+        --------
+        :meth:`face_center`, :meth:`faces_centroids`
+
+        Notes
+        -----
+        With NumPy, all centers are computed at once with :func:`compas.datastructures.mesh_faces_centers_numpy`.
+        The center of a face with zero area is its centroid.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_centers_numpy
+
+            return dict(zip(self.faces(), mesh_faces_centers_numpy(self).tolist()))
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        result = {}
+        for fkey in self.faces():
+            points = [xyz[key] for key in self.face_vertices(fkey)]
+            try:
+                result[fkey] = centroid_polygon(points)
+            except ZeroDivisionError:
+                result[fkey] = centroid_points(points)
+        return result
+
+    def faces_areas(self):
+        """Compute the areas of all faces.
+
+        Returns
+        -------
+        dict[int, float]
+            The area per face.
+
+        See Also
+        --------
+        :meth:`face_area`, :meth:`vertices_areas`
+
+        Notes
+        -----
+        With NumPy, all areas are computed at once with :func:`compas.datastructures.mesh_faces_areas_numpy`.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_areas_numpy
+
+            return dict(zip(self.faces(), mesh_faces_areas_numpy(self).tolist()))
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return {fkey: area_polygon([xyz[key] for key in self.face_vertices(fkey)]) for fkey in self.faces()}
+
+    def faces_flatness(self, maxdev=0.02):
+        """Compute the flatness of all faces.
+
+        Parameters
+        ----------
+        maxdev : float, optional
+            A maximum value for the allowed deviation from flatness.
+
+        Returns
+        -------
+        dict[int, float]
+            The flatness per face.
+
+        Raises
+        ------
+        ValueError
+            If the mesh has faces with less than four vertices.
+
+        See Also
+        --------
+        :meth:`face_flatness`
+
+        Notes
+        -----
+        With NumPy, all values are computed at once with :func:`compas.datastructures.mesh_faces_flatness_numpy`.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_flatness_numpy
+
+            return dict(zip(self.faces(), mesh_faces_flatness_numpy(self, maxdev=maxdev).tolist()))
+        if any(len(self.face_vertices(fkey)) < 4 for fkey in self.faces()):
+            raise ValueError("The flatness is only defined for faces with at least four vertices.")
+        return {fkey: self.face_flatness(fkey, maxdev=maxdev) for fkey in self.faces()}
+
     def face_aspect_ratio(self, fkey):
         """Face aspect ratio as the ratio between the lengths of the maximum and minimum face edges.
 
@@ -1626,6 +2031,11 @@ class Mesh(HalfEdge):
             A list of vertex keys per boundary.
 
         """
+        if self._topology is not None:
+            return self._topology.boundaries(self._vertices_on_boundaries)
+        return self._vertices_on_boundaries()
+
+    def _vertices_on_boundaries(self):
         # all boundary vertices
         vertices_set = set()
         for key, nbrs in iter(self.halfedge.items()):
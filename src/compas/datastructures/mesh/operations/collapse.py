@@ -116,6 +116,8 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
     if v in fixed or u in fixed:
         return False
 
+    mesh.clear_cache([u, v] + mesh.vertex_neighbors(u) + mesh.vertex_neighbors(v))
+
     # move U
     x, y, z = mesh.edge_point(edge, t)
     mesh.vertex[u]["x"] = x
@@ -265,6 +267,8 @@ def trimesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
     if v in fixed or u in fixed:
         return False
 
+    mesh.clear_cache([u, v] + mesh.vertex_neighbors(u) + mesh.vertex_neighbors(v))
+
     # move U
     x, y, z = mesh.edge_point(edge, t)
 
@@ -51,6 +51,7 @@ def mesh_add_vertex_to_face_edge(mesh, key, fkey, v):
     vertices = mesh.face_vertices(fkey)
     i = vertices.index(v)
     u = vertices[i - 1]
+    mesh.clear_cache([u, v, key])
     vertices.insert(key, i - 1)
     mesh.halfedge[u][key] = fkey
     mesh.halfedge[key][v] = fkey
@@ -32,6 +32,7 @@ def mesh_merge_faces(mesh, faces):
     [3, 5, 0, 4, 1, 6, 2, 7]
 
     """
+    mesh.clear_cache(mesh.face_vertices(faces[0]) + mesh.face_vertices(faces[1]))
     u, v = None, None
     for i, j in mesh.face_halfedges(faces[0]):
         if faces[1] == mesh.halfedge[j][i]:
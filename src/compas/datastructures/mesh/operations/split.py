@@ -52,6 +52,8 @@ def mesh_split_edge(mesh, edge, t=0.5, allow_boundary=False):
         if fkey_uv is None or fkey_vu is None:
             return
 
+    mesh.clear_cache([u, v])
+
     # coordinates
     x, y, z = mesh.edge_point(edge, t)
 
@@ -122,6 +124,8 @@ def trimesh_split_edge(mesh, edge, t=0.5, allow_boundary=False):
         if fkey_uv is None or fkey_vu is None:
             return
 
+    mesh.clear_cache([u, v])
+
     # coordinates
     x, y, z = mesh.edge_point(edge, t)
 
@@ -211,6 +215,8 @@ def mesh_split_face(mesh, fkey, u, v):
     if i + 1 == j:
         raise ValueError("The split vertices are neighbors.")
 
+    mesh.clear_cache(face)
+
     if j > i:
         f = face[i : j + 1]
         g = face[j:] + face[: i + 1]
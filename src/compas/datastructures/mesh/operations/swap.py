@@ -46,6 +46,8 @@ def trimesh_swap_edge(mesh, edge, allow_boundary=True):
     if o_uv in mesh.halfedge[o_vu] and o_vu in mesh.halfedge[o_uv]:
         return False
 
+    mesh.clear_cache([u, v, o_uv, o_vu])
+
     # swap
     # delete the current half-edge
     del mesh.halfedge[u][v]
@@ -31,6 +31,7 @@ def mesh_unweld_vertices(mesh, fkey, where=None):
     """
     face = []
     vertices = mesh.face_vertices(fkey)
+    mesh.clear_cache(vertices)
 
     if not where:
         where = vertices
@@ -2,12 +2,463 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from collections import deque
+from timeit import default_timer as timer
+
+import compas
+
+from compas.geometry import KDTree
+from compas.geometry import add_vectors
+from compas.geometry import distance_point_point_sqrd
+from compas.geometry import dot_vectors
+from compas.geometry import scale_vector
+from compas.geometry import subtract_vectors
+
 from .smoothing import mesh_smooth_area
 from .operations.collapse import trimesh_collapse_edge
 from .operations.swap import trimesh_swap_edge
 from .operations.split import trimesh_split_edge
 
 
+def _closest_point_on_triangle(point, a, b, c):
+    ab = subtract_vectors(b, a)
+    ac = subtract_vectors(c, a)
+    ap = subtract_vectors(point, a)
+    d1 = dot_vectors(ab, ap)
+    d2 = dot_vectors(ac, ap)
+    if d1 <= 0 and d2 <= 0:
+        return a
+    bp = subtract_vectors(point, b)
+    d3 = dot_vectors(ab, bp)
+    d4 = dot_vectors(ac, bp)
+    if d3 >= 0 and d4 <= d3:
+        return b
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        return add_vectors(a, scale_vector(ab, d1 / (d1 - d3)))
+    cp = subtract_vectors(point, c)
+    d5 = dot_vectors(ab, cp)
+    d6 = dot_vectors(ac, cp)
+    if d6 >= 0 and d5 <= d6:
+        return c
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        return add_vectors(a, scale_vector(ac, d2 / (d2 - d6)))
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and (d4 - d3) >= 0 and (d5 - d6) >= 0:
+        return add_vectors(b, scale_vector(subtract_vectors(c, b), (d4 - d3) / ((d4 - d3) + (d5 - d6))))
+    denom = va + vb + vc
+    if not denom:
+        return a
+    return add_vectors(a, add_vectors(scale_vector(ab, vb / denom), scale_vector(ac, vc / denom)))
+
+
+class _SurfaceProjector(object):
+    """Closest points on the faces of a mesh.
+
+    With NumPy, the closest points are found with a :class:`~compas.datastructures.MeshBVH`.
+    Otherwise, the candidate faces of a point are the faces around the nearest vertex of the mesh and around its neighbors.
+    """
+
+    def __init__(self, surface):
+        self.bvh = None
+        if not compas.IPY:
+            from .bvh_numpy import MeshBVH
+
+            self.bvh = MeshBVH.from_mesh(surface)
+            return
+        keys = list(surface.vertices())
+        xyz = [surface.vertex_coordinates(key) for key in keys]
+        triangles = {}
+        for face in surface.faces():
+            points = surface.face_coordinates(face)
+            triangles[face] = [(points[0], points[i], points[i + 1]) for i in range(1, len(points) - 1)]
+        candidates = []
+        for key in keys:
+            faces = set(surface.vertex_faces(key))
+            for nbr in surface.vertex_neighbors(key):
+                faces.update(surface.vertex_faces(nbr))
+            candidates.append([triangle for face in faces for triangle in triangles[face]])
+        self.tree = KDTree(xyz)
+        self.candidates = candidates
+
+    def closest_points(self, points):
+        if self.bvh:
+            return self.bvh.closest_points(points)[0].tolist()
+        indices, _ = self.tree.query(points, k=1)
+        closest = []
+        for point, index in zip(points, indices):
+            best = None
+            for a, b, c in self.candidates[index[0]]:
+                candidate = _closest_point_on_triangle(point, a, b, c)
+                d = distance_point_point_sqrd(point, candidate)
+                if best is None or d < best[0]:
+                    best = d, candidate
+            closest.append(list(best[1]) if best else list(point))
+        return closest
+
+
+class TrimeshRemesher(object):
+    """Isotropic remeshing of a triangle mesh, driven by priority queues of edge lengths.
+
+    Instead of sweeping over all edges of the mesh for every operation,
+    the remesher keeps the edges that are too long or too short in priority queues,
+    and only updates the queues with the edges around every local modification.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A triangle mesh.
+    target : float
+        The target length for the mesh edges.
+    tol : float, optional
+        Length deviation tolerance.
+    allow_boundary_split : bool, optional
+        Allow boundary edges to be split.
+    allow_boundary_swap : bool, optional
+        Allow boundary edges or edges connected to the boundary to be swapped.
+    allow_boundary_collapse : bool, optional
+        Allow boundary edges or edges connected to the boundary to be collapsed.
+    fixed : list[int], optional
+        A list of vertices that have to stay fixed.
+    project : bool, optional
+        If True, project new and relaxed vertices onto the original surface.
+    surface : :class:`~compas.datastructures.Mesh`, optional
+        The surface to project the vertices onto.
+        Defaults to a copy of the mesh before remeshing.
+
+    Attributes
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        The mesh being remeshed.
+    lmin : float
+        Edges shorter than this length are collapsed.
+    lmax : float
+        Edges longer than this length are split.
+    stats : list[dict]
+        Per iteration of :meth:`run`, the number of splits, collapses and swaps,
+        the time spent on every phase, and the number of vertices and faces afterwards.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> mesh.quads_to_triangles()
+    >>> remesher = TrimeshRemesher(mesh, target=0.5, project=True)
+    >>> remesher.run(kmax=20)
+    >>> sum(stats["split"] for stats in remesher.stats) > 0
+    True
+
+    """
+
+    def __init__(
+        self,
+        mesh,
+        target,
+        tol=0.1,
+        allow_boundary_split=False,
+        allow_boundary_swap=False,
+        allow_boundary_collapse=False,
+        fixed=None,
+        project=False,
+        surface=None,
+    ):
+        self.mesh = mesh
+        self.target = target
+        self.lmin = (1 - tol) * (4.0 / 5.0) * target
+        self.lmax = (1 + tol) * (4.0 / 3.0) * target
+        self.allow_boundary_split = allow_boundary_split
+        self.allow_boundary_swap = allow_boundary_swap
+        self.allow_boundary_collapse = allow_boundary_collapse
+        self.fixed = set(fixed or [])
+        self.boundary = set(u for u, nbrs in mesh.halfedge.items() for v in nbrs if nbrs[v] is None)
+        self.projector = None
+        if project:
+            self.projector = _SurfaceProjector(surface or mesh.copy())
+        self.stats = []
+
+    def _is_free(self, u, v):
+        return u not in self.fixed or v not in self.fixed
+
+    def _project(self, vertices):
+        vertices = [vertex for vertex in vertices if vertex not in self.fixed]
+        if not self.projector or not vertices:
+            return
+        mesh = self.mesh
+        points = self.projector.closest_points([mesh.vertex_coordinates(vertex) for vertex in vertices])
+        for vertex, point in zip(vertices, points):
+            mesh.vertex_attributes(vertex, "xyz", point)
+
+    def split(self, lmax=None):
+        """Split all edges that are longer than a maximum length, the longest edges first.
+
+        Parameters
+        ----------
+        lmax : float, optional
+            The maximum length.
+            Defaults to :attr:`lmax`.
+
+        Returns
+        -------
+        int
+            The number of splits.
+
+        """
+        mesh = self.mesh
+        halfedge = mesh.halfedge
+        lmax = self.lmax if lmax is None else lmax
+        queue = []
+        for u, v in mesh.edges():
+            if self._is_free(u, v):
+                length = mesh.edge_length((u, v))
+                if length > lmax:
+                    queue.append((-length, u, v))
+        heapify(queue)
+        count = 0
+        while queue:
+            _, u, v = heappop(queue)
+            if u not in halfedge or v not in halfedge[u]:
+                continue
+            on_boundary = halfedge[u][v] is None or halfedge[v][u] is None
+            w = trimesh_split_edge(mesh, (u, v), allow_boundary=self.allow_boundary_split)
+            if w is None:
+                continue
+            count += 1
+            if on_boundary:
+                self.boundary.add(w)
+            else:
+                self._project([w])
+            for nbr in halfedge[w]:
+                if self._is_free(w, nbr):
+                    length = mesh.edge_length((w, nbr))
+                    if length > lmax:
+                        heappush(queue, (-length, w, nbr))
+        return count
+
+    def collapse(self, lmin=None, lmax=None):
+        """Collapse all edges that are shorter than a minimum length, the shortest edges first.
+
+        Collapses are skipped if they would create edges that are longer than a maximum length.
+
+        Parameters
+        ----------
+        lmin : float, optional
+            The minimum length.
+            Defaults to :attr:`lmin`.
+        lmax : float, optional
+            The maximum length.
+            Defaults to :attr:`lmax`.
+
+        Returns
+        -------
+        int
+            The number of collapses.
+
+        """
+        mesh = self.mesh
+        halfedge = mesh.halfedge
+        lmin = self.lmin if lmin is None else lmin
+        lmax = self.lmax if lmax is None else lmax
+        lmax2 = lmax**2
+        queue = []
+        for u, v in mesh.edges():
+            if self._is_free(u, v):
+                length = mesh.edge_length((u, v))
+                if length < lmin:
+                    queue.append((length, u, v))
+        heapify(queue)
+        count = 0
+        while queue:
+            length, u, v = heappop(queue)
+            if u not in halfedge or v not in halfedge[u]:
+                continue
+            current = mesh.edge_length((u, v))
+            if current >= lmin:
+                continue
+            if current != length:
+                heappush(queue, (current, u, v))
+                continue
+            point = mesh.vertex_coordinates(u) if u in self.boundary else mesh.edge_midpoint((u, v))
+            if any(
+                distance_point_point_sqrd(point, mesh.vertex_coordinates(nbr)) > lmax2
+                for nbr in list(halfedge[u]) + list(halfedge[v])
+                if nbr != u and nbr != v
+            ):
+                continue
+            if not trimesh_collapse_edge(mesh, (u, v), allow_boundary=self.allow_boundary_collapse, fixed=self.fixed):
+                continue
+            count += 1
+            self.boundary.discard(v)
+            if u not in self.boundary:
+                self._project([u])
+            for nbr in halfedge[u]:
+                if self._is_free(u, nbr):
+                    length = mesh.edge_length((u, nbr))
+                    if length < lmin:
+                        heappush(queue, (length, u, nbr))
+        return count
+
+    def _valency_error(self, u, v):
+        mesh = self.mesh
+        halfedge = mesh.halfedge
+        face1 = mesh.face[halfedge[u][v]]
+        face2 = mesh.face[halfedge[v][u]]
+        v1 = face1[face1.index(u) - 1]
+        v2 = face2[face2.index(v) - 1]
+        valency = []
+        for vertex in (u, v, v1, v2):
+            degree = len(halfedge[vertex])
+            if vertex in self.boundary:
+                degree += 2
+            valency.append(degree)
+        current = abs(valency[0] - 6) + abs(valency[1] - 6) + abs(valency[2] - 6) + abs(valency[3] - 6)
+        flipped = abs(valency[0] - 7) + abs(valency[1] - 7) + abs(valency[2] - 5) + abs(valency[3] - 5)
+        return current, flipped
+
+    def swap(self):
+        """Swap all edges of which the swap improves the valency of the vertices around the edge.
+
+        Every swap reduces the total deviation of the valencies of the vertices from the ideal valency,
+        therefore the process terminates.
+
+        Returns
+        -------
+        int
+            The number of swaps.
+
+        """
+        mesh = self.mesh
+        halfedge = mesh.halfedge
+        queue = deque(edge for edge in mesh.edges() if self._is_free(*edge))
+        queued = set(queue)
+        count = 0
+        while queue:
+            edge = queue.popleft()
+            queued.discard(edge)
+            u, v = edge
+            if u not in halfedge or v not in halfedge[u]:
+                continue
+            if halfedge[u][v] is None or halfedge[v][u] is None:
+                continue
+            current, flipped = self._valency_error(u, v)
+            if current <= flipped:
+                continue
+            faces = trimesh_swap_edge(mesh, (u, v), allow_boundary=self.allow_boundary_swap)
+            if not faces:
+                continue
+            count += 1
+            for face in faces:
+                for a, b in mesh.face_halfedges(face):
+                    if (a, b) in queued or (b, a) in queued or not self._is_free(a, b):
+                        continue
+                    queue.append((a, b))
+                    queued.add((a, b))
+        return count
+
+    def relax(self, smooth=True):
+        """Smooth the mesh and project the vertices back onto the surface.
+
+        Parameters
+        ----------
+        smooth : bool, optional
+            If False, only project the vertices.
+
+        Returns
+        -------
+        None
+
+        """
+        if smooth:
+            mesh_smooth_area(self.mesh, fixed=self.fixed | self.boundary, kmax=1)
+        self._project([vertex for vertex in self.mesh.vertices() if vertex not in self.boundary])
+
+    def run(self, kmax=100, divergence=0.01, smooth=True, verbose=False, callback=None, callback_args=None):
+        """Run the remeshing process.
+
+        The iterations cycle through splits, collapses, swaps and an idle step, with smoothing at every iteration.
+        During the first half of the iterations, the length thresholds are relaxed,
+        starting from half of the length of the longest edge.
+
+        Parameters
+        ----------
+        kmax : int, optional
+            The number of iterations.
+        divergence : float, optional
+            Stop if the relative change of the number of vertices over 10 iterations in the second half of the process
+            is smaller than this value.
+        smooth : bool, optional
+            Apply smoothing at every iteration.
+        verbose : bool, optional
+            Print the statistics of every iteration.
+        callback : callable, optional
+            A user-defined function that is called after every iteration.
+        callback_args : list[Any], optional
+            A list of additional parameters to be passed to the callback function.
+
+        Returns
+        -------
+        None
+
+        """
+        mesh = self.mesh
+        target_start = max(mesh.edge_length(edge) for edge in mesh.edges()) / 2.0
+        fac = target_start / self.target
+        kmax_start = kmax / 2.0
+
+        for k in range(kmax):
+            if k <= kmax_start:
+                scale = fac * (1.0 - k / kmax_start)
+                dlmin = self.lmin * scale
+                dlmax = self.lmax * scale
+            else:
+                dlmin = 0
+                dlmax = 0
+
+            if k % 20 == 0:
+                num_vertices_1 = mesh.number_of_vertices()
+
+            stats = {"iteration": k, "split": 0, "collapse": 0, "swap": 0}
+            t0 = timer()
+            phase = k % 4
+            if phase == 0:
+                stats["split"] = self.split(self.lmax + dlmax)
+            elif phase == 1:
+                stats["collapse"] = self.collapse(self.lmin - dlmin, self.lmax + dlmax)
+            elif phase == 2:
+                stats["swap"] = self.swap()
+            t1 = timer()
+
+            converged = False
+            if (k - 10) % 20 == 0:
+                num_vertices_2 = mesh.number_of_vertices()
+                converged = abs(1 - num_vertices_1 / num_vertices_2) < divergence and k > kmax_start
+
+            if not converged:
+                self.relax(smooth=smooth)
+            t2 = timer()
+
+            stats["time"] = t1 - t0
+            stats["relax_time"] = t2 - t1
+            stats["vertices"] = mesh.number_of_vertices()
+            stats["faces"] = mesh.number_of_faces()
+            self.stats.append(stats)
+
+            if verbose:
+                print(
+                    "{iteration}: {split} splits, {collapse} collapses, {swap} swaps in {time:.3f}s, "
+                    "relaxation in {relax_time:.3f}s, {vertices} vertices, {faces} faces".format(**stats)
+                )
+
+            if converged:
+                break
+
+            if callback:
+                callback(mesh, k, callback_args)
+
+
 def trimesh_remesh(
     mesh,
     target,
@@ -36,7 +487,8 @@ def trimesh_remesh(
     tol : float, optional
         Length deviation tolerance.
     divergence : float, optional
-        ??
+        Stop if the relative change of the number of vertices over 10 iterations in the second half of the process
+        is smaller than this value.
     verbose : bool, optional
         Print feedback messages.
     allow_boundary_split : bool, optional
@@ -73,6 +525,11 @@ def trimesh_remesh(
     The minimum and maximum lengths are calculated based on a desired target
     length.
 
+    The edges to split and collapse are processed from priority queues of edge lengths,
+    which are updated with the edges around every local modification.
+    Use a :class:`TrimeshRemesher` directly to project the vertices back onto the original surface,
+    or to inspect the number of operations and the timing of every iteration.
+
     For more info, see [1]_.
 
     References
@@ -81,154 +538,25 @@ def trimesh_remesh(
            Proceedings of the 2004 Eurographics/ACM SIGGRAPH symposium on Geometry processing - SGP '04, p.185.
            Available at: http://portal.acm.org/citation.cfm?doid=1057432.1057457.
 
-    """
-    if verbose:
-        print(target)
-
-    lmin = (1 - tol) * (4.0 / 5.0) * target
-    lmax = (1 + tol) * (4.0 / 3.0) * target
-
-    edge_lengths = [mesh.edge_length(edge) for edge in mesh.edges()]
-    target_start = max(edge_lengths) / 2.0
-
-    fac = target_start / target
-
-    boundary = set(mesh.vertices_on_boundary())
-
-    fixed = fixed or []
-    fixed = set(fixed)
+    See Also
+    --------
+    :class:`TrimeshRemesher`
 
-    count = 0
-
-    kmax_start = kmax / 2.0
-
-    for k in range(kmax):
-        if k <= kmax_start:
-            scale = fac * (1.0 - k / kmax_start)
-            dlmin = lmin * scale
-            dlmax = lmax * scale
-        else:
-            dlmin = 0
-            dlmax = 0
-
-        if verbose:
-            print(k)
-
-        count += 1
-
-        if k % 20 == 0:
-            num_vertices_1 = mesh.number_of_vertices()
-
-        # split
-        if count == 1:
-            visited = set()
-
-            for u, v in list(mesh.edges()):
-                if u in fixed and v in fixed:
-                    continue
-
-                if u in visited or v in visited:
-                    continue
-                if mesh.edge_length((u, v)) <= lmax + dlmax:
-                    continue
-
-                if verbose:
-                    print("split edge: {0} - {1}".format(u, v))
-
-                trimesh_split_edge(mesh, (u, v), allow_boundary=allow_boundary_split)
-
-                visited.add(u)
-                visited.add(v)
-
-        # collapse
-        elif count == 2:
-            visited = set()
-
-            for u, v in list(mesh.edges()):
-                if u in fixed and v in fixed:
-                    continue
-
-                if u in visited or v in visited:
-                    continue
-                if mesh.edge_length((u, v)) >= lmin - dlmin:
-                    continue
-                if verbose:
-                    print("collapse edge: {0} - {1}".format(u, v))
-
-                trimesh_collapse_edge(mesh, (u, v), allow_boundary=allow_boundary_collapse, fixed=fixed)
-
-                visited.add(u)
-                visited.add(v)
-
-                visited.update(mesh.halfedge[u])
-
-        # swap
-        elif count == 3:
-            visited = set()
-
-            for u, v in list(mesh.edges()):
-                if u in fixed and v in fixed:
-                    continue
-
-                if u in visited or v in visited:
-                    continue
-
-                f1 = mesh.halfedge[u][v]
-                f2 = mesh.halfedge[v][u]
-
-                if f1 is None or f2 is None:
-                    continue
-
-                face1 = mesh.face[f1]
-                face2 = mesh.face[f2]
-
-                v1 = face1[face1.index(u) - 1]
-                v2 = face2[face2.index(v) - 1]
-
-                valency1 = mesh.vertex_degree(u)
-                valency2 = mesh.vertex_degree(v)
-                valency3 = mesh.vertex_degree(v1)
-                valency4 = mesh.vertex_degree(v2)
-
-                if u in boundary:
-                    valency1 += 2
-                if v in boundary:
-                    valency2 += 2
-                if v1 in boundary:
-                    valency3 += 2
-                if v2 in boundary:
-                    valency4 += 2
-
-                current_error = abs(valency1 - 6) + abs(valency2 - 6) + abs(valency3 - 6) + abs(valency4 - 6)
-                flipped_error = abs(valency1 - 7) + abs(valency2 - 7) + abs(valency3 - 5) + abs(valency4 - 5)
-
-                if current_error <= flipped_error:
-                    continue
-
-                if verbose:
-                    print("swap edge: {0} - {1}".format(u, v))
-
-                trimesh_swap_edge(mesh, (u, v), allow_boundary=allow_boundary_swap)
-
-                visited.add(u)
-                visited.add(v)
-        # count
-        else:
-            count = 0
-
-        if (k - 10) % 20 == 0:
-            num_vertices_2 = mesh.number_of_vertices()
-
-            if abs(1 - num_vertices_1 / num_vertices_2) < divergence and k > kmax_start:
-                break
-
-        # smoothen
-        if smooth:
-            if allow_boundary_split:
-                boundary = set(mesh.vertices_on_boundary())
-
-            mesh_smooth_area(mesh, fixed=fixed.union(boundary), kmax=1)
-
-        # callback
-        if callback:
-            callback(mesh, k, callback_args)
+    """
+    remesher = TrimeshRemesher(
+        mesh,
+        target,
+        tol=tol,
+        allow_boundary_split=allow_boundary_split,
+        allow_boundary_swap=allow_boundary_swap,
+        allow_boundary_collapse=allow_boundary_collapse,
+        fixed=fixed,
+    )
+    remesher.run(
+        kmax=kmax,
+        divergence=divergence,
+        smooth=smooth,
+        verbose=verbose,
+        callback=callback,
+        callback_args=callback_args,
+    )
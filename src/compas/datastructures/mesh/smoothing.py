@@ -33,6 +33,10 @@ def mesh_smooth_centroid(mesh, fixed=None, kmax=100, damping=0.5, callback=None,
     Exception
         If a callback is provided, but it is not callable.
 
+    See Also
+    --------
+    :func:`mesh_smooth_centroid_numpy`
+
     """
     if callback:
         if not callable(callback):
@@ -87,6 +91,10 @@ def mesh_smooth_centerofmass(mesh, fixed=None, kmax=100, damping=0.5, callback=N
     Exception
         If a callback is provided, but it is not callable.
 
+    See Also
+    --------
+    :func:`mesh_smooth_centerofmass_numpy`
+
     """
     if callback:
         if not callable(callback):
@@ -141,6 +149,10 @@ def mesh_smooth_area(mesh, fixed=None, kmax=100, damping=0.5, callback=None, cal
     Exception
         If a callback is provided, but it is not callable.
 
+    See Also
+    --------
+    :func:`mesh_smooth_area_numpy`
+
     """
     if callback:
         if not callable(callback):
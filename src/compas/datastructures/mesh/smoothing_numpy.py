@@ -1,8 +1,266 @@
-from numpy import array
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
 
+from numpy import arange
+from numpy import asarray
+from numpy import cumsum
+from numpy import divide
+from numpy import ones
+from numpy import repeat
+from numpy import zeros
+
+from scipy.sparse import coo_matrix
+
+from .geometry_numpy import _fan
 from .matrices import trimesh_cotangent_laplacian_matrix
 
 
+def _free_vertices(mesh, fixed):
+    vertex_index = mesh.vertex_index()
+    free = ones(len(vertex_index), dtype=bool)
+    if fixed:
+        free[[vertex_index[key] for key in fixed if key in vertex_index]] = False
+    return vertex_index, free
+
+
+def _rings(items):
+    """Flatten a list of rings of indices into the index of the ring and the indices of the segments of every ring."""
+    sizes = asarray([len(ring) for ring in items], dtype=int)
+    offsets = cumsum(sizes) - sizes
+    groups = repeat(arange(len(items)), sizes)
+    b = asarray([index for ring in items for index in ring], dtype=int)
+    local = arange(b.shape[0]) - offsets[groups]
+    a = b[offsets[groups] + (local - 1) % sizes[groups]]
+    return sizes, offsets, groups, a, b
+
+
+def _mean_matrix(items, n):
+    """Matrix computing the average of the points of every item of a list of lists of indices."""
+    sizes = asarray([len(item) for item in items], dtype=float)
+    rows = repeat(arange(len(items)), sizes.astype(int))
+    cols = asarray([index for item in items for index in item], dtype=int)
+    data = divide(1.0, sizes, out=zeros(len(items)), where=sizes > 0)[rows]
+    return coo_matrix((data, (rows, cols)), shape=(len(items), n)).tocsr()
+
+
+def _smooth(mesh, targets, free, kmax, damping, callback, callback_args, callback_interval):
+    if callback:
+        if not callable(callback):
+            raise Exception("Callback is not callable.")
+
+    X = mesh.vertices_attributes_array("xyz")
+    for k in range(kmax):
+        T = targets(X)
+        X[free] += damping * (T[free] - X[free])
+        if callback and (k + 1) % callback_interval == 0:
+            mesh.set_vertices_attributes_array("xyz", X)
+            callback(k, callback_args)
+    mesh.set_vertices_attributes_array("xyz", X)
+
+
+def mesh_smooth_centroid_numpy(
+    mesh,
+    fixed=None,
+    kmax=100,
+    damping=0.5,
+    callback=None,
+    callback_args=None,
+    callback_interval=1,
+):
+    """Smooth a mesh by moving every free vertex to the centroid of its neighbors.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    fixed : list[int], optional
+        The fixed vertices of the mesh.
+    kmax : int, optional
+        The maximum number of iterations.
+    damping : float, optional
+        The damping factor.
+    callback : callable, optional
+        A user-defined callback function to be executed every `callback_interval` iterations.
+    callback_args : list[Any], optional
+        A list of arguments to be passed to the callback.
+    callback_interval : int, optional
+        The number of iterations between calls to the callback.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    Exception
+        If a callback is provided, but it is not callable.
+
+    See Also
+    --------
+    :func:`mesh_smooth_centroid`
+
+    Notes
+    -----
+    The averaging operator is assembled once, as a sparse matrix,
+    and all iterations are computed on an array of vertex coordinates.
+    The coordinates of the vertices are only updated at the end,
+    and before every call to the callback.
+    Vertices without neighbors are not moved.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> fixed = list(mesh.vertices_where({'vertex_degree': 2}))
+    >>> mesh_smooth_centroid_numpy(mesh, fixed=fixed, kmax=10)
+
+    """
+    vertex_index, free = _free_vertices(mesh, fixed)
+    nbrs = [[vertex_index[nbr] for nbr in mesh.vertex_neighbors(vertex)] for vertex in mesh.vertices()]
+    free[[index for index, ring in enumerate(nbrs) if not ring]] = False
+    P = _mean_matrix(nbrs, len(vertex_index))
+    _smooth(mesh, P.dot, free, kmax, damping, callback, callback_args, callback_interval)
+
+
+def mesh_smooth_centerofmass_numpy(
+    mesh,
+    fixed=None,
+    kmax=100,
+    damping=0.5,
+    callback=None,
+    callback_args=None,
+    callback_interval=1,
+):
+    """Smooth a mesh by moving every free vertex to the center of mass of the polygon formed by the neighboring vertices.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    fixed : list[int], optional
+        The fixed vertices of the mesh.
+    kmax : int, optional
+        The maximum number of iterations.
+    damping : float, optional
+        The damping factor.
+    callback : callable, optional
+        A user-defined callback function to be executed every `callback_interval` iterations.
+    callback_args : list[Any], optional
+        A list of arguments to be passed to the callback.
+    callback_interval : int, optional
+        The number of iterations between calls to the callback.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    Exception
+        If a callback is provided, but it is not callable.
+
+    See Also
+    --------
+    :func:`mesh_smooth_centerofmass`
+
+    Notes
+    -----
+    The polygons of the ordered neighbors of the vertices are flattened into index arrays once,
+    and the centers of mass of all polygons are computed at once in every iteration.
+    The coordinates of the vertices are only updated at the end,
+    and before every call to the callback.
+    Vertices with less than three neighbors are moved to the centroid of their neighbors, or not at all.
+
+    """
+    vertex_index, free = _free_vertices(mesh, fixed)
+    rings = [[vertex_index[nbr] for nbr in mesh.vertex_neighbors(vertex, ordered=True)] for vertex in mesh.vertices()]
+    free[[index for index, ring in enumerate(rings) if not ring]] = False
+    P = _mean_matrix(rings, len(vertex_index))
+    sizes, offsets, groups, a, b = _rings(rings)
+    polygon = sizes > 3
+
+    def targets(X):
+        o = P.dot(X)
+        A2, C = _fan(X, o, sizes, offsets, groups, a, b)
+        ok = polygon & (A2 != 0)
+        o[ok] = C[ok] / A2[ok, None]
+        return o
+
+    _smooth(mesh, targets, free, kmax, damping, callback, callback_args, callback_interval)
+
+
+def mesh_smooth_area_numpy(
+    mesh,
+    fixed=None,
+    kmax=100,
+    damping=0.5,
+    callback=None,
+    callback_args=None,
+    callback_interval=1,
+):
+    """Smooth a mesh by moving each vertex to the barycenter of the centroids of the surrounding faces, weighted by area.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    fixed : list[int], optional
+        The fixed vertices of the mesh.
+    kmax : int, optional
+        The maximum number of iterations.
+    damping : float, optional
+        The damping factor.
+    callback : callable, optional
+        A user-defined callback function to be executed every `callback_interval` iterations.
+    callback_args : list[Any], optional
+        A list of arguments to be passed to the callback.
+    callback_interval : int, optional
+        The number of iterations between calls to the callback.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    Exception
+        If a callback is provided, but it is not callable.
+
+    See Also
+    --------
+    :func:`mesh_smooth_area`
+
+    Notes
+    -----
+    The face centroid and vertex-face incidence operators are assembled once, as sparse matrices,
+    and the areas of all faces are computed at once in every iteration.
+    The coordinates of the vertices are only updated at the end,
+    and before every call to the callback.
+    Vertices without adjacent faces of non-zero area are not moved.
+
+    """
+    vertex_index, free = _free_vertices(mesh, fixed)
+    n = len(vertex_index)
+    faces = [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in mesh.faces()]
+    F = _mean_matrix(faces, n)
+    VF = F.T.tocsr()
+    VF.data[:] = 1.0
+    sizes, offsets, groups, a, b = _rings(faces)
+
+    def targets(X):
+        c = F.dot(X)
+        A2, _ = _fan(X, c, sizes, offsets, groups, a, b)
+        area = 0.5 * abs(A2)
+        A = VF.dot(area)
+        T = X.copy()
+        ok = A != 0
+        T[ok] = VF.dot(area[:, None] * c)[ok] / A[ok, None]
+        return T
+
+    _smooth(mesh, targets, free, kmax, damping, callback, callback_args, callback_interval)
+
+
 def trimesh_smooth_laplacian_cotangent(trimesh, fixed, kmax=10):
     """Smooth a triangle mesh using a laplacian matrix with cotangent weights.
 
@@ -21,14 +279,12 @@ def trimesh_smooth_laplacian_cotangent(trimesh, fixed, kmax=10):
         The mesh is modified in place.
 
     """
+    vertex_index = trimesh.vertex_index()
+    free = ones(trimesh.number_of_vertices(), dtype=bool)
+    free[[vertex_index[key] for key in fixed if key in vertex_index]] = False
     for k in range(kmax):
-        V = array(trimesh.vertices_attributes("xyz"))
+        V = trimesh.vertices_attributes_array("xyz")
         L = trimesh_cotangent_laplacian_matrix(trimesh)
         d = L.dot(V)
-        V = V + d
-        for key, attr in trimesh.vertices(True):
-            if key in fixed:
-                continue
-            attr["x"] = V[key][0]
-            attr["y"] = V[key][1]
-            attr["z"] = V[key][2]
+        V[free] += d[free]
+        trimesh.set_vertices_attributes_array("xyz", V)
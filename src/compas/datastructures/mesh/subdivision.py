@@ -4,7 +4,8 @@ from __future__ import division
 
 from math import cos
 from math import pi
-from copy import deepcopy
+
+import compas
 
 from compas.geometry import centroid_points
 from compas.geometry import offset_polygon
@@ -51,15 +52,7 @@ def subd_factory(cls):
 
 
 def mesh_fast_copy(other):
-    SubdMesh = subd_factory(type(other))
-    subd = SubdMesh()
-    subd.vertex = deepcopy(other.vertex)
-    subd.face = deepcopy(other.face)
-    subd.facedata = deepcopy(other.facedata)
-    subd.halfedge = deepcopy(other.halfedge)
-    subd._max_vertex = other._max_vertex
-    subd._max_face = other._max_face
-    return subd
+    return other.copy(cls=subd_factory(type(other)))
 
 
 # distinguish between subd of meshes with and without boundary
@@ -757,3 +750,362 @@ def trimesh_subdivide_loop(mesh, k=1, fixed=None):
             del subd.face[fkey]
 
     return cls.from_data(subd.data)
+
+
+# ==============================================================================
+# Subdivision plans
+# ==============================================================================
+
+
+def _add_stencil(stencil, weight, other):
+    for key, value in other.items():
+        stencil[key] = stencil.get(key, 0.0) + weight * value
+
+
+def _average_stencils(stencils):
+    stencil = {}
+    weight = 1.0 / len(stencils)
+    for other in stencils:
+        _add_stencil(stencil, weight, other)
+    return stencil
+
+
+def _catmullclark_stencils(mesh, fixed):
+    # same topological operations as in mesh_subdivide_catmullclark
+    subd = mesh_fast_copy(mesh)
+    stencils = {key: {key: 1.0} for key in mesh.vertices()}
+
+    edgepoints = []
+    for u, v in mesh.edges():
+        w = subd.split_edge((u, v), allow_boundary=True)
+        crease = mesh.edge_attribute((u, v), "crease") or 0
+        stencils[w] = {u: 0.5, v: 0.5}
+        if crease:
+            edgepoints.append([w, True])
+            subd.edge_attribute((u, w), "crease", crease - 1)
+            subd.edge_attribute((w, v), "crease", crease - 1)
+        else:
+            edgepoints.append([w, False])
+
+    fkey_stencil = {}
+    for fkey in mesh.faces():
+        vertices = mesh.face_vertices(fkey)
+        fkey_stencil[fkey] = _average_stencils([stencils[key] for key in vertices])
+        descendant = {i: j for i, j in subd.face_halfedges(fkey)}
+        ancestor = {j: i for i, j in subd.face_halfedges(fkey)}
+        c = subd.add_vertex(0.0, 0.0, 0.0)
+        stencils[c] = fkey_stencil[fkey]
+        for key in vertices:
+            subd.add_face([ancestor[key], key, descendant[key], c])
+        del subd.face[fkey]
+
+    before = stencils.copy()
+
+    for w, crease in edgepoints:
+        if not crease:
+            stencils[w] = _average_stencils([before[nbr] for nbr in subd.halfedge[w]])
+
+    for key in mesh.vertices():
+        if key in fixed:
+            continue
+        nbrs = mesh.vertex_neighbors(key)
+        creases = mesh.edges_attribute("crease", keys=[(key, nbr) for nbr in nbrs])
+        C = sum(1 if crease else 0 for crease in creases)
+        if C < 2:
+            F = _average_stencils([fkey_stencil[fkey] for fkey in mesh.vertex_faces(key) if fkey is not None])
+            enbrs = [before[nbr] for nbr in subd.halfedge[key]]
+            n = len(enbrs)
+            stencil = {}
+            _add_stencil(stencil, 1.0 / n, F)
+            _add_stencil(stencil, 2.0 / n, _average_stencils(enbrs))
+            _add_stencil(stencil, (n - 3.0) / n, before[key])
+            stencils[key] = stencil
+        elif C == 2:
+            stencil = {}
+            _add_stencil(stencil, 6.0 / 8.0, before[key])
+            for nbr, crease in zip(nbrs, creases):
+                if crease:
+                    _add_stencil(stencil, 1.0 / 8.0, before[nbr])
+            stencils[key] = stencil
+
+    return subd, stencils
+
+
+def _doosabin_stencils(mesh):
+    # same topological operations as in mesh_subdivide_doosabin
+    subd = subd_factory(type(mesh))()
+    stencils = {}
+    fkey_old_new = {fkey: {} for fkey in mesh.faces()}
+
+    for fkey in mesh.faces():
+        vertices = mesh.face_vertices(fkey)
+        n = len(vertices)
+        face = []
+        for i in range(n):
+            stencil = {}
+            for j in range(n):
+                if i == j:
+                    alpha = (n + 5.0) / (4.0 * n)
+                else:
+                    alpha = (3.0 + 2.0 * cos(2.0 * pi * (i - j) / n)) / (4.0 * n)
+                stencil[vertices[j]] = stencil.get(vertices[j], 0.0) + alpha
+            new = subd.add_vertex(0.0, 0.0, 0.0)
+            stencils[new] = stencil
+            fkey_old_new[fkey][vertices[i]] = new
+            face.append(new)
+        subd.add_face(face)
+
+    boundary = set(mesh.vertices_on_boundary())
+
+    for key in mesh.vertices():
+        if key in boundary:
+            continue
+        face = [fkey_old_new[fkey][key] for fkey in mesh.vertex_faces(key, ordered=True) if fkey is not None]
+        subd.add_face(face[::-1])
+
+    edges = set()
+    for u in mesh.halfedge:
+        for v in mesh.halfedge[u]:
+            if (u, v) in edges:
+                continue
+            edges.add((u, v))
+            edges.add((v, u))
+            uv_fkey = mesh.halfedge[u][v]
+            vu_fkey = mesh.halfedge[v][u]
+            if uv_fkey is None or vu_fkey is None:
+                continue
+            subd.add_face(
+                [
+                    fkey_old_new[uv_fkey][u],
+                    fkey_old_new[vu_fkey][u],
+                    fkey_old_new[vu_fkey][v],
+                    fkey_old_new[uv_fkey][v],
+                ]
+            )
+
+    return subd, stencils
+
+
+def _loop_stencils(subd):
+    # same topological operations as in trimesh_subdivide_loop
+    stencils = {}
+    fkey_vertices = {fkey: subd.face_vertices(fkey)[:] for fkey in subd.faces()}
+    uv_w = {(u, v): subd.face_vertex_ancestor(fkey, u) for fkey in subd.faces() for u, v in subd.face_halfedges(fkey)}
+    boundary = set(subd.vertices_on_boundary())
+
+    for key in subd.vertices():
+        nbrs = subd.vertex_neighbors(key)
+        if key in boundary:
+            stencil = {key: 0.75}
+            for nbr in nbrs:
+                if subd.halfedge[key][nbr] is None or subd.halfedge[nbr][key] is None:
+                    stencil[nbr] = stencil.get(nbr, 0.0) + 0.125
+        else:
+            n = len(nbrs)
+            a = 3.0 / 16.0 if n == 3 else 3.0 / (8 * n)
+            stencil = {key: 1.0 - n * a}
+            for nbr in nbrs:
+                stencil[nbr] = stencil.get(nbr, 0.0) + a
+        stencils[key] = stencil
+
+    edgepoints = {}
+    for u, v in list(subd.edges()):
+        w = subd.split_edge((u, v), allow_boundary=True)
+        edgepoints[(u, v)] = w
+        edgepoints[(v, u)] = w
+        if (u, v) in uv_w and (v, u) in uv_w:
+            stencil = {}
+            _add_stencil(stencil, 3.0 / 8.0, {u: 1.0, v: 1.0})
+            _add_stencil(stencil, 1.0 / 8.0, {uv_w[(u, v)]: 1.0})
+            _add_stencil(stencil, 1.0 / 8.0, {uv_w[(v, u)]: 1.0})
+        else:
+            stencil = {u: 0.5, v: 0.5}
+        stencils[w] = stencil
+
+    for fkey, (u, v, w) in fkey_vertices.items():
+        uv = edgepoints[(u, v)]
+        vw = edgepoints[(v, w)]
+        wu = edgepoints[(w, u)]
+        subd.add_face([wu, u, uv])
+        subd.add_face([uv, v, vw])
+        subd.add_face([vw, w, wu])
+        subd.add_face([uv, vw, wu])
+        del subd.face[fkey]
+
+    return stencils
+
+
+class SubdivisionPlan(object):
+    """Precomputed subdivision of a control mesh, for repeated evaluation with changing vertex coordinates.
+
+    The subdivision schemes supported by a plan are linear in the coordinates of the control mesh.
+    The plan computes the topology of the subdivided mesh once,
+    together with the stencils that express the coordinates of every subdivided vertex
+    as a weighted sum of the coordinates of the control vertices.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        The control mesh.
+    scheme : Literal['catmullclark', 'doosabin', 'loop'], optional
+        The subdivision scheme.
+    k : int, optional
+        The number of levels of subdivision.
+    fixed : list[int], optional
+        A list of fixed vertices.
+        This is only used by the Catmull-Clark scheme.
+
+    Attributes
+    ----------
+    scheme : str
+        The subdivision scheme.
+    k : int
+        The number of levels of subdivision.
+    vertices : list[int]
+        The identifiers of the vertices of the control mesh,
+        in the order of the columns of the stencil matrix.
+    mesh : :class:`~compas.datastructures.Mesh`
+        The subdivided mesh.
+        The order of its vertices is the order of the rows of the stencil matrix.
+    matrix : scipy.sparse.csr_matrix, read-only
+        The stencil matrix.
+
+    Raises
+    ------
+    ValueError
+        If the scheme is not supported.
+
+    Notes
+    -----
+    The result of a plan is identical to the result of the corresponding subdivision function,
+    as long as the topology of the control mesh, the fixed vertices, and the "crease" attributes of the edges
+    do not change.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas.datastructures import Mesh
+    >>> cage = Mesh.from_shape(Box.from_width_height_depth(1, 1, 1))
+    >>> plan = SubdivisionPlan(cage, k=2)
+    >>> plan.mesh.number_of_faces()
+    96
+    >>> xyz = [[2 * x, y, z] for x, y, z in cage.vertices_attributes('xyz')]
+    >>> len(plan.evaluate(xyz)) == plan.mesh.number_of_vertices()
+    True
+
+    """
+
+    SCHEMES = ("catmullclark", "doosabin", "loop")
+
+    def __init__(self, mesh, scheme="catmullclark", k=1, fixed=None):
+        if scheme not in self.SCHEMES:
+            raise ValueError("Scheme is not supported: {}".format(scheme))
+        fixed = set(fixed or [])
+        self.scheme = scheme
+        self.k = k
+        self.vertices = list(mesh.vertices())
+        self._levels = []
+        self._matrix = None
+
+        keys = self.vertices
+        subd = mesh_fast_copy(mesh) if scheme == "loop" else mesh
+        for _ in range(k):
+            if scheme == "catmullclark":
+                subd, stencils = _catmullclark_stencils(subd, fixed)
+            elif scheme == "doosabin":
+                subd, stencils = _doosabin_stencils(subd)
+            else:
+                stencils = _loop_stencils(subd)
+            key_index = {key: index for index, key in enumerate(keys)}
+            keys = list(subd.vertices())
+            indptr = [0]
+            indices = []
+            data = []
+            for key in keys:
+                for old, weight in stencils[key].items():
+                    indices.append(key_index[old])
+                    data.append(weight)
+                indptr.append(len(indices))
+            self._levels.append((indptr, indices, data))
+
+        self.mesh = type(mesh).from_data(subd.data) if k else mesh.copy()
+        self.update(mesh)
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            from scipy.sparse import csr_matrix
+            from scipy.sparse import identity
+
+            n = len(self.vertices)
+            matrix = identity(n, format="csr")
+            for indptr, indices, data in self._levels:
+                level = csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, n))
+                matrix = level.dot(matrix)
+                n = len(indptr) - 1
+            self._matrix = matrix.tocsr()
+        return self._matrix
+
+    def evaluate(self, points):
+        """Compute the coordinates of the vertices of the subdivided mesh from new coordinates of the control vertices.
+
+        Parameters
+        ----------
+        points : list[[float, float, float]] | ndarray
+            The coordinates of the control vertices, in the order of :attr:`vertices`.
+
+        Returns
+        -------
+        ndarray | list[list[float]]
+            The coordinates of the vertices of the subdivided mesh, in the order of the vertices of :attr:`mesh`.
+            The result is an array of shape (n, 3), except in IronPython, where it is a list of lists.
+
+        Raises
+        ------
+        ValueError
+            If the number of points is not equal to the number of control vertices.
+
+        """
+        if len(points) != len(self.vertices):
+            raise ValueError("Expected {} points, got {}.".format(len(self.vertices), len(points)))
+        if not compas.IPY:
+            from numpy import asarray
+
+            return self.matrix.dot(asarray(points, dtype=float).reshape((-1, 3)))
+        points = [list(point) for point in points]
+        for indptr, indices, data in self._levels:
+            result = []
+            for i in range(len(indptr) - 1):
+                x, y, z = 0.0, 0.0, 0.0
+                for j in range(indptr[i], indptr[i + 1]):
+                    weight = data[j]
+                    point = points[indices[j]]
+                    x += weight * point[0]
+                    y += weight * point[1]
+                    z += weight * point[2]
+                result.append([x, y, z])
+            points = result
+        return points
+
+    def update(self, mesh):
+        """Update the coordinates of the subdivided mesh with the current coordinates of the control mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`~compas.datastructures.Mesh`
+            The control mesh, with the same topology as the mesh used to compute the plan.
+
+        Returns
+        -------
+        :class:`~compas.datastructures.Mesh`
+            The subdivided mesh of the plan.
+
+        """
+        if not compas.IPY:
+            xyz = self.evaluate(mesh.vertices_attributes_array("xyz", keys=self.vertices))
+            self.mesh.set_vertices_attributes_array("xyz", xyz)
+        else:
+            xyz = self.evaluate(mesh.vertices_attributes("xyz", keys=self.vertices))
+            for key, point in zip(self.mesh.vertices(), xyz):
+                self.mesh.vertex_attributes(key, "xyz", point)
+        return self.mesh
@@ -2,8 +2,13 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas
+
 from compas.geometry import transform_points
 
+if not compas.IPY:
+    from compas.geometry import transform_points_numpy
+
 
 def mesh_transform(mesh, transformation):
     """Transform a mesh.
@@ -20,6 +25,11 @@ def mesh_transform(mesh, transformation):
     None
         The mesh is modified in-place.
 
+    Notes
+    -----
+    If NumPy is available, the coordinates of all vertices are transformed as one array.
+    Otherwise, they are transformed in one pass with :func:`~compas.geometry.transform_points`.
+
     Examples
     --------
     >>> from compas.datastructures import Mesh
@@ -30,11 +40,14 @@ def mesh_transform(mesh, transformation):
     >>> mesh_transform(tmesh, T)
 
     """
+    if not compas.IPY:
+        xyz = mesh.vertices_attributes_array("xyz")
+        mesh.set_vertices_attributes_array("xyz", transform_points_numpy(xyz, transformation))
+        return
     vertices = list(mesh.vertices())
-    xyz = [mesh.vertex_coordinates(vertex) for vertex in vertices]
-    xyz[:] = transform_points(xyz, transformation)
-    for index, vertex in enumerate(vertices):
-        mesh.vertex_attributes(vertex, "xyz", xyz[index])
+    xyz = transform_points([mesh.vertex_coordinates(vertex) for vertex in vertices], transformation)
+    for vertex, point in zip(vertices, xyz):
+        mesh.vertex_attributes(vertex, "xyz", point)
 
 
 def mesh_transformed(mesh, transformation):
@@ -30,11 +30,8 @@ def mesh_transform_numpy(mesh, transformation):
     >>> mesh_transform_numpy(tmesh, T)
 
     """
-    vertices = list(mesh.vertices())
-    xyz = [mesh.vertex_coordinates(vertex) for vertex in vertices]
-    xyz[:] = transform_points_numpy(xyz, transformation)
-    for index, vertex in enumerate(vertices):
-        mesh.vertex_attributes(vertex, "xyz", xyz[index])
+    xyz = mesh.vertices_attributes_array("xyz")
+    mesh.set_vertices_attributes_array("xyz", transform_points_numpy(xyz, transformation))
 
 
 def mesh_transformed_numpy(mesh, transformation):
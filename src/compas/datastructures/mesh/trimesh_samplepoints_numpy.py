@@ -1,4 +1,3 @@
-from numpy import array
 from numpy.random import choice
 from numpy.random import rand
 from numpy import sqrt
@@ -59,11 +58,7 @@ def trimesh_samplepoints_numpy(mesh, num_points=1000, return_normals=False):
         raise ValueError("Mesh is invalid.")
 
     # (1)  Prepare data for computing
-    vertex_index = mesh.vertex_index()
-    vertices = mesh.vertices_attributes("xyz")
-    faces = [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in mesh.faces()]
-    V = array(vertices, dtype=float64)
-    F = array(faces, dtype=int)
+    V, F, _ = mesh.to_arrays()
 
     e01 = V[F[:, 1]] - V[F[:, 0]]
     e12 = V[F[:, 2]] - V[F[:, 1]]
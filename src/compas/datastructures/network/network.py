@@ -11,8 +11,10 @@ else:
 
 from compas.files import OBJ
 
-from compas.utilities import geometric_key
+from compas.utilities import geometric_keys
+from compas.utilities import SpatialHash
 from compas.geometry import Point
+from compas.geometry import KDTree
 from compas.geometry import Vector
 from compas.geometry import Line
 from compas.geometry import centroid_points
@@ -38,6 +40,7 @@ from .smoothing import network_smooth_centroid
 from .planarity import network_count_crossings
 from .planarity import network_find_crossings
 from .planarity import network_is_crossed
+from .planarity import network_iter_crossings
 from .planarity import network_is_xy
 
 
@@ -67,6 +70,7 @@ class Network(Graph):
     count_crossings = network_count_crossings
     find_crossings = network_find_crossings
     is_crossed = network_is_crossed
+    iter_crossings = network_iter_crossings
     is_xy = network_is_xy
 
     if not compas.IPY:
@@ -173,24 +177,12 @@ class Network(Graph):
 
         """
         network = cls()
-        edges = []
-        node = {}
-        for line in lines:
-            sp = line[0]
-            ep = line[1]
-            a = geometric_key(sp, precision)
-            b = geometric_key(ep, precision)
-            node[a] = sp
-            node[b] = ep
-            edges.append((a, b))
-        key_index = dict((k, i) for i, k in enumerate(iter(node)))
-        for key, xyz in iter(node.items()):
-            i = key_index[key]
+        spatialhash = SpatialHash(precision=precision)
+        indices = spatialhash.add_points([point for line in lines for point in (line[0], line[1])])
+        for i, xyz in enumerate(spatialhash.points):
             network.add_node(i, x=xyz[0], y=xyz[1], z=xyz[2])
-        for u, v in edges:
-            i = key_index[u]
-            j = key_index[v]
-            network.add_edge(i, j)
+        for k in range(0, len(indices), 2):
+            network.add_edge(indices[k], indices[k + 1])
         return network
 
     @classmethod
@@ -229,7 +221,7 @@ class Network(Graph):
         return network
 
     @classmethod
-    def from_pointcloud(cls, cloud, degree=3):
+    def from_pointcloud(cls, cloud, degree=3, nearest=False):
         """Construct a network from random connections between the points of a pointcloud.
 
         Parameters
@@ -238,6 +230,9 @@ class Network(Graph):
             A pointcloud object.
         degree : int, optional
             The number of connections per node.
+        nearest : bool, optional
+            If True, connect every node to its `degree` nearest neighbors instead of to random nodes.
+            The nearest neighbors are found with a :class:`~compas.geometry.KDTree`.
 
         Returns
         -------
@@ -253,6 +248,17 @@ class Network(Graph):
         network = cls()
         for x, y, z in cloud:
             network.add_node(x=x, y=y, z=z)
+        if nearest:
+            nodes = list(network.nodes())
+            k = min(degree + 1, len(nodes))
+            tree = KDTree(network.nodes_attributes("xyz", keys=nodes))
+            indices, _ = tree.query(network.nodes_attributes("xyz", keys=nodes), k=k)
+            for u, nbrs in zip(nodes, indices):
+                for index in nbrs:
+                    v = nodes[index]
+                    if u != v and not network.has_edge((u, v), directed=False):
+                        network.add_edge(u, v)
+            return network
         for u in network.nodes():
             for v in network.node_sample(size=degree):
                 network.add_edge(u, v)
@@ -359,9 +365,9 @@ class Network(Graph):
         :func:`compas.geometry.geometric_key`
 
         """
-        gkey = geometric_key
+        nodes = list(self.nodes())
         xyz = self.node_coordinates
-        return {key: gkey(xyz(key), precision) for key in self.nodes()}
+        return dict(zip(nodes, geometric_keys([xyz(key) for key in nodes], precision)))
 
     key_gkey = node_gkey
 
@@ -385,9 +391,9 @@ class Network(Graph):
         :func:`compas.geometry.geometric_key`
 
         """
-        gkey = geometric_key
+        nodes = list(self.nodes())
         xyz = self.node_coordinates
-        return {gkey(xyz(key), precision): key for key in self.nodes()}
+        return dict(zip(geometric_keys([xyz(key) for key in nodes], precision), nodes))
 
     gkey_key = gkey_node
 
@@ -3,11 +3,10 @@ from __future__ import absolute_import
 from __future__ import division
 
 from math import cos
+from math import floor
 from math import sin
 from math import pi
 
-from itertools import product
-
 from compas.geometry import angle_vectors_xy
 from compas.geometry import is_intersection_segment_segment_xy
 from compas.geometry import is_ccw_xy
@@ -22,6 +21,103 @@ def network_embed_in_plane_proxy(data, fixed=None, straightline=True):
     return network.to_data()
 
 
+def _segment_cells(a, b, size):
+    """Find the cells of a uniform grid that are crossed by a segment.
+
+    The segment is traversed column by column.
+    In every column, the cells between the lowest and the highest point of the segment in that column are included.
+    The ranges are slightly enlarged, such that no cells are missed because of rounding errors.
+    """
+    (x1, y1), (x2, y2) = sorted(((a[0], a[1]), (b[0], b[1])))
+    eps = 1e-9 * size
+    i1 = int(floor((x1 - eps) / size))
+    i2 = int(floor((x2 + eps) / size))
+    dx = x2 - x1
+    for i in range(i1, i2 + 1):
+        if dx > 0:
+            xa = min(max(x1, i * size), x2)
+            xb = min(max(x1, (i + 1) * size), x2)
+            ya = y1 + (y2 - y1) * (xa - x1) / dx
+            yb = y1 + (y2 - y1) * (xb - x1) / dx
+        else:
+            ya, yb = y1, y2
+        j1 = int(floor((min(ya, yb) - eps) / size))
+        j2 = int(floor((max(ya, yb) + eps) / size))
+        for j in range(j1, j2 + 1):
+            yield i, j
+
+
+def _iter_crossings(edges, xy):
+    """Iterate over the pairs of crossing edges, using a uniform grid as broad phase.
+
+    Every edge is registered in the cells of the grid that it crosses,
+    and only tested for intersection against the edges registered before it in the same cells.
+    Every pair of edges is therefore tested at most once.
+    The size of the cells is the average size of the edges along the X or Y axis.
+    """
+    edges = [(u, v) for u, v in edges if u != v]
+    if not edges:
+        return
+
+    sizes = [max(abs(xy[u][0] - xy[v][0]), abs(xy[u][1] - xy[v][1])) for u, v in edges]
+    size = sum(sizes) / len(sizes) or 1.0
+
+    grid = {}
+
+    for index, (u1, v1) in enumerate(edges):
+        a = xy[u1]
+        b = xy[v1]
+        candidates = set()
+        for cell in _segment_cells(a, b, size):
+            if cell in grid:
+                candidates.update(grid[cell])
+                grid[cell].append(index)
+            else:
+                grid[cell] = [index]
+        for other in sorted(candidates):
+            u2, v2 = edges[other]
+            if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
+                continue
+            c = xy[u2]
+            d = xy[v2]
+            # the intersection test is not symmetric for touching segments
+            if is_intersection_segment_segment_xy((c, d), (a, b)) or is_intersection_segment_segment_xy((a, b), (c, d)):
+                yield (u2, v2), (u1, v1)
+
+
+def network_iter_crossings(network):
+    """Iterate over the pairs of crossing edges in a network.
+
+    Parameters
+    ----------
+    network : :class:`~compas.datastructures.Network`
+        A network object.
+
+    Yields
+    ------
+    tuple[tuple[hashable, hashable], tuple[hashable, hashable]]
+        A pair of crossing edges, with each edge represented by two vertex keys.
+
+    Notes
+    -----
+    This algorithm assumes that the network lies in the XY plane.
+
+    The edges are inserted one by one in a uniform grid, and every edge is only tested for intersection
+    against the previously inserted edges that share a cell of the grid with it.
+    Crossings are therefore found as the edges are inserted, without testing all pairs of edges.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Network
+    >>> network = Network.from_lines([([0, 0, 0], [1, 1, 0]), ([1, 0, 0], [0, 1, 0]), ([2, 0, 0], [3, 0, 0])])
+    >>> len(list(network_iter_crossings(network)))
+    1
+
+    """
+    xy = {key: network.node_attributes(key, "xy") for key in network.nodes()}
+    return _iter_crossings(network.edges(), xy)
+
+
 def network_is_crossed(network):
     """Verify if a network has crossing edges.
 
@@ -39,30 +135,17 @@ def network_is_crossed(network):
     Notes
     -----
     This algorithm assumes that the network lies in the XY plane.
+    The search stops at the first crossing that is found.
 
     """
-    for (u1, v1), (u2, v2) in product(network.edges(), network.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = network.node_attributes(u1, "xy")
-        b = network.node_attributes(v1, "xy")
-        c = network.node_attributes(u2, "xy")
-        d = network.node_attributes(v2, "xy")
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
+    for crossing in network_iter_crossings(network):
+        return True
     return False
 
 
 def _are_edges_crossed(edges, vertices):
-    for (u1, v1), (u2, v2) in product(edges, edges):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = vertices[u1]
-        b = vertices[v1]
-        c = vertices[u2]
-        d = vertices[v2]
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
+    for crossing in _iter_crossings(edges, vertices):
+        return True
     return False
 
 
@@ -84,7 +167,7 @@ def network_count_crossings(network):
     This algorithm assumes that the network lies in the XY plane.
 
     """
-    return len(network_find_crossings(network))
+    return sum(1 for crossing in network_iter_crossings(network))
 
 
 def network_find_crossings(network):
@@ -104,22 +187,12 @@ def network_find_crossings(network):
     -----
     This algorithm assumes that the network lies in the XY plane.
 
+    See Also
+    --------
+    :func:`network_iter_crossings`
+
     """
-    crossings = set()
-    for (u1, v1), (u2, v2) in product(network.edges(), network.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        if ((u1, v1), (u2, v2)) in crossings:
-            continue
-        if ((u2, v2), (u1, v1)) in crossings:
-            continue
-        a = network.node_attributes(u1, "xy")
-        b = network.node_attributes(v1, "xy")
-        c = network.node_attributes(u2, "xy")
-        d = network.node_attributes(v2, "xy")
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            crossings.add(((u1, v1), (u2, v2)))
-    return list(crossings)
+    return list(network_iter_crossings(network))
 
 
 def network_is_xy(network):
@@ -32,6 +32,10 @@ def network_smooth_centroid(network, fixed=None, kmax=100, damping=0.5, callback
     Exception
         If a callback is provided, but it is not callable.
 
+    See Also
+    --------
+    :func:`network_smooth_centroid_numpy`
+
     """
     if callback:
         if not callable(callback):
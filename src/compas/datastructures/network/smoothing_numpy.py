@@ -0,0 +1,96 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+from numpy import ones
+
+from compas.numerical import adjacency_matrix
+
+
+def network_smooth_centroid_numpy(
+    network,
+    fixed=None,
+    kmax=100,
+    damping=0.5,
+    callback=None,
+    callback_args=None,
+    callback_interval=1,
+):
+    """Smooth a network by moving every free node to the centroid of its neighbors.
+
+    Parameters
+    ----------
+    network : :class:`~compas.datastructures.Network`
+        A network object.
+    fixed : list[hashable], optional
+        The fixed nodes of the network.
+    kmax : int, optional
+        The maximum number of iterations.
+    damping : float, optional
+        The damping factor.
+    callback : callable, optional
+        A user-defined callback function to be executed every `callback_interval` iterations.
+    callback_args : list[Any], optional
+        A list of arguments to be passed to the callback.
+    callback_interval : int, optional
+        The number of iterations between calls to the callback.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    Exception
+        If a callback is provided, but it is not callable.
+
+    See Also
+    --------
+    :func:`network_smooth_centroid`
+
+    Notes
+    -----
+    The averaging operator is assembled once, as a sparse matrix,
+    and all iterations are computed on an array of node coordinates.
+    The coordinates of the nodes are only updated at the end,
+    and before every call to the callback.
+    Nodes without neighbors are not moved.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.datastructures import Network
+    >>> network = Network.from_obj(compas.get('lines.obj'))
+    >>> fixed = list(network.leaves())
+    >>> network_smooth_centroid_numpy(network, fixed=fixed, kmax=10)
+
+    """
+    if callback:
+        if not callable(callback):
+            raise Exception("Callback is not callable.")
+
+    nodes = list(network.nodes())
+    node_index = network.node_index()
+    adjacency = [[node_index[nbr] for nbr in network.neighbors(node)] for node in nodes]
+
+    A = adjacency_matrix(adjacency, rtype="csr")
+    degree = asarray(A.sum(axis=1)).ravel()
+    free = ones(len(nodes), dtype=bool)
+    free[degree == 0] = False
+    if fixed:
+        free[[node_index[node] for node in fixed]] = False
+    degree[degree == 0] = 1.0
+
+    def update():
+        for node, xyz in zip(nodes, X.tolist()):
+            network.node_attributes(node, "xyz", xyz)
+
+    X = asarray(network.nodes_attributes("xyz"), dtype=float).reshape((-1, 3))
+    for k in range(kmax):
+        C = A.dot(X) / degree[:, None]
+        X[free] += damping * (C[free] - X[free])
+        if callback and (k + 1) % callback_interval == 0:
+            update()
+            callback(k, callback_args)
+    update()
@@ -27,7 +27,7 @@ from compas.geometry import project_point_plane
 from compas.geometry import scale_vector
 from compas.geometry import subtract_vectors
 
-from compas.utilities import geometric_key
+from compas.utilities import geometric_keys
 from compas.utilities import linspace
 
 from .bbox import volmesh_bounding_box
@@ -366,9 +366,9 @@ class VolMesh(HalfFace):
         :meth:`gkey_vertex`
 
         """
-        gkey = geometric_key
+        vertices = list(self.vertices())
         xyz = self.vertex_coordinates
-        return {vertex: gkey(xyz(vertex), precision) for vertex in self.vertices()}
+        return dict(zip(vertices, geometric_keys([xyz(vertex) for vertex in vertices], precision)))
 
     def gkey_vertex(self, precision=None):
         """Returns a dictionary that maps *geometric keys* of a certain precision
@@ -389,9 +389,9 @@ class VolMesh(HalfFace):
         :meth:`vertex_gkey`
 
         """
-        gkey = geometric_key
+        vertices = list(self.vertices())
         xyz = self.vertex_coordinates
-        return {gkey(xyz(vertex), precision): vertex for vertex in self.vertices()}
+        return dict(zip(geometric_keys([xyz(vertex) for vertex in vertices], precision), vertices))
 
     # --------------------------------------------------------------------------
     # builders
@@ -2,12 +2,19 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from collections import OrderedDict
+import codecs
+import re
+import time
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
 import compas
 from compas import _iotools
-from compas.utilities import geometric_key
+from compas.utilities import SpatialHash
+
+# texture and normal references of face vertices
+RE_FACE_REFERENCES = re.compile(r"/\S*")
 
 
 class OBJ(object):
@@ -115,6 +122,40 @@ class OBJ(object):
         self._parser.parse()
         self._is_parsed = True
 
+    def iter_objects(self, groups=False):
+        """Read the file incrementally, and yield the vertices and faces of its objects one by one.
+
+        Parameters
+        ----------
+        groups : bool, optional
+            If True, iterate over the groups of the file instead of over the objects.
+
+        Yields
+        ------
+        tuple[str, list[list[float]], list[list[int]]]
+            The name of the object, its unique vertices up to the specified precision,
+            and its faces as lists of indices into those vertices.
+
+        Examples
+        --------
+        >>> import compas
+        >>> from compas.datastructures import Mesh
+        >>> obj = OBJ(compas.get('faces.obj'))
+        >>> for name, vertices, faces in obj.iter_objects():
+        ...     mesh = Mesh.from_vertices_and_faces(vertices, faces)
+        ...
+        >>> mesh.number_of_faces()
+        25
+
+        """
+        reader = OBJReader(self.filepath)
+        reader.open()
+        reader.pre()
+        for name, vertices, faces in reader.iter_objects(groups=groups):
+            spatialhash = SpatialHash(precision=self.precision)
+            index_index = spatialhash.add_points(vertices)
+            yield name, spatialhash.points, [[index_index[index] for index in face] for face in faces]
+
     def write(self, mesh, unweld=False, **kwargs):
         """Write a mesh to the file.
 
@@ -198,12 +239,29 @@ class OBJReader(object):
         Groups of mesh objects defined by their vertices and faces.
     objects : dict[str, tuple[list[int], list[list[int]]]]
         Named mesh objects defined by their vertices and faces.
+    textures : list[list[float]]
+        List of lists of texture coordinates.
+    number_of_lines : int
+        The number of lines read from the file.
+    number_of_characters : int
+        The number of characters read from the file.
+    time : float
+        The time spent reading, in seconds.
 
     """
 
+    # the size of the chunks in which the file is read
+    CHUNK_SIZE = 1 << 22
+
+    # the starts of lines that are read in blocks
+    BLOCKS = ("v ", "vn", "vt", "f ")
+
     def __init__(self, filepath):
         self.filepath = filepath
         self.content = None
+        self.number_of_lines = 0
+        self.number_of_characters = 0
+        self.time = 0.0
         # vertex data
         self.vertices = []
         self.weights = []
@@ -231,46 +289,30 @@ class OBJReader(object):
         self.object = None
 
     def open(self):
-        """Open the file and read its contents.
+        """Open the file for reading its contents in chunks.
+
+        The file is only opened once the contents are consumed,
+        and it is closed as soon as all chunks have been read.
 
         Returns
         -------
         None
 
         """
-        with _iotools.open_file(self.filepath, "r") as f:
-            self.content = f.readlines()
+        self.content = self._read_chunks()
 
     def pre(self):
         """Pre-process the contents.
 
+        The chunks of the file are lazily converted into a stream of lines,
+        with line continuations resolved.
+
         Returns
         -------
         None
 
         """
-        lines = []
-        is_continuation = False
-        needs_decode = None
-
-        for line in self.content:
-            # Check this only one time
-            if needs_decode is None:
-                needs_decode = hasattr(line, "decode")
-            if needs_decode:
-                line = line.decode("utf-8")
-            line = line.rstrip()
-            if not line:
-                continue
-            if is_continuation:
-                lines[-1] = lines[-1][:-2] + line
-            else:
-                lines.append(line)
-            if line[-1] == "\\":
-                is_continuation = True
-            else:
-                is_continuation = False
-        self.content = iter(lines)
+        self.content = self._read_lines(self.content)
 
     def post(self):
         """Post-process the contents.
@@ -282,6 +324,59 @@ class OBJReader(object):
         """
         pass
 
+    @property
+    def throughput(self):
+        """float - The number of lines read per second."""
+        if not self.time:
+            return 0.0
+        return self.number_of_lines / self.time
+
+    def _read_chunks(self):
+        decoder = None
+        with _iotools.open_file(self.filepath, "r") as f:
+            for chunk in _iotools.iter_file(f, size=self.CHUNK_SIZE):
+                # URLs are opened as byte streams
+                if not isinstance(chunk, str):
+                    if decoder is None:
+                        decoder = codecs.getincrementaldecoder("utf-8")()
+                    chunk = decoder.decode(chunk)
+                self.number_of_characters += len(chunk)
+                yield chunk
+
+    def _read_lines(self, chunks):
+        remainder = ""
+        for chunk in chunks:
+            text = remainder + chunk
+            lines = text.split("\n")
+            remainder = lines.pop()
+            if "\\" in text:
+                lines = self._join_continuations(lines)
+                if lines and lines[-1].rstrip().endswith("\\"):
+                    remainder = lines.pop() + "\n" + remainder
+            self.number_of_lines += chunk.count("\n")
+            for line in lines:
+                yield line
+        if remainder:
+            self.number_of_lines += 1
+            for line in self._join_continuations([remainder]):
+                yield line
+
+    def _join_continuations(self, lines):
+        joined = []
+        continuation = None
+        for line in lines:
+            line = line.rstrip()
+            if continuation is not None:
+                line = continuation + line
+                continuation = None
+            if line.endswith("\\"):
+                continuation = line[:-1]
+                continue
+            joined.append(line)
+        if continuation is not None:
+            joined.append(continuation + "\\")
+        return joined
+
     def read(self):
         """Read the contents of the file, line by line.
 
@@ -303,49 +398,178 @@ class OBJReader(object):
         * ``o``: start of named object
         * ``g``: start of a named group
 
+        Runs of consecutive lines with vertex coordinates, normals, texture coordinates, or faces
+        are converted to numbers in bulk.
+
         Returns
         -------
         None
 
         """
+        for _ in self._read_statements(()):
+            pass
+
+    def iter_objects(self, groups=False):
+        """Read the contents of the file incrementally, one object at a time.
+
+        Parameters
+        ----------
+        groups : bool, optional
+            If True, iterate over the groups of the file instead of over the objects.
+
+        Yields
+        ------
+        tuple[str, list[list[float]], list[list[int]]]
+            The name of the object or group,
+            the coordinates of the vertices of its faces,
+            and its faces as lists of indices into those vertices.
+
+        Notes
+        -----
+        The vertex coordinates are kept in :attr:`vertices`,
+        since faces can refer to vertices defined in other parts of the file.
+        All other collected data is discarded after every object,
+        which limits memory usage for large files with many objects.
+
+        """
+        for _ in self._read_statements(("g",) if groups else ("o",)):
+            if self.faces:
+                yield self._pop_faces(self.group if groups else self.object)
+        if self.faces:
+            yield self._pop_faces(self.group if groups else self.object)
+
+    def _pop_faces(self, name):
+        indices = sorted(set(index for face in self.faces for index in face))
+        index_index = {index: i for i, index in enumerate(indices)}
+        vertices = [self.vertices[index] for index in indices]
+        faces = [[index_index[index] for index in face] for face in self.faces]
+        del self.points[:]
+        del self.lines[:]
+        del self.faces[:]
+        self.groups.clear()
+        self.objects.clear()
+        return name, vertices, faces
+
+    def _read_statements(self, stop):
+        # read all lines and yield before every statement with a head in `stop`
+        # runs of consecutive lines with vertex data or faces are converted in one go
         if not self.content:
             return
-        for line in self.content:
-            parts = line.split()
-            if not parts:
-                continue
-            head = parts[0]
-            tail = parts[1:]
-            if head == "#":
-                self._read_comment(tail)
-                continue
-            if head == "v":
-                self._read_vertex_coordinates(tail)
-                continue
-            if head == "vt":
-                self._read_vertex_texture(tail)
-                continue
-            if head == "vn":
-                self._read_vertex_normal(tail)
-                continue
-            if head == "vp":
-                self._read_parameter_vertex(tail)
-                continue
-            if head in ("p", "l", "f"):
-                self._read_polygonal_geometry(head, tail)
-                continue
-            if head in ("deg", "bmat", "step", "cstype"):
-                self._read_freeform_attribute(head, tail)
-                continue
-            if head in ("curv", "curv2", "surf"):
-                self._read_freeform_geometry(head, tail)
-                continue
-            if head in ("parm", "trim", "hole", "scrv", "sp", "end"):
-                self._read_freeform_statement(head, tail)
-                continue
-            if head in ("g", "s", "mg", "o"):
-                self._read_grouping(head, tail)
+        t0 = time.time()
+        for start, lines in groupby(self.content, key=itemgetter(slice(0, 2))):
+            if start in self.BLOCKS:
+                self._read_block(start[0] if start == "v " or start == "f " else start, list(lines))
                 continue
+            for line in lines:
+                parts = line.split()
+                if not parts:
+                    continue
+                head = parts[0]
+                if head in stop:
+                    self.time += time.time() - t0
+                    yield head
+                    t0 = time.time()
+                self._read_statement(head, parts[1:])
+        self.time += time.time() - t0
+
+    def _read_statement(self, head, tail):
+        if head == "#":
+            self._read_comment(tail)
+        elif head == "v":
+            self._read_vertex_coordinates(tail)
+        elif head == "vt":
+            self._read_vertex_texture(tail)
+        elif head == "vn":
+            self._read_vertex_normal(tail)
+        elif head == "vp":
+            self._read_parameter_vertex(tail)
+        elif head in ("p", "l", "f"):
+            self._read_polygonal_geometry(head, tail)
+        elif head in ("deg", "bmat", "step", "cstype"):
+            self._read_freeform_attribute(head, tail)
+        elif head in ("curv", "curv2", "surf"):
+            self._read_freeform_geometry(head, tail)
+        elif head in ("parm", "trim", "hole", "scrv", "sp", "end"):
+            self._read_freeform_statement(head, tail)
+        elif head in ("g", "s", "mg", "o"):
+            self._read_grouping(head, tail)
+
+    def _read_block(self, head, lines):
+        """Read a block of consecutive lines with the same head.
+
+        The values of all lines are converted at once,
+        unless the block contains lines with a deviating number of values.
+        In that case, the lines are processed one by one.
+
+        """
+        if head == "f":
+            done = self._read_face_block(lines)
+        else:
+            done = self._read_vertex_block(head, lines)
+        if not done:
+            for line in lines:
+                parts = line.split()
+                if parts:
+                    self._read_statement(parts[0], parts[1:])
+
+    def _read_face_block(self, lines):
+        # the heads of the lines are replaced by zeros
+        # which is never a valid vertex reference
+        # and thus marks the start of every face
+        text = " ".join(lines)
+        if "/" in text:
+            text = RE_FACE_REFERENCES.sub("", text)
+        text = text.replace("f", "0")
+        if compas.IPY:
+            values = [int(value) for value in text.split()]
+            starts = [index for index, value in enumerate(values) if value == 0]
+            faces = [values[a + 1 : b] for a, b in zip(starts, starts[1:] + [len(values)])]
+            faces = [[self._vertex_reference(index) for index in face] for face in faces]
+        else:
+            from numpy import array
+            from numpy import flatnonzero
+
+            values = array(text.split(), dtype=int)
+            starts = flatnonzero(values == 0)
+            counts = (starts[1:] - starts[:-1] - 1).tolist() + [len(values) - starts[-1] - 1]
+            # relative references count backwards from the last vertex
+            values[values < 0] += len(self.vertices) + 1
+            values -= 1
+            if min(counts) == max(counts):
+                faces = values.reshape((len(starts), counts[0] + 1))[:, 1:].tolist()
+            else:
+                values = values.tolist()
+                faces = [values[a + 1 : a + 1 + n] for a, n in zip(starts.tolist(), counts)]
+        if len(faces) != len(lines):
+            return False
+        start = len(self.faces)
+        self.faces.extend(face for face in faces if len(face) > 2)
+        refs = [("f", index) for index in range(start, len(self.faces))]
+        self.groups[self.group].extend(refs)
+        self.objects[self.object].extend(refs)
+        return True
+
+    def _read_vertex_block(self, head, lines):
+        # every line has a head followed by three values
+        values = " ".join(lines).split()
+        if len(values) != 4 * len(lines) or values[::4].count(head) != len(lines):
+            return False
+        del values[::4]
+        if compas.IPY:
+            values = [float(value) for value in values]
+            values = [values[i : i + 3] for i in range(0, len(values), 3)]
+        else:
+            from numpy import array
+
+            values = array(values, dtype=float).reshape((-1, 3)).tolist()
+        if head == "v":
+            self.vertices.extend(values)
+            self.weights.extend([1.0] * len(values))
+        elif head == "vn":
+            self.normals.extend(values)
+        else:
+            self.textures.extend(values)
+        return True
 
     def _read_comment(self, data):
         """Read a comment.
@@ -373,10 +597,27 @@ class OBJReader(object):
             self.weights.append(float(data[3]))
 
     def _read_vertex_texture(self, data):
-        pass
+        """Read the coordinates of a texture vertex.
+
+        Three types of formats are possible:
+
+        * u
+        * u v
+        * u v w
+
+        """
+        self.textures.append([float(x) for x in data])
 
     def _read_vertex_normal(self, data):
-        pass
+        """Read the components of a vertex normal.
+
+        Only one format is possible:
+
+        * i j k
+
+        """
+        if len(data) == 3:
+            self.normals.append([float(x) for x in data])
 
     def _read_parameter_vertex(self, data):
         pass
@@ -403,13 +644,19 @@ class OBJReader(object):
             face = []
             for d in data:
                 parts = d.split("/")
-                i = int(parts[0]) - 1
+                i = self._vertex_reference(int(parts[0]))
                 face.append(i)
             self.faces.append(face)
             ref = "f", len(self.faces) - 1
             self.groups[self.group].append(ref)
             self.objects[self.object].append(ref)
 
+    def _vertex_reference(self, index):
+        # convert a one-based or relative vertex reference to a zero-based index
+        if index < 0:
+            return len(self.vertices) + index
+        return index - 1
+
     def _read_freeform_attribute(self, name, data):
         if name == "deg":
             self.deg = [int(i) for i in data]
@@ -519,18 +766,10 @@ class OBJParser(object):
         None
 
         """
-        index_key = OrderedDict()
-        vertex = OrderedDict()
-
-        for i, xyz in enumerate(iter(self.reader.vertices)):
-            key = geometric_key(xyz, self.precision)
-            index_key[i] = key
-            vertex[key] = xyz
-
-        vertex_index = {key: index for index, key in enumerate(vertex)}
-        index_index = {index: vertex_index[key] for index, key in iter(index_key.items())}
+        spatialhash = SpatialHash(precision=self.precision)
+        index_index = spatialhash.add_points(self.reader.vertices)
 
-        self.vertices = [xyz for xyz in iter(vertex.values())]
+        self.vertices = spatialhash.points
         self.points = [index_index[index] for index in self.reader.points]
         self.lines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) == 2]
         self.polylines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) > 2]
@@ -637,8 +876,7 @@ class OBJWriter(object):
                 self._v += mesh.number_of_vertices()
 
     def _write_vertices(self, mesh):
-        for key in mesh.vertices():
-            x, y, z = mesh.vertex_coordinates(key)
+        for x, y, z in mesh.vertices_attributes("xyz"):
             self.file.write(self.vertex_tpl.format(x, y, z))
 
     def _write_faces(self, mesh):
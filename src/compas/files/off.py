@@ -286,8 +286,7 @@ class OFFWriter(object):
         self.file.write("{} {} {}\n".format(self.v, self.f, self.e))
 
     def _write_vertices(self):
-        for key in self.mesh.vertices():
-            x, y, z = self.mesh.vertex_coordinates(key)
+        for x, y, z in self.mesh.vertices_attributes("xyz"):
             self.file.write(self.vertex_tpl.format(x, y, z))
 
     def _write_faces(self):
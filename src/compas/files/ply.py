@@ -702,8 +702,7 @@ class PLYWriter(object):
         self.file.write("end_header\n")
 
     def _write_vertices(self):
-        for key in self.mesh.vertices():
-            x, y, z = self.mesh.vertex_coordinates(key)
+        for x, y, z in self.mesh.vertices_attributes("xyz"):
             self.file.write(self.vertex_tpl.format(x, y, z))
 
     def _write_faces(self):
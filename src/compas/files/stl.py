@@ -7,7 +7,11 @@ import struct
 import compas
 from compas import _iotools
 from compas.geometry import Translation
-from compas.utilities import geometric_key
+from compas.utilities import SpatialHash
+
+# binary facet layout
+# normal, three vertices, and a two-byte attribute count
+FACET_DTYPE = [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")]
 
 
 class STL(object):
@@ -61,6 +65,31 @@ class STL(object):
         self._parser = STLParser(self._reader, precision=self.precision)
         self._is_parsed = True
 
+    def read_arrays(self):
+        """Read the welded vertices and faces of the file as NumPy arrays, without constructing a mesh.
+
+        Returns
+        -------
+        ndarray
+            The vertex coordinates as an array of shape (n, 3).
+        ndarray
+            The faces as an array of shape (m, 3) of vertex indices.
+
+        Notes
+        -----
+        For binary files, the facets are read directly from a memory map of the file
+        and vertices are welded based on the exact bit patterns of their coordinates.
+        ASCII files are parsed as usual and converted to arrays.
+
+        """
+        from numpy import asarray
+
+        reader = self._reader if self._is_parsed else STLReader(self.filepath)
+        if reader.facet_array is not None:
+            return _weld_facets_numpy(reader.facet_array)
+        parser = self._parser if self._is_parsed else STLParser(reader, precision=self.precision)
+        return asarray(parser.vertices, dtype=float).reshape((-1, 3)), asarray(parser.faces, dtype=int).reshape((-1, 3))
+
     def write(self, mesh, **kwargs):
         """Write a mesh to the file.
 
@@ -93,6 +122,18 @@ class STLReader(object):
     filepath : path string | file-like object | URL string
         A path, a file-like object or a URL pointing to a file.
 
+    Attributes
+    ----------
+    header : bytes
+        The header of a binary file.
+    facets : list[dict]
+        The facets of the file, with a normal and three vertices per facet.
+    facet_array : ndarray
+        For binary files read outside of IronPython,
+        the facets as a structured NumPy array with fields "normal", "vertices" and "attributes".
+        The array is memory-mapped from the file if possible.
+        Otherwise, this attribute is None.
+
     References
     ----------
     * http://paulbourke.net/dataformats/stl/
@@ -103,9 +144,20 @@ class STLReader(object):
         self.filepath = filepath
         self.file = None
         self.header = None
-        self.facets = []
+        self.facet_array = None
+        self._facets = []
         self.read()
 
+    @property
+    def facets(self):
+        if self._facets is None:
+            self._facets = self._facets_from_array()
+        return self._facets
+
+    @facets.setter
+    def facets(self, facets):
+        self._facets = facets
+
     def read(self):
         """Read the data.
 
@@ -235,7 +287,11 @@ class STLReader(object):
             self.file = file
             self.file.seek(0)
             self.header = self._read_header_binary()
-            self.facets = self._read_facets_binary()
+            if compas.IPY:
+                self.facets = self._read_facets_binary()
+            else:
+                self.facet_array = self._read_facets_binary_numpy()
+                self.facets = None
 
     def _read_header_binary(self):
         bytes_ = self.file.read(80)
@@ -266,6 +322,31 @@ class STLReader(object):
             facets.append(self._read_facet_binary())
         return facets
 
+    def _read_facets_binary_numpy(self):
+        import numpy as np
+
+        n = self._read_number_of_facets_binary()
+        dtype = np.dtype(FACET_DTYPE)
+        if hasattr(self.filepath, "read") or str(self.filepath).startswith("http"):
+            data = self.file.read(n * dtype.itemsize)
+            if len(data) < n * dtype.itemsize:
+                raise ValueError("The file contains fewer facets than specified in its header.")
+            return np.frombuffer(data, dtype=dtype, count=n)
+        if n == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self.filepath, dtype=dtype, mode="r", offset=84, shape=(n,))
+
+    def _facets_from_array(self):
+        facets = []
+        data = self.facet_array.tobytes()
+        for index, (normal, vertices) in enumerate(
+            zip(self.facet_array["normal"].tolist(), self.facet_array["vertices"].tolist())
+        ):
+            start = index * 50
+            keys = (data[start + 12 : start + 24], data[start + 24 : start + 36], data[start + 36 : start + 48])
+            facets.append({"normal": tuple(normal), "vertices": tuple(map(tuple, vertices)), "keys": keys})
+        return facets
+
 
 class STLParser(object):
     """Class for parsing data from a STL file.
@@ -304,18 +385,34 @@ class STLParser(object):
         None
 
         """
+        if self.reader.facet_array is not None:
+            vertices, faces = _weld_facets_numpy(self.reader.facet_array)
+            self.vertices = vertices.tolist()
+            self.faces = faces.tolist()
+            return
+        facets = self.reader.facets
+        if facets and "keys" not in facets[0]:
+            points = [xyz for facet in facets for xyz in facet["vertices"][:3]]
+            cell_index = {}
+            vertices = []
+            indices = []
+            for xyz, cell in zip(points, SpatialHash(precision=self.precision).cells(points)):
+                if cell not in cell_index:
+                    cell_index[cell] = len(vertices)
+                    vertices.append(xyz)
+                indices.append(cell_index[cell])
+            self.vertices = vertices
+            self.faces = [indices[i : i + 3] for i in range(0, len(indices), 3)]
+            return
         gkey_index = {}
         vertices = []
         faces = []
-        for facet in self.reader.facets:
+        for facet in facets:
             face = []
             facet_vertices = facet["vertices"]
             for i in range(3):
                 xyz = facet_vertices[i]
-                if "keys" in facet:
-                    gkey = facet["keys"][i]
-                else:
-                    gkey = geometric_key(xyz, self.precision)
+                gkey = facet["keys"][i]
                 if gkey not in gkey_index:
                     gkey_index[gkey] = len(vertices)
                     vertices.append(xyz)
@@ -412,6 +509,8 @@ class STLWriter(object):
             raise ValueError("Mesh must have fewer than 4294967295 faces to be written to binary STL.")
 
     def _write_binary_faces(self):
+        if not compas.IPY:
+            return self._write_binary_faces_numpy()
         vertex_xyz = self._vertex_xyz
         for face in self.mesh.faces():
             normal = list(self.mesh.face_normal(face))
@@ -419,3 +518,40 @@ class STLWriter(object):
             for vertex in self.mesh.face_vertices(face):
                 self.file.write(struct.pack("<3f", *vertex_xyz[vertex]))
             self.file.write(b"\0\0")
+
+    def _write_binary_faces_numpy(self):
+        import numpy as np
+
+        vertex_index = self.mesh.vertex_index()
+        xyz = self.mesh.vertices_attributes_array("xyz")
+        faces = np.array(
+            [[vertex_index[vertex] for vertex in self.mesh.face_vertices(face)] for face in self.mesh.faces()],
+            dtype=int,
+        ).reshape((-1, 3))
+        vertices = xyz[faces]
+        normals = np.cross(vertices[:, 1] - vertices[:, 0], vertices[:, 2] - vertices[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1.0
+        facets = np.zeros(len(faces), dtype=FACET_DTYPE)
+        # adding zero turns negative zeros into positive ones
+        facets["normal"] = normals / lengths[:, None] + 0.0
+        facets["vertices"] = vertices
+        self.file.write(facets.tobytes())
+
+
+def _weld_facets_numpy(facet_array):
+    # weld the vertices of binary facets based on the bit patterns of their coordinates
+    # vertices are numbered in order of first occurrence
+    import numpy as np
+
+    xyz = np.ascontiguousarray(facet_array["vertices"]).reshape((-1, 3))
+    if not len(xyz):
+        return np.zeros((0, 3), dtype=float), np.zeros((0, 3), dtype=int)
+    keys = xyz.view(np.dtype((np.void, xyz.dtype.itemsize * 3))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty(len(order), dtype=int)
+    rank[order] = np.arange(len(order))
+    vertices = xyz[first[order]].astype(float)
+    faces = rank[inverse.ravel()].reshape((-1, 3))
+    return vertices, faces
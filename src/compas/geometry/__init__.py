@@ -180,6 +180,7 @@ from ._core.transformations import (
 from ._core.transformations import reflect_line_plane, reflect_line_triangle, rotate_points, rotate_points_xy
 from ._core.transformations import scale_points, scale_points_xy
 from ._core.transformations import (
+    concatenate_matrices,
     transform_frames,
     transform_points,
     transform_vectors,
@@ -193,7 +194,7 @@ if not compas.IPY:
     from ._core.transformations_numpy import homogenize_and_flatten_frames_numpy, homogenize_numpy
     from ._core.transformations_numpy import local_to_world_coordinates_numpy
     from ._core.transformations_numpy import (
-        # transform_frames_numpy,
+        transform_frames_numpy,
         transform_points_numpy,
         transform_vectors_numpy,
     )
@@ -382,6 +383,9 @@ from .brep.vertex import BrepVertex
 from .brep.trim import BrepTrim
 from .brep.trim import BrepTrimIsoStatus
 
+if not compas.IPY:
+    from .arrays_numpy import PointArray, VectorArray, FrameArray
+
 
 __all__ = [
     "close",
@@ -616,6 +620,7 @@ __all__ = [
     "translation_from_matrix",
     "local_axes",
     "orthonormalize_axes",
+    "concatenate_matrices",
     "transform_points",
     "transform_vectors",
     "transform_frames",
@@ -730,6 +735,7 @@ if not compas.IPY:
         "icp_numpy",
         "transform_points_numpy",
         "transform_vectors_numpy",
+        "transform_frames_numpy",
         "homogenize_numpy",
         "dehomogenize_numpy",
         "homogenize_and_flatten_frames_numpy",
@@ -740,4 +746,7 @@ if not compas.IPY:
         "voronoi_from_points_numpy",
         "trimesh_descent_numpy",
         "trimesh_gradient_numpy",
+        "PointArray",
+        "VectorArray",
+        "FrameArray",
     ]
@@ -578,6 +578,10 @@ def closest_points_in_cloud_numpy(points, cloud, threshold=10**7, distances=True
     Items in cloud further from items in points than threshold return zero
     distance and will affect the indices returned if not set suitably high.
 
+    If `distances` is False, the distance matrix is not computed.
+    Instead, the closest points are found with a :class:`~compas.geometry.KDTree`,
+    and for multiple nearest neighbors the indices are sorted by distance, with shape (n x `num_nbrs`).
+
     Examples
     --------
     >>> from numpy import allclose
@@ -595,6 +599,13 @@ def closest_points_in_cloud_numpy(points, cloud, threshold=10**7, distances=True
 
     points = asarray(points).reshape((-1, 3))
     cloud = asarray(cloud).reshape((-1, 3))
+    if not distances:
+        from compas.geometry import KDTree
+
+        indices, _ = KDTree(cloud, leafsize=max(16, num_nbrs)).query(points, k=num_nbrs)
+        if num_nbrs == 1:
+            return indices[:, 0]
+        return indices
     d_matrix = distance_matrix(points, cloud, threshold=threshold)
     if num_nbrs == 1:
         indices = argmin(d_matrix, axis=1)
@@ -4,6 +4,8 @@ from __future__ import division
 
 import collections
 
+import compas
+
 from .distance import distance_point_point_sqrd
 
 
@@ -19,17 +21,28 @@ class KDTree(object):
         A list of objects to populate the tree with.
         If objects are provided, the tree is built automatically.
         Otherwise, use :meth:`build`.
+    leafsize : int, optional
+        The maximum number of points per leaf of the array-based tree used for batched queries.
 
     Attributes
     ----------
     root : Node
         The root node of the built tree.
         This is the median with respect to the different dimensions of the tree.
+    points : list[[float, float, float] | :class:`~compas.geometry.Point`]
+        The points of the tree.
 
     Notes
     -----
     For more info, see [1]_ and [2]_.
 
+    The tree supports two kinds of queries.
+    :meth:`nearest_neighbor` and :meth:`nearest_neighbors` search a tree of nodes for one point at a time.
+    :meth:`query` and :meth:`query_radius` search many points at once.
+    If Numpy is available, they use a flat, array-based tree with an implicit node layout,
+    in which every leaf contains at most `leafsize` points and every node stores the bounding box of its points.
+    Both trees are only built when they are needed.
+
     References
     ----------
     .. [1] Wikipedia. *k-d tree*.
@@ -39,14 +52,34 @@ class KDTree(object):
 
     Examples
     --------
-    >>>
+    >>> tree = KDTree([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    >>> point, label, distance = tree.nearest_neighbor([0.9, 0.2, 0.0])
+    >>> label
+    1
+    >>> indices, distances = tree.query([[0.9, 0.2, 0.0], [0.2, 0.9, 0.0]], k=2)
+    >>> [list(row) for row in indices]
+    [[1, 2], [3, 2]]
 
     """
 
-    def __init__(self, objects=None):
-        self.root = None
-        if objects:
-            self.root = self.build([(o, i) for i, o in enumerate(objects)])
+    def __init__(self, objects=None, leafsize=16):
+        if leafsize < 2:
+            raise ValueError("The leaf size should be at least 2.")
+        self._root = None
+        self._arrays = None
+        self._labels = None
+        self.leafsize = leafsize
+        self.points = list(objects) if objects is not None else []
+
+    @property
+    def root(self):
+        if self._root is None and self.points:
+            self._root = self._build([(o, i) for i, o in enumerate(self.points)], 0)
+        return self._root
+
+    @root.setter
+    def root(self, root):
+        self._root = root
 
     def build(self, objects, axis=0):
         """Populate a kd-tree with given objects.
@@ -63,7 +96,20 @@ class KDTree(object):
         Node or None
             The root node, or None if the sequence of objects is empty.
 
+        Notes
+        -----
+        The objects replace the points of the tree.
+        The batched queries return the labels of the objects instead of their indices.
+
         """
+        objects = list(objects)
+        self.points = [point for point, _ in objects]
+        self._labels = [label for _, label in objects]
+        self._arrays = None
+        self._root = self._build(objects, axis)
+        return self._root
+
+    def _build(self, objects, axis):
         if not objects:
             return
 
@@ -76,8 +122,8 @@ class KDTree(object):
             median_point,
             axis,
             median_label,
-            self.build(objects[:median_idx], next_axis),
-            self.build(objects[median_idx + 1 :], next_axis),
+            self._build(objects[:median_idx], next_axis),
+            self._build(objects[median_idx + 1 :], next_axis),
         )
 
     def nearest_neighbor(self, point, exclude=None):
@@ -152,3 +198,332 @@ class KDTree(object):
         if distance_sort:
             return sorted(nnbrs, key=lambda nnbr: nnbr[2])
         return nnbrs
+
+    def neighbors_in_radius(self, point, radius):
+        """Find all neighbors within a given distance of a point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            XYZ coordinates of the base point.
+        radius : float
+            The search radius.
+
+        Returns
+        -------
+        list[[[float, float, float], int or str, float]]
+            The neighbors, sorted by distance to the base point.
+
+        """
+
+        def search(node):
+            if node is None:
+                return
+
+            d2 = distance_point_point_sqrd(point, node.point)
+            if d2 <= r2:
+                nbrs.append([node.point, node.label, d2**0.5])
+
+            d = point[node.axis] - node.point[node.axis]
+            if d <= 0 or d**2 <= r2:
+                search(node.left)
+            if d >= 0 or d**2 <= r2:
+                search(node.right)
+
+        r2 = radius**2
+        nbrs = []
+        search(self.root)
+        return sorted(nbrs, key=lambda nbr: nbr[2])
+
+    # --------------------------------------------------------------------------
+    # batched queries
+    # --------------------------------------------------------------------------
+
+    @property
+    def arrays(self):
+        """dict: The arrays of the flat tree used for batched queries."""
+        if self._arrays is None:
+            self._arrays = _build_arrays(self.points, self.leafsize)
+            if self._labels is not None:
+                import numpy as np
+
+                self._arrays["order"] = np.asarray(self._labels)[self._arrays["order"]]
+        return self._arrays
+
+    def query(self, points, k=1):
+        """Find the k nearest neighbors of multiple points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            The query points.
+        k : int, optional
+            The number of nearest neighbors per point.
+
+        Returns
+        -------
+        tuple[array[int], array[float]] | tuple[list[list[int]], list[list[float]]]
+            The indices of the nearest neighbors of every query point, sorted by distance,
+            or their labels if the tree was populated with :meth:`build`,
+            and the corresponding distances, as arrays of shape (len(points), k).
+            In environments without Numpy, nested lists are returned instead.
+
+        Raises
+        ------
+        ValueError
+            If `k` is smaller than 1 or larger than the number of points in the tree.
+
+        """
+        if k < 1 or k > len(self.points):
+            raise ValueError("The number of neighbors should be between 1 and the number of points in the tree.")
+
+        if compas.IPY:
+            indices = []
+            distances = []
+            for point in points:
+                nnbrs = self.nearest_neighbors(point, k, distance_sort=True)
+                indices.append([label for _, label, _ in nnbrs])
+                distances.append([d for _, _, d in nnbrs])
+            return indices, distances
+
+        return _query_arrays(self.arrays, points, k)
+
+    def query_radius(self, points, radius):
+        """Find all neighbors within a given distance of multiple points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            The query points.
+        radius : float
+            The search radius.
+
+        Returns
+        -------
+        tuple[list[array[int]], list[array[float]]] | tuple[list[list[int]], list[list[float]]]
+            Per query point, the indices of the neighbors within the search radius, sorted by distance,
+            or their labels if the tree was populated with :meth:`build`,
+            and the corresponding distances.
+            In environments without Numpy, lists are returned instead of arrays.
+
+        """
+        if not self.points:
+            return [[] for point in points], [[] for point in points]
+
+        if compas.IPY:
+            indices = []
+            distances = []
+            for point in points:
+                nbrs = self.neighbors_in_radius(point, radius)
+                indices.append([label for _, label, _ in nbrs])
+                distances.append([d for _, _, d in nbrs])
+            return indices, distances
+
+        return _query_radius_arrays(self.arrays, points, radius)
+
+
+# ==============================================================================
+# Array-based tree
+# ==============================================================================
+
+# Number of query points processed at once by the batched queries.
+QUERY_CHUNK_SIZE = 1 << 14
+
+
+def _build_arrays(points, leafsize):
+    """Build a flat kd-tree with bucket leaves and an implicit, heap-ordered node layout.
+
+    At level ``l`` the points are divided into ``2**l`` consecutive segments of (almost) equal size.
+    Every segment is split in two along the axis of its largest extent, by partitioning its points around the median.
+    The children of node ``i`` are the nodes ``2 * i + 1`` and ``2 * i + 2``.
+    """
+    import numpy as np
+
+    xyz = np.asarray(points, dtype=float)
+    if xyz.ndim != 2:
+        xyz = xyz.reshape((len(points), -1))
+    n, dim = xyz.shape
+
+    depth = 0
+    while n > leafsize * 2**depth:
+        depth += 1
+
+    order = np.arange(n)
+
+    for level in range(depth):
+        count = 2**level
+        bounds = (np.arange(count + 1) * n) // count
+        splits = (np.arange(1, 2 * count, 2) * n) // (2 * count) - bounds[:-1]
+        sizes = np.diff(bounds)
+        width = sizes.max()
+
+        sorted_xyz = xyz[order]
+        extent = np.maximum.reduceat(sorted_xyz, bounds[:-1]) - np.minimum.reduceat(sorted_xyz, bounds[:-1])
+        axes = np.argmax(extent, axis=1)
+
+        # pad the segments to the same size, with infinity at the end
+        columns = np.arange(width)
+        index = bounds[:-1, None] + columns
+        valid = columns < sizes[:, None]
+        index[~valid] = 0
+        values = sorted_xyz[index, axes[:, None]]
+        values[~valid] = np.inf
+
+        # the segments differ in size by at most one, and so do their splits
+        kth = sorted(set([splits.min(), splits.max(), width - 1]))
+        local = np.argpartition(values, kth, axis=1)
+        order = order[(bounds[:-1, None] + local)[valid]]
+
+    count = 2**depth
+    bounds = (np.arange(count + 1) * n) // count
+    sorted_xyz = xyz[order]
+
+    levels_min = [np.minimum.reduceat(sorted_xyz, bounds[:-1])]
+    levels_max = [np.maximum.reduceat(sorted_xyz, bounds[:-1])]
+    for level in range(depth):
+        levels_min.append(levels_min[-1].reshape((-1, 2, dim)).min(axis=1))
+        levels_max.append(levels_max[-1].reshape((-1, 2, dim)).max(axis=1))
+
+    return {
+        "xyz": sorted_xyz,
+        "order": order,
+        "depth": depth,
+        "bounds": bounds,
+        "leafsize": int(np.diff(bounds).max()),
+        "min": np.vstack(levels_min[::-1]),
+        "max": np.vstack(levels_max[::-1]),
+    }
+
+
+def _box_distance_sqrd(xyz, bmin, bmax):
+    import numpy as np
+
+    d = np.maximum(bmin - xyz, 0) + np.maximum(xyz - bmax, 0)
+    return (d * d).sum(axis=1)
+
+
+def _leaves(arrays, xyz, bound):
+    """Find the leaves within the bound distance of every query point.
+
+    Returns the index of the query point, the leaf, and the squared distance to the bounding box of the leaf.
+    """
+    import numpy as np
+
+    qindex = np.arange(len(xyz))
+    nodes = np.zeros(len(xyz), dtype=int)
+    d2 = np.zeros(len(xyz))
+
+    for level in range(arrays["depth"]):
+        qindex = np.repeat(qindex, 2)
+        nodes = (2 * nodes[:, None] + np.array([1, 2])).ravel()
+        d2 = _box_distance_sqrd(xyz[qindex], arrays["min"][nodes], arrays["max"][nodes])
+        keep = d2 <= bound[qindex]
+        qindex = qindex[keep]
+        nodes = nodes[keep]
+        d2 = d2[keep]
+
+    return qindex, nodes - (2 ** arrays["depth"] - 1), d2
+
+
+def _points(arrays, xyz, qindex, leaves, bound):
+    """Collect the points of the given leaves within the bound distance of the corresponding query points.
+
+    Returns the index of the query point, the index of the sorted point,
+    and the squared distance of every candidate, ordered by query point and distance.
+    """
+    import numpy as np
+
+    bounds = arrays["bounds"]
+    columns = np.arange(arrays["leafsize"])
+    index = bounds[leaves, None] + columns
+    valid = index < bounds[leaves + 1, None]
+    index[~valid] = 0
+
+    d2 = ((arrays["xyz"][index] - xyz[qindex][:, None, :]) ** 2).sum(axis=2)
+    valid &= d2 <= bound[qindex][:, None]
+
+    qindex = np.broadcast_to(qindex[:, None], index.shape)[valid]
+    index = index[valid]
+    d2 = d2[valid]
+
+    ordering = np.lexsort((d2, qindex))
+    return qindex[ordering], index[ordering], d2[ordering]
+
+
+def _first(qindex, number, count):
+    """Select the first items of every group of a sorted array of group indices."""
+    import numpy as np
+
+    counts = np.bincount(qindex, minlength=count)
+    offsets = np.cumsum(counts) - counts
+    return np.arange(len(qindex)) - offsets[qindex] < number
+
+
+def _query_arrays(arrays, points, k):
+    import numpy as np
+
+    xyz = np.asarray(points, dtype=float).reshape((-1, arrays["xyz"].shape[1]))
+    n = len(arrays["xyz"])
+    depth = arrays["depth"]
+    width = min(max(k, arrays["leafsize"]), n)
+    # the number of leaves that contain at least k points
+    nleaves = -(-k // (n // 2**depth))
+
+    indices = np.empty((len(xyz), k), dtype=arrays["order"].dtype)
+    distances = np.empty((len(xyz), k), dtype=float)
+
+    for start in range(0, len(xyz), QUERY_CHUNK_SIZE):
+        chunk = xyz[start : start + QUERY_CHUNK_SIZE]
+        m = len(chunk)
+
+        # descend to the closest leaf
+        # the distance to the k-th nearest of any k points is an upper bound for the search
+        nodes = np.zeros(m, dtype=int)
+        for level in range(depth):
+            left = 2 * nodes + 1
+            d_left = _box_distance_sqrd(chunk, arrays["min"][left], arrays["max"][left])
+            d_right = _box_distance_sqrd(chunk, arrays["min"][left + 1], arrays["max"][left + 1])
+            nodes = left + (d_right < d_left)
+        first = np.minimum(arrays["bounds"][nodes - (2**depth - 1)], n - width)
+        window = first[:, None] + np.arange(width)
+        d2 = ((arrays["xyz"][window] - chunk[:, None, :]) ** 2).sum(axis=2)
+        bound = np.partition(d2, k - 1, axis=1)[:, k - 1]
+
+        # tighten the bound with the points of the closest leaves within the bound
+        qindex, leaves, d2 = _leaves(arrays, chunk, bound)
+        ordering = np.lexsort((d2, qindex))
+        qindex, leaves, d2 = qindex[ordering], leaves[ordering], d2[ordering]
+        closest = _first(qindex, nleaves, m)
+        qnear, _, d2near = _points(arrays, chunk, qindex[closest], leaves[closest], np.full(m, np.inf))
+        bound = np.minimum(bound, d2near[_first(qnear, k, m)].reshape((m, k))[:, -1])
+
+        keep = d2 <= bound[qindex]
+        qindex, index, d2 = _points(arrays, chunk, qindex[keep], leaves[keep], bound)
+        select = _first(qindex, k, m)
+
+        indices[start : start + m] = arrays["order"][index[select]].reshape((m, k))
+        distances[start : start + m] = np.sqrt(d2[select]).reshape((m, k))
+
+    return indices, distances
+
+
+def _query_radius_arrays(arrays, points, radius):
+    import numpy as np
+
+    xyz = np.asarray(points, dtype=float).reshape((-1, arrays["xyz"].shape[1]))
+
+    indices = []
+    distances = []
+
+    for start in range(0, len(xyz), QUERY_CHUNK_SIZE):
+        chunk = xyz[start : start + QUERY_CHUNK_SIZE]
+        bound = np.full(len(chunk), float(radius) ** 2)
+
+        qindex, leaves, _ = _leaves(arrays, chunk, bound)
+        qindex, index, d2 = _points(arrays, chunk, qindex, leaves, bound)
+
+        splits = np.cumsum(np.bincount(qindex, minlength=len(chunk)))[:-1]
+        indices += np.split(arrays["order"][index], splits)
+        distances += np.split(np.sqrt(d2), splits)
+
+    return indices, distances
@@ -16,8 +16,6 @@ from ._algebra import cross_vectors
 from ._algebra import vector_component
 from ._algebra import vector_component_xy
 from ._algebra import multiply_matrix_vector
-from ._algebra import multiply_matrices
-from ._algebra import transpose_matrix
 from ._algebra import norm_vector
 from .angles import angle_vectors
 from .distance import closest_point_on_plane
@@ -190,6 +188,82 @@ def dehomogenize_and_unflatten_frames(points_and_vectors):
 # ==============================================================================
 
 
+def _matrix_rows(T):
+    """Unpack the rows of a 4x4 transformation matrix or of the matrix of a transformation."""
+    return getattr(T, "matrix", T)
+
+
+def concatenate_matrices(matrices):
+    """Concatenate a chain of transformation matrices into one transformation matrix.
+
+    Parameters
+    ----------
+    matrices : sequence[list[list[float]] | :class:`~compas.geometry.Transformation`]
+        The 4x4 matrices, or the transformations.
+
+    Returns
+    -------
+    list[list[float]]
+        The 4x4 matrix of the concatenated transformation.
+        If the chain is empty, the identity matrix.
+
+    Notes
+    -----
+    The matrices are concatenated in the same order as transformations are concatenated by multiplication:
+    the concatenation of ``[A, B, C]`` is equal to ``A * B * C``,
+    and corresponds to applying `C` first and `A` last.
+
+    The product is accumulated in local variables,
+    such that long chains can be concatenated without creating intermediate matrices.
+
+    Examples
+    --------
+    >>> from compas.geometry import multiply_matrices
+    >>> A = matrix_from_axis_and_angle([0, 0, 1], math.radians(45), point=[1, 2, 3])
+    >>> B = matrix_from_scale_factors([2.0, 1.0, 0.5])
+    >>> concatenate_matrices([A, B]) == multiply_matrices(A, B)
+    True
+
+    """
+    a00, a01, a02, a03 = 1.0, 0.0, 0.0, 0.0
+    a10, a11, a12, a13 = 0.0, 1.0, 0.0, 0.0
+    a20, a21, a22, a23 = 0.0, 0.0, 1.0, 0.0
+    a30, a31, a32, a33 = 0.0, 0.0, 0.0, 1.0
+    for index, M in enumerate(matrices):
+        (b00, b01, b02, b03), (b10, b11, b12, b13), (b20, b21, b22, b23), (b30, b31, b32, b33) = _matrix_rows(M)
+        if not index:
+            a00, a01, a02, a03 = b00, b01, b02, b03
+            a10, a11, a12, a13 = b10, b11, b12, b13
+            a20, a21, a22, a23 = b20, b21, b22, b23
+            a30, a31, a32, a33 = b30, b31, b32, b33
+            continue
+        a00, a01, a02, a03 = (
+            a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+            a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+            a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+            a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+        )
+        a10, a11, a12, a13 = (
+            a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+            a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+            a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+            a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+        )
+        a20, a21, a22, a23 = (
+            a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+            a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+            a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+            a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+        )
+        a30, a31, a32, a33 = (
+            a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+            a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+            a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+            a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33,
+        )
+    return [[a00, a01, a02, a03], [a10, a11, a12, a13], [a20, a21, a22, a23], [a30, a31, a32, a33]]
+
+
 def transform_points(points, T):
     """Transform multiple points with one transformation matrix.
 
@@ -205,6 +279,11 @@ def transform_points(points, T):
     list[[float, float, float]]
         Transformed points.
 
+    Notes
+    -----
+    The points are transformed in a single pass, with the matrix multiplication written out explicitly,
+    which is equivalent to, but a lot faster than, multiplying the homogenized points with the transposed matrix.
+
     Examples
     --------
     >>> points = [[1, 0, 0], [1, 2, 4], [4, 7, 1]]
@@ -212,7 +291,24 @@ def transform_points(points, T):
     >>> points_transformed = transform_points(points, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(T)))
+    (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), (m30, m31, m32, m33) = _matrix_rows(T)
+    if m30 == 0 and m31 == 0 and m32 == 0 and m33 == 1:
+        return [
+            [
+                m00 * x + m01 * y + m02 * z + m03,
+                m10 * x + m11 * y + m12 * z + m13,
+                m20 * x + m21 * y + m22 * z + m23,
+            ]
+            for x, y, z in points
+        ]
+    transformed = []
+    for x, y, z in points:
+        X = m00 * x + m01 * y + m02 * z + m03
+        Y = m10 * x + m11 * y + m12 * z + m13
+        Z = m20 * x + m21 * y + m22 * z + m23
+        W = m30 * x + m31 * y + m32 * z + m33
+        transformed.append([X / W, Y / W, Z / W] if W else [X, Y, Z])
+    return transformed
 
 
 def transform_vectors(vectors, T):
@@ -230,6 +326,10 @@ def transform_vectors(vectors, T):
     list[[float, float, float]]
         Transformed vectors.
 
+    Notes
+    -----
+    The translation component of the transformation does not affect the vectors.
+
     Examples
     --------
     >>> vectors = [[1, 0, 0], [1, 2, 4], [4, 7, 1]]
@@ -237,7 +337,24 @@ def transform_vectors(vectors, T):
     >>> vectors_transformed = transform_vectors(vectors, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(vectors, w=0.0), transpose_matrix(T)))
+    (m00, m01, m02, _), (m10, m11, m12, _), (m20, m21, m22, _), (m30, m31, m32, _) = _matrix_rows(T)
+    if m30 == 0 and m31 == 0 and m32 == 0:
+        return [
+            [
+                m00 * x + m01 * y + m02 * z,
+                m10 * x + m11 * y + m12 * z,
+                m20 * x + m21 * y + m22 * z,
+            ]
+            for x, y, z in vectors
+        ]
+    transformed = []
+    for x, y, z in vectors:
+        X = m00 * x + m01 * y + m02 * z
+        Y = m10 * x + m11 * y + m12 * z
+        Z = m20 * x + m21 * y + m22 * z
+        W = m30 * x + m31 * y + m32 * z
+        transformed.append([X / W, Y / W, Z / W] if W else [X, Y, Z])
+    return transformed
 
 
 def transform_frames(frames, T):
@@ -263,8 +380,16 @@ def transform_frames(frames, T):
     >>> transformed_frames = transform_frames(frames, T)
 
     """
-    points_and_vectors = homogenize_and_flatten_frames(frames)
-    return dehomogenize_and_unflatten_frames(multiply_matrices(points_and_vectors, transpose_matrix(T)))
+    T = _matrix_rows(T)
+    points = []
+    vectors = []
+    for point, xaxis, yaxis in frames:
+        points.append(point)
+        vectors.append(xaxis)
+        vectors.append(yaxis)
+    points = transform_points(points, T)
+    vectors = transform_vectors(vectors, T)
+    return [[point, vectors[2 * i], vectors[2 * i + 1]] for i, point in enumerate(points)]
 
 
 def world_to_local_coordinates(frame, xyz):
@@ -1,4 +1,8 @@
 from numpy import asarray
+from numpy import concatenate
+from numpy import matmul
+from numpy import ndarray
+from numpy import swapaxes
 from numpy import hstack
 from numpy import ones
 from numpy import vectorize
@@ -7,22 +11,63 @@ from numpy import tile
 from scipy.linalg import solve  # type: ignore
 
 from ._algebra import cross_vectors
+from .transformations import concatenate_matrices
+
+
+def _matrices_numpy(T):
+    """Convert a transformation, a chain of transformations, a 4x4 matrix, or a stack of matrices to an array.
+
+    The transformations of a chain are applied in the order of the chain.
+    """
+    if hasattr(T, "matrix"):
+        return asarray(T.matrix, dtype=float)
+    if isinstance(T, ndarray):
+        return asarray(T, dtype=float)
+    T = list(T)
+    if all(hasattr(M, "matrix") for M in T):
+        return asarray(concatenate_matrices(T[::-1]), dtype=float)
+    return asarray(T, dtype=float)
+
+
+def _transform_numpy(xyz, T, w):
+    """Transform points (w = 1) or vectors (w = 0) with one transformation, or with a stack of transformations."""
+    xyz = asarray(xyz, dtype=float).reshape((-1, 3))
+    T = _matrices_numpy(T)
+    result = matmul(xyz, swapaxes(T[..., :3, :3], -1, -2))
+    if w:
+        result += T[..., None, :3, 3]
+    h = T[..., 3, :]
+    if (h[..., :3] != 0).any() or (w and (h[..., 3] != 1).any()):
+        W = matmul(xyz, h[..., :3, None])[..., 0]
+        if w:
+            W += h[..., None, 3]
+        W[W == 0] = 1.0
+        result /= W[..., None]
+    return result
 
 
 def transform_points_numpy(points, T):
-    """Transform multiple points with one Transformation using numpy.
+    """Transform multiple points with one transformation, or with multiple transformations, using numpy.
 
     Parameters
     ----------
     points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
         A list of points to be transformed.
-    T : :class:`~compas.geometry.Transformation` | list[list[float]]
-        The transformation to apply.
+    T : :class:`~compas.geometry.Transformation` | sequence[:class:`~compas.geometry.Transformation`] | array-like
+        The transformation to apply, a 4x4 matrix,
+        a chain of transformations that are applied in the order of the sequence,
+        as in :meth:`~compas.geometry.Geometry.transformed`,
+        or an array of shape (M, 4, 4) with M matrices that are each applied to all points.
 
     Returns
     -------
-    (N, 3) ndarray
-        The transformed points.
+    (N, 3) ndarray | (M, N, 3) ndarray
+        The transformed points,
+        or the points transformed by every one of the transformations.
+
+    Notes
+    -----
+    The points are transformed in a single pass, without homogenizing the coordinates.
 
     Examples
     --------
@@ -31,26 +76,33 @@ def transform_points_numpy(points, T):
     >>> T = matrix_from_axis_and_angle([0, 2, 0], math.radians(45), point=[4, 5, 6])
     >>> points_transformed = transform_points_numpy(points, T)
 
+    >>> from compas.geometry import Translation
+    >>> T = [Translation.from_vector([i, 0, 0]).matrix for i in range(5)]
+    >>> transform_points_numpy(points, T).shape
+    (5, 3, 3)
+
     """
-    T = asarray(T)
-    points = homogenize_numpy(points, w=1.0)
-    return dehomogenize_numpy(points.dot(T.T))
+    return _transform_numpy(points, T, 1.0)
 
 
 def transform_vectors_numpy(vectors, T):
-    """Transform multiple vectors with one Transformation using numpy.
+    """Transform multiple vectors with one transformation, or with multiple transformations, using numpy.
 
     Parameters
     ----------
     vectors : sequence[[float, float, float] | :class:`~compas.geometry.Vector`]
         A list of vectors to be transformed.
-    T : :class:`~compas.geometry.Transformation`
-        The transformation to apply.
+    T : :class:`~compas.geometry.Transformation` | sequence[:class:`~compas.geometry.Transformation`] | array-like
+        The transformation to apply, a 4x4 matrix,
+        a chain of transformations that are applied in the order of the sequence,
+        as in :meth:`~compas.geometry.Geometry.transformed`,
+        or an array of shape (M, 4, 4) with M matrices that are each applied to all vectors.
 
     Returns
     -------
-    (N, 3) ndarray
-        The transformed vectors.
+    (N, 3) ndarray | (M, N, 3) ndarray
+        The transformed vectors,
+        or the vectors transformed by every one of the transformations.
 
     Examples
     --------
@@ -60,24 +112,25 @@ def transform_vectors_numpy(vectors, T):
     >>> vectors_transformed = transform_vectors_numpy(vectors, T)
 
     """
-    T = asarray(T)
-    vectors = homogenize_numpy(vectors, w=0.0)
-    return dehomogenize_numpy(vectors.dot(T.T))
+    return _transform_numpy(vectors, T, 0.0)
 
 
 def transform_frames_numpy(frames, T):
-    """Transform multiple frames with one Transformation usig numpy.
+    """Transform multiple frames with one transformation, or with multiple transformations, using numpy.
 
     Parameters
     ----------
     frames : sequence[[point, vector, vector] | :class:`~compas.geometry.Frame`]
         A list of frames to be transformed.
-    T : :class:`~compas.geometry.Transformation`
-        The transformation to apply on the frames.
+    T : :class:`~compas.geometry.Transformation` | sequence[:class:`~compas.geometry.Transformation`] | array-like
+        The transformation to apply, a 4x4 matrix,
+        a chain of transformations that are applied in the order of the sequence,
+        as in :meth:`~compas.geometry.Geometry.transformed`,
+        or an array of shape (M, 4, 4) with M matrices that are each applied to all frames.
 
     Returns
     -------
-    (N, 3, 3) ndarray
+    (N, 3, 3) ndarray | (M, N, 3, 3) ndarray
         The transformed frames.
 
     Examples
@@ -88,9 +141,10 @@ def transform_frames_numpy(frames, T):
     >>> transformed_frames = transform_frames_numpy(frames, T)
 
     """
-    T = asarray(T)
-    points_and_vectors = homogenize_and_flatten_frames_numpy(frames)
-    return dehomogenize_and_unflatten_frames_numpy(points_and_vectors.dot(T.T))
+    frames = asarray(frames, dtype=float).reshape((-1, 3, 3))
+    points = _transform_numpy(frames[:, 0], T, 1.0)
+    vectors = _transform_numpy(frames[:, 1:].reshape((-1, 3)), T, 0.0)
+    return concatenate([points[..., None, :], vectors.reshape(points.shape[:-1] + (2, 3))], axis=-2)
 
 
 def world_to_local_coordinates_numpy(frame, xyz):
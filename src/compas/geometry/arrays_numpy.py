@@ -0,0 +1,633 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import array2string
+from numpy import asarray
+from numpy import cross
+from numpy import einsum
+from numpy import float64
+from numpy import sqrt
+from numpy import stack
+
+from compas.geometry import transform_frames_numpy
+from compas.geometry import transform_points_numpy
+from compas.geometry import transform_vectors_numpy
+from compas.geometry import Geometry
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import Frame
+
+__all__ = ["PointArray", "VectorArray", "FrameArray"]
+
+
+def _as_coordinates(values):
+    """Convert a sequence of XYZ coordinates to an array of shape (n, 3), without copying if possible."""
+    values = asarray(values, dtype=float64)
+    if values.size == 0:
+        values = values.reshape((0, 3))
+    if values.ndim != 2 or values.shape[1] != 3:
+        raise ValueError("Expected a sequence of XYZ coordinates, got an array of shape {}.".format(values.shape))
+    return values
+
+
+def _as_operand(other):
+    """Convert the operand of an arithmetic operation to an array that broadcasts against coordinates of shape (n, 3)."""
+    other = asarray(other, dtype=float64)
+    if other.ndim == 1 and other.shape[0] != 3:
+        raise ValueError("Expected XYZ coordinates, got an array of shape {}.".format(other.shape))
+    return other
+
+
+def _as_factors(n):
+    """Convert a number or a sequence of numbers (one per item) to an array that broadcasts against (n, 3)."""
+    n = asarray(n, dtype=float64)
+    if n.ndim == 1:
+        return n[:, None]
+    return n
+
+
+def _unitize(vectors):
+    """Scale vectors of shape (n, 3) to unit length, in place."""
+    vectors /= sqrt(einsum("ij,ij->i", vectors, vectors))[:, None]
+
+
+def _orthonormalize(axes):
+    """Orthonormalize x and y axes of shape (n, 2, 3), in place, in the same way as :class:`~compas.geometry.Frame`."""
+    xaxes = axes[:, 0]
+    yaxes = axes[:, 1]
+    _unitize(xaxes)
+    _unitize(yaxes)
+    zaxes = cross(xaxes, yaxes)
+    _unitize(zaxes)
+    yaxes[:] = cross(zaxes, xaxes)
+
+
+class _CoordinateArray(Geometry):
+    """Base class for arrays of XYZ coordinates."""
+
+    def __init__(self, coordinates, **kwargs):
+        super(_CoordinateArray, self).__init__(**kwargs)
+        self._array = _as_coordinates(coordinates)
+
+    def __repr__(self):
+        name = type(self).__name__
+        return "{0}({1})".format(name, array2string(self._array, separator=", ", prefix=name + "("))
+
+    def __len__(self):
+        return self._array.shape[0]
+
+    def __getitem__(self, key):
+        result = self._array[key]
+        if isinstance(key, tuple) or result.ndim != 2:
+            return result
+        return type(self)(result)
+
+    def __setitem__(self, key, value):
+        self._array[key] = value
+
+    def __iter__(self):
+        return iter(self._array)
+
+    def __array__(self, dtype=None):
+        if dtype is None:
+            return self._array
+        return self._array.astype(dtype)
+
+    def __eq__(self, other):
+        try:
+            other = asarray(other, dtype=float64)
+        except (TypeError, ValueError):
+            return False
+        return self._array.shape == other.shape and bool((self._array == other).all())
+
+    def __mul__(self, n):
+        return type(self)(self._array * _as_factors(n))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, n):
+        return type(self)(self._array / _as_factors(n))
+
+    def __imul__(self, n):
+        self._array *= _as_factors(n)
+        return self
+
+    def __itruediv__(self, n):
+        self._array /= _as_factors(n)
+        return self
+
+    def _copy(self, cls):
+        return cls(self._array.copy())
+
+    @property
+    def array(self):
+        return self._array
+
+
+class PointArray(_CoordinateArray):
+    """An array of points, stored as one contiguous block of coordinates.
+
+    Parameters
+    ----------
+    points : sequence[[float, float, float] | :class:`~compas.geometry.Point`] | (N, 3) ndarray
+        The XYZ coordinates of the points.
+        If the coordinates are already provided as an array of floats, the point array is a view of that array.
+    **kwargs : dict[str, Any], optional
+        Additional keyword arguments collected in a dict.
+
+    Attributes
+    ----------
+    array : (N, 3) ndarray
+        The coordinates of the points.
+    centroid : :class:`~compas.geometry.Point`
+        The centroid of the points.
+
+    Notes
+    -----
+    Indexing a point array with an integer or with a slice returns a view on the coordinates of the original array,
+    as a (3,) ndarray or as a point array, respectively.
+    Modifying the view modifies the original array.
+    Indexing with a sequence of indices or with a mask returns a copy.
+
+    Point arrays behave as sequences of points,
+    and can therefore be used with all functions that accept sequences of points,
+    such as :func:`~compas.geometry.centroid_points` or :func:`~compas.geometry.transform_points_numpy`.
+
+    Examples
+    --------
+    >>> from compas.geometry import Translation
+    >>> points = PointArray([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    >>> points.centroid
+    Point(0.667, 0.333, 0.000)
+    >>> points[1:] += [0, 0, 1]
+    >>> points[2]
+    array([1., 1., 1.])
+    >>> points.transform(Translation.from_vector([1, 0, 0]))
+    >>> (points - points[0]).lengths
+    array([0.        , 1.41421356, 1.73205081])
+
+    """
+
+    JSONSCHEMA = {
+        "type": "object",
+        "properties": {
+            "points": {"type": "array", "items": Point.JSONSCHEMA},
+        },
+        "required": ["points"],
+    }
+
+    def __init__(self, points, **kwargs):
+        super(PointArray, self).__init__(points, **kwargs)
+
+    def __add__(self, other):
+        return PointArray(self._array + _as_operand(other))
+
+    def __sub__(self, other):
+        return VectorArray(self._array - _as_operand(other))
+
+    def __iadd__(self, other):
+        self._array += _as_operand(other)
+        return self
+
+    def __isub__(self, other):
+        self._array -= _as_operand(other)
+        return self
+
+    # ==========================================================================
+    # Data
+    # ==========================================================================
+
+    @property
+    def data(self):
+        return {"points": self._array.tolist()}
+
+    @data.setter
+    def data(self, data):
+        self._array = _as_coordinates(data["points"])
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data["points"])
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def centroid(self):
+        return Point(*self._array.mean(axis=0).tolist())
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def to_points(self):
+        """Convert the array to a list of point objects.
+
+        Returns
+        -------
+        list[:class:`~compas.geometry.Point`]
+
+        """
+        return [Point(x, y, z) for x, y, z in self._array.tolist()]
+
+    def transform(self, T):
+        """Transform all points of the array in place.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        self._array[:] = transform_points_numpy(self._array, T)
+
+
+class VectorArray(_CoordinateArray):
+    """An array of vectors, stored as one contiguous block of coordinates.
+
+    Parameters
+    ----------
+    vectors : sequence[[float, float, float] | :class:`~compas.geometry.Vector`] | (N, 3) ndarray
+        The XYZ components of the vectors.
+        If the components are already provided as an array of floats, the vector array is a view of that array.
+    **kwargs : dict[str, Any], optional
+        Additional keyword arguments collected in a dict.
+
+    Attributes
+    ----------
+    array : (N, 3) ndarray
+        The components of the vectors.
+    lengths : (N,) ndarray
+        The lengths of the vectors.
+
+    Notes
+    -----
+    Indexing follows the same rules as for :class:`~compas.geometry.PointArray`.
+
+    Examples
+    --------
+    >>> vectors = VectorArray([[1, 0, 0], [0, 2, 0]])
+    >>> vectors.unitize()
+    >>> vectors.cross([0, 0, 1])
+    VectorArray([[ 0., -1.,  0.],
+                 [ 1.,  0.,  0.]])
+
+    """
+
+    JSONSCHEMA = {
+        "type": "object",
+        "properties": {
+            "vectors": {"type": "array", "items": Vector.JSONSCHEMA},
+        },
+        "required": ["vectors"],
+    }
+
+    def __init__(self, vectors, **kwargs):
+        super(VectorArray, self).__init__(vectors, **kwargs)
+
+    def __add__(self, other):
+        return VectorArray(self._array + _as_operand(other))
+
+    def __sub__(self, other):
+        return VectorArray(self._array - _as_operand(other))
+
+    def __neg__(self):
+        return VectorArray(-self._array)
+
+    def __iadd__(self, other):
+        self._array += _as_operand(other)
+        return self
+
+    def __isub__(self, other):
+        self._array -= _as_operand(other)
+        return self
+
+    # ==========================================================================
+    # Data
+    # ==========================================================================
+
+    @property
+    def data(self):
+        return {"vectors": self._array.tolist()}
+
+    @data.setter
+    def data(self, data):
+        self._array = _as_coordinates(data["vectors"])
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data["vectors"])
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def lengths(self):
+        return sqrt(einsum("ij,ij->i", self._array, self._array))
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def to_vectors(self):
+        """Convert the array to a list of vector objects.
+
+        Returns
+        -------
+        list[:class:`~compas.geometry.Vector`]
+
+        """
+        return [Vector(x, y, z) for x, y, z in self._array.tolist()]
+
+    def unitize(self):
+        """Scale all vectors of the array to unit length, in place.
+
+        Returns
+        -------
+        None
+
+        """
+        _unitize(self._array)
+
+    def unitized(self):
+        """Returns a copy of the array with all vectors scaled to unit length.
+
+        Returns
+        -------
+        :class:`~compas.geometry.VectorArray`
+
+        """
+        vectors = self.copy()
+        vectors.unitize()
+        return vectors
+
+    def dot(self, other):
+        """Compute the dot products of the vectors with one other vector, or with the vectors of another array.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`~compas.geometry.Vector` | :class:`~compas.geometry.VectorArray`
+            The other vector(s).
+
+        Returns
+        -------
+        (N,) ndarray
+
+        """
+        return (self._array * _as_operand(other)).sum(axis=-1)
+
+    def cross(self, other):
+        """Compute the cross products of the vectors with one other vector, or with the vectors of another array.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`~compas.geometry.Vector` | :class:`~compas.geometry.VectorArray`
+            The other vector(s).
+
+        Returns
+        -------
+        :class:`~compas.geometry.VectorArray`
+
+        """
+        return VectorArray(cross(self._array, _as_operand(other)))
+
+    def transform(self, T):
+        """Transform all vectors of the array in place.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+            Translations do not affect vectors.
+
+        Returns
+        -------
+        None
+
+        """
+        self._array[:] = transform_vectors_numpy(self._array, T)
+
+
+class FrameArray(Geometry):
+    """An array of frames, stored as one contiguous block of origins and axes.
+
+    Parameters
+    ----------
+    points : sequence[point] | (N, 3) ndarray
+        The origins of the frames.
+    xaxes : sequence[vector] | (N, 3) ndarray
+        The x-axes of the frames.
+    yaxes : sequence[vector] | (N, 3) ndarray
+        The y-axes of the frames.
+    **kwargs : dict[str, Any], optional
+        Additional keyword arguments collected in a dict.
+
+    Attributes
+    ----------
+    array : (N, 3, 3) ndarray
+        The origins, x-axes and y-axes of the frames.
+    points : :class:`~compas.geometry.PointArray`
+        A view on the origins of the frames.
+    xaxes : :class:`~compas.geometry.VectorArray`
+        A view on the x-axes of the frames.
+    yaxes : :class:`~compas.geometry.VectorArray`
+        A view on the y-axes of the frames.
+    zaxes : :class:`~compas.geometry.VectorArray`, read-only
+        The z-axes of the frames.
+
+    Notes
+    -----
+    The axes are orthonormalized in the same way as the axes of :class:`~compas.geometry.Frame`.
+    Indexing a frame array with an integer returns a view on the origin and axes of one frame, as a (3, 3) ndarray.
+    Indexing with a slice returns a frame array that is a view on the original array.
+
+    Examples
+    --------
+    >>> from compas.geometry import Rotation
+    >>> frames = FrameArray([[0, 0, 0], [1, 0, 0]], [[1, 0, 0], [1, 0, 0]], [[0, 1, 0], [0, 2, 0]])
+    >>> frames.transform(Rotation.from_axis_and_angle([0, 0, 1], 3.14159265359 / 2))
+    >>> frames.to_frames()[1] == Frame([0, 1, 0], [0, 1, 0], [-1, 0, 0])
+    True
+
+    """
+
+    JSONSCHEMA = {
+        "type": "object",
+        "properties": {
+            "points": {"type": "array", "items": Point.JSONSCHEMA},
+            "xaxes": {"type": "array", "items": Vector.JSONSCHEMA},
+            "yaxes": {"type": "array", "items": Vector.JSONSCHEMA},
+        },
+        "required": ["points", "xaxes", "yaxes"],
+    }
+
+    def __init__(self, points, xaxes, yaxes, **kwargs):
+        super(FrameArray, self).__init__(**kwargs)
+        self._array = None
+        self._set_frames(points, xaxes, yaxes)
+
+    def __repr__(self):
+        return "FrameArray({0!r}, {1!r}, {2!r})".format(self.points, self.xaxes, self.yaxes)
+
+    def __len__(self):
+        return self._array.shape[0]
+
+    def __getitem__(self, key):
+        result = self._array[key]
+        if isinstance(key, tuple) or result.ndim != 3:
+            return result
+        return self._view(result)
+
+    def __iter__(self):
+        return iter(self._array)
+
+    def __array__(self, dtype=None):
+        if dtype is None:
+            return self._array
+        return self._array.astype(dtype)
+
+    def __eq__(self, other):
+        try:
+            other = asarray(other, dtype=float64)
+        except (TypeError, ValueError):
+            return False
+        return self._array.shape == other.shape and bool((self._array == other).all())
+
+    # ==========================================================================
+    # Data
+    # ==========================================================================
+
+    @property
+    def data(self):
+        return {
+            "points": self._array[:, 0].tolist(),
+            "xaxes": self._array[:, 1].tolist(),
+            "yaxes": self._array[:, 2].tolist(),
+        }
+
+    @data.setter
+    def data(self, data):
+        self._set_frames(data["points"], data["xaxes"], data["yaxes"])
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data["points"], data["xaxes"], data["yaxes"])
+
+    def _copy(self, cls):
+        return cls._view(self._array.copy())
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def array(self):
+        return self._array
+
+    @property
+    def points(self):
+        return PointArray(self._array[:, 0])
+
+    @points.setter
+    def points(self, points):
+        self._array[:, 0] = points
+
+    @property
+    def xaxes(self):
+        return VectorArray(self._array[:, 1])
+
+    @xaxes.setter
+    def xaxes(self, vectors):
+        self._array[:, 1] = vectors
+        _orthonormalize(self._array[:, 1:])
+
+    @property
+    def yaxes(self):
+        return VectorArray(self._array[:, 2])
+
+    @yaxes.setter
+    def yaxes(self, vectors):
+        self._array[:, 2] = vectors
+        _orthonormalize(self._array[:, 1:])
+
+    @property
+    def zaxes(self):
+        return VectorArray(cross(self._array[:, 1], self._array[:, 2]))
+
+    # ==========================================================================
+    # Constructors
+    # ==========================================================================
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Construct a frame array from a sequence of frames.
+
+        Parameters
+        ----------
+        frames : sequence[[point, vector, vector] | :class:`~compas.geometry.Frame`]
+            The frames.
+
+        Returns
+        -------
+        :class:`~compas.geometry.FrameArray`
+
+        """
+        frames = [[list(point), list(xaxis), list(yaxis)] for point, xaxis, yaxis in frames]
+        if not frames:
+            return cls([], [], [])
+        points, xaxes, yaxes = zip(*frames)
+        return cls(points, xaxes, yaxes)
+
+    @classmethod
+    def _view(cls, array):
+        frames = cls.__new__(cls)
+        Geometry.__init__(frames)
+        frames._array = array
+        return frames
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def _set_frames(self, points, xaxes, yaxes):
+        array = stack([_as_coordinates(points), _as_coordinates(xaxes), _as_coordinates(yaxes)], axis=1)
+        _orthonormalize(array[:, 1:])
+        self._array = array
+
+    def to_frames(self):
+        """Convert the array to a list of frame objects.
+
+        Returns
+        -------
+        list[:class:`~compas.geometry.Frame`]
+
+        """
+        return [Frame(point, xaxis, yaxis) for point, xaxis, yaxis in self._array.tolist()]
+
+    def transform(self, T):
+        """Transform all frames of the array in place.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The axes of the frames are orthonormalized after the transformation,
+        such that the result remains a valid frame also for transformations that include scaling or shearing.
+
+        """
+        self._array[:] = transform_frames_numpy(self._array, T)
+        _orthonormalize(self._array[:, 1:])
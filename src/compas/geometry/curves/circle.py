@@ -118,6 +118,9 @@ class Circle(Conic):
     def data(self):
         return {"frame": self.frame, "radius": self.radius}
 
+    def _copy(self, cls):
+        return cls(self.radius, frame=self.frame)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -143,6 +143,9 @@ class Ellipse(Conic):
     def data(self):
         return {"frame": self.frame, "major": self.major, "minor": self.minor}
 
+    def _copy(self, cls):
+        return cls(self.major, self.minor, frame=self.frame)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -128,6 +128,9 @@ class Line(Curve):
     def data(self):
         return {"start": self.start, "end": self.end}
 
+    def _copy(self, cls):
+        return cls(self.start, self.end)
+
     # ==========================================================================
     # properties
     # ==========================================================================
@@ -118,6 +118,9 @@ class Polyline(Curve):
     def data(self):
         return {"points": self.points}
 
+    def _copy(self, cls):
+        return cls(self.points)
+
     # ==========================================================================
     # properties
     # ==========================================================================
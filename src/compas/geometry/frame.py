@@ -77,6 +77,8 @@ class Frame(Geometry):
         "required": ["point", "xaxis", "yaxis"],
     }
 
+    __slots__ = ("_point", "_xaxis", "_yaxis", "_zaxis")
+
     def __init__(self, point, xaxis, yaxis, **kwargs):
         super(Frame, self).__init__(**kwargs)
         self._point = None
@@ -169,6 +171,9 @@ class Frame(Geometry):
         """
         return cls(data["point"], data["xaxis"], data["yaxis"])
 
+    def _copy(self, cls):
+        return cls(self.point, self.xaxis, self.yaxis)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -3,11 +3,15 @@ from __future__ import division
 from __future__ import print_function
 
 from compas.data import Data
+from compas.geometry import concatenate_matrices
+from compas.geometry import Transformation
 
 
 class Geometry(Data):
     """Base class for all geometric objects."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Geometry, self).__init__(*args, **kwargs)
 
@@ -35,15 +39,28 @@ class Geometry(Data):
 
         Parameters
         ----------
-        transformation : :class:`~compas.geometry.Transformation`
-            The transformation used to transform the geometry.
+        transformation : :class:`~compas.geometry.Transformation` | sequence[:class:`~compas.geometry.Transformation`]
+            The transformation used to transform the geometry,
+            or a chain of transformations that are applied in the order of the sequence.
+            A chain is concatenated into one transformation first,
+            such that the copy is transformed only once.
 
         Returns
         -------
         :class:`Geometry`
             The transformed geometry.
 
+        Examples
+        --------
+        >>> from compas.geometry import Point, Rotation, Translation
+        >>> R = Rotation.from_axis_and_angle([0, 0, 1], math.radians(90))
+        >>> T = Translation.from_vector([1, 0, 0])
+        >>> Point(1, 0, 0).transformed([T, R])
+        Point(0.000, 2.000, 0.000)
+
         """
+        if isinstance(transformation, (list, tuple)) and all(isinstance(T, Transformation) for T in transformation):
+            transformation = Transformation(concatenate_matrices(transformation[::-1]))
         geometry = self.copy()
         geometry.transform(transformation)
         return geometry
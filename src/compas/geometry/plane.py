@@ -124,6 +124,9 @@ class Plane(Geometry):
         """
         return cls(data["point"], data["normal"])
 
+    def _copy(self, cls):
+        return cls(self.point, self.normal)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
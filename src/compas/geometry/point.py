@@ -108,14 +108,13 @@ class Point(Geometry):
         "items": {"type": "number"},
     }
 
+    __slots__ = ("_x", "_y", "_z")
+
     def __init__(self, x, y, z=0.0, **kwargs):
         super(Point, self).__init__(**kwargs)
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
 
     def __repr__(self):
         return "Point({0:.{3}f}, {1:.{3}f}, {2:.{3}f})".format(self.x, self.y, self.z, PRECISION[:1])
@@ -128,11 +127,11 @@ class Point(Geometry):
             return [self[i] for i in range(*key.indices(len(self)))]
         i = key % 3
         if i == 0:
-            return self.x
+            return self._x
         if i == 1:
-            return self.y
+            return self._y
         if i == 2:
-            return self.z
+            return self._z
         raise KeyError
 
     def __setitem__(self, key, value):
@@ -149,7 +148,7 @@ class Point(Geometry):
         raise KeyError
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter([self._x, self._y, self._z])
 
     def __eq__(self, other):
         return self.x == other[0] and self.y == other[1] and self.z == other[2]
@@ -239,6 +238,9 @@ class Point(Geometry):
         """
         return cls(*data)
 
+    def _copy(self, cls):
+        return cls(self.x, self.y, self.z)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
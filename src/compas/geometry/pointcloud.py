@@ -8,6 +8,7 @@ from compas.geometry import transform_points
 from compas.geometry import centroid_points
 from compas.geometry import bounding_box
 from compas.geometry import closest_point_in_cloud
+from compas.geometry import KDTree
 from compas.geometry import Geometry
 from compas.geometry import Point
 
@@ -88,6 +89,9 @@ class Pointcloud(Geometry):
     def from_data(cls, data):
         return cls(data["points"])
 
+    def _copy(self, cls):
+        return cls(self.points)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -273,10 +277,8 @@ class Pointcloud(Geometry):
         None
             The cloud is modified in place.
         """
-        for index, point in enumerate(transform_points(self.points, T)):
-            self.points[index].x = point[0]
-            self.points[index].y = point[1]
-            self.points[index].z = point[2]
+        for point, xyz in zip(self.points, transform_points(self.points, T)):
+            point.data = xyz
 
     # ==========================================================================
     # Methods
@@ -295,6 +297,33 @@ class Pointcloud(Geometry):
         :class:`~compas.geometry.Point`
             The closest point on the pointcloud.
 
+        Notes
+        -----
+        For a single query, a linear scan of the points is faster than building a :class:`~compas.geometry.KDTree`.
+        Use :meth:`closest_points` to search for many points at once.
+
         """
         distance, point, index = closest_point_in_cloud(point, self.points)
         return point
+
+    def closest_points(self, points):
+        """Compute the closest points on the pointcloud to multiple given points.
+
+        Parameters
+        ----------
+        points : list[:class:`~compas.geometry.Point`]
+            The points.
+
+        Returns
+        -------
+        list[:class:`~compas.geometry.Point`]
+            The closest points on the pointcloud.
+
+        Notes
+        -----
+        The points of the pointcloud are stored in a :class:`~compas.geometry.KDTree`,
+        which is searched for all points at once.
+
+        """
+        indices, _ = KDTree(self.points).query(points, k=1)
+        return [self.points[index[0]] for index in indices]
@@ -134,6 +134,9 @@ class Polygon(Geometry):
     def data(self, data):
         self.points = data["points"]
 
+    def _copy(self, cls):
+        return cls(self.points)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
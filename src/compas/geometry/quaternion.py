@@ -169,6 +169,9 @@ class Quaternion(Geometry):
         """
         return cls(data["w"], data["x"], data["y"], data["z"])
 
+    def _copy(self, cls):
+        return cls(self.w, self.x, self.y, self.z)
+
     # ==========================================================================
     # properties
     # ==========================================================================
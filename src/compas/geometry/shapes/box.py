@@ -172,6 +172,9 @@ class Box(Shape):
         self.ysize = data["ysize"]
         self.zsize = data["zsize"]
 
+    def _copy(self, cls):
+        return cls(self.xsize, self.ysize, self.zsize, frame=self.frame)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
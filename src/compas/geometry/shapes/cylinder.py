@@ -132,6 +132,9 @@ class Cylinder(Shape):
         self.radius = data["radius"]
         self.height = data["height"]
 
+    def _copy(self, cls):
+        return cls(frame=self.frame, radius=self.radius, height=self.height)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -114,6 +114,9 @@ class Sphere(Shape):
         self.frame = data["frame"]
         self.radius = data["radius"]
 
+    def _copy(self, cls):
+        return cls(frame=self.frame, radius=self.radius)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
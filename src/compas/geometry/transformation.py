@@ -14,6 +14,7 @@ import math
 
 from compas.data import Data
 
+from compas.geometry import concatenate_matrices
 from compas.geometry import multiply_matrices
 from compas.geometry import transpose_matrix
 from compas.geometry import basis_vectors_from_matrix
@@ -539,7 +540,7 @@ class Transformation(Data):
         Rz * Ry * Rx means that Rx is first transformation, Ry second, and Rz third.
 
         """
-        self.matrix = multiply_matrices(self.matrix, other.matrix)
+        self.matrix = concatenate_matrices([self.matrix, other.matrix])
 
     def concatenated(self, other):
         """Concatenate two transformations into one `Transformation`.
@@ -561,5 +562,5 @@ class Transformation(Data):
         """
         cls = type(self)
         if isinstance(other, cls):
-            return cls(multiply_matrices(self.matrix, other.matrix))
-        return Transformation(multiply_matrices(self.matrix, other.matrix))
+            return cls(concatenate_matrices([self.matrix, other.matrix]))
+        return Transformation(concatenate_matrices([self.matrix, other.matrix]))
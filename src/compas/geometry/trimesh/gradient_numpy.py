@@ -1,9 +1,9 @@
 from numpy import arange
+from numpy import cross
 from numpy import divide
 from numpy import hstack
 from numpy import tile
 
-from scipy import cross  # type: ignore
 from scipy.sparse import coo_matrix  # type: ignore
 
 from compas.numerical.linalg import normrow
@@ -72,14 +72,13 @@ class Vector(Geometry):
         "items": {"type": "number"},
     }
 
+    __slots__ = ("_x", "_y", "_z")
+
     def __init__(self, x, y, z=0.0, **kwargs):
         super(Vector, self).__init__(**kwargs)
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
 
     def __repr__(self):
         return "Vector({0:.{3}f}, {1:.{3}f}, {2:.{3}f})".format(self.x, self.y, self.z, PRECISION[:1])
@@ -92,11 +91,11 @@ class Vector(Geometry):
             return [self[i] for i in range(*key.indices(len(self)))]
         i = key % 3
         if i == 0:
-            return self.x
+            return self._x
         if i == 1:
-            return self.y
+            return self._y
         if i == 2:
-            return self.z
+            return self._z
         raise KeyError
 
     def __setitem__(self, key, value):
@@ -113,7 +112,7 @@ class Vector(Geometry):
         raise KeyError
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter([self._x, self._y, self._z])
 
     def __eq__(self, other):
         return self.x == other[0] and self.y == other[1] and self.z == other[2]
@@ -842,8 +841,8 @@ class Vector(Geometry):
 
         Parameters
         ----------
-        T : :class:`~compas.geometry.Transformation` | list[list[float]]
-            The transformation.
+        T : :class:`~compas.geometry.Transformation` | list[list[float]] | sequence[:class:`~compas.geometry.Transformation`]
+            The transformation, or a chain of transformations.
 
         Returns
         -------
@@ -860,6 +859,4 @@ class Vector(Geometry):
         Vector(0.000, 1.000, 0.000)
 
         """
-        vector = self.copy()
-        vector.transform(T)
-        return vector
+        return super(Vector, self).transformed(T)
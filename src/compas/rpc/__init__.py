@@ -4,7 +4,8 @@ from .errors import RPCClientError, RPCServerError
 from .proxy import Proxy
 from .server import Server
 from .dispatcher import Dispatcher
+from .pool import XFuncPool
 from .xfunc import XFunc
 
 
-__all__ = ["RPCClientError", "RPCServerError", "Proxy", "Server", "Dispatcher", "XFunc"]
+__all__ = ["RPCClientError", "RPCServerError", "Proxy", "Server", "Dispatcher", "XFunc", "XFuncPool"]
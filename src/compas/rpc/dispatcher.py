@@ -92,6 +92,74 @@ class Dispatcher(object):
             if args[1] not in sys.path:
                 sys.path.insert(0, args[1])
 
+        function = self._resolve(name, odict)
+
+        if function is not None:
+            try:
+                idict = json.loads(args[0], cls=DataDecoder)
+            except (IndexError, TypeError):
+                odict["error"] = (
+                    "API methods require a single JSON encoded dictionary as input.\n"
+                    "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
+                )
+
+            else:
+                self._call(function, idict, odict)
+
+        return json.dumps(odict, cls=DataEncoder)
+
+    def _dispatch_calls(self, calls, path=None):
+        """Dispatcher method for batches of API calls.
+
+        This method is used by the binary transport, and by batched calls over XMLRPC.
+        In the latter case, it is called as ``_dispatch_calls`` through :meth:`_dispatch`.
+
+        Parameters
+        ----------
+        calls : list[dict]
+            The calls, each with the ``'name'`` of the function,
+            and the lists of positional ``'args'`` and named ``'kwargs'`` arguments.
+        path : str, optional
+            A path that should be added to the PYTHONPATH before dispatching the calls.
+
+        Returns
+        -------
+        list[dict]
+            An output dictionary per call.
+            See :meth:`_dispatch` for the structure of the output dictionaries.
+
+        """
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+        results = []
+
+        for call in calls:
+            odict = {"data": None, "error": None, "profile": None}
+            function = self._resolve(call["name"], odict)
+            if function is not None:
+                self._call(function, {"args": call.get("args") or [], "kwargs": call.get("kwargs") or {}}, odict)
+            results.append(odict)
+
+        return results
+
+    def _resolve(self, name, odict):
+        """Find the function corresponding to the name of an API call.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        odict : dict
+            The output dictionary.
+
+        Returns
+        -------
+        callable or None
+            The function, or None if it could not be found.
+            In that case, the error is recorded in the output dictionary.
+
+        """
         parts = name.split(".")
 
         functionname = parts[-1]
@@ -111,26 +179,12 @@ class Dispatcher(object):
                 module = self
         except Exception:
             odict["error"] = traceback.format_exc()
+            return None
 
-        else:
-            try:
-                function = getattr(module, functionname)
-            except AttributeError:
-                odict["error"] = "This function is not part of the API: {0}".format(functionname)
-
-            else:
-                try:
-                    idict = json.loads(args[0], cls=DataDecoder)
-                except (IndexError, TypeError):
-                    odict["error"] = (
-                        "API methods require a single JSON encoded dictionary as input.\n"
-                        "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
-                    )
-
-                else:
-                    self._call(function, idict, odict)
-
-        return json.dumps(odict, cls=DataEncoder)
+        try:
+            return getattr(module, functionname)
+        except AttributeError:
+            odict["error"] = "This function is not part of the API: {0}".format(functionname)
 
     def _call(self, function, idict, odict):
         """Method that handles the actual call to the function corresponding to the API call.
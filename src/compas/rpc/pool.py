@@ -0,0 +1,526 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import atexit
+import base64
+import json
+import threading
+import time
+import weakref
+
+from collections import deque
+
+import compas
+import compas._os
+
+from compas.data import DataEncoder
+from compas.data import DataDecoder
+from compas.rpc import RPCServerError
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    from subprocess import Popen
+    from subprocess import PIPE
+except ImportError:
+    try:
+        from System.Diagnostics import Process
+    except ImportError:
+        compas.raise_if_ironpython()
+
+
+# The worker script is passed to the interpreter with ``-c``.
+# On Windows it is wrapped in double quotes, so it should not contain any.
+
+WORKER = """
+import os
+import sys
+import time
+import base64
+import importlib
+import threading
+import traceback
+
+import json
+
+try:
+    import cPickle as pickle
+except Exception:
+    import pickle
+
+try:
+    from cStringIO import StringIO
+except Exception:
+    from io import StringIO
+
+import cProfile
+import pstats
+
+from compas.data import DataEncoder
+from compas.data import DataDecoder
+
+serializer = sys.argv[1]
+timeout    = float(sys.argv[2])
+
+for path in reversed(sys.argv[3:]):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+channel = os.fdopen(os.dup(1), 'w')
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+
+state = {'busy': False, 'time': time.time()}
+
+
+def watchdog():
+    while True:
+        time.sleep(min(timeout, 1.0))
+        if not state['busy'] and time.time() - state['time'] > timeout:
+            os._exit(0)
+
+
+if timeout > 0:
+    thread = threading.Thread(target=watchdog)
+    thread.daemon = True
+    thread.start()
+
+
+def loads(line):
+    if serializer == 'json':
+        return json.loads(line, cls=DataDecoder)
+    return pickle.loads(base64.b64decode(line.encode('ascii')))
+
+
+def dumps(odict):
+    if serializer == 'json':
+        return json.dumps(odict, cls=DataEncoder)
+    return base64.b64encode(pickle.dumps(odict, 2)).decode('ascii')
+
+
+functions = {}
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+
+    state['busy'] = True
+    output = StringIO()
+    stream = None
+
+    try:
+        idict    = loads(line)
+        basedir  = idict['basedir']
+        funcname = idict['funcname']
+
+        f = functions.get((basedir, funcname))
+        if f is None:
+            if basedir and basedir not in sys.path:
+                sys.path.insert(0, basedir)
+            parts = funcname.split('.')
+            if len(parts) < 2:
+                raise Exception('Cannot import the function because no module name is specified.')
+            m = importlib.import_module('.'.join(parts[:-1]))
+            f = getattr(m, parts[-1])
+            functions[basedir, funcname] = f
+
+        sys.stdout = output
+
+        if idict['profile']:
+            profile = cProfile.Profile()
+            profile.enable()
+            r = profile.runcall(f, *idict['args'], **idict['kwargs'])
+            profile.disable()
+            stream = StringIO()
+            stats  = pstats.Stats(profile, stream=stream)
+            stats.sort_stats(1)
+            stats.print_stats(20)
+        else:
+            r = f(*idict['args'], **idict['kwargs'])
+
+    except Exception:
+        odict = {'error': traceback.format_exc(), 'data': None, 'profile': None}
+
+    else:
+        odict = {'error': None, 'data': r, 'profile': stream.getvalue() if stream else None}
+
+    finally:
+        sys.stdout = sys.stderr
+
+    odict['output'] = output.getvalue()
+
+    try:
+        result = dumps(odict)
+    except Exception:
+        result = dumps({'error': traceback.format_exc(), 'data': None, 'profile': None, 'output': odict['output']})
+
+    channel.write(result + '\\n')
+    channel.flush()
+
+    state['busy'] = False
+    state['time'] = time.time()
+
+"""
+
+
+_POOLS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_pools():
+    for pool in list(_POOLS):
+        pool.close()
+
+
+class _Worker(object):
+    """A warm interpreter process reading requests from its stdin and writing responses to its stdout."""
+
+    def __init__(self, python, serializer, timeout, paths):
+        self.time = time.time()
+        env = compas._os.prepare_environment()
+        args = [serializer, str(timeout)] + list(paths)
+
+        try:
+            Popen
+
+        except NameError:
+            process = Process()
+            for name in env:
+                if process.StartInfo.EnvironmentVariables.ContainsKey(name):
+                    process.StartInfo.EnvironmentVariables[name] = env[name]
+                else:
+                    process.StartInfo.EnvironmentVariables.Add(name, env[name])
+            process.StartInfo.UseShellExecute = False
+            process.StartInfo.CreateNoWindow = True
+            process.StartInfo.RedirectStandardInput = True
+            process.StartInfo.RedirectStandardOutput = True
+            process.StartInfo.FileName = python
+            process.StartInfo.Arguments = '-u -c "{0}" {1}'.format(
+                WORKER, " ".join('"{0}"'.format(arg) for arg in args)
+            )
+            process.Start()
+
+        else:
+            process = Popen(
+                [python, "-u", "-c", WORKER] + args,
+                stdin=PIPE,
+                stdout=PIPE,
+                env=env,
+                universal_newlines=True,
+            )
+
+        self.process = process
+
+    @property
+    def pid(self):
+        try:
+            return self.process.pid
+        except AttributeError:
+            return self.process.Id
+
+    @property
+    def is_alive(self):
+        try:
+            return self.process.poll() is None
+        except AttributeError:
+            return not self.process.HasExited
+
+    def send(self, line):
+        try:
+            self.process.stdin.write(line + "\n")
+            self.process.stdin.flush()
+        except AttributeError:
+            self.process.StandardInput.WriteLine(line)
+            self.process.StandardInput.Flush()
+
+    def receive(self):
+        try:
+            line = self.process.stdout.readline()
+        except AttributeError:
+            line = self.process.StandardOutput.ReadLine()
+        if not line:
+            raise RPCServerError("The worker process terminated unexpectedly.")
+        self.time = time.time()
+        return line
+
+    def terminate(self):
+        try:
+            try:
+                self.process.stdin.close()
+                self.process.stdout.close()
+            except AttributeError:
+                self.process.StandardInput.Close()
+            if self.is_alive:
+                try:
+                    self.process.kill()
+                except AttributeError:
+                    self.process.Kill()
+            try:
+                self.process.wait()
+            except AttributeError:
+                self.process.WaitForExit()
+        except Exception:
+            pass
+
+
+class XFuncPool(object):
+    """A pool of persistent worker processes for running wrapped functions in an external interpreter.
+
+    Every worker is a long-running Python process that communicates with the pool over its standard streams.
+    Modules imported by a worker stay imported between calls,
+    such that repeated calls only pay the cost of the function itself
+    and not the startup time of the interpreter and the import of packages like Numpy and Scipy.
+
+    Workers are started on demand, up to the size of the pool.
+    A worker that crashed or exited is replaced by a fresh one on the next call.
+
+    Parameters
+    ----------
+    size : int, optional
+        The maximum number of worker processes.
+    python : str, optional
+        The Python executable.
+        This can be a path to a specific executable (e.g. ``'/opt/local/bin/python'``)
+        or the name of an executable registered on the system `PATH` (e.g. ``'pythonw'``).
+    paths : list[str], optional
+        A list of paths to be added to the `PYTHONPATH` of the workers.
+    serializer : {'json', 'pickle'}, optional
+        The serialization mechnanism to be used to pass data between the pool and the workers.
+    idle_timeout : float, optional
+        Number of seconds after which an idle worker is shut down.
+        If the timeout is zero or negative, workers are only shut down when the pool is closed.
+
+    Attributes
+    ----------
+    workers : list[int]
+        The process IDs of the running workers.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import XFunc
+        from compas.rpc import XFuncPool
+
+        pool = XFuncPool(size=2)
+
+        fd_numpy = XFunc('compas.numerical.fd_numpy', pool=pool)
+        dr_numpy = XFunc('compas.numerical.dr_numpy', pool=pool)
+
+        for i in range(100):
+            result = fd_numpy(vertices, edges, fixed, q, loads)
+
+        pool.close()
+
+    """
+
+    def __init__(self, size=1, python=None, paths=None, serializer="json", idle_timeout=300):
+        if size < 1:
+            raise ValueError("The size of the pool should be at least 1.")
+        if serializer not in ("json", "pickle"):
+            raise Exception("*serializer* should be one of {'json', 'pickle'}.")
+        self.size = size
+        self.python = compas._os.select_python(python)
+        self.paths = paths or []
+        self.serializer = serializer
+        self.idle_timeout = idle_timeout
+        self._idle = []
+        self._busy = set()
+        self._condition = threading.Condition()
+        self._closed = False
+        _POOLS.add(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def workers(self):
+        with self._condition:
+            return [worker.pid for worker in self._idle + list(self._busy)]
+
+    # --------------------------------------------------------------------------
+    # workers
+    # --------------------------------------------------------------------------
+
+    def _spawn(self):
+        # the worker outlives the pool-side timeout by a small margin
+        # to avoid sending a request to a worker that is about to exit
+        timeout = self.idle_timeout + 5 if self.idle_timeout and self.idle_timeout > 0 else 0
+        return _Worker(self.python, self.serializer, timeout, self.paths)
+
+    def _acquire(self):
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RPCServerError("The pool is closed.")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if not worker.is_alive or self._is_expired(worker):
+                        worker.terminate()
+                        continue
+                    self._busy.add(worker)
+                    return worker
+                if len(self._busy) < self.size:
+                    worker = self._spawn()
+                    self._busy.add(worker)
+                    return worker
+                self._condition.wait()
+
+    def _release(self, worker, discard=False):
+        with self._condition:
+            self._busy.discard(worker)
+            if discard or self._closed or not worker.is_alive:
+                worker.terminate()
+            else:
+                self._idle.append(worker)
+            self._condition.notify()
+
+    def _is_expired(self, worker):
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return False
+        return time.time() - worker.time > self.idle_timeout
+
+    def close(self):
+        """Shut down all workers of the pool.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._condition:
+            self._closed = True
+            for worker in self._idle:
+                worker.terminate()
+            del self._idle[:]
+            self._condition.notify_all()
+
+    # --------------------------------------------------------------------------
+    # serialization
+    # --------------------------------------------------------------------------
+
+    def _dumps(self, idict):
+        if self.serializer == "json":
+            return json.dumps(idict, cls=DataEncoder)
+        return base64.b64encode(pickle.dumps(idict, 2)).decode("ascii")
+
+    def _loads(self, line):
+        if self.serializer == "json":
+            return json.loads(line, cls=DataDecoder)
+        return pickle.loads(base64.b64decode(line.strip().encode("ascii")))
+
+    def _request(self, funcname, args, kwargs, basedir, profile):
+        return self._dumps(
+            {
+                "funcname": funcname,
+                "args": list(args),
+                "kwargs": kwargs or {},
+                "basedir": basedir,
+                "profile": profile,
+            }
+        )
+
+    def _send(self, worker, request):
+        try:
+            worker.send(request)
+        except Exception:
+            self._release(worker, discard=True)
+            raise RPCServerError("The worker process terminated unexpectedly.")
+
+    def _receive(self, worker):
+        try:
+            odict = self._loads(worker.receive())
+        except BaseException:
+            # the worker is out of sync with the pool, or dead
+            self._release(worker, discard=True)
+            raise
+        self._release(worker)
+        return odict
+
+    # --------------------------------------------------------------------------
+    # calls
+    # --------------------------------------------------------------------------
+
+    def call(self, funcname, args=None, kwargs=None, basedir=None, profile=False):
+        """Call a function in one of the workers of the pool.
+
+        Parameters
+        ----------
+        funcname : str
+            The full name of the function, including the name of its module.
+        args : list, optional
+            Positional arguments to be passed to the function.
+        kwargs : dict, optional
+            Named arguments to be passed to the function.
+        basedir : str, optional
+            A directory that should be added to the `PYTHONPATH` of the worker such that the function can be found.
+        profile : bool, optional
+            If True, profile the call to the function.
+
+        Returns
+        -------
+        dict
+            A dictionary with the returned ``'data'``, a traceback of the ``'error'`` raised by the function if any,
+            the ``'profile'`` of the call, and the ``'output'`` printed by the function.
+
+        Raises
+        ------
+        RPCServerError
+            If the worker process terminated during the call.
+
+        """
+        request = self._request(funcname, args or [], kwargs, basedir, profile)
+        worker = self._acquire()
+        self._send(worker, request)
+        return self._receive(worker)
+
+    def starmap(self, funcname, iterable, basedir=None, profile=False):
+        """Call a function for every set of arguments in an iterable, distributing the calls over the workers.
+
+        Parameters
+        ----------
+        funcname : str
+            The full name of the function, including the name of its module.
+        iterable : iterable[list]
+            The positional arguments of every call.
+        basedir : str, optional
+            A directory that should be added to the `PYTHONPATH` of the workers such that the function can be found.
+        profile : bool, optional
+            If True, profile the calls to the function.
+
+        Returns
+        -------
+        list[dict]
+            The results of the calls, in the order of the arguments.
+            See :meth:`XFuncPool.call` for the contents of every result.
+
+        Raises
+        ------
+        RPCServerError
+            If a worker process terminated during a call.
+
+        """
+        results = []
+        pending = deque()
+        try:
+            for args in iterable:
+                if len(pending) >= self.size:
+                    results.append(self._receive(pending.popleft()))
+                request = self._request(funcname, args, None, basedir, profile)
+                worker = self._acquire()
+                self._send(worker, request)
+                pending.append(worker)
+            while pending:
+                results.append(self._receive(pending.popleft()))
+        finally:
+            for worker in pending:
+                self._release(worker, discard=True)
+        return results
@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import socket
 import time
 
 import compas
@@ -10,6 +11,8 @@ import compas._os
 from compas.rpc import RPCServerError
 from compas.data import DataDecoder
 from compas.data import DataEncoder
+from compas.rpc.transport import send_message
+from compas.rpc.transport import receive_message
 
 try:
     from xmlrpclib import ServerProxy
@@ -56,6 +59,13 @@ class Proxy(object):
     capture_output : bool, optional
         If True, capture the stdout/stderr output of the remote process.
         In general, `capture_output` should be True when using a `pythonw` as executable (default).
+    path : str, optional
+        A path that should be added to the PYTHONPATH of the server.
+    transport : {'xmlrpc', 'binary'}, optional
+        The transport used for sending calls to the server.
+        With ``'binary'``, calls are sent over a persistent socket connection,
+        and arrays of numbers are sent as raw buffers instead of as text.
+        If the server does not support the binary transport, XMLRPC is used instead.
 
     Attributes
     ----------
@@ -70,6 +80,8 @@ class Proxy(object):
         Fully qualified package name required for starting the server/service.
     python : str
         The type of Python executable that should be used to execute the code.
+    transport : str, read-only
+        The transport that is actually used for sending calls to the server.
 
     Notes
     -----
@@ -96,6 +108,18 @@ class Proxy(object):
     Starting a new proxy server...                          # doctest: +SKIP
     New proxy server started.                               # doctest: +SKIP
     Stopping the server proxy.                              # doctest: +SKIP
+
+    Multiple calls can be sent to the server in a single request with a batch.
+    The results are available after the batch is executed.
+
+    >>> with Proxy('numpy', transport='binary') as np:              # doctest: +SKIP
+    ...     with np.batch() as batch:                               # doctest: +SKIP
+    ...         batch.linspace(0, 1, 11)                            # doctest: +SKIP
+    ...         batch.arange(5)                                     # doctest: +SKIP
+    ...                                                             # doctest: +SKIP
+    >>> batch.results                                               # doctest: +SKIP
+    [[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0], [0, 1, 2, 3, 4]]
+
     """
 
     def __init__(
@@ -109,6 +133,7 @@ class Proxy(object):
         autoreload=True,
         capture_output=True,
         path=None,
+        transport="xmlrpc",
     ):
         self._package = None
         self._python = compas._os.select_python(python)
@@ -120,7 +145,11 @@ class Proxy(object):
         self._function = None
         self._profile = None
         self._path = path
+        self._name = None
+        self._socket = None
 
+        if transport not in ("xmlrpc", "binary"):
+            raise ValueError("*transport* should be one of {'xmlrpc', 'binary'}.")
         self.service = service
         self.package = package
         self.autoreload = autoreload
@@ -132,6 +161,9 @@ class Proxy(object):
             self._server = self.start_server()
             self._implicitely_started_server = True
 
+        if transport == "binary":
+            self._socket = self._connect_binary()
+
     # ==========================================================================
     # properties
     # ==========================================================================
@@ -148,6 +180,10 @@ class Proxy(object):
     def profile(self, profile):
         self._profile = profile
 
+    @property
+    def transport(self):
+        return "binary" if self._socket else "xmlrpc"
+
     @property
     def package(self):
         return self._package
@@ -183,6 +219,7 @@ class Proxy(object):
         return self
 
     def __exit__(self, *args):
+        self._disconnect_binary()
         # If we started the RPC server, we will try to clean up and stop it
         # otherwise we just disconnect from it
         if self._implicitely_started_server:
@@ -209,6 +246,7 @@ class Proxy(object):
             self._function = getattr(self._server, name)
         except Exception:
             raise RPCServerError()
+        self._name = name
         return self._proxy
 
     # ==========================================================================
@@ -331,6 +369,7 @@ class Proxy(object):
 
         """
         print("Stopping the server proxy.")
+        self._disconnect_binary()
         try:
             self._server.remote_shutdown()
         except Exception:
@@ -348,6 +387,38 @@ class Proxy(object):
         self.stop_server()
         self.start_server()
 
+    def _connect_binary(self):
+        """Connect to the socket server of the binary transport.
+
+        Returns
+        -------
+        socket.socket
+            The connected socket, or None if the server does not support the binary transport.
+            In that case, the proxy falls back to XMLRPC.
+
+        """
+        try:
+            port = self._server.binary_port()
+            if not port:
+                raise RPCServerError("The binary transport is not available.")
+            host = self._url.split("://")[-1]
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.connect((host, port))
+        except Exception:
+            print("The binary transport is not available. Falling back to XMLRPC.")
+            return None
+        return sock
+
+    def _disconnect_binary(self):
+        if not self._socket:
+            return
+        try:
+            self._socket.close()
+        except Exception:
+            pass
+        self._socket = None
+
     def _terminate_process(self):
         """Attempts to terminate the python process hosting the proxy server.
 
@@ -395,6 +466,15 @@ class Proxy(object):
         Numpy objects are automatically converted to their built-in Python equivalents.
 
         """
+        if self._socket:
+            result = self._dispatch_calls([{"name": self._name, "args": args, "kwargs": kwargs}])[0]
+
+            if result["error"]:
+                raise RPCServerError(result["error"])
+
+            self.profile = result["profile"]
+            return result["data"]
+
         idict = {"args": args, "kwargs": kwargs}
         istring = json.dumps(idict, cls=DataEncoder)
         # it makes sense that there is a broken pipe error
@@ -421,3 +501,128 @@ class Proxy(object):
 
         self.profile = result["profile"]
         return result["data"]
+
+    def _dispatch_calls(self, calls):
+        """Send multiple calls to the server in a single request.
+
+        Parameters
+        ----------
+        calls : list[dict]
+            The calls, each with the fully qualified ``'name'`` of the function,
+            and the positional ``'args'`` and named ``'kwargs'`` arguments.
+
+        Returns
+        -------
+        list[dict]
+            The result dict of every call.
+            See :meth:`_proxy` for the structure of the result dicts.
+
+        """
+        if self._socket:
+            try:
+                send_message(self._socket, {"calls": calls, "path": self._path})
+                result = receive_message(self._socket)
+            except Exception:
+                # the connection is no longer in a usable state
+                self._disconnect_binary()
+                raise
+            if result["error"]:
+                raise RPCServerError(result["error"])
+            return result["results"]
+
+        istring = json.dumps({"args": [calls], "kwargs": {}}, cls=DataEncoder)
+        ostring = self._server._dispatch_calls(istring, self._path or "")
+
+        if not ostring:
+            raise RPCServerError("No output was generated.")
+
+        result = json.loads(ostring, cls=DataDecoder)
+
+        if result["error"]:
+            raise RPCServerError(result["error"])
+
+        return result["data"]
+
+    def batch(self):
+        """Create a batch of calls to be sent to the server in a single request.
+
+        Returns
+        -------
+        :class:`~compas.rpc.proxy.Batch`
+
+        """
+        return Batch(self)
+
+
+class Batch(object):
+    """A batch of calls to remote functions, sent to the server in a single request.
+
+    Calls are collected by calling functions on the batch as if it were the proxy.
+    The batch is executed when the ``with`` block is exited without errors,
+    or explicitly through :meth:`execute`.
+
+    Parameters
+    ----------
+    proxy : :class:`~compas.rpc.Proxy`
+        The proxy connected to the server.
+
+    Attributes
+    ----------
+    calls : list[dict]
+        The calls that have not been executed yet.
+    results : list
+        The data returned by the functions of the last execution of the batch.
+    profiles : list[str]
+        The profiles of the functions of the last execution of the batch.
+
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self.calls = []
+        self.results = None
+        self.profiles = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if exc_type is None:
+            self.execute()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._proxy.package:
+            name = "{}.{}".format(self._proxy.package, name)
+
+        def call(*args, **kwargs):
+            self.calls.append({"name": name, "args": args, "kwargs": kwargs})
+            return len(self.calls) - 1
+
+        return call
+
+    def execute(self):
+        """Send the collected calls to the server.
+
+        Returns
+        -------
+        list
+            The data returned by the functions, in the order of the calls.
+
+        Raises
+        ------
+        RPCServerError
+            If any of the calls resulted in an error on the server.
+
+        """
+        calls, self.calls = self.calls, []
+        results = self._proxy._dispatch_calls(calls)
+
+        for result in results:
+            if result["error"]:
+                raise RPCServerError(result["error"])
+
+        self.results = [result["data"] for result in results]
+        self.profiles = [result["profile"] for result in results]
+        return self.results
@@ -9,6 +9,8 @@ try:
 except ImportError:
     from xmlrpc.server import SimpleXMLRPCServer
 
+from compas.rpc.transport import BinaryServer
+
 
 class Server(SimpleXMLRPCServer):
     """Version of a `SimpleXMLRPCServer` that can be cleanly terminated from the client side.
@@ -41,6 +43,17 @@ class Server(SimpleXMLRPCServer):
             server.register_instance(DefaultService())
             server.serve_forever()
 
+    To also accept calls over the faster binary transport,
+    serve the dispatcher on a socket before starting the XMLRPC server.
+
+    .. code-block:: python
+
+        service = DefaultService()
+
+        server.register_instance(service)
+        server.serve_binary(service)
+        server.serve_forever()
+
     """
 
     def ping(self):
@@ -59,6 +72,46 @@ class Server(SimpleXMLRPCServer):
         """
         return 1
 
+    binary_server = None
+
+    def serve_binary(self, dispatcher, port=0):
+        """Serve the calls to a dispatcher over the binary transport protocol, in a background thread.
+
+        Parameters
+        ----------
+        dispatcher : :class:`~compas.rpc.Dispatcher`
+            The dispatcher handling the calls.
+        port : int, optional
+            The port of the socket server.
+            By default, any available port is used.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Clients can find the port of the socket server through :meth:`binary_port`,
+        which is registered as a function of the XMLRPC server.
+
+        """
+        self.binary_server = BinaryServer((self.server_address[0], port), dispatcher)
+        self.binary_server.serve_in_thread()
+        self.register_function(self.binary_port)
+
+    def binary_port(self):
+        """Get the port of the socket server of the binary transport.
+
+        Returns
+        -------
+        int
+            The port number, or 0 if the binary transport is not available.
+
+        """
+        if not self.binary_server:
+            return 0
+        return self.binary_server.port
+
     def remote_shutdown(self):
         """Stop the server through a call from the client side.
 
@@ -72,4 +125,7 @@ class Server(SimpleXMLRPCServer):
         return 1
 
     def _shutdown_thread(self):
+        if self.binary_server:
+            self.binary_server.shutdown()
+            self.binary_server.server_close()
         self.shutdown()
@@ -75,6 +75,10 @@ def start_service(port, autoreload, **kwargs):
     service = DefaultService() if not autoreload else FileWatcherService()
     server.register_instance(service)
 
+    # serve the same service over a socket with the binary transport protocol
+    # the port of this socket is available through *binary_port*
+    server.serve_binary(service)
+
     print("Listening{}...".format(" with autoreload of modules enabled" if autoreload else ""))
     print("Press CTRL+C to abort")
     server.serve_forever()
@@ -0,0 +1,340 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import json
+import socket
+import struct
+import sys
+import threading
+import traceback
+
+from array import array
+
+from compas.data import DataEncoder
+from compas.data import DataDecoder
+
+try:
+    from SocketServer import ThreadingTCPServer
+    from SocketServer import BaseRequestHandler
+except ImportError:
+    from socketserver import ThreadingTCPServer
+    from socketserver import BaseRequestHandler
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    long
+except NameError:
+    long = int
+
+
+__all__ = [
+    "BinaryServer",
+    "send_message",
+    "receive_message",
+]
+
+
+# Minimum number of items of a list of numbers to send it as a raw buffer.
+BUFFER_THRESHOLD = 32
+
+# Typecodes of the raw buffers and the corresponding little-endian Numpy types.
+TYPECODES = {"d": "<f8", "i": "<i4"}
+
+INT32_MIN = -(2**31)
+INT32_MAX = 2**31 - 1
+
+BIGENDIAN = sys.byteorder == "big"
+
+
+# ==============================================================================
+# Buffers
+# ==============================================================================
+
+
+def _tobytes(values):
+    if BIGENDIAN:
+        values.byteswap()
+    try:
+        return values.tobytes()
+    except AttributeError:
+        return values.tostring()
+
+
+def _frombytes(typecode, data):
+    values = array(typecode)
+    try:
+        values.frombytes(data)
+    except AttributeError:
+        values.fromstring(data)
+    if BIGENDIAN:
+        values.byteswap()
+    return values
+
+
+def _pack_list(values, buffers):
+    """Pack a nested, rectangular list of numbers into a raw buffer.
+
+    Returns a placeholder of the buffer, or None if the list is not a rectangular array of numbers of the same type.
+    Lists mixing integers and floats are not packed, such that the type of every number is preserved.
+    """
+    shape = []
+    leaf = values
+    while isinstance(leaf, (list, tuple)):
+        shape.append(len(leaf))
+        if not leaf:
+            return None
+        leaf = leaf[0]
+    if isinstance(leaf, bool) or not isinstance(leaf, (int, float)):
+        return None
+
+    flat = values
+    for n in shape[1:]:
+        rows = flat
+        flat = []
+        for row in rows:
+            if not isinstance(row, (list, tuple)) or len(row) != n:
+                return None
+            flat.extend(row)
+
+    if isinstance(leaf, float):
+        if not all(isinstance(value, float) for value in flat):
+            return None
+        typecode = "d"
+    else:
+        if not all(isinstance(value, (int, long)) and not isinstance(value, bool) for value in flat):
+            return None
+        typecode = "i"
+    try:
+        data = array(typecode, flat)
+    except (TypeError, OverflowError, ValueError):
+        return None
+
+    buffers.append(_tobytes(data))
+    return {"__buffer__": len(buffers) - 1, "typecode": typecode, "shape": shape}
+
+
+def _pack_numpy(o, buffers):
+    if o.dtype.kind == "f":
+        typecode = "d"
+    elif o.dtype.kind in "iu" and (o.size == 0 or (o.min() >= INT32_MIN and o.max() <= INT32_MAX)):
+        typecode = "i"
+    else:
+        return None
+    data = np.ascontiguousarray(o, dtype=TYPECODES[typecode])
+    buffers.append(data.tobytes())
+    return {"__buffer__": len(buffers) - 1, "typecode": typecode, "shape": list(o.shape)}
+
+
+def _pack(o, buffers):
+    if isinstance(o, (list, tuple)):
+        if len(o) >= BUFFER_THRESHOLD:
+            placeholder = _pack_list(o, buffers)
+            if placeholder is not None:
+                return placeholder
+        return [_pack(item, buffers) for item in o]
+    if isinstance(o, dict):
+        return {key: _pack(value, buffers) for key, value in o.items()}
+    return o
+
+
+def _unpack(placeholder, buffers):
+    data = buffers[placeholder["__buffer__"]]
+    typecode = placeholder["typecode"]
+    shape = placeholder["shape"]
+    if np is not None:
+        return np.frombuffer(data, dtype=TYPECODES[typecode]).reshape(shape).tolist()
+    values = _frombytes(typecode, data).tolist()
+    for n in reversed(shape[1:]):
+        values = [values[i : i + n] for i in range(0, len(values), n)]
+    return values
+
+
+class BufferEncoder(DataEncoder):
+    """Data encoder that moves arrays of numbers out of the JSON document into a list of raw buffers.
+
+    Parameters
+    ----------
+    buffers : list[bytes]
+        The list to which the raw buffers are appended.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.buffers = kwargs.pop("buffers")
+        super(BufferEncoder, self).__init__(*args, **kwargs)
+
+    def encode(self, o):
+        return super(BufferEncoder, self).encode(_pack(o, self.buffers))
+
+    def default(self, o):
+        if np is not None and isinstance(o, np.ndarray):
+            placeholder = _pack_numpy(o, self.buffers)
+            if placeholder is not None:
+                return placeholder
+        return _pack(super(BufferEncoder, self).default(o), self.buffers)
+
+
+class BufferDecoder(DataDecoder):
+    """Data decoder that restores arrays of numbers from a list of raw buffers.
+
+    Parameters
+    ----------
+    buffers : list[bytes]
+        The raw buffers referenced by the JSON document.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.buffers = kwargs.pop("buffers")
+        super(BufferDecoder, self).__init__(*args, **kwargs)
+
+    def object_hook(self, o):
+        if "__buffer__" in o:
+            return _unpack(o, self.buffers)
+        return super(BufferDecoder, self).object_hook(o)
+
+
+# ==============================================================================
+# Messages
+# ==============================================================================
+
+
+def send_message(sock, message):
+    """Send a message over a socket.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        A connected socket.
+    message : object
+        A JSON-serializable object, which may contain COMPAS data objects and Numpy arrays.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    A message is sent as a single frame with the following layout.
+    The number of bytes of the JSON header and the number of raw buffers, as big-endian, unsigned 32-bit integers.
+    The JSON header, encoded as UTF-8.
+    For every raw buffer, its number of bytes as a big-endian, unsigned 64-bit integer, followed by the buffer itself.
+
+    Rectangular lists of numbers with at least :data:`BUFFER_THRESHOLD` items and numeric Numpy arrays
+    are sent as raw buffers of little-endian doubles or 32-bit integers, instead of as text.
+
+    """
+    buffers = []
+    header = json.dumps(message, cls=BufferEncoder, buffers=buffers).encode("utf-8")
+    chunks = [struct.pack(">II", len(header), len(buffers)), header]
+    for data in buffers:
+        chunks.append(struct.pack(">Q", len(data)))
+        chunks.append(data)
+    sock.sendall(b"".join(chunks))
+
+
+def _receive(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise EOFError("The connection was closed.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def receive_message(sock):
+    """Receive a message sent with :func:`send_message` from a socket.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        A connected socket.
+
+    Returns
+    -------
+    object
+        The message, with raw buffers converted back to (nested) lists of numbers.
+
+    Raises
+    ------
+    EOFError
+        If the connection was closed.
+
+    """
+    size, count = struct.unpack(">II", _receive(sock, 8))
+    header = _receive(sock, size).decode("utf-8")
+    buffers = []
+    for i in range(count):
+        (size,) = struct.unpack(">Q", _receive(sock, 8))
+        buffers.append(_receive(sock, size))
+    return json.loads(header, cls=BufferDecoder, buffers=buffers)
+
+
+# ==============================================================================
+# Server
+# ==============================================================================
+
+
+class _BinaryRequestHandler(BaseRequestHandler):
+    def handle(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            try:
+                message = receive_message(self.request)
+            except EOFError:
+                break
+            except Exception:
+                # the rest of the stream cannot be read reliably after a malformed or partial frame
+                send_message(self.request, {"results": None, "error": traceback.format_exc()})
+                break
+            results = self.server.dispatcher._dispatch_calls(message["calls"], message.get("path"))
+            send_message(self.request, {"results": results, "error": None})
+
+
+class BinaryServer(ThreadingTCPServer):
+    """Socket server dispatching batches of calls sent with the binary transport protocol.
+
+    Every connection is handled in a separate thread, and can be used for any number of requests.
+    A request is a message with a list of ``'calls'`` and an optional ``'path'``,
+    and is answered with a message with the corresponding list of ``'results'``.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host and port of the server.
+        Use port ``0`` to bind to any available port.
+    dispatcher : :class:`~compas.rpc.Dispatcher`
+        The dispatcher handling the calls.
+
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, dispatcher):
+        ThreadingTCPServer.__init__(self, address, _BinaryRequestHandler)
+        self.dispatcher = dispatcher
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def serve_in_thread(self):
+        """Serve requests in a background thread.
+
+        Returns
+        -------
+        threading.Thread
+
+        """
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return thread
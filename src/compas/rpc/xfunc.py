@@ -11,6 +11,7 @@ import compas._os
 
 from compas.data import DataEncoder
 from compas.data import DataDecoder
+from compas.rpc.pool import XFuncPool
 
 try:
     import cPickle as pickle
@@ -146,6 +147,16 @@ class XFunc(object):
         A list of paths to be added to the `PYTHONPATH` by the subprocess.
     serializer : {'json', 'pickle'}, optional
         The serialization mechnanism to be used to pass data between the caller and the subprocess.
+    pool : bool | :class:`~compas.rpc.XFuncPool`, optional
+        If True, run the function in a pool of persistent worker processes owned by this wrapper,
+        instead of starting a new subprocess for every call.
+        If a pool is provided, the calls are run by the workers of that pool,
+        which can be shared between multiple wrapped functions.
+        In that case, the Python executable, paths, and serializer of the pool are used.
+    profiling : bool, optional
+        If False, calls run by a pool of worker processes are not profiled,
+        and :attr:`profile` is None after every call.
+        Calls in a new subprocess are always profiled.
 
     Attributes
     ----------
@@ -170,6 +181,14 @@ class XFunc(object):
 
         fd_numpy = XFunc('compas.numerical.fd_numpy', python='/Users/brg/environments/py2/python')
 
+    Starting a new subprocess for every call is slow, because the interpreter has to start
+    and all required packages have to be imported each time.
+    For repeated calls, use a pool of persistent worker processes instead.
+
+    .. code-block:: python
+
+        fd_numpy = XFunc('compas.numerical.fd_numpy', pool=True)
+
     Examples
     --------
     :mod:`compas.numerical` provides an implementation of the Force Density Method that
@@ -234,12 +253,16 @@ class XFunc(object):
         argtypes=None,
         kwargtypes=None,
         restypes=None,
+        pool=None,
+        profiling=True,
     ):
         self._basedir = None
         self._tmpdir = None
         self._callback = None
         self._python = None
         self._serializer = None
+        self._pool = None
+        self._owns_pool = False
         self.funcname = funcname
         self.basedir = basedir
         self.tmpdir = tmpdir or tempfile.mkdtemp("compas_xfunc")
@@ -253,6 +276,8 @@ class XFunc(object):
         self.argtypes = argtypes
         self.kwargtypes = kwargtypes
         self.restypes = restypes
+        self.pool = pool
+        self.profiling = profiling
         self.data = None
         self.profile = None
         self.error = None
@@ -311,6 +336,34 @@ class XFunc(object):
             raise Exception("*serializer* should be one of {'json', 'pickle'}.")
         self._serializer = serializer
 
+    @property
+    def pool(self):
+        """:class:`~compas.rpc.XFuncPool`: The pool of worker processes running the calls, if any."""
+        return self._pool
+
+    @pool.setter
+    def pool(self, pool):
+        if pool is True:
+            self._owns_pool = True
+            pool = XFuncPool(python=self.python, paths=self.paths, serializer=self.serializer)
+        elif pool:
+            self._owns_pool = False
+        else:
+            self._owns_pool = False
+            pool = None
+        self._pool = pool
+
+    def close(self):
+        """Shut down the pool of worker processes, if it is owned by this wrapper.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._pool and self._owns_pool:
+            self._pool.close()
+
     @property
     def ipath(self):
         return os.path.join(self.tmpdir, "%s.in" % self.funcname)
@@ -338,6 +391,9 @@ class XFunc(object):
             In this case, check the :attr:`XFunc.error` for more information.
 
         """
+        if self.pool:
+            return self._call_pool(args, kwargs)
+
         # if self.argtypes:
         #     args = [arg for arg in args]
 
@@ -439,3 +495,22 @@ class XFunc(object):
             raise Exception(self.error)
 
         return self.data
+
+    def _call_pool(self, args, kwargs):
+        odict = self.pool.call(self.funcname, args, kwargs, basedir=self.basedir, profile=self.profiling)
+
+        for line in odict["output"].splitlines():
+            line = line.strip()
+            if self.callback:
+                self.callback(line, self.callback_args)
+            if self.verbose:
+                print(line)
+
+        self.data = odict["data"]
+        self.profile = odict["profile"]
+        self.error = odict["error"]
+
+        if self.error:
+            raise Exception(self.error)
+
+        return self.data
@@ -2,11 +2,80 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import KDTree
-
 from compas.utilities import pairwise
-from compas.geometry import centroid_points
-from compas.topology.traversal import breadth_first_traverse
+
+
+def _face_edges(faces):
+    """Map the edges of the faces to the faces using them.
+
+    Every edge is identified by the pair of its vertices in ascending order,
+    and is mapped to a list of pairs, with for every face using the edge the index of the face,
+    and a flag indicating that the face traverses the edge in ascending order.
+    """
+    edges = {}
+    for face, vertices in enumerate(faces):
+        u = vertices[-1]
+        for v in vertices:
+            if u < v:
+                edges.setdefault((u, v), []).append((face, True))
+            else:
+                edges.setdefault((v, u), []).append((face, False))
+            u = v
+    return edges
+
+
+def _face_flips(faces, root=0):
+    """Identify the faces that have to be reversed for adjacent faces to have opposite halfedges.
+
+    The relative orientations of the faces are collected in a union-find structure
+    in which every face stores its parent and the parity of its orientation with respect to that parent.
+    Faces that are traversed in the same direction by two faces have to have opposite parity.
+    Relations that contradict the already collected relations,
+    which only exist for non-orientable or non-manifold collections of faces, are ignored.
+
+    Every connected component keeps the orientation of the root face,
+    if it belongs to the component, or of its face with the lowest index.
+    """
+    n = len(faces)
+    parent = list(range(n))
+    parity = [0] * n
+    size = [1] * n
+
+    def find(face):
+        p = 0
+        path = []
+        while parent[face] != face:
+            path.append(face)
+            p ^= parity[face]
+            face = parent[face]
+        q = p
+        for node in path:
+            parent[node] = face
+            parity[node], q = q, q ^ parity[node]
+        return face, p
+
+    for cycles in _face_edges(faces).values():
+        a, da = cycles[0]
+        for b, db in cycles[1:]:
+            ra, pa = find(a)
+            rb, pb = find(b)
+            if ra == rb:
+                continue
+            if size[ra] < size[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            parity[rb] = pa ^ pb ^ (da == db)
+            size[ra] += size[rb]
+
+    reference = {}
+    if n:
+        r, p = find(root)
+        reference[r] = p
+    flips = []
+    for face in range(n):
+        r, p = find(face)
+        flips.append(p != reference.setdefault(r, p))
+    return flips
 
 
 def unify_cycles(vertices, faces, root=0):
@@ -26,16 +95,18 @@ def unify_cycles(vertices, faces, root=0):
     list[list[int]]
         A list of faces with the same orientation as the root face.
 
-    Raises
-    ------
-    AssertionError
-        If not all faces were visited.
-
     Notes
     -----
-    The algorithm works by first building an adjacency dict of the faces, which can be traversed efficiently to unify all face cycles.
-    Although this process technically only requires the connectivity information contained in the faces,
-    the locations of the vertices can be used to speed up execution for very large collections of faces.
+    The relative orientations of faces sharing an edge are collected in a union-find structure,
+    which unifies all face cycles in nearly linear time.
+    This process only requires the connectivity information contained in the faces.
+    The vertex coordinates are not used.
+
+    Every connected component of the faces is unified separately.
+    The component of the root face gets the orientation of the root face,
+    the other components the orientation of their first face.
+
+    The faces are modified in place.
 
     Examples
     --------
@@ -45,24 +116,9 @@ def unify_cycles(vertices, faces, root=0):
     [[0, 1, 2], [2, 3, 0]]
 
     """
-
-    def unify(node, nbr):
-        # find the common edge
-        for u, v in pairwise(faces[nbr] + faces[nbr][0:1]):
-            if u in faces[node] and v in faces[node]:
-                # node and nbr have edge u-v in common
-                i = faces[node].index(u)
-                j = faces[node].index(v)
-                if i == j - 1 or (j == 0 and u == faces[node][-1]):
-                    # if the traversal of a neighboring halfedge
-                    # is in the same direction
-                    # flip the neighbor
-                    faces[nbr][:] = faces[nbr][::-1]
-                    return
-
-    adj = face_adjacency(vertices, faces)
-    visited = breadth_first_traverse(adj, root, unify)
-    assert len(list(visited)) == len(faces), "Not all faces were visited"
+    for face, flip in enumerate(_face_flips(faces, root)):
+        if flip:
+            faces[face][:] = faces[face][::-1]
     return faces
 
 
@@ -83,9 +139,9 @@ def face_adjacency(xyz, faces):
 
     Notes
     -----
-    If the number of faces is larger than one hundred (100),
-    this function uses Rhino's RTree for limiting the search for neighbours
-    to the immediate surroundings of any given face.
+    Two faces are neighbours if they share an edge, regardless of the direction in which they traverse it.
+    The neighbours are found exactly, by hashing the edges of all faces, in linear time.
+    The coordinates of the vertices are not used.
 
     Examples
     --------
@@ -95,58 +151,15 @@ def face_adjacency(xyz, faces):
     {0: [1], 1: [0]}
 
     """
-    f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    tree = KDTree(points)
-    closest = [tree.nearest_neighbors(point, nmax) for point in points]
-    closest = [[index for _, index, _ in nnbrs] for nnbrs in closest]
+    edges = _face_edges(faces)
     adjacency = {}
     for face, vertices in enumerate(faces):
         nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
+        found = set([face])
         for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
+            for nbr, _ in edges[(u, v) if u < v else (v, u)]:
+                if nbr not in found:
+                    nbrs.append(nbr)
+                    found.add(nbr)
         adjacency[face] = nbrs
     return adjacency
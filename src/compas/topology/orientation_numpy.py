@@ -2,11 +2,31 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from scipy.spatial import cKDTree
-
-from compas.utilities import pairwise
-from compas.geometry import centroid_points
-from compas.topology.traversal import breadth_first_traverse
+from numpy import arange
+from numpy import asarray
+from numpy import concatenate
+from numpy import cumsum
+from numpy import lexsort
+from numpy import maximum
+from numpy import minimum
+from numpy import ones
+from numpy import repeat
+from numpy import stack
+from numpy import unique
+
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+def _face_halfedges_numpy(faces):
+    """The halfedges of the faces, as arrays of start vertices, end vertices, and face indices."""
+    sizes = asarray([len(vertices) for vertices in faces], dtype=int)
+    v = asarray([vertex for vertices in faces for vertex in vertices], dtype=int)
+    offsets = cumsum(sizes) - sizes
+    groups = repeat(arange(sizes.shape[0]), sizes)
+    local = arange(v.shape[0]) - offsets[groups]
+    u = v[offsets[groups] + (local - 1) % sizes[groups]]
+    return u, v, groups
 
 
 def unify_cycles_numpy(vertices, faces, root=0):
@@ -26,16 +46,20 @@ def unify_cycles_numpy(vertices, faces, root=0):
     list[list[int]]
         A list of faces with the same orientation as the root face.
 
-    Raises
-    ------
-    AssertionError
-        If not all faces were visited.
-
     Notes
     -----
-    The algorithm works by first building an adjacency dict of the faces, which can be traversed efficiently to unify all face cycles.
-    Although this process technically only requires the connectivity information contained in the faces,
-    the locations of the vertices can be used to speed up execution for very large collections of faces.
+    The halfedges of all faces are sorted by edge, such that faces sharing an edge are found in one pass.
+    The faces are unified with the connected components of a graph with two nodes per face,
+    one for each orientation of the face, in which the nodes of compatible orientations of neighbouring faces are connected.
+    This process only requires the connectivity information contained in the faces.
+    The vertex coordinates are not used.
+
+    Every connected component of the faces is unified separately.
+    The component of the root face gets the orientation of the root face,
+    the other components the orientation of their first face.
+    The faces of non-orientable components are not modified.
+
+    The faces are modified in place.
 
     Examples
     --------
@@ -45,24 +69,35 @@ def unify_cycles_numpy(vertices, faces, root=0):
     [[0, 1, 2], [2, 3, 0]]
 
     """
-
-    def unify(node, nbr):
-        # find the common edge
-        for u, v in pairwise(faces[nbr] + faces[nbr][0:1]):
-            if u in faces[node] and v in faces[node]:
-                # node and nbr have edge u-v in common
-                i = faces[node].index(u)
-                j = faces[node].index(v)
-                if i == j - 1 or (j == 0 and u == faces[node][-1]):
-                    # if the traversal of a neighboring halfedge
-                    # is in the same direction
-                    # flip the neighbor
-                    faces[nbr][:] = faces[nbr][::-1]
-                    return
-
-    adj = face_adjacency_numpy(vertices, faces)
-    visited = breadth_first_traverse(adj, root, unify)
-    assert len(list(visited)) == len(faces), "Not all faces were visited"
+    f = len(faces)
+    if not f:
+        return faces
+    u, v, groups = _face_halfedges_numpy(faces)
+    lo = minimum(u, v)
+    hi = maximum(u, v)
+    order = lexsort((lo, hi))
+    same = (lo[order][1:] == lo[order][:-1]) & (hi[order][1:] == hi[order][:-1])
+    i = order[:-1][same]
+    j = order[1:][same]
+    a = groups[i]
+    b = groups[j]
+    # faces traversing a shared edge in the same direction need opposite orientations
+    flip = ((u[i] < v[i]) == (u[j] < v[j])).astype(int)
+
+    graph = coo_matrix((ones(a.shape[0]), (a, b)), shape=(f, f))
+    _, components = connected_components(graph, directed=False)
+
+    rows = concatenate((a, a + f))
+    cols = concatenate((b + flip * f, b + (1 - flip) * f))
+    graph = coo_matrix((ones(rows.shape[0]), (rows, cols)), shape=(2 * f, 2 * f))
+    _, orientations = connected_components(graph, directed=False)
+
+    _, reference = unique(components, return_index=True)
+    reference[components[root]] = root
+    reference = reference[components]
+    flips = orientations[:f] != orientations[reference]
+    for face in flips.nonzero()[0].tolist():
+        faces[face][:] = faces[face][::-1]
     return faces
 
 
@@ -83,9 +118,9 @@ def face_adjacency_numpy(xyz, faces):
 
     Notes
     -----
-    If the number of faces is larger than one hundred (100),
-    this function uses Scipy's `cKDTree` for limiting the search for neighbours
-    to the immediate surroundings of any given face.
+    Two faces are neighbours if they share an edge, regardless of the direction in which they traverse it.
+    The neighbours are found exactly, from the sparse incidence matrix of faces and edges.
+    The coordinates of the vertices are not used.
 
     Examples
     --------
@@ -96,57 +131,15 @@ def face_adjacency_numpy(xyz, faces):
 
     """
     f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    k = min(len(faces), nmax)
-    tree = cKDTree(points)
-    _, closest = tree.query(points, k=k, n_jobs=-1)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
+    if not f:
+        return {}
+    u, v, groups = _face_halfedges_numpy(faces)
+    _, edges = unique(stack((minimum(u, v), maximum(u, v)), axis=1), axis=0, return_inverse=True)
+    incidence = coo_matrix((ones(groups.shape[0]), (groups, edges.ravel())), shape=(f, edges.max() + 1)).tocsr()
+    adjacency = incidence.dot(incidence.T).tocsr()
+    adjacency.setdiag(0)
+    adjacency.eliminate_zeros()
+    adjacency.sort_indices()
+    indptr = adjacency.indptr.tolist()
+    indices = adjacency.indices.tolist()
+    return {face: indices[indptr[face] : indptr[face + 1]] for face in range(f)}
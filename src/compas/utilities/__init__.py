@@ -45,7 +45,7 @@ from .itertools import (
     remap_values,
     window,
 )
-from .maps import geometric_key, geometric_key_xy, reverse_geometric_key
+from .maps import geometric_key, geometric_keys, geometric_key_xy, reverse_geometric_key, SpatialHash
 from .remote import download_file_from_remote
 from .ssh import SSH
 
@@ -93,6 +93,8 @@ __all__ = [
     "geometric_key",
     "reverse_geometric_key",
     "geometric_key_xy",
+    "geometric_keys",
+    "SpatialHash",
     "download_file_from_remote",
     "SSH",
 ]
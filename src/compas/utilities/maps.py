@@ -2,6 +2,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import math
+
 import compas
 
 
@@ -125,3 +127,302 @@ def geometric_key_xy(xy, precision=None, sanitize=True):
         if "{0:.{1}}".format(y, precision) == minzero:
             y = 0.0
     return "{0:.{2}},{1:.{2}}".format(x, y, precision)
+
+
+def geometric_keys(points, precision=None, sanitize=True):
+    """Convert the XYZ coordinates of multiple points to strings that can be used as dict keys.
+
+    Parameters
+    ----------
+    points : list[list[float]]
+        The XYZ coordinates of the points.
+    precision : str, optional
+        A formatting option that specifies the precision of the
+        individual numbers in the string.
+        Supported values are any float precision (e.g. ``'3f'``), or decimal integer (``'d'``).
+        Default is ``None``, in which case the global precision setting will be used (:attr:`compas.PRECISION`).
+    sanitize : bool, optional
+        If True, minus signs ("-") will be removed from values that are equal to zero up to the given precision.
+
+    Returns
+    -------
+    list[str]
+        The string representations of the given coordinates,
+        identical to the result of :func:`geometric_key` for every point.
+
+    See also
+    --------
+    geometric_key, SpatialHash
+
+    Examples
+    --------
+    >>> geometric_keys([[0.0, 0.0, 0.0], [1.0, -0.0001, 0.0]])
+    ['0.000,0.000,0.000', '1.000,0.000,0.000']
+
+    """
+    if not precision:
+        precision = compas.PRECISION
+    if precision == "d":
+        return ["{0},{1},{2}".format(int(x), int(y), int(z)) for x, y, z in points]
+    template = "{{0:.{0}}},{{1:.{0}}},{{2:.{0}}}".format(precision)
+    gkeys = [template.format(x, y, z) for x, y, z in points]
+    if sanitize:
+        minzero = "-{0:.{1}}".format(0.0, precision)
+        zero = minzero[1:]
+        for index, gkey in enumerate(gkeys):
+            if minzero in gkey:
+                gkeys[index] = ",".join([zero if value == minzero else value for value in gkey.split(",")])
+    return gkeys
+
+
+class SpatialHash(object):
+    """Spatial hash of points on a regular grid, for fast detection of coincident points.
+
+    With a precision specifier, points are coincident if they have the same geometric key,
+    and the grid cells are the integer equivalents of the rounded coordinates in those keys.
+    With an explicit tolerance, points are snapped to grid cells of size ``tolerance``,
+    and a point is coincident with a unique point if their distance is not larger than the tolerance.
+    In that case, the neighbouring cells are searched as well.
+
+    With a precision specifier, every unique point stores the coordinates of the last point that was merged with it.
+    With an explicit tolerance, every unique point keeps the coordinates of the first point,
+    such that all points merged with it are within the tolerance of these coordinates.
+
+    Parameters
+    ----------
+    tolerance : float, optional
+        The size of the grid cells and the merge distance.
+        If no tolerance is provided, it is derived from the precision.
+    precision : str, optional
+        A precision specifier in the form of a string formatting specifier,
+        such as ``'3f'`` for a tolerance of ``0.001``, or ``'d'`` for truncation to integers.
+        Default is :attr:`compas.PRECISION`.
+        Other specifiers are supported through string-based geometric keys.
+
+    Attributes
+    ----------
+    points : list[list[float]]
+        The unique points, in the order in which they were first encountered.
+    tolerance : float
+        The size of the grid cells.
+
+    See also
+    --------
+    geometric_key, geometric_keys
+
+    Examples
+    --------
+    >>> spatialhash = SpatialHash(precision='3f')
+    >>> spatialhash.add_points([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0001, 0.0, 0.0]])
+    [0, 1, 0]
+    >>> spatialhash.add([1.0, 0.0, -0.0002])
+    1
+    >>> len(spatialhash)
+    2
+    >>> spatialhash.points[1]
+    [1.0, 0.0, -0.0002]
+
+    """
+
+    def __init__(self, tolerance=None, precision=None):
+        self._precision = None
+        self._digits = None
+        self._truncate = False
+        self._scale = None
+        self._distance = None
+        if tolerance is None:
+            precision = precision or compas.PRECISION
+            if precision == "d":
+                self._truncate = True
+                tolerance = 1.0
+            elif precision[-1] == "f" and precision[:-1].isdigit():
+                self._digits = int(precision[:-1])
+                tolerance = 10.0**-self._digits
+                self._scale = float(10**self._digits)
+            else:
+                self._precision = precision
+        elif tolerance <= 0:
+            raise ValueError("The tolerance should be a positive number: {}".format(tolerance))
+        else:
+            self._scale = 1.0 / tolerance
+            self._distance = tolerance
+        self.tolerance = tolerance
+        self._cell_index = {}
+        self.points = []
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, point):
+        return self.get(point) is not None
+
+    def _round(self, value):
+        # round half away from zero on the decimal value, as string formatting does
+        # near a tie, the product with the scale is not exact enough to decide
+        scaled = value * self._scale
+        floor = math.floor(scaled)
+        if abs(scaled - floor - 0.5) > 1e-9 * max(1.0, abs(scaled)):
+            return int(floor + 1 if scaled - floor > 0.5 else floor)
+        return int("{0:.{1}f}".format(value, self._digits).replace(".", ""))
+
+    def cell(self, point):
+        """Compute the grid cell of a point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            The XYZ coordinates of the point.
+
+        Returns
+        -------
+        tuple[int, int, int] | str
+            The integer coordinates of the cell,
+            or a geometric key string if the precision cannot be expressed as a tolerance.
+
+        """
+        x, y, z = point[0], point[1], point[2]
+        if self._precision:
+            return geometric_key(point, self._precision)
+        if self._truncate:
+            return int(x), int(y), int(z)
+        if self._distance:
+            scale = self._scale
+            return int(math.floor(x * scale)), int(math.floor(y * scale)), int(math.floor(z * scale))
+        return self._round(x), self._round(y), self._round(z)
+
+    def cells(self, points):
+        """Compute the grid cells of multiple points.
+
+        Parameters
+        ----------
+        points : list[[float, float, float] | :class:`~compas.geometry.Point`]
+            The XYZ coordinates of the points.
+
+        Returns
+        -------
+        list[tuple[int, int, int] | str]
+            The cells of the points.
+
+        Notes
+        -----
+        Outside of IronPython, the cells are computed in bulk with NumPy.
+
+        """
+        if self._precision:
+            return geometric_keys(points, self._precision)
+        if compas.IPY or not len(points):
+            return [self.cell(point) for point in points]
+        return list(map(tuple, self._cells_numpy(points).tolist()))
+
+    def _cells_numpy(self, points):
+        from numpy import abs
+        from numpy import asarray
+        from numpy import floor
+        from numpy import maximum
+        from numpy import nonzero
+        from numpy import trunc
+
+        xyz = asarray(points, dtype=float)[:, :3]
+        if self._truncate:
+            return trunc(xyz).astype(int)
+        scaled = xyz * self._scale
+        lower = floor(scaled)
+        if self._distance:
+            return lower.astype(int)
+        fraction = scaled - lower
+        cells = (lower + (fraction > 0.5)).astype(int)
+        ties = abs(fraction - 0.5) <= 1e-9 * maximum(1.0, abs(scaled))
+        for i in nonzero(ties.any(axis=1))[0].tolist():
+            cells[i] = self.cell(xyz[i].tolist())
+        return cells
+
+    def _neighbours(self, cell):
+        i, j, k = cell
+        for a in (i - 1, i, i + 1):
+            for b in (j - 1, j, j + 1):
+                for c in (k - 1, k, k + 1):
+                    yield a, b, c
+
+    def _find(self, point, cell):
+        if not self._distance:
+            return self._cell_index.get(cell)
+        x, y, z = point[0], point[1], point[2]
+        best = self._distance**2
+        found = None
+        for neighbour in self._neighbours(cell):
+            for index in self._cell_index.get(neighbour, ()):
+                u, v, w = self.points[index][:3]
+                d = (x - u) ** 2 + (y - v) ** 2 + (z - w) ** 2
+                if d < best or (d == best and (found is None or index < found)):
+                    found = index
+                    best = d
+        return found
+
+    def _insert(self, point, cell):
+        index = self._find(point, cell)
+        if self._distance:
+            if index is None:
+                index = len(self.points)
+                self.points.append(point)
+                self._cell_index.setdefault(cell, []).append(index)
+            return index
+        if index is None:
+            index = self._cell_index[cell] = len(self.points)
+            self.points.append(point)
+        else:
+            self.points[index] = point
+        return index
+
+    def get(self, point, default=None):
+        """Get the index of the unique point coincident with a given point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            The XYZ coordinates of the point.
+        default : Any, optional
+            The value returned if no coincident point exists.
+
+        Returns
+        -------
+        int | Any
+            The index of the coincident point in :attr:`points`, or the default value.
+
+        """
+        index = self._find(point, self.cell(point))
+        return default if index is None else index
+
+    def add(self, point):
+        """Add a point to the hash.
+
+        If the point is coincident with an existing unique point and the hash is based on a precision specifier,
+        the coordinates of the unique point are replaced by the coordinates of the given point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            The XYZ coordinates of the point.
+
+        Returns
+        -------
+        int
+            The index of the unique point coincident with the given point.
+
+        """
+        return self._insert(point, self.cell(point))
+
+    def add_points(self, points):
+        """Add multiple points to the hash.
+
+        Parameters
+        ----------
+        points : list[[float, float, float] | :class:`~compas.geometry.Point`]
+            The XYZ coordinates of the points.
+
+        Returns
+        -------
+        list[int]
+            For every point, the index of the unique point coincident with it.
+
+        """
+        return [self._insert(point, cell) for point, cell in zip(points, self.cells(points))]
@@ -0,0 +1,71 @@
+import pytest
+
+import compas
+from compas.data import binary_dump
+from compas.data import binary_dumps
+from compas.data import binary_load
+from compas.data import binary_loads
+from compas.datastructures import Mesh
+from compas.datastructures import Network
+from compas.geometry import Point
+
+
+def test_binary_native():
+    before = [[], (), {}, "", 1, 1.0, True, None]
+    after = binary_loads(binary_dumps(before))
+    assert after == [[], [], {}, "", 1, 1.0, True, None]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_binary_columns(compress):
+    before = {
+        "floats": [0.5 * i for i in range(100)],
+        "ints": list(range(-50, 50)),
+        "mixed": [i if i % 2 else float(i) for i in range(100)],
+        "bools": [i % 3 == 0 for i in range(100)],
+        "big": [2**70 + i for i in range(100)],
+        "rows": [(i, i + 1.0, i + 2.0) for i in range(100)],
+        "ragged": [list(range(i % 5 + 1)) for i in range(100)],
+        "map": {i: [i, 2 * i] for i in range(100)},
+        "table": {str(i): {"x": float(i), "y": i} if i % 2 else {"x": 0.0, "z": [i, i]} for i in range(100)},
+        "points": [Point(i, 0, 0) for i in range(100)],
+        "$escaped": {"$binary": ["array", 0, "<f8", [1]], "$": 1},
+    }
+    after = binary_loads(binary_dumps(before, compress=compress))
+    expected = compas.json_loads(compas.json_dumps(before))
+    for key in expected:
+        if key == "points":
+            assert after[key] == expected[key]
+        else:
+            assert compas.json_dumps(after[key]) == compas.json_dumps(expected[key])
+    assert [type(value) for value in after["mixed"]] == [type(value) for value in before["mixed"]]
+
+
+def test_binary_numpy():
+    if compas.IPY:
+        return
+
+    import numpy as np
+
+    before = [np.arange(300.0).reshape(100, 3), np.arange(100, dtype=np.uint8), np.ones(64, dtype=bool)]
+    after = binary_loads(binary_dumps(before))
+    assert after == compas.json_loads(compas.json_dumps(before))
+
+
+def test_binary_mesh(tmp_path):
+    before = Mesh.from_meshgrid(dx=10, nx=10)
+    before.vertex_attribute(0, "is_fixed", True)
+    binary_dump(before, str(tmp_path / "mesh.bin"))
+    after = binary_load(str(tmp_path / "mesh.bin"))
+    assert after.guid == before.guid
+    assert after.data == compas.json_loads(compas.json_dumps(before)).data
+
+    before.to_binary(str(tmp_path / "mesh.bin"))
+    assert Mesh.from_binary(str(tmp_path / "mesh.bin")).data == after.data
+
+
+def test_binary_network():
+    before = Network.from_obj(compas.get("lines.obj"))
+    after = binary_loads(binary_dumps(before))
+    assert after.guid == before.guid
+    assert after.data == compas.json_loads(compas.json_dumps(before)).data
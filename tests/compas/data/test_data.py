@@ -11,3 +11,45 @@ def test_string_casting():
 
     test = TestClass(42)
     assert str(test) == "TestClass 42"
+
+
+def test_copy_uses_data_of_subclass():
+    from compas.datastructures import Mesh
+
+    class LabelledMesh(Mesh):
+        def __init__(self, *args, **kwargs):
+            super(LabelledMesh, self).__init__(*args, **kwargs)
+            self.label = None
+
+        @property
+        def data(self):
+            data = super(LabelledMesh, self).data
+            data["label"] = self.label
+            return data
+
+        @data.setter
+        def data(self, data):
+            Mesh.data.fset(self, data)
+            self.label = data["label"]
+
+    mesh = LabelledMesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0]], [[0, 1, 2]])
+    mesh.label = "a"
+    other = mesh.copy()
+    assert other.label == "a"
+    assert other.data == mesh.data
+
+
+def test_copy_of_primitives():
+    from compas.geometry import Circle
+    from compas.geometry import Frame
+    from compas.geometry import Point
+    from compas.geometry import Polygon
+
+    for a in (Point(1, 2, 3), Polygon([[0, 0, 0], [1, 0, 0], [1, 1, 0]]), Circle(1.0, frame=Frame.worldYZ())):
+        b = a.copy()
+        assert b is not a
+        assert b.data == a.data
+    a = Circle(1.0)
+    b = a.copy()
+    b.frame.point.x = 1.0
+    assert a.frame.point.x == 0.0
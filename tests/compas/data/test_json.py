@@ -1,4 +1,9 @@
+import io
+
 import compas
+from compas.data import DataProxy
+from compas.data import json_iter
+from compas.data.encoders import cls_from_dtype
 from compas.datastructures import Mesh
 from compas.datastructures import Network
 from compas.datastructures import VolMesh
@@ -113,6 +118,63 @@ def test_json_pretty():
     assert result == """{\n"a": 12,\n"b": 6565\n}"""
 
 
+def test_json_lazy():
+    box = Box(frame=Frame(Point(1, 2, 3), Vector(1, 0, 0), Vector(0, 1, 0)), xsize=1, ysize=2, zsize=3)
+    mesh = Mesh.from_meshgrid(dx=1, nx=3)
+    before = {"box": box, "mesh": mesh, "points": [Point(0, 0, 0), Point(1, 0, 0)]}
+    after = compas.json_loads(compas.json_dumps(before), lazy=True)
+    assert isinstance(after["mesh"], DataProxy)
+    assert isinstance(after["mesh"], Mesh)
+    assert after["mesh"].dtype == mesh.dtype
+    assert after["mesh"].guid == mesh.guid
+    assert not after["mesh"].is_materialized
+    assert after["mesh"].number_of_faces() == 9
+    assert after["mesh"].is_materialized
+    assert not after["box"].is_materialized
+    assert after["box"].frame.point == box.frame.point
+    assert type(after["box"].materialize().frame) is Frame
+    assert after["points"][1] + Vector(1, 0, 0) == Point(2, 0, 0)
+    assert list(after["points"][1]) == [1.0, 0.0, 0.0]
+
+
+def test_json_lazy_inplace():
+    text = compas.json_dumps({"point": Point(1, 2, 3), "vector": Vector(1, 0, 0)})
+    results = []
+    for lazy in (False, True):
+        data = compas.json_loads(text, lazy=lazy)
+        point = data["point"]
+        point += Vector(1, 1, 1)
+        point -= Vector(0, 0, 1)
+        point *= 2
+        point /= 4
+        vector = data["vector"]
+        vector *= 3
+        assert point is data["point"]
+        assert vector is data["vector"]
+        results.append((list(data["point"]), list(data["vector"])))
+    assert results[0] == results[1] == ([1.0, 1.5, 1.5], [3.0, 0.0, 0.0])
+
+
+def test_json_iter():
+    before = [Point(i, 0, 0) for i in range(100)] + [{"a": [1, 2, 3]}, None, 1.5]
+    text = compas.json_dumps(before, pretty=True)
+    after = list(json_iter(io.StringIO(text)))
+    assert after == compas.json_loads(text)
+    proxies = list(json_iter(io.StringIO(text), lazy=True))[:100]
+    assert all(type(point) is DataProxy and not point.is_materialized for point in proxies)
+
+    before = {"a": 1, "b": Mesh.from_meshgrid(dx=1, nx=3), "c": [1, {"d": None}]}
+    after = list(json_iter(io.StringIO(compas.json_dumps(before, compact=True))))
+    assert [key for key, _ in after] == ["a", "b", "c"]
+    assert after[1][1].guid == before["b"].guid
+    assert after[2][1] == [1, {"d": None}]
+
+
+def test_json_cls_from_dtype():
+    assert cls_from_dtype("compas.geometry/Point") is Point
+    assert cls_from_dtype("compas.geometry/Point") is Point
+
+
 # temporarily commented because folder does not exist yet on main
 # def test_json_url():
 #     data = compas.json_load('https://raw.githubusercontent.com/compas-dev/compas/main/src/compas/data/schemas/graph.json')
@@ -1,5 +1,7 @@
 import pickle
+from compas.datastructures import Mesh
 from compas.geometry import Frame
+from compas.geometry import Point
 
 
 def test_pickling():
@@ -11,3 +13,19 @@ def test_pickling():
     assert all(a == b for a, b in zip(f1.yaxis, f2.yaxis))
     assert all(a == b for a, b in zip(f1.zaxis, f2.zaxis))
     assert f1.guid == f2.guid
+
+
+def test_pickling_slots():
+    p1 = Point(1, 2, 3, name="point")
+    assert not hasattr(p1, "__dict__")
+    p2 = pickle.loads(pickle.dumps(p1, protocol=pickle.HIGHEST_PROTOCOL))
+    assert p2 == p1
+    assert p2.guid == p1.guid
+    assert p2.name == "point"
+
+    mesh = Mesh.from_polyhedron(4)
+    mesh.name = "tet"
+    other = pickle.loads(pickle.dumps(mesh, protocol=pickle.HIGHEST_PROTOCOL))
+    assert other.name == "tet"
+    assert other.guid == mesh.guid
+    assert other.number_of_faces() == 4
@@ -43,6 +43,18 @@ def test_edgedata_io(graph):
 # ==============================================================================
 
 
+def test_copy(graph):
+    graph.update_default_edge_attributes({"path": []})
+    graph.edge_attribute((0, 1), "path", [0, 1])
+    other = graph.copy()
+    assert other.data == graph.data
+    assert other.adjacency == graph.adjacency
+    other.edge_attribute((0, 1), "path").append(2)
+    other.delete_node(4)
+    assert graph.edge_attribute((0, 1), "path") == [0, 1]
+    assert graph.has_node(4)
+
+
 def test_node_sample(graph):
     for node in graph.node_sample():
         assert graph.has_node(node)
@@ -6,6 +6,8 @@ from compas.geometry import Box
 
 from compas.datastructures import HalfEdge
 from compas.datastructures import Mesh
+from compas.datastructures import trimesh_split_edge
+from compas.datastructures import trimesh_swap_edge
 
 
 # ==============================================================================
@@ -430,3 +432,75 @@ def test_strip_faces_open(grid):
 
     assert grid.is_face_on_boundary(faces[0])
     assert grid.is_face_on_boundary(faces[-1])
+
+
+# ==============================================================================
+# Tests - Topology cache
+# ==============================================================================
+
+
+def _topology(mesh):
+    return (
+        mesh.is_closed(),
+        mesh.is_manifold(),
+        {vertex: (mesh.is_vertex_on_boundary(vertex), mesh.vertex_degree(vertex)) for vertex in mesh.vertices()},
+        {face: sorted(mesh.face_neighbors(face)) for face in mesh.faces()},
+        sorted(sorted(vertices) for vertices in mesh.vertices_on_boundaries()),
+    )
+
+
+def test_topology_cache_hits(grid):
+    cache = grid.enable_topology_cache()
+    assert grid.enable_topology_cache() is cache
+    assert not grid.is_closed()
+    assert grid.is_manifold()
+    assert grid.is_manifold()
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert cache.updates == grid.number_of_vertices()
+
+    grid.vertices_on_boundaries()
+    grid.vertices_on_boundaries()
+    assert cache.hits == 2
+    assert cache.misses == 3
+
+    face = grid.face_sample()[0]
+    vertices = grid.face_vertices(face)
+    grid.delete_face(face)
+    assert grid.vertex_degree(vertices[0]) == len(grid.vertex_neighbors(vertices[0]))
+    assert cache.updates == grid.number_of_vertices() + len(vertices)
+    assert grid.is_vertex_on_boundary(vertices[0])
+
+    grid.disable_topology_cache()
+    assert grid.topology_cache is None
+
+
+def test_topology_cache_operations():
+    random.seed(0)
+    mesh = Mesh.from_meshgrid(dx=10, nx=6)
+    mesh.quads_to_triangles()
+    mesh.enable_topology_cache()
+    for i in range(100):
+        edge = random.choice(list(mesh.edges()))
+        if i % 10 == 0:
+            mesh.delete_face(mesh.face_sample()[0])
+        elif i % 2 == 0:
+            trimesh_split_edge(mesh, edge, allow_boundary=True)
+        else:
+            trimesh_swap_edge(mesh, edge, allow_boundary=False)
+        cached = _topology(mesh)
+        cache = mesh.topology_cache
+        mesh.disable_topology_cache()
+        assert cached == _topology(mesh)
+        mesh._topology = cache
+    assert mesh.topology_cache.stats()["rate"] > 0.5
+
+
+def test_topology_cache_clear(box):
+    cache = box.enable_topology_cache()
+    assert box.is_closed()
+    box.delete_face(box.face_sample()[0])
+    assert not box.is_closed()
+    box.clear()
+    assert box.topology_cache is cache
+    assert not box.is_closed()
@@ -0,0 +1,79 @@
+import random
+
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import Network
+from compas.datastructures import VolMesh
+
+
+def test_hash_mesh():
+    mesh = Mesh.from_meshgrid(dx=10, nx=20)
+    before = mesh.structural_hash()
+    assert before == Mesh.from_meshgrid(dx=10, nx=20).structural_hash()
+
+    mesh.vertex_attribute(5, "z", 1.0)
+    mesh.face_attribute(3, "color", "red")
+    mesh.edge_attribute((0, 1), "weight", 2.0)
+    after = mesh.structural_hash(before, vertices=[5], faces=[3], edges=[(1, 0)])
+    assert after != before
+    assert after == mesh.structural_hash()
+    assert after.diff(before) == ["edges", "faces", "vertices"]
+
+    mesh.delete_face(7)
+    vertex = mesh.add_vertex(x=20.0, y=20.0, z=0.0)
+    face = mesh.add_face([vertex, 1, 0])
+    updated = mesh.structural_hash(after, vertices=[vertex], faces=[7, face])
+    assert updated == mesh.structural_hash()
+
+    mesh.attributes["name"] = "changed"
+    assert mesh.structural_hash(updated).diff(updated) == ["attributes"]
+
+
+def test_hash_order():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+    faces = [[0, 1, 2, 3], [1, 4, 2]]
+    a = Mesh.from_vertices_and_faces(vertices, faces)
+    b = Mesh()
+    for key in reversed(range(len(vertices))):
+        b.add_vertex(key=key, z=vertices[key][2], y=vertices[key][1], x=vertices[key][0])
+    for fkey in reversed(range(len(faces))):
+        b.add_face(faces[fkey], fkey=fkey)
+    assert a.structural_hash() == b.structural_hash()
+    assert a.sha256() != b.sha256()
+
+
+def test_hash_network():
+    network = Network.from_obj(compas.get("lines.obj"))
+    before = network.structural_hash()
+    random.seed(0)
+    edges = random.sample(list(network.edges()), 5)
+    for edge in edges:
+        network.edge_attribute(edge, "force", 1.0)
+    node = network.add_node("extra", x=1.0, y=1.0, z=1.0)
+    network.add_edge(node, 0)
+    after = network.structural_hash(before, nodes=[node], edges=edges + [(node, 0)])
+    assert after == network.structural_hash()
+    assert after.diff(before) == ["edges", "nodes"]
+
+
+def test_hash_network_isolated_node():
+    network = Network.from_obj(compas.get("lines.obj"))
+    before = network.structural_hash()
+    node = network.add_node("isolated", x=1.0, y=1.0, z=1.0)
+    after = network.structural_hash(before, nodes=[node])
+    assert after == network.structural_hash()
+    assert after.diff(before) == ["nodes"]
+    network.delete_node(node)
+    assert network.structural_hash(after, nodes=[node]) == before
+
+
+def test_hash_volmesh():
+    volmesh = VolMesh.from_obj(compas.get("boxes.obj"))
+    before = volmesh.structural_hash()
+    cell = volmesh.cell_sample()[0]
+    face = volmesh.face_sample()[0]
+    volmesh.cell_attribute(cell, "load", 1.0)
+    volmesh.face_attribute(face, "load", 2.0)
+    after = volmesh.structural_hash(before, cells=[cell], faces=[face])
+    assert after == volmesh.structural_hash()
+    assert after.diff(before) == ["cells", "faces"]
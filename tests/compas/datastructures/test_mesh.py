@@ -215,6 +215,41 @@ def test_to_vertices_and_faces_triangulated():
     assert len(faces) == 60
 
 
+def test_from_arrays():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    vertices, faces = mesh.to_vertices_and_faces()
+    other = Mesh.from_arrays(vertices, faces)
+    assert other.halfedge == Mesh.from_vertices_and_faces(vertices, dict(enumerate(faces))).halfedge
+    assert other.number_of_edges() == mesh.number_of_edges()
+
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+    mesh = Mesh.from_arrays(vertices, [0, 1, 2, 3, 1, 4, 2, 2, 1, 1], offsets=[0, 4, 7, 10])
+    assert mesh.number_of_faces() == 2
+    assert mesh.is_valid()
+
+
+def test_to_arrays():
+    if compas.IPY:
+        return
+
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    V, F, vertex_index = mesh.to_arrays()
+    assert V.shape == (36, 3)
+    assert F.shape == (25, 4)
+    assert mesh.to_arrays()[1] is F
+
+    other = Mesh.from_arrays(V, F)
+    assert allclose(other.vertices_attributes("xyz"), V)
+    assert other.face_vertices(0) == F[0].tolist()
+
+    mesh.insert_vertex(0)
+    with pytest.raises(ValueError):
+        mesh.to_arrays()
+    V, F, offsets, vertex_index = mesh.to_arrays(return_offsets=True)
+    assert offsets.tolist()[-3:] == [102, 105, 108]
+    assert F[offsets[-2] :].tolist() == [vertex_index[vertex] for vertex in mesh.face_vertices(28)]
+
+
 def test_to_lines():
     lines = compas.json_load(compas.get("lines.json"))
     mesh = Mesh.from_lines(lines)
@@ -235,6 +270,26 @@ def test_copy():
     assert mesh1.number_of_edges() == mesh2.number_of_edges()
 
 
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_copy_is_independent(storage):
+    mesh = Mesh(storage=storage)
+    mesh.data = Mesh.from_obj(compas.get("faces.obj")).data
+    mesh.update_default_face_attributes(tags=[])
+    mesh.face_attribute(0, "tags", ["a"])
+    mesh.edge_attribute((0, 1), "weight", 2.0)
+    other = mesh.copy()
+    assert other.storage == storage
+    assert other.data == mesh.data
+    assert other.halfedge == mesh.halfedge
+    other.vertex_attribute(0, "x", 10.0)
+    other.face_attribute(0, "tags").append("b")
+    other.delete_face(1)
+    assert mesh.vertex_attribute(0, "x") == 0.0
+    assert mesh.face_attribute(0, "tags") == ["a"]
+    assert mesh.has_face(1)
+    assert other.is_valid()
+
+
 def test_clear():
     mesh = Mesh.from_obj(compas.get("faces.obj"))
     mesh.clear()
@@ -711,6 +766,39 @@ def test_face_curvature():
     assert mesh.face_curvature(0) == 0
 
 
+@pytest.mark.parametrize("ipy", [True, False])
+def test_batched_geometry(monkeypatch, ipy):
+    if compas.IPY and not ipy:
+        return
+    monkeypatch.setattr(compas, "IPY", ipy)
+
+    mesh = Mesh.from_obj(compas.get("quadmesh.obj"))
+    normals = mesh.faces_normals()
+    centroids = mesh.faces_centroids()
+    centers = mesh.faces_centers()
+    areas = mesh.faces_areas()
+    flatness = mesh.faces_flatness()
+    for face in mesh.faces():
+        assert allclose(normals[face], mesh.face_normal(face))
+        assert allclose(centroids[face], mesh.face_centroid(face))
+        assert allclose(centers[face], mesh.face_center(face))
+        assert allclose([areas[face], flatness[face]], [mesh.face_area(face), mesh.face_flatness(face)])
+
+    normals = mesh.vertices_normals()
+    areas = mesh.vertices_areas()
+    for vertex in mesh.vertices():
+        assert allclose(normals[vertex], mesh.vertex_normal(vertex))
+        assert allclose([areas[vertex]], [mesh.vertex_area(vertex)])
+
+    lengths = mesh.edges_lengths()
+    assert list(lengths) == list(mesh.edges())
+    assert allclose([lengths[edge] for edge in mesh.edges()], [mesh.edge_length(edge) for edge in mesh.edges()])
+
+    mesh.insert_vertex(0)
+    with pytest.raises(ValueError):
+        mesh.faces_flatness()
+
+
 # --------------------------------------------------------------------------
 # boundary
 # --------------------------------------------------------------------------
@@ -783,3 +871,111 @@ def test_face_attributes_includes_all_defaults(box):
     ]
 
     assert box.face_attribute(random_fkey, "attr3") == "value3"
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_vertices_attributes_array(storage):
+    mesh = Mesh(storage=storage)
+    mesh.data = Mesh.from_obj(compas.get("faces.obj")).data
+    mesh.delete_vertex(3)
+    xyz = mesh.vertices_attributes_array("xyz")
+    assert xyz.shape == (mesh.number_of_vertices(), 3)
+    assert xyz.tolist() == mesh.vertices_attributes("xyz")
+    mesh.set_vertices_attributes_array("xyz", xyz + 1.0)
+    assert mesh.vertex_coordinates(0) == [1.0, 1.0, 1.0]
+    mesh.set_vertices_attribute_array("z", [5.0, 6.0], keys=[0, 1])
+    assert mesh.vertices_attribute_array("z", keys=[0, 1]).tolist() == [5.0, 6.0]
+    with pytest.raises(KeyError):
+        mesh.vertices_attributes_array("xyz", keys=[3])
+    with pytest.raises(ValueError):
+        mesh.set_vertices_attributes_array("xyz", xyz[:2])
+    with pytest.raises(KeyError):
+        mesh.set_vertices_attributes_array("xyz", [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]], keys=[0, 3])
+    assert mesh.vertex_coordinates(0) == [1.0, 1.0, 5.0]
+    with pytest.raises(KeyError):
+        mesh.set_vertices_attributes_array(["x", "w"], [[0.0, 0.0], [0.0, 0.0]], keys=[0, 3])
+    assert mesh.vertex_attribute(0, "w") is None
+
+
+def test_faces_and_edges_attributes_array():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    mesh.update_default_face_attributes(area=1.0)
+    mesh.set_faces_attribute_array("area", range(mesh.number_of_faces()))
+    assert mesh.faces_attribute("area") == list(range(mesh.number_of_faces()))
+    assert mesh.faces_attribute_array("area").sum() == sum(range(mesh.number_of_faces()))
+    edges = list(mesh.edges())[:3]
+    mesh.set_edges_attributes_array(["q", "l"], [[1, 2], [3, 4], [5, 6]], keys=edges)
+    assert mesh.edges_attributes_array(["q", "l"], keys=edges).tolist() == [[1, 2], [3, 4], [5, 6]]
+    assert mesh.edge_attribute(edges[1], "l") == 4
+    with pytest.raises(KeyError):
+        mesh.set_edges_attributes_array(["q"], [[0], [0]], keys=[edges[0], (-1, -2)])
+    assert mesh.edge_attribute(edges[0], "q") == 1
+    with pytest.raises(KeyError):
+        mesh.set_faces_attributes_array(["area"], [[0], [0]], keys=[0, -1])
+    assert mesh.face_attribute(0, "area") == 0
+    mesh.set_faces_attribute_array("area", [1, 1], keys=[0, 1])
+    with pytest.raises(KeyError):
+        mesh.set_faces_attributes_array(["area"], [[0], [0]], keys=[0, -1])
+    assert mesh.face_attribute(0, "area") == 1
+
+
+# --------------------------------------------------------------------------
+# storage
+# --------------------------------------------------------------------------
+
+
+def test_array_storage_data():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    other = Mesh(storage="array")
+    other.data = mesh.data
+    assert other.storage == "array"
+    assert other.data == mesh.data
+    assert list(other.edges()) == list(mesh.edges())
+    assert other.vertex_attribute(0, "x") == mesh.vertex_attribute(0, "x")
+
+
+def test_array_storage_operations():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    other = Mesh(storage="array")
+    other.data = mesh.data
+    for m in (mesh, other):
+        m.split_edge((0, 1), allow_boundary=True)
+        m.merge_faces(m.vertex_faces(7)[:2])
+        m.delete_vertex(20)
+        m.insert_vertex(max(m.faces()))
+    assert other.is_valid()
+    assert other.data == mesh.data
+
+
+def test_array_storage_attributes():
+    mesh = Mesh(storage="array")
+    a = mesh.add_vertex(x=1, y=2, z=3, name="a")
+    mesh.vertex_attribute(a, "x", "not a number")
+    assert mesh.vertex_attributes(a, "xyz") == ["not a number", 2.0, 3.0]
+    assert mesh.vertex_attribute(a, "name") == "a"
+    mesh.unset_vertex_attribute(a, "x")
+    assert mesh.vertex_attribute(a, "x") == 0.0
+    mesh.vertex_attribute(a, "z", float("nan"))
+    assert "z" in mesh.vertex[a]
+    assert mesh.vertex_attribute(a, "z") != mesh.vertex_attribute(a, "z")
+    with pytest.raises(ValueError):
+        Mesh(storage="unknown")
+
+
+def test_array_storage_matches_dict_storage():
+    meshes = [Mesh(), Mesh(storage="array")]
+    for mesh in meshes:
+        a = mesh.add_vertex(x=1, y=2.5, z=3)
+        b = mesh.add_vertex(attr_dict={"name": "b", "z": 0.0, "x": 1.0, "y": 2.0})
+        mesh.vertex_attribute(a, "y", "two")
+        mesh.vertex_attribute(a, "w", 1)
+        mesh.vertex_attribute(a, "y", 2.0)
+        mesh.vertex_attribute(b, "x", 2**60)
+        mesh.unset_vertex_attribute(b, "z")
+        mesh.vertex_attribute(b, "z", 5)
+        mesh.set_vertices_attributes_array("xz", [[7, 8], [9, 10]])
+    for key in meshes[0].vertices():
+        expected = meshes[0].vertex[key]
+        attr = meshes[1].vertex[key]
+        assert list(attr.items()) == list(expected.items())
+        assert [type(value) for value in attr.values()] == [type(value) for value in expected.values()]
@@ -0,0 +1,77 @@
+import compas
+from compas.datastructures import Mesh
+from compas.geometry import Scale
+from compas.geometry import Translation
+from compas.geometry import allclose
+from compas.geometry import is_point_in_convex_polygon_xy
+
+if not compas.IPY:
+    import numpy as np
+
+    from compas.datastructures import MeshBVH
+    from compas.datastructures import trimesh_pull_points_numpy
+
+
+def test_bvh_contains_points():
+    if compas.IPY:
+        return
+
+    mesh = Mesh.from_polyhedron(12)
+    bvh = MeshBVH.from_mesh(mesh, leafsize=2)
+    points = np.random.default_rng(0).uniform(-1.5, 1.5, size=(1000, 3))
+
+    def inside():
+        centroids = np.array([mesh.face_centroid(face) for face in mesh.faces()])
+        normals = np.array([mesh.face_normal(face) for face in mesh.faces()])
+        return (((points[:, None] - centroids[None]) * normals[None]).sum(axis=2) < 0).all(axis=1)
+
+    assert (bvh.contains_points(points) == inside()).all()
+
+    mesh.transform(Scale.from_factors([2.0, 1.5, 1.0]))
+    bvh.refit()
+    assert (bvh.contains_points(points) == inside()).all()
+
+
+def test_bvh_closest_points():
+    if compas.IPY:
+        return
+
+    mesh = Mesh.from_obj(compas.get("tubemesh.obj"))
+    bvh = MeshBVH.from_mesh(mesh)
+    points = np.random.default_rng(1).uniform(-5, 5, size=(100, 3))
+    closest, faces, distances = bvh.closest_points(points)
+    assert allclose(np.sqrt(((closest - points) ** 2).sum(axis=1)), distances)
+    for point, face, distance in zip(points, faces, distances):
+        assert distance <= min(np.linalg.norm(mesh.vertices_attributes_array("xyz") - point, axis=1)) + 1e-9
+        assert face in mesh.face
+    assert allclose(trimesh_pull_points_numpy(mesh, points[:10]), closest[:10])
+
+
+def test_bvh_intersect_rays():
+    if compas.IPY:
+        return
+
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    bvh = MeshBVH.from_mesh(mesh)
+    rays = [[[2.5, 3.5, 5.0], [0, 0, -2.0]], [[2.5, 3.5, 5.0], [0, 0, 1.0]], [[-1.0, 0.5, 0.0], [1.0, 0, 0]]]
+    faces, distances = bvh.intersect_rays(rays)
+    assert faces[1] == -1 and distances[1] == float("inf")
+    assert distances[0] == 5.0
+    polygon = mesh.face_coordinates(int(faces[0]))
+    assert is_point_in_convex_polygon_xy([2.5, 3.5, 0.0], polygon)
+
+    V, F, _ = mesh.to_arrays()
+    faces, distances = MeshBVH(V, F).intersect_rays(rays)
+    assert distances[0] == 5.0 and F[faces[0]].tolist() == mesh.face_vertices(list(mesh.faces())[faces[0]])
+
+
+def test_bvh_overlapping_faces():
+    if compas.IPY:
+        return
+
+    a = Mesh.from_meshgrid(dx=10, nx=10)
+    b = a.transformed(Translation.from_vector([9.5, 9.5, 0.0]))
+    pairs = MeshBVH.from_mesh(a).overlapping_faces(MeshBVH.from_mesh(b))
+    assert pairs.tolist() == [[99, 0]]
+    b.transform(Translation.from_vector([1.0, 0, 0]))
+    assert MeshBVH.from_mesh(a).overlapping_faces(MeshBVH.from_mesh(b)).shape == (0, 2)
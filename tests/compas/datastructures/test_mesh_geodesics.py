@@ -0,0 +1,55 @@
+from numpy import isfinite
+from numpy import isinf
+
+from compas.datastructures import Mesh
+from compas.datastructures import HeatGeodesicSolver
+from compas.datastructures import mesh_geodesic_distances_numpy
+from compas.datastructures import meshes_join
+from compas.geometry import Translation
+from compas.geometry import allclose
+from compas.geometry import distance_point_point
+
+
+def test_geodesic_distances_grid():
+    mesh = Mesh.from_meshgrid(dx=10, nx=30)
+    mesh.quads_to_triangles()
+    distances = mesh_geodesic_distances_numpy(mesh, [0])
+    origin = mesh.vertex_coordinates(0)
+    for vertex, index in mesh.vertex_index().items():
+        assert abs(distances[index] - distance_point_point(origin, mesh.vertex_coordinates(vertex))) < 0.5
+
+
+def test_geodesic_solver_batch():
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    mesh.quads_to_triangles()
+    solver = HeatGeodesicSolver(mesh)
+    sources = [[0], [60], [10, 110]]
+    D = solver.batch_distances(sources)
+    assert D.shape == (3, mesh.number_of_vertices())
+    for d, vertices in zip(D, sources):
+        assert allclose(d, solver.distances(vertices))
+        assert allclose([d[solver.vertex_index[vertex]] for vertex in vertices], [0.0] * len(vertices), tol=0.5)
+
+
+def test_geodesic_distances_components():
+    a = Mesh.from_meshgrid(dx=10, nx=10)
+    b = a.transformed(Translation.from_vector([20, 0, 0]))
+    mesh = meshes_join([a, b])
+    mesh.quads_to_triangles()
+    solver = HeatGeodesicSolver(mesh)
+    first = [vertex for vertex in mesh.vertices() if mesh.vertex_attribute(vertex, "x") < 15]
+    second = [vertex for vertex in mesh.vertices() if mesh.vertex_attribute(vertex, "x") > 15]
+
+    d = solver.distances([first[0]])
+    assert abs(d[solver.vertex_index[first[0]]]) < 0.5
+    assert all(isfinite(d[solver.vertex_index[vertex]]) for vertex in first)
+    assert all(isinf(d[solver.vertex_index[vertex]]) for vertex in second)
+
+    d = solver.distances([first[0], second[-1]])
+    assert abs(d[solver.vertex_index[first[0]]]) < 0.5
+    assert abs(d[solver.vertex_index[second[-1]]]) < 0.5
+    assert all(isfinite(d))
+    single = solver.distances([first[0]])
+    assert allclose(
+        [d[solver.vertex_index[vertex]] for vertex in first], [single[solver.vertex_index[vertex]] for vertex in first]
+    )
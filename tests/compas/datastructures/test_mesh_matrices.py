@@ -0,0 +1,75 @@
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import mesh_laplacian_matrix
+from compas.datastructures import trimesh_cotangent_laplacian_matrix
+from compas.datastructures import trimesh_gradient_matrix
+from compas.datastructures import trimesh_vertexarea_matrix
+from compas.datastructures.mesh.matrices import trimesh_edge_cotangents
+from compas.geometry import allclose
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh.from_obj(compas.get("hypar.obj"))
+    mesh.quads_to_triangles()
+    return mesh
+
+
+def test_cotangent_laplacian_matrix(mesh):
+    vertex_index = mesh.vertex_index()
+    L = trimesh_cotangent_laplacian_matrix(mesh, rtype="array")
+    for vertex in mesh.vertices():
+        i = vertex_index[vertex]
+        nbrs = mesh.vertex_neighbors(vertex)
+        weights = [sum(trimesh_edge_cotangents(mesh, (vertex, nbr))) for nbr in nbrs]
+        assert L[i, i] == -1.0
+        assert allclose([L[i, vertex_index[nbr]] for nbr in nbrs], [w / sum(weights) for w in weights])
+
+
+def test_laplacian_matrix(mesh):
+    vertex_index = mesh.vertex_index()
+    L = mesh_laplacian_matrix(mesh, rtype="array")
+    for vertex in mesh.vertices():
+        i = vertex_index[vertex]
+        nbrs = mesh.vertex_neighbors(vertex)
+        assert L[i, i] == -1.0
+        assert allclose([L[i, vertex_index[nbr]] for nbr in nbrs], [1.0 / len(nbrs)] * len(nbrs))
+        assert allclose([L[i].sum()], [0.0])
+
+
+def test_vertexarea_and_gradient_matrix(mesh):
+    A = trimesh_vertexarea_matrix(mesh)
+    assert allclose([A.diagonal().sum()], [mesh.area()])
+
+    grid = Mesh.from_meshgrid(dx=3, nx=3)
+    grid.quads_to_triangles()
+    G = trimesh_gradient_matrix(grid)
+    g = G.dot(grid.vertices_attribute("x")).reshape((3, -1))
+    assert allclose(g.T, [[1.0, 0.0, 0.0]] * grid.number_of_faces())
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_matrix_cache(storage):
+    grid = Mesh.from_meshgrid(dx=3, nx=3)
+    grid.quads_to_triangles()
+    mesh = Mesh(storage=storage)
+    mesh.data = grid.data
+
+    L = trimesh_cotangent_laplacian_matrix(mesh, cache=True)
+    assert trimesh_cotangent_laplacian_matrix(mesh, cache=True) is L
+
+    mesh.vertex_attribute(4, "z", 1.0)
+    L2 = trimesh_cotangent_laplacian_matrix(mesh, cache=True)
+    assert L2 is not L
+    assert allclose(L2.toarray(), trimesh_cotangent_laplacian_matrix(mesh).toarray())
+
+    U = mesh_laplacian_matrix(mesh, cache=True)
+    mesh.vertex_attribute(4, "z", 2.0)
+    assert mesh_laplacian_matrix(mesh, cache=True) is U
+
+    mesh.delete_face(next(mesh.faces()))
+    U2 = mesh_laplacian_matrix(mesh, cache=True)
+    assert U2 is not U
+    assert allclose(U2.toarray(), mesh_laplacian_matrix(mesh).toarray())
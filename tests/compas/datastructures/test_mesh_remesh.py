@@ -0,0 +1,32 @@
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import TrimeshRemesher
+from compas.datastructures import trimesh_remesh
+from compas.geometry import distance_point_point
+
+
+def test_remesh():
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    mesh.quads_to_triangles()
+    trimesh_remesh(mesh, target=0.5, kmax=40, allow_boundary_split=True)
+    assert mesh.is_valid()
+    assert mesh.is_trimesh()
+    lengths = [mesh.edge_length(edge) for edge in mesh.edges()]
+    assert 0.25 < sum(lengths) / len(lengths) < 1.0
+
+
+def test_remesher_projection_and_stats():
+    mesh = Mesh.from_obj(compas.get("hypar.obj"))
+    mesh.quads_to_triangles()
+    surface = mesh.copy()
+    remesher = TrimeshRemesher(mesh, target=0.5, project=True, allow_boundary_split=True)
+    remesher.run(kmax=20)
+    assert len(remesher.stats) == 20
+    assert sum(stats["split"] for stats in remesher.stats) > 0
+    assert remesher.stats[-1]["vertices"] == mesh.number_of_vertices()
+
+    vertices = list(mesh.vertices())
+    points = [mesh.vertex_coordinates(vertex) for vertex in vertices]
+    closest = TrimeshRemesher(surface, target=0.5, project=True).projector.closest_points(points)
+    for point, other in zip(points, closest):
+        assert distance_point_point(point, other) < 1e-6
@@ -0,0 +1,52 @@
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import mesh_smooth_area
+from compas.datastructures import mesh_smooth_area_numpy
+from compas.datastructures import mesh_smooth_centerofmass
+from compas.datastructures import mesh_smooth_centerofmass_numpy
+from compas.datastructures import mesh_smooth_centroid
+from compas.datastructures import mesh_smooth_centroid_numpy
+from compas.datastructures import trimesh_smooth_laplacian_cotangent
+from compas.geometry import allclose
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh.from_obj(compas.get("hypar.obj"))
+    for vertex in mesh.vertices():
+        mesh.vertex_attribute(vertex, "z", mesh.vertex_attribute(vertex, "z") + 0.1 * (vertex % 3))
+    return mesh
+
+
+@pytest.mark.parametrize(
+    "smooth, smooth_numpy",
+    [
+        (mesh_smooth_centroid, mesh_smooth_centroid_numpy),
+        (mesh_smooth_centerofmass, mesh_smooth_centerofmass_numpy),
+        (mesh_smooth_area, mesh_smooth_area_numpy),
+    ],
+)
+def test_smooth_numpy(mesh, smooth, smooth_numpy):
+    fixed = list(mesh.vertices_on_boundary())
+    other = mesh.copy()
+    smooth(mesh, fixed=fixed, kmax=10)
+    smooth_numpy(other, fixed=fixed, kmax=10)
+    assert allclose(mesh.vertices_attributes("xyz"), other.vertices_attributes("xyz"))
+
+
+def test_smooth_numpy_callback(mesh):
+    iterations = []
+    mesh_smooth_centroid_numpy(mesh, kmax=10, callback=lambda k, args: iterations.append(k), callback_interval=5)
+    assert iterations == [4, 9]
+
+
+def test_smooth_laplacian_cotangent_ignores_unknown_fixed():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    mesh.quads_to_triangles()
+    fixed = list(mesh.vertices_on_boundary())
+    other = mesh.copy()
+    trimesh_smooth_laplacian_cotangent(mesh, fixed, kmax=2)
+    trimesh_smooth_laplacian_cotangent(other, fixed + [-1], kmax=2)
+    assert allclose(mesh.vertices_attributes("xyz"), other.vertices_attributes("xyz"))
@@ -1,6 +1,8 @@
 import pytest
 
 from compas.datastructures import Mesh
+from compas.datastructures import SubdivisionPlan
+from compas.geometry import allclose
 
 
 @pytest.fixture
@@ -58,3 +60,30 @@ def test_tris_subdivide_quad(mesh_tris):
     assert subd.number_of_vertices() == (
         mesh_tris.number_of_vertices() + mesh_tris.number_of_edges() + mesh_tris.number_of_faces()
     )
+
+
+@pytest.mark.parametrize("scheme", ["catmullclark", "doosabin", "loop"])
+def test_subdivision_plan(mesh_tris, scheme):
+    mesh_tris.update_default_edge_attributes(crease=0)
+    mesh_tris.edge_attribute(next(mesh_tris.edges()), "crease", 1)
+    plan = SubdivisionPlan(mesh_tris, scheme=scheme, k=2)
+    subd = mesh_tris.subdivide(scheme=scheme, k=2)
+    assert plan.mesh.face == subd.face
+    assert allclose(plan.mesh.vertices_attributes("xyz"), subd.vertices_attributes("xyz"))
+
+    for key in mesh_tris.vertices():
+        x, y, z = mesh_tris.vertex_coordinates(key)
+        mesh_tris.vertex_attributes(key, "xyz", [2 * x, y + 1, z])
+    subd = mesh_tris.subdivide(scheme=scheme, k=2)
+    assert plan.update(mesh_tris) is plan.mesh
+    assert allclose(plan.mesh.vertices_attributes("xyz"), subd.vertices_attributes("xyz"))
+    xyz = mesh_tris.vertices_attributes("xyz", keys=plan.vertices)
+    assert allclose(plan.evaluate(xyz), subd.vertices_attributes("xyz"))
+
+
+def test_subdivision_plan_errors(mesh_quads):
+    with pytest.raises(ValueError):
+        SubdivisionPlan(mesh_quads, scheme="frames")
+    plan = SubdivisionPlan(mesh_quads)
+    with pytest.raises(ValueError):
+        plan.evaluate([[0.0, 0.0, 0.0]])
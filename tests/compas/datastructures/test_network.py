@@ -1,6 +1,11 @@
 import pytest
 
+import compas
 from compas.datastructures import Network
+from compas.datastructures import network_smooth_centroid
+from compas.datastructures import network_smooth_centroid_numpy
+from compas.geometry import Line
+from compas.geometry import allclose
 
 
 @pytest.fixture
@@ -31,6 +36,14 @@ def test_add_node():
     assert network.add_node(0, x=1) == 0
 
 
+def test_from_lines_with_line_objects():
+    lines = [Line([0, 0, 0], [1, 0, 0]), Line([1, 0, 0], [1, 1, 0])]
+    network = Network.from_lines(lines)
+    assert network.number_of_nodes() == 3
+    assert network.number_of_edges() == 2
+    assert network.node_coordinates(1) == [1.0, 0.0, 0.0]
+
+
 def test_non_planar(k5_network):
     try:
         import planarity  # noqa: F401
@@ -52,3 +65,46 @@ def test_planar(k5_network):
 
     k5_network.delete_edge(("a", "b"))  # Delete (a, b) edge to make K5 planar
     assert network_is_planar(k5_network) is True
+
+
+def test_crossings():
+    lines = [
+        ([0, 0, 0], [4, 4, 0]),
+        ([0, 4, 0], [4, 0, 0]),
+        ([1, 0, 0], [1, 4, 0]),
+        ([2, 0, 0], [3, 0, 0]),
+        ([0, 4, 0], [10, 4, 0]),
+    ]
+    network = Network.from_lines(lines)
+    crossings = network.find_crossings()
+
+    assert len(crossings) == 3
+    assert network.count_crossings() == 3
+    assert network.is_crossed()
+    for (u1, v1), (u2, v2) in crossings:
+        assert len(set([u1, v1, u2, v2])) == 4
+
+    network.delete_edge(list(network.edges())[0])
+    network.delete_edge(list(network.edges())[0])
+    assert not network.is_crossed()
+    assert list(network.iter_crossings()) == []
+
+
+def test_crossings_touching():
+    for lines in [
+        [([0.2, 6.4, 0], [6.3, 0.3, 0]), ([5.5, 1.1, 0], [0.3, 1.2, 0])],
+        [([5.5, 1.1, 0], [0.3, 1.2, 0]), ([0.2, 6.4, 0], [6.3, 0.3, 0])],
+    ]:
+        network = Network.from_lines(lines)
+        assert network.count_crossings() == 1
+        assert network.is_crossed()
+
+
+def test_smooth_centroid_numpy():
+    network = Network.from_obj(compas.get("lines.obj"))
+    fixed = list(network.leaves())
+    other = network.copy()
+    network_smooth_centroid(network, fixed=fixed, kmax=10)
+    network_smooth_centroid_numpy(other, fixed=fixed, kmax=10)
+    for node in network.nodes():
+        assert allclose(network.node_coordinates(node), other.node_coordinates(node))
@@ -17,3 +17,17 @@ def test_volmesh_data():
 
     assert data2 == data2_
     assert data1 == data2
+
+
+def test_volmesh_copy():
+    vmesh1 = VolMesh.from_obj(compas.get("boxes.obj"))
+    vmesh2 = vmesh1.copy()
+
+    assert vmesh2.to_data() == vmesh1.to_data()
+    assert vmesh2.cell_faces(0) == vmesh1.cell_faces(0)
+
+    vmesh2.vertex_attribute(0, "x", -1.0)
+    vmesh2.delete_cell(0)
+
+    assert vmesh1.vertex_attribute(0, "x") != -1.0
+    assert vmesh1.number_of_cells() == vmesh2.number_of_cells() + 1
@@ -0,0 +1,72 @@
+import io
+
+import compas
+from compas.datastructures import Mesh
+from compas.files import OBJ
+from compas.files import OBJReader
+
+
+TEXT = """# objects with shared vertices
+o first
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0 0.5
+vt 0 0
+vn 0 0 1
+g group
+f 1/1/1 2/1/1 3//1
+f 1 3 \\
+4
+o second
+v 2 0 0
+f 2 -1 3
+"""
+
+
+def read(text, chunk_size=None):
+    reader = OBJReader(io.StringIO(text))
+    if chunk_size:
+        reader.CHUNK_SIZE = chunk_size
+    reader.open()
+    reader.pre()
+    reader.read()
+    return reader
+
+
+def test_reader():
+    reader = read(TEXT)
+    assert reader.vertices == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [2.0, 0.0, 0.0]]
+    assert reader.weights == [1.0, 1.0, 1.0, 0.5, 1.0]
+    assert reader.normals == [[0.0, 0.0, 1.0]]
+    assert reader.textures == [[0.0, 0.0]]
+    assert reader.faces == [[0, 1, 2], [0, 2, 3], [1, 4, 2]]
+    assert reader.objects["first"] == [("g", "group"), ("f", 0), ("f", 1)]
+    assert reader.objects["second"] == [("f", 2)]
+    assert reader.number_of_lines == TEXT.count("\n")
+
+
+def test_reader_chunks():
+    reader = read(TEXT, chunk_size=5)
+    assert reader.vertices == read(TEXT).vertices
+    assert reader.faces == read(TEXT).faces
+
+
+def test_reader_iter_objects():
+    reader = OBJReader(io.StringIO(TEXT))
+    reader.open()
+    reader.pre()
+    objects = list(reader.iter_objects())
+    assert [name for name, _, _ in objects] == ["first", "second"]
+    name, vertices, faces = objects[1]
+    assert vertices == [[1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [2.0, 0.0, 0.0]]
+    assert faces == [[0, 2, 1]]
+
+
+def test_obj_iter_objects():
+    obj = OBJ(compas.get("faces.obj"))
+    meshes = [Mesh.from_vertices_and_faces(vertices, faces) for _, vertices, faces in obj.iter_objects()]
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    assert len(meshes) == 1
+    assert meshes[0].number_of_vertices() == mesh.number_of_vertices()
+    assert meshes[0].number_of_faces() == mesh.number_of_faces()
@@ -44,3 +44,20 @@ def test_binary_read_write_fidelity():
     mesh_2 = Mesh.from_stl(fp)
     assert mesh.adjacency == mesh_2.adjacency
     assert mesh.vertex == mesh_2.vertex
+
+
+def test_read_arrays(ascii_stl, binary_stl):
+    for filepath in (ascii_stl, binary_stl):
+        stl = STL(filepath)
+        vertices, faces = stl.read_arrays()
+        assert vertices.shape == (len(stl.parser.vertices), 3)
+        assert faces.tolist() == stl.parser.faces
+        assert vertices.tolist() == [list(xyz) for xyz in stl.parser.vertices]
+
+
+def test_binary_facets(binary_stl):
+    stl = STL(binary_stl)
+    facet = stl.reader.facets[0]
+    assert len(facet["vertices"]) == 3
+    assert len(facet["keys"]) == 3
+    assert len(stl.reader.facets) == len(stl.parser.faces)
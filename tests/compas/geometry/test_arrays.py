@@ -0,0 +1,158 @@
+import math
+
+import pytest
+
+import compas
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Rotation
+from compas.geometry import Scale
+from compas.geometry import Translation
+from compas.geometry import allclose
+from compas.geometry import centroid_points
+from compas.geometry import transform_points
+from compas.geometry import transform_vectors
+
+if not compas.IPY:
+    import numpy as np
+
+    from compas.geometry import FrameArray
+    from compas.geometry import PointArray
+    from compas.geometry import VectorArray
+    from compas.geometry import transform_points_numpy
+
+
+@pytest.fixture
+def points():
+    return [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [-1.0, 0.5, 2.0], [4.0, -3.0, 1.0]]
+
+
+@pytest.fixture
+def T():
+    return Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([1, 1, 0], math.radians(30))
+
+
+def test_primitives_slots():
+    for obj in (Point(1, 2, 3), Frame.worldXY()):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.foo = "bar"
+
+
+def test_point_array_views(points):
+    if compas.IPY:
+        return
+
+    array = PointArray(points)
+    assert len(array) == 4
+    assert array == points
+    assert array[1].tolist() == [1.0, 2.0, 3.0]
+
+    row = array[1]
+    row[0] = 10.0
+    assert array.array[1, 0] == 10.0
+
+    tail = array[2:]
+    assert isinstance(tail, PointArray)
+    tail += [1.0, 1.0, 1.0]
+    assert array[3].tolist() == [5.0, -2.0, 2.0]
+
+    picked = array[[0, 1]]
+    picked *= 0
+    assert array[1].tolist() == [10.0, 2.0, 3.0]
+
+    buffer = np.zeros((2, 3))
+    PointArray(buffer)[0] = [1, 2, 3]
+    assert buffer[0].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_point_array_arithmetic(points):
+    if compas.IPY:
+        return
+
+    a = PointArray(points)
+    b = PointArray(points[::-1])
+    vectors = a - b
+    assert isinstance(vectors, VectorArray)
+    assert allclose(vectors, [[x - y for x, y in zip(p, q)] for p, q in zip(points, points[::-1])])
+    assert isinstance(a + vectors, PointArray)
+    assert allclose(a - Point(1, 1, 1), [[x - 1, y - 1, z - 1] for x, y, z in points])
+    assert allclose(a * [1, 2, 3, 4], [[n * x for x in p] for n, p in zip([1, 2, 3, 4], points)])
+    assert allclose(2 * a, a + a)
+    assert allclose((a / 2).array, a.array * 0.5)
+    with pytest.raises(ValueError):
+        a + [1, 2]
+
+
+def test_point_array_core_functions(points, T):
+    if compas.IPY:
+        return
+
+    array = PointArray(points)
+    assert allclose(centroid_points(array), array.centroid)
+    assert allclose(transform_points(array, T), transform_points(points, T))
+    assert allclose(transform_points_numpy(array, T), transform_points(points, T))
+
+    transformed = array.transformed(T)
+    assert allclose(transformed, transform_points(points, T))
+    assert array == points
+
+    array.transform(Scale.from_factors([2, 2, 2]))
+    assert allclose(array, [[2 * x for x in point] for point in points])
+    assert [point.x for point in array.to_points()] == [2 * point[0] for point in points]
+
+
+def test_vector_array(points, T):
+    if compas.IPY:
+        return
+
+    vectors = VectorArray(points[1:])
+    assert allclose(vectors.lengths, [math.sqrt(sum(x**2 for x in v)) for v in points[1:]])
+    assert allclose(vectors.transformed(T), transform_vectors(points[1:], T))
+    assert allclose(vectors.unitized().lengths, [1.0, 1.0, 1.0])
+    assert allclose(vectors.dot([1, 0, 0]), [1.0, -1.0, 4.0])
+    assert allclose(vectors.cross(vectors), np.zeros((3, 3)))
+    assert allclose(-vectors + vectors, np.zeros((3, 3)))
+
+
+def test_frame_array(T):
+    if compas.IPY:
+        return
+
+    frames = [Frame.worldXY(), Frame([1, 2, 3], [1, 1, 0], [0, 1, 1]), Frame([0, 0, 1], [0, 1, 0], [0, 0, 1])]
+    array = FrameArray.from_frames(frames)
+    assert len(array) == 3
+    assert all(a == b for a, b in zip(array.to_frames(), frames))
+    assert allclose(array.zaxes, [frame.zaxis for frame in frames])
+
+    unnormalized = FrameArray([[1, 2, 3]], [[2, 2, 0]], [[0, 3, 3]])
+    assert unnormalized.to_frames()[0] == frames[1]
+
+    array.transform(T)
+    for frame in frames:
+        frame.transform(T)
+    assert all(a == b for a, b in zip(array.to_frames(), frames))
+
+    view = array[1:]
+    view.points += [1, 0, 0]
+    assert allclose(array.points[1], frames[1].point + [1, 0, 0])
+    assert array[0].shape == (3, 3)
+
+    other = json_loads(json_dumps(array))
+    assert isinstance(other, FrameArray)
+    assert np.allclose(other.array, array.array)
+
+
+def test_array_data(points):
+    if compas.IPY:
+        return
+
+    array = PointArray(points)
+    other = json_loads(json_dumps(array))
+    assert isinstance(other, PointArray)
+    assert other == array
+    assert array.copy() == array
+    assert array.copy().array is not array.array
+    assert len(PointArray([])) == 0
@@ -1,10 +1,18 @@
 import pytest
 
+import compas
+
 # from compas.geometry import homogenize
 # from compas.geometry import dehomogenize
+from compas.datastructures import Mesh
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Projection
 from compas.geometry import Rotation
+from compas.geometry import Scale
 from compas.geometry import Translation
 from compas.geometry import allclose
+from compas.geometry import concatenate_matrices
 from compas.geometry import intersection_segment_segment_xy
 from compas.geometry import mirror_points_line
 from compas.geometry import mirror_points_line_xy
@@ -25,6 +33,8 @@ from compas.geometry import rotate_points
 from compas.geometry import rotate_points_xy
 from compas.geometry import scale_points
 from compas.geometry import scale_points_xy
+from compas.geometry import multiply_matrices
+from compas.geometry import transform_frames
 from compas.geometry import transform_points
 from compas.geometry import transform_vectors
 from compas.geometry import translate_points
@@ -55,6 +65,77 @@ def test_transform_vectors(R):
     ]
 
 
+def test_transform_points_projective():
+    P = Projection.from_plane_and_point([[0, 0, 0], [0, 0, 1]], [0, 0, 10])
+    points = transform_points([[1, 2, 5], [1, 2, 0]], P)
+    assert allclose(points, [[2, 4, 0], [1, 2, 0]])
+
+
+def test_transform_frames(R, T):
+    frames = [Frame.worldXY(), Frame([1, 2, 3], [1, 1, 0], [0, 1, 1])]
+    for frame, (point, xaxis, yaxis) in zip(frames, transform_frames(frames, T * R)):
+        frame.transform(T * R)
+        assert allclose(point, frame.point)
+        assert allclose(xaxis, frame.xaxis)
+        assert allclose(yaxis, frame.yaxis)
+
+
+def test_concatenate_matrices(R, T):
+    S = Scale.from_factors([1, 2, 3])
+    assert concatenate_matrices([T, R, S]) == multiply_matrices(multiply_matrices(T.matrix, R.matrix), S.matrix)
+    assert concatenate_matrices([T.matrix]) == T.matrix
+    assert concatenate_matrices([]) == [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    assert (T * R * S).matrix == concatenate_matrices([T, R, S])
+
+
+def test_transformed_chain(R, T):
+    point = Point(1, 2, 3)
+    assert allclose(point.transformed([T, R, T]), point.transformed(T).transformed(R).transformed(T))
+    assert allclose(point.transformed([T, R]), point.transformed(T).transformed(R))
+    assert allclose(point.transformed([R, T]), point.transformed(R).transformed(T))
+    assert not allclose(point.transformed([T, R]), point.transformed([R, T]))
+    assert point.transformed([]) == point
+
+
+def test_transform_numpy(R, T):
+    if compas.IPY:
+        return
+
+    from compas.geometry import transform_points_numpy
+    from compas.geometry import transform_vectors_numpy
+    from compas.geometry import transform_frames_numpy
+
+    points = [[1, 2, 3], [5, 6, 7], [0, 0, 1]]
+    P = Projection.from_plane_and_point([[0, 0, 0], [0, 0, 1]], [0, 0, 10])
+    for X in (T, R, P):
+        assert allclose(transform_points_numpy(points, X), transform_points(points, X))
+        assert allclose(transform_vectors_numpy(points, X), transform_vectors(points, X))
+
+    many = transform_points_numpy(points, [X.matrix for X in (T, R, P)])
+    assert many.shape == (3, 3, 3)
+    for X, transformed in zip([T, R, P], many):
+        assert allclose(transformed, transform_points(points, X))
+
+    # a sequence of transformations is a chain, applied in the same order as by Geometry.transformed
+    chain = transform_points_numpy(points, [T, R])
+    assert chain.shape == (3, 3)
+    assert allclose(chain, transform_points(transform_points(points, T), R))
+    assert allclose(chain, [Point(*point).transformed([T, R]) for point in points])
+    assert allclose(transform_vectors_numpy(points, [T, R]), transform_vectors(points, R))
+
+    frames = [Frame.worldXY(), Frame([1, 2, 3], [1, 1, 0], [0, 1, 1])]
+    assert allclose(transform_frames_numpy(frames, [R.matrix, T.matrix])[1], transform_frames(frames, T))
+    assert allclose(transform_frames_numpy(frames, [R, T]), transform_frames(frames, T * R))
+
+
+def test_mesh_transform(R, T):
+    mesh = Mesh.from_polyhedron(6)
+    xyz = mesh.vertices_attributes("xyz")
+    mesh.transform(T * R)
+    assert allclose(mesh.vertices_attributes("xyz"), transform_points(xyz, T * R))
+    assert all(isinstance(x, float) for x in mesh.vertex_coordinates(0))
+
+
 # def test_homogenize():
 #     assert homogenize([[1, 2, 3]], 0.5) == [[0.5, 1.0, 1.5, 0.5]]
 
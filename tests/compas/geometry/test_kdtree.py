@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from compas.geometry import KDTree
+from compas.geometry import distance_point_point
+
+
+@pytest.fixture
+def cloud():
+    random.seed(0)
+    points = [[random.random(), random.random(), random.random()] for _ in range(500)]
+    # duplicate points should not break the search
+    points += points[:20]
+    return points
+
+
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_query(cloud, k):
+    tree = KDTree(cloud, leafsize=8)
+    samples = [[random.random(), random.random(), random.random()] for _ in range(50)] + cloud[:10]
+    indices, distances = tree.query(samples, k=k)
+
+    assert indices.shape == (len(samples), k)
+    for sample, nbrs, dists in zip(samples, indices, distances):
+        expected = sorted(distance_point_point(sample, point) for point in cloud)[:k]
+        assert list(dists) == pytest.approx(expected)
+        assert [distance_point_point(sample, cloud[index]) for index in nbrs] == pytest.approx(expected)
+
+
+def test_query_matches_nearest_neighbor(cloud):
+    tree = KDTree(cloud)
+    samples = [[random.random(), random.random(), random.random()] for _ in range(20)]
+    indices, distances = tree.query(samples)
+    for sample, dists in zip(samples, distances):
+        assert dists[0] == pytest.approx(tree.nearest_neighbor(sample)[2])
+
+
+def test_query_radius(cloud):
+    tree = KDTree(cloud)
+    samples = [[random.random(), random.random(), random.random()] for _ in range(20)]
+    indices, distances = tree.query_radius(samples, 0.2)
+
+    for sample, nbrs, dists in zip(samples, indices, distances):
+        expected = [i for i, point in enumerate(cloud) if distance_point_point(sample, point) <= 0.2]
+        assert sorted(nbrs) == expected
+        assert list(dists) == sorted(dists)
+        assert sorted(label for _, label, _ in tree.neighbors_in_radius(sample, 0.2)) == expected
+
+
+def test_query_invalid():
+    tree = KDTree([[0, 0, 0], [1, 0, 0]])
+    with pytest.raises(ValueError):
+        tree.query([[0, 0, 0]], k=3)
+    assert KDTree().query_radius([[0, 0, 0]], 1.0) == ([[]], [[]])
+
+
+def test_build(cloud):
+    tree = KDTree([[0, 0, 0], [1, 0, 0]])
+    tree.query([[0, 0, 0]])
+    tree.root = tree.build([(point, "p{}".format(i)) for i, point in enumerate(cloud)])
+    assert len(tree.points) == len(cloud)
+    samples = cloud[:5]
+    indices, distances = tree.query(samples, k=3)
+    for sample, nbrs in zip(samples, indices):
+        expected = [label for _, label, _ in tree.nearest_neighbors(sample, 3, distance_sort=True)]
+        assert sorted(nbrs) == sorted(expected)
+    indices, distances = tree.query_radius(samples, 0.1)
+    assert sorted(indices[0]) == sorted(label for _, label, _ in tree.neighbors_in_radius(samples[0], 0.1))
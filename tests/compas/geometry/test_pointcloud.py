@@ -18,3 +18,9 @@ def test_inequality():
     assert a != b
     b = Pointcloud.from_bounds(10, 10, 10, 10)
     assert a != b
+
+
+def test_closest_points():
+    cloud = Pointcloud.from_bounds(10, 10, 10, 50)
+    points = [[1, 2, 3], [5, 5, 5], [10, 0, 10]]
+    assert cloud.closest_points(points) == [cloud.closest_point(point) for point in points]
@@ -18,3 +18,22 @@ def test_switch_package():
         r = proxy.inv(A)
 
     assert allclose(r, [[-2, 1], [1.5, -0.5]])
+
+
+def test_binary_transport():
+    with Proxy("numpy", python="python", transport="binary") as proxy:
+        assert proxy.transport == "binary"
+
+        points = [[0.5 * i, 1.0, 2.0] for i in range(100)]
+        assert proxy.asarray(points) == points
+        assert proxy.arange(20) == list(range(20))
+
+
+def test_batch():
+    for transport in ("xmlrpc", "binary"):
+        with Proxy("numpy", python="python", transport=transport) as proxy:
+            with proxy.batch() as batch:
+                batch.arange(5)
+                batch.linspace(0, 1, 3)
+
+    assert batch.results == [[0, 1, 2, 3, 4], [0.0, 0.5, 1.0]]
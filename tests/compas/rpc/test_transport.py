@@ -0,0 +1,78 @@
+import json
+import socket
+import struct
+
+import numpy as np
+import pytest
+
+from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import Polyline
+from compas.rpc import Dispatcher
+from compas.rpc.transport import BinaryServer
+from compas.rpc.transport import BufferEncoder
+from compas.rpc.transport import send_message
+from compas.rpc.transport import receive_message
+
+
+@pytest.fixture
+def connection():
+    a, b = socket.socketpair()
+    yield a, b
+    a.close()
+    b.close()
+
+
+def test_message_roundtrip(connection):
+    a, b = connection
+    message = {
+        "points": [[float(i), 0.5, -1.0] for i in range(100)],
+        "faces": [[0, 1, 2], [2, 3, 4, 5]],
+        "indices": list(range(100)),
+        "names": ["a"] * 100,
+        "point": Point(1, 2, 3),
+        "array": np.arange(60, dtype=float).reshape((20, 3)),
+        "large": [2**40] * 50,
+        "mixed": [1, 2.5] * 20,
+        "polyline": Polyline([[float(i), 0.0, 0.0] for i in range(50)]),
+    }
+    send_message(a, message)
+    result = receive_message(b)
+
+    assert result["points"] == message["points"]
+    assert result["faces"] == message["faces"]
+    assert result["indices"] == message["indices"]
+    assert result["names"] == message["names"]
+    assert result["point"] == message["point"]
+    assert result["array"] == message["array"].tolist()
+    assert result["large"] == message["large"]
+    assert [type(value) for value in result["mixed"]] == [int, float] * 20
+    assert result["polyline"] == message["polyline"]
+
+
+def test_data_buffers():
+    buffers = []
+    json.dumps(PointArray([[float(i), 0.0, 0.0] for i in range(50)]), cls=BufferEncoder, buffers=buffers)
+    assert len(buffers) == 1
+
+
+def test_message_closed(connection):
+    a, b = connection
+    a.close()
+    with pytest.raises(EOFError):
+        receive_message(b)
+
+
+def test_server_closes_after_malformed_frame():
+    server = BinaryServer(("127.0.0.1", 0), Dispatcher())
+    server.serve_in_thread()
+    sock = socket.create_connection(("127.0.0.1", server.port), timeout=10)
+    try:
+        sock.sendall(struct.pack(">II", 5, 0) + b"{bad}")
+        assert receive_message(sock)["error"]
+        with pytest.raises(EOFError):
+            receive_message(sock)
+    finally:
+        sock.close()
+        server.shutdown()
+        server.server_close()
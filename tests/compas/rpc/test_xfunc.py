@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from compas.rpc import XFunc
+from compas.rpc import XFuncPool
+from compas.rpc import RPCServerError
+
+
+def test_xfunc_pool_reuses_workers():
+    add_vectors = XFunc("compas.geometry.add_vectors", python="python", pool=True)
+    getpid = XFunc("os.getpid", pool=add_vectors.pool)
+
+    assert add_vectors([1, 2, 3], [1, 1, 1]) == [2, 3, 4]
+    assert getpid() == getpid()
+    assert add_vectors.pool.workers == [getpid()]
+
+    add_vectors.close()
+
+
+def test_xfunc_pool_errors():
+    with XFuncPool(python="python") as pool:
+        sqrt = XFunc("math.sqrt", pool=pool)
+
+        with pytest.raises(Exception) as error:
+            sqrt(-1)
+        assert "ValueError" in str(error.value)
+        assert sqrt(4) == 2.0
+        assert sqrt.profile
+
+        sqrt = XFunc("math.sqrt", pool=pool, profiling=False)
+        assert sqrt(4) == 2.0
+        assert sqrt.profile is None
+
+
+def test_xfunc_pool_restarts_workers():
+    with XFuncPool(python="python", idle_timeout=0.5) as pool:
+        pid = pool.call("os.getpid")["data"]
+
+        with pytest.raises(RPCServerError):
+            pool.call("os._exit", [1])
+        assert pool.call("os.getpid")["data"] != pid
+
+        pid = pool.call("os.getpid")["data"]
+        time.sleep(1.0)
+        assert pool.call("os.getpid")["data"] != pid
+
+
+def test_xfunc_pool_starmap():
+    with XFuncPool(size=2, python="python", serializer="pickle") as pool:
+        results = pool.starmap("compas.geometry.add_vectors", [([i, 0, 0], [0, i, 0]) for i in range(10)])
+
+    assert [result["data"] for result in results] == [[i, i, 0] for i in range(10)]
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.topology import face_adjacency
+from compas.topology import unify_cycles
+
+
+@pytest.fixture
+def soup():
+    grid = Mesh.from_meshgrid(dx=10, nx=10)
+    grid.quads_to_triangles()
+    vertices, faces = grid.to_vertices_and_faces()
+    # a second, disconnected grid
+    offset = len(vertices)
+    other = Mesh.from_meshgrid(dx=3, nx=3)
+    faces += [[offset + vertex for vertex in face] for face in other.to_vertices_and_faces()[1]]
+    vertices += other.to_vertices_and_faces()[0]
+    random.seed(0)
+    return vertices, [face[::-1] if random.random() < 0.5 else face for face in faces]
+
+
+def test_face_adjacency(soup):
+    vertices, faces = soup
+    adjacency = face_adjacency(vertices, faces)
+    assert len(adjacency) == len(faces)
+    for face, nbrs in adjacency.items():
+        assert face not in nbrs
+        for nbr in nbrs:
+            assert face in adjacency[nbr]
+            assert len(set(faces[face]) & set(faces[nbr])) == 2
+    assert sum(len(nbrs) for nbrs in adjacency.values()) == 2 * (280 + 12)
+
+
+@pytest.mark.parametrize("root", [0, 205])
+def test_unify_cycles(soup, root):
+    vertices, faces = soup
+    first = faces[root][:]
+    faces = unify_cycles(vertices, faces, root=root)
+    assert faces[root] == first
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    assert mesh.is_manifold()
+    assert len(mesh.vertices_on_boundaries()) == 2
+    assert len(set(mesh.face_normal(face)[2] > 0 for face in range(200))) == 1
+    assert len(set(mesh.face_normal(face)[2] > 0 for face in range(200, 209))) == 1
+
+
+def test_unify_cycles_numpy(soup):
+    if compas.IPY:
+        return
+
+    from compas.topology import face_adjacency_numpy
+    from compas.topology import unify_cycles_numpy
+
+    vertices, faces = soup
+    adjacency = face_adjacency_numpy(vertices, faces)
+    assert adjacency == {face: sorted(nbrs) for face, nbrs in face_adjacency(vertices, faces).items()}
+    unified = unify_cycles_numpy(vertices, [face[:] for face in faces], root=205)
+    assert unified == unify_cycles(vertices, faces, root=205)
@@ -0,0 +1,85 @@
+import pytest
+
+from compas.utilities import SpatialHash
+from compas.utilities import geometric_key
+from compas.utilities import geometric_keys
+
+
+@pytest.mark.parametrize(
+    "precision",
+    ["3f", "1f", "d", "6g"],
+)
+def test_geometric_keys(precision):
+    points = [[0.0, 0.0, 0.0], [1.23456, -0.00001, 7.5], [-3.0, 2.0, -0.04]]
+    assert geometric_keys(points, precision) == [geometric_key(point, precision) for point in points]
+
+
+@pytest.mark.parametrize(
+    "precision",
+    ["3f", "d", None],
+)
+def test_spatialhash_matches_geometric_key(precision):
+    points = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0001, -0.0001, 0.0], [1.2, 3.4, 5.6], [1.0002, 0.0, 0.0]]
+    spatialhash = SpatialHash(precision=precision)
+    gkey_index = {}
+    expected = [gkey_index.setdefault(geometric_key(point, precision), len(gkey_index)) for point in points]
+    assert spatialhash.add_points(points) == expected
+    assert len(spatialhash) == len(gkey_index)
+    assert spatialhash.get([1.0, 0.0, 0.0]) == 1
+    assert [9.0, 9.0, 9.0] not in spatialhash
+
+
+@pytest.mark.parametrize(
+    "precision",
+    ["3f", "0f", "d"],
+)
+def test_spatialhash_ties_match_geometric_key(precision):
+    points = [
+        [0.0005, 0.0, 0.0],
+        [0.0004999, 0.0, 0.0],
+        [0.00051, 0.0, 0.0],
+        [-0.0005, 0.0, 0.0],
+        [2.5, 0.0015, -1.0025],
+    ]
+    for bulk in (True, False):
+        spatialhash = SpatialHash(precision=precision)
+        gkey_index = {}
+        expected = [gkey_index.setdefault(geometric_key(point, precision), len(gkey_index)) for point in points]
+        if bulk:
+            assert spatialhash.add_points(points) == expected
+        else:
+            assert [spatialhash.add(point) for point in points] == expected
+
+
+def test_spatialhash_keeps_last():
+    spatialhash = SpatialHash(precision="3f")
+    assert spatialhash.add_points([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0001, 0.0, 0.0]]) == [0, 1, 0]
+    assert spatialhash.points == [[0.0001, 0.0, 0.0], [1.0, 0.0, 0.0]]
+
+
+def test_spatialhash_tolerance():
+    spatialhash = SpatialHash(tolerance=0.5)
+    assert spatialhash.add([0.0, 0.0, 0.0]) == 0
+    assert spatialhash.add([0.2, -0.2, 0.1]) == 0
+    assert spatialhash.add_points([[1.0, 0.0, 0.0], [0.9, 0.1, 0.0]]) == [1, 1]
+    assert spatialhash.points == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+    with pytest.raises(ValueError):
+        SpatialHash(tolerance=0)
+
+
+def test_spatialhash_tolerance_neighbours():
+    spatialhash = SpatialHash(tolerance=0.1)
+    assert spatialhash.add([0.099, 0.0, 0.0]) == 0
+    assert spatialhash.add([0.101, 0.0, 0.0]) == 0
+    assert spatialhash.add([0.02, 0.0, 0.0]) == 0
+    assert spatialhash.get([0.05, 0.05, 0.05]) == 0
+    assert spatialhash.add([0.3, 0.0, 0.0]) == 1
+    assert [0.15, 0.1, 0.0] not in spatialhash
+    assert [-0.09, 0.0, 0.0] not in spatialhash
+
+
+def test_spatialhash_tolerance_chain():
+    spatialhash = SpatialHash(tolerance=0.1)
+    points = [[0.09 * i, 0.0, 0.0] for i in range(5)]
+    assert spatialhash.add_points(points) == [0, 0, 1, 1, 2]
+    assert spatialhash.points == [points[0], points[2], points[4]]